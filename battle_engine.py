@@ -1,7 +1,6 @@
 #!/usr/bin/python
 
 import math
-import random
 
 import factories.monster_factory
 from commands.use_potion_command import UsePotionCommand
@@ -11,7 +10,7 @@ from items.unique_items import highLevelFindableUniques
 from items.unique_items import eliteLevelFindableUniques
 import constants
 
-def battle(player, context, monsters = None):
+def battle(player, context, monsters = None, policy = None):
     """
     The battle engine of Lord of the Rings.
 
@@ -22,8 +21,12 @@ def battle(player, context, monsters = None):
                        or story-based battles (e.g., boss battles).
     @param monsters:   An optional parameter used for story-based battles. 
                        Consists of the list of monsters to fight.
+    @param policy:     An optional BattlePolicy that chooses player's actions.
+                       Defaults to player's battle policy. Without a policy,
+                       the user is prompted.
                        
-    @return:           True if battle was won; False otherwise.
+    @return:           True if battle was won or no monsters appeared; 
+                       False otherwise.
 
     Differences between random battles and story-based battles:
     -Random battles: monster factory called by battle engine and monsters are 
@@ -31,14 +34,18 @@ def battle(player, context, monsters = None):
     -Story-based battles: monsters must be supplied through the "monsters" 
     parameter. Player cannot run from battle.
     """
+    io = player.getIo()
+    if policy is None:
+        policy = player.getBattlePolicy()
+
     #Battle setup
     output = _battleSetup(player, context)
     if context == constants.BattleEngineContext.RANDOM:
         bonusDifficulty = output[0]
         monsters = output[1]
-        #If no monsters are spawned
+        #If no monsters are spawned, there is nothing to lose
         if len(monsters) == 0:
-            return
+            return True
     else:
         bonusDifficulty = output
         
@@ -47,53 +54,65 @@ def battle(player, context, monsters = None):
     #Main battle sequence
     while len(monsters) != 0:
         #Display enemy monsters
-        print "Monsters:"
+        io.output("Monsters:")
         for monster in monsters:
-            print "\t%s: %s" % (monster.getName(), monster.getDescription())
-        print ""
+            io.output("\t%s: %s" % (monster.getName(), monster.getDescription()))
+        io.output()
         
-        #Solicit user input
+        #Solicit user input or ask policy
         choice = None
-        acceptable = ["attack", "use potion", "run", "explode"]
-        while choice not in acceptable:
-            choice = raw_input("You may: 'attack', 'use potion', 'run.' ")
+        argument = None
+        if policy is not None:
+            choice, argument = policy.chooseAction(player, monsters)
+        else:
+            acceptable = ["attack", "use potion", "run", "explode"]
+            while choice not in acceptable:
+                choice = io.input("You may: 'attack', 'use potion', 'run.' ")
         
         #Player attack option
-        if choice == 'attack':
-            earnings = _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
+        if choice == constants.BattleAction.ATTACK:
+            earnings = _playerAttackPhase(player, monsters, bonusDifficulty, 
+                earnings, argument)
             
         #Use potion option
-        elif choice == "use potion":
-            _usePotion(player)
+        elif choice == constants.BattleAction.USE_POTION:
+            _usePotion(player, argument)
             
         #Run option
-        elif choice == "run":
+        elif choice == constants.BattleAction.RUN:
             if context == constants.BattleEngineContext.RANDOM:
-                if random.random() < constants.BattleEngine.RUN_PROBABILITY_SUCCESS:
-                    print "You ran away succesfully!"
-                    print ""
+                combat = player.getRandom(constants.RandomStream.COMBAT)
+                runProbability = constants.BattleEngine.RUN_PROBABILITY_SUCCESS
+                if combat.random() < runProbability:
+                    io.output("You ran away succesfully!")
+                    io.output()
                     return True
                 else:
-                    print "Your path is blocked!"
+                    io.output("Your path is blocked!")
             else:
-                print "Your path is blocked!"
+                io.output("Your path is blocked!")
                 
         #Code - eliminates all enemies
         elif choice == "explode":
             monsters = []
             earnings = [0, 0]
 
+        else:
+            errorMsg = "Battle policy chose invalid action: %s" % choice
+            raise AssertionError(errorMsg)
+
         #Break between player and monster phases
-        raw_input("Press enter to continue. ")
-        print ""
+        if policy is None:
+            io.pause()
+        io.output()
 
         #Monsters attack phase
-        continueBattle = _monsterAttackPhase(player, monsters)
+        continueBattle = _monsterAttackPhase(player, monsters, policy is None)
         
         #Escape sequence given battle loss
         if not continueBattle:
-            print ""
-            print "Gandalf bails you out."
+            io.output()
+            io.output("Gandalf bails you out.")
             player.heal(1)
             
             return False
@@ -116,6 +135,8 @@ def _battleSetup(player, context):
                       and a list of monster objects to fight. For
                       boss battles, the bonus-difficulty stat.
     """
+    io = player.getIo()
+
     #For random battles
     if context == constants.BattleEngineContext.RANDOM:
         #Create variables
@@ -126,11 +147,11 @@ def _battleSetup(player, context):
         #Spawn monsters
         monsterCount = _monsterNumGen(player)
         monsters = factories.monster_factory.getMonsters(monsterCount, region, 
-        bonusDifficulty)
+        bonusDifficulty, player.getRandom(constants.RandomStream.SPAWN))
 
         #Declare battle
-        print "Zonkle-tronks! Wild monsters appeared!"
-        print ""
+        io.output("Zonkle-tronks! Wild monsters appeared!")
+        io.output()
 
         return bonusDifficulty, monsters
     
@@ -142,9 +163,9 @@ def _battleSetup(player, context):
         bonusDifficulty = location.getBattleBonusDifficulty()
     
         #Display splash screen
-        print """
+        io.output("""
 ()==[:::::::::::::> ()==[:::::::::::::> ()==[:::::::::::::>
-"""
+""")
         return bonusDifficulty
     
     else:
@@ -166,6 +187,28 @@ def _monsterNumGen(player):
     region = location.getRegion()
     bonusDifficulty = location.getBattleBonusDifficulty()
    
+    monsterCount = getBaseMonsterCount(region, bonusDifficulty)
+        
+    #Apply normal distribution to introduce variation
+    standardDeviation = monsterCount/constants.BattleEngine.STANDARD_DEVIATION
+    
+    spawn = player.getRandom(constants.RandomStream.SPAWN)
+    monsterCount = spawn.normalvariate(monsterCount, standardDeviation)
+    monsterCount = max(math.floor(monsterCount), 1)
+    monsterCount = int(monsterCount)
+    
+    return monsterCount
+
+def getBaseMonsterCount(region, bonusDifficulty):
+    """
+    Determines the average number of monsters spawned in a random battle, 
+    before variation is applied.
+
+    @param region:           The region of the space.
+    @param bonusDifficulty:  The bonus difficulty of the space.
+
+    @return:                 Average number of monsters to spawn.
+    """
     #Calculate region spawn
     if region == constants.RegionType.ERIADOR:
         monsterCount = (1 + bonusDifficulty) * constants.RegionBaseSpawn.ERIADOR
@@ -188,17 +231,54 @@ def _monsterNumGen(player):
     else:
         errorMsg = "Invalid region - region base monster determination."
         raise AssertionError(errorMsg)
-        
-    #Apply normal distribution to introduce variation
-    standardDeviation = monsterCount/constants.BattleEngine.STANDARD_DEVIATION
-    
-    monsterCount = random.normalvariate(monsterCount, standardDeviation)
-    monsterCount = max(math.floor(monsterCount), 1)
-    monsterCount = int(monsterCount)
     
     return monsterCount
 
-def _playerAttackPhase(player, monsters, bonusDifficulty, earnings):
+def getExpectedDamage(region, bonusDifficulty, attack, defense):
+    """
+    Estimates the damage player takes in a random battle fought to the end,
+    attacking one monster at a time.
+
+    A monster that needs r attacks to slay and is k-th in line strikes once
+    for every attack spent on the monsters before it, then r - 1 more times.
+    Summing over the average number of monsters, with monster kinds drawn from
+    the region's spawn distribution, gives
+        E[d]E[r]n(n - 1)/2 + nE[d(r - 1)]
+    for n monsters, damage d per strike and attacks r per monster.
+
+    @param region:           The region of the space.
+    @param bonusDifficulty:  The bonus difficulty of the space.
+    @param attack:           Player's total attack.
+    @param defense:          Player's total defense.
+
+    @return:                 Expected damage.
+    """
+    upperLimits, kindNames = factories.monster_factory.getSpawnTable(region)
+    monsterCount = max(getBaseMonsterCount(region, bonusDifficulty), 1)
+    attack = max(attack, 1)
+
+    damage = 0
+    rounds = 0
+    damageOverRounds = 0
+    lowerLimit = 0
+    for upperLimit, kindName in zip(upperLimits, kindNames):
+        kind = factories.monster_factory.getMonsterKind(kindName, 
+            bonusDifficulty)
+        probability = upperLimit - lowerLimit
+        lowerLimit = upperLimit
+
+        #As in Player.takeAttack() and Monster.takeAttack()
+        strike = max(kind.getAttack() - defense, 0)
+        attacks = math.ceil(float(kind.getHp()) / attack)
+        damage += probability * strike
+        rounds += probability * attacks
+        damageOverRounds += probability * strike * (attacks - 1)
+
+    return (damage * rounds * monsterCount * (monsterCount - 1) / 2 + 
+        monsterCount * damageOverRounds)
+
+def _playerAttackPhase(player, monsters, bonusDifficulty, earnings, 
+    target = None):
     """
     When the user gets to attack a single monster object.
     If monster health is reduced to zero, monster is removed
@@ -212,85 +292,103 @@ def _playerAttackPhase(player, monsters, bonusDifficulty, earnings):
                           is money earned and second is experience received. 
                           Earnings needs to be passed in between successive 
                           function calls to update battle earnings.
+    @keyword target:      (Optional) Index of the monster to attack. If not
+                          given, the user is asked whom to attack.
     
     @return:              2-element tuple carrying battle earnings.
                           First element is money earned, second
                           element is experience received.
     """
+    io = player.getIo()
+
     #Starting battle earnings
     money      = earnings[0]
     experience = earnings[1]
 
-    #Solicit attack target
-    target = raw_input("Whom? ")
-    print ""
-    #Find monster object
-    for monster in monsters:
-        if monster.getName() == target:
-            #Carry out attack
-            player.attack(monster)
-            print ("%s did %s damage to %s!" % (player.getName(), 
-            player.getTotalAttack(), monster.getName()))
-            #If monster is still alive
-            if monster.getHp() > 0:
-                print ("%s has %s hp remaining." % (monster.getName(), 
-                monster.getHp()))
-            #If monster has died
-            else:
-                print "%s" % monster.getDeathString()
-                #Generate earnings from winning battle
-                expIncrease = monster.getExperience() * (1 + bonusDifficulty)
-                experience += expIncrease
-                money += math.floor(expIncrease/constants.BattleEngine.MONEY_CONSTANT)
-                #Remove monster from monsters list
-                for monster in monsters:
-                    if monster.getName() == target:
-                        monsters.remove(monster)
-                        #No need to keep iterating through monsters
-                        break
-            #No need to keep iterating through monsters
-            break
+    #Solicit attack target and find monster object
+    if target is None:
+        targetName = io.input("Whom? ")
+        io.output()
+        for monster in monsters:
+            if monster.getName() == targetName:
+                break
+        else:
+            io.output("%s looks at you in confusion." % player.getName())
+            return money, experience
+    else:
+        if not 0 <= target < len(monsters):
+            errorMsg = "Battle policy chose invalid target: %s" % target
+            raise AssertionError(errorMsg)
+        monster = monsters[target]
+
+    #Carry out attack
+    player.attack(monster)
+    io.output("%s did %s damage to %s!" % (player.getName(), 
+    player.getTotalAttack(), monster.getName()))
+    #If monster is still alive
+    if monster.getHp() > 0:
+        io.output("%s has %s hp remaining." % (monster.getName(), 
+        monster.getHp()))
+    #If monster has died
     else:
-        print "%s looks at you in confusion." % player.getName()
+        io.output("%s" % monster.getDeathString())
+        #Generate earnings from winning battle
+        expIncrease = monster.getExperience() * (1 + bonusDifficulty)
+        experience += expIncrease
+        money += math.floor(expIncrease/constants.BattleEngine.MONEY_CONSTANT)
+        #Remove monster from monsters list
+        monsters.remove(monster)
         
     return money, experience
 
-def _usePotion(player):
+def _usePotion(player, potion = None):
     """
     Creates an additional UsePotionCommand object
     for battle purposes only and then executes the 
     action sequence of this usePotion.
 
     @param player:   The player object.
+    @keyword potion: (Optional) The potion to use. If not given, the user is
+                     asked which potion to use.
     """
     usePotionCmd = UsePotionCommand(" ", " ", player)
-    usePotionCmd.execute()
+    if potion is None:
+        usePotionCmd.execute()
+    elif player.getInventory().containsItem(potion):
+        usePotionCmd.usePotion(potion)
+    else:
+        errorMsg = "Battle policy chose potion not in inventory: %s" % potion
+        raise AssertionError(errorMsg)
 
-def _monsterAttackPhase(player, monsters):
+def _monsterAttackPhase(player, monsters, pause = True):
     """
     Monster attack phase - when monsters attack player.
 
     @param player:      The player object.
     @param monsters:    The offending list of monsters.
+    @keyword pause:     (Optional) Whether to wait for the user to press
+                        enter after monsters attack.
 
     @return:            True if battle is to continue. False
                         otherwise.
     """
+    io = player.getIo()
+
     #Monsters attack
     for monster in monsters:
         monster.attack(player)
-        print ("%s %s for %s damage!" % (monster.getName(), 
+        io.output("%s %s for %s damage!" % (monster.getName(), 
         monster.getAttackString(), monster.getAttack()))
-        print "%s has %s HP remaining." % (player.getName(), player.getHp())
+        io.output("%s has %s HP remaining." % (player.getName(), player.getHp()))
         
         #Battle ends
         if player.getHp() == 0:
-            print ""
+            io.output()
             return False
     
-    if monsters:
-        raw_input("Press enter to continue. ")
-        print ""
+    if monsters and pause:
+        io.pause()
+        io.output()
     
     #Battle continuation
     return True
@@ -304,30 +402,33 @@ def _itemFind(player, experience):
     @param player:         The player object.
     @param experience:     The experience gained from the battle.
     """
+    io = player.getIo()
+
     location = player.getLocation()
+    loot = player.getRandom(constants.RandomStream.LOOT)
    
     #Item find for low-level uniques
     if player.getLevel() < 15:
-        lowLevel = triangular(constants.ItemFind.lowLevel)
+        lowLevel = triangular(constants.ItemFind.lowLevel, loot)
         if experience > lowLevel:
-            item = random.choice(lowLevelFindableUniques)
-            print "You found %s!" % item.getName()
+            item = loot.choice(lowLevelFindableUniques)
+            io.output("You found %s!" % item.getName())
             if not player.addToInventory(item):
                 location.addItem(item)
 
     #Item find for high-level uniques
-    highLevel = triangular(constants.ItemFind.highLevel)
+    highLevel = triangular(constants.ItemFind.highLevel, loot)
     if experience > highLevel:
-        item = random.choice(highLevelFindableUniques)
-        print "You found %s!" % item.getName()
+        item = loot.choice(highLevelFindableUniques)
+        io.output("You found %s!" % item.getName())
         if not player.addToInventory(item):
             location.addItem(item)
             
     #Item find for elite-level uniques
-    eliteLevel = triangular(constants.ItemFind.eliteLevel)
+    eliteLevel = triangular(constants.ItemFind.eliteLevel, loot)
     if experience > eliteLevel:
-        item = random.choice(eliteLevelFindableUniques)
-        print "You found %s!" % item.getName()
+        item = loot.choice(eliteLevelFindableUniques)
+        io.output("You found %s!" % item.getName())
         if not player.addToInventory(item):
             location.addItem(item)
     
@@ -341,6 +442,8 @@ def _endSequence(player, earnings):
     @param earnings:    2-element tuple: first element is 
                         money and second is experience.
     """
+    io = player.getIo()
+
     money = earnings[0]
     experience = earnings[1]
     
@@ -354,11 +457,11 @@ def _endSequence(player, earnings):
     bar = "$" * lengthBar
     
     #Victory sequence
-    print bar
-    print victoryDeclaration
-    print gainsDeclaration
+    io.output(bar)
+    io.output(victoryDeclaration)
+    io.output(gainsDeclaration)
     _itemFind(player, experience)
     player.increaseMoney(money)
     player.increaseExperience(experience)
-    print bar
-    print ""
+    io.output(bar)
+    io.output()
@@ -0,0 +1,149 @@
+#!/usr/bin/python
+
+from items.potion import Potion
+import constants
+
+class BattlePolicy(object):
+    """
+    Parent class for objects that fight battles on the player's behalf.
+
+    When the battle engine is given a policy, it asks the policy for each
+    action instead of prompting the user. Actions are 2-element tuples of a
+    constants.BattleAction and an argument:
+        -BattleAction.ATTACK:      Index of the target in the list of monsters.
+        -BattleAction.USE_POTION:  The potion in player's inventory to drink.
+        -BattleAction.RUN:         None.
+    """
+    def chooseAction(self, player, monsters):
+        """
+        Decides player's next action in battle.
+
+        This method should be overridden by child classes.
+
+        @param player:     The player object.
+        @param monsters:   The list of monsters still standing.
+
+        @return:           2-element tuple of action and argument.
+        """
+        errorMsg = ("BattlePolicy.chooseAction() should be overridden by child "
+            "class.")
+        raise AssertionError(errorMsg)
+
+    @staticmethod
+    def getBestPotion(player):
+        """
+        Finds the potion with the most healing power in player's inventory.
+
+        @param player:     The player object.
+
+        @return:           The potion, or None if player has no potions.
+        """
+        bestPotion = None
+        for item in player.getInventory():
+            if isinstance(item, Potion) and (bestPotion is None or
+                item.getHealing() > bestPotion.getHealing()):
+                bestPotion = item
+
+        return bestPotion
+
+class TargetingPolicy(BattlePolicy):
+    """
+    Attacks the monster that scores lowest under a key function and drinks
+    the strongest potion when HP drops to a threshold.
+
+    Child classes supply the key function.
+    """
+    def __init__(self, potionThreshold = .3):
+        """
+        Initializes targeting policy.
+
+        @keyword potionThreshold:   (Optional) Fraction of player's maximum HP
+                                    at or below which player drinks a potion.
+                                    Zero means never.
+        """
+        self._potionThreshold = potionThreshold
+
+    def chooseAction(self, player, monsters):
+        """
+        Drinks a potion if player is hurt badly enough and has one. Otherwise
+        attacks the target chosen by the key function.
+
+        @param player:     The player object.
+        @param monsters:   The list of monsters still standing.
+
+        @return:           2-element tuple of action and argument.
+        """
+        if player.getHp() <= self._potionThreshold * player.getTotalMaxHp():
+            potion = self.getBestPotion(player)
+            if potion:
+                return constants.BattleAction.USE_POTION, potion
+
+        target = min(range(len(monsters)),
+            key = lambda index: self._targetKey(monsters[index]))
+        return constants.BattleAction.ATTACK, target
+
+    def _targetKey(self, monster):
+        """
+        Scores a monster. The monster with the lowest score is attacked.
+
+        This method should be overridden by child classes.
+
+        @param monster:    The monster to score.
+
+        @return:           The monster's score.
+        """
+        errorMsg = ("TargetingPolicy._targetKey() should be overridden by "
+            "child class.")
+        raise AssertionError(errorMsg)
+
+class FocusLowestHpPolicy(TargetingPolicy):
+    """
+    Attacks the monster with the least HP, to thin out enemy numbers quickly.
+    """
+    def _targetKey(self, monster):
+        return monster.getHp()
+
+class FocusHighestAttackPolicy(TargetingPolicy):
+    """
+    Attacks the monster with the highest attack, to cut incoming damage.
+    """
+    def _targetKey(self, monster):
+        return -monster.getAttack()
+
+class RunBelowThresholdPolicy(BattlePolicy):
+    """
+    Runs when HP drops to a threshold and otherwise defers to another policy.
+
+    Running only succeeds in random battles. In story battles the battle
+    engine blocks the path and player loses his turn.
+    """
+    def __init__(self, runThreshold = .3, policy = None):
+        """
+        Initializes run policy.
+
+        @keyword runThreshold:   (Optional) Fraction of player's maximum HP at
+                                 or below which player runs.
+        @keyword policy:         (Optional) Policy used while player does not
+                                 run. Defaults to FocusLowestHpPolicy without
+                                 potions.
+        """
+        if policy is None:
+            policy = FocusLowestHpPolicy(potionThreshold = 0)
+
+        self._runThreshold = runThreshold
+        self._policy = policy
+
+    def chooseAction(self, player, monsters):
+        """
+        Runs if player is hurt badly enough. Otherwise lets the wrapped policy
+        decide.
+
+        @param player:     The player object.
+        @param monsters:   The list of monsters still standing.
+
+        @return:           2-element tuple of action and argument.
+        """
+        if player.getHp() <= self._runThreshold * player.getTotalMaxHp():
+            return constants.BattleAction.RUN, None
+
+        return self._policy.chooseAction(player, monsters)
@@ -0,0 +1,248 @@
+#!/usr/bin/python
+
+"""
+Headless Monte Carlo simulator for random battles, used to balance monster
+stats, region spawns and space difficulty.
+
+Many battles are simulated at once with NumPy arrays. The arithmetic mirrors
+battle_engine.battle(), Player.takeAttack() and Monster.takeAttack(). The
+simulated player:
+    -Attacks the first monster still standing each round.
+    -Drinks a potion instead of attacking when his HP is at or below the
+     potion threshold and he has potions left.
+    -Never runs.
+
+Requires NumPy.
+
+Usage: python battle_simulator.py [battles]
+"""
+
+import math
+import sys
+
+import numpy
+
+import battle_engine
+import factories.monster_factory
+import player
+import constants
+
+#Battles are simulated in chunks of this size to bound memory use
+CHUNK_SIZE = 100000
+
+#Battles still going after this many rounds are counted as losses
+MAX_ROUNDS = 1000
+
+def getPlayerStats(level, weaponAttack = 0, armorDefense = 0, charmHp = 0):
+    """
+    Calculates player stats at a given level, the same way Player levels up.
+
+    @param level:            Player level.
+    @keyword weaponAttack:   (Optional) Attack of equipped weapon and charms.
+    @keyword armorDefense:   (Optional) Defense of equipped armor and charms.
+    @keyword charmHp:        (Optional) HP bonus of equipped charms.
+
+    @return:                 3-element tuple of maximum HP, total attack and
+                             total defense.
+    """
+    maxHp, attack, weightLimit = player.getLevelStats(level)
+
+    return maxHp + charmHp, attack + weaponAttack, armorDefense
+
+def simulateBattles(region, bonusDifficulty, playerStats, battles,
+    potions = 0, potionHealing = 0, potionThreshold = .3, seed = None):
+    """
+    Simulates random battles in a space.
+
+    @param region:            Region of the space.
+    @param bonusDifficulty:   Bonus difficulty of the space.
+    @param playerStats:       3-element tuple of player maximum HP, attack and
+                              defense, as returned by getPlayerStats().
+                              Player starts each battle at full HP.
+    @param battles:           Number of battles to simulate.
+    @keyword potions:         (Optional) Number of potions player carries.
+    @keyword potionHealing:   (Optional) HP healed per potion.
+    @keyword potionThreshold: (Optional) Fraction of maximum HP at or below
+                              which player drinks a potion.
+    @keyword seed:            (Optional) Seed for the random number
+                              generator.
+
+    @return:                  Dictionary with the following keys:
+                              "battles":    Number of battles simulated.
+                              "winRate":    Fraction of battles won.
+                              "rounds":     Average number of rounds.
+                              "experience": Average experience gained.
+                                            Lost battles earn nothing.
+                              "money":      Average money gained.
+                              "potions":    Average potions consumed.
+    """
+    random = numpy.random.RandomState(seed)
+    monsterTable = _getMonsterTable(region, bonusDifficulty)
+
+    totals = {"wins": 0, "rounds": 0, "experience": 0, "money": 0,
+        "potions": 0}
+    remaining = battles
+    while remaining > 0:
+        chunk = min(remaining, CHUNK_SIZE)
+        _simulateChunk(random, monsterTable, region, bonusDifficulty,
+            playerStats, chunk, potions, potionHealing, potionThreshold,
+            totals)
+        remaining -= chunk
+
+    battles = float(max(battles, 1))
+    return {"battles":    int(battles),
+            "winRate":    totals["wins"] / battles,
+            "rounds":     totals["rounds"] / battles,
+            "experience": totals["experience"] / battles,
+            "money":      totals["money"] / battles,
+            "potions":    totals["potions"] / battles}
+
+def _getMonsterTable(region, bonusDifficulty):
+    """
+    Helper function that collects the stats of the monsters that spawn in a
+    region.
+
+    @param region:            Region to spawn monsters in.
+    @param bonusDifficulty:   Bonus difficulty of the space.
+
+    @return:                  Tuple of arrays: upper limits of each kind's
+                              spawn range, HP, attack, experience earned and
+                              money earned.
+    """
+    upperLimits, kindNames = factories.monster_factory.getSpawnTable(region)
+
+    hp = []
+    attack = []
+    experience = []
+    money = []
+    for kindName in kindNames:
+        kind = factories.monster_factory.getMonsterKind(kindName,
+            bonusDifficulty)
+        #Same earnings as battle_engine._playerAttackPhase()
+        expIncrease = kind.getExperience() * (1 + bonusDifficulty)
+        hp.append(kind.getHp())
+        attack.append(kind.getAttack())
+        experience.append(expIncrease)
+        money.append(math.floor(expIncrease /
+            constants.BattleEngine.MONEY_CONSTANT))
+
+    return (numpy.array(upperLimits, dtype = float),
+        numpy.array(hp, dtype = float), numpy.array(attack, dtype = float),
+        numpy.array(experience, dtype = float),
+        numpy.array(money, dtype = float))
+
+def _simulateChunk(random, monsterTable, region, bonusDifficulty, playerStats,
+    battles, potions, potionHealing, potionThreshold, totals):
+    """
+    Helper function that simulates a number of battles side by side and adds
+    their outcomes to totals.
+
+    Arrays have one row per battle. Monster arrays have one column per
+    monster, in order of attack. Slain and absent monsters have zero HP.
+    """
+    upperLimits, kindHp, kindAttack, kindExperience, kindMoney = monsterTable
+    maxHp, playerAttack, playerDefense = playerStats
+
+    #Number of monsters, as in battle_engine._monsterNumGen()
+    baseCount = battle_engine.getBaseMonsterCount(region, bonusDifficulty)
+    standardDeviation = baseCount / constants.BattleEngine.STANDARD_DEVIATION
+    counts = random.normal(baseCount, standardDeviation, battles)
+    counts = numpy.maximum(numpy.floor(counts), 1).astype(int)
+
+    #Kind of each monster, as in monster_factory.getMonsters()
+    columns = counts.max()
+    kinds = numpy.searchsorted(upperLimits,
+        random.random_sample((battles, columns)), side = "right")
+    kinds = numpy.minimum(kinds, len(upperLimits) - 1)
+    present = numpy.arange(columns) < counts[:, numpy.newaxis]
+
+    monsterHp = numpy.where(present, kindHp[kinds], 0)
+    #Damage monsters deal to player after armor, as in Player.takeAttack()
+    monsterDamage = numpy.maximum(kindAttack[kinds] - playerDefense, 0)
+
+    hp = numpy.full(battles, maxHp, dtype = float)
+    potionsLeft = numpy.full(battles, potions, dtype = int)
+    experience = numpy.zeros(battles)
+    money = numpy.zeros(battles)
+
+    for rounds in range(1, MAX_ROUNDS + 1):
+        rows = numpy.arange(len(hp))
+
+        #Player phase: drink a potion or attack the first monster standing
+        drink = (potionsLeft > 0) & (hp <= potionThreshold * maxHp)
+        hp = numpy.where(drink, numpy.minimum(hp + potionHealing, maxHp), hp)
+        potionsLeft -= drink
+
+        targets = (monsterHp > 0).argmax(axis = 1)
+        targetHp = monsterHp[rows, targets]
+        newHp = numpy.where(drink, targetHp,
+            numpy.maximum(targetHp - playerAttack, 0))
+        slain = (targetHp > 0) & (newHp == 0)
+        monsterHp[rows, targets] = newHp
+        experience += numpy.where(slain, kindExperience[kinds[rows, targets]],
+            0)
+        money += numpy.where(slain, kindMoney[kinds[rows, targets]], 0)
+
+        #Monster phase: every monster standing attacks
+        alive = monsterHp > 0
+        hp = numpy.maximum(hp - (monsterDamage * alive).sum(axis = 1), 0)
+
+        #Battles end when either side has fallen
+        won = (hp > 0) & ~alive.any(axis = 1)
+        finished = won | (hp == 0)
+        if rounds == MAX_ROUNDS:
+            finished[:] = True
+        if not finished.any():
+            continue
+
+        totals["wins"] += won.sum()
+        totals["rounds"] += rounds * finished.sum()
+        totals["experience"] += experience[won].sum()
+        totals["money"] += money[won].sum()
+        totals["potions"] += (potions - potionsLeft[finished]).sum()
+
+        #Only keep simulating battles that are still going
+        going = ~finished
+        if not going.any():
+            break
+        hp = hp[going]
+        potionsLeft = potionsLeft[going]
+        experience = experience[going]
+        money = money[going]
+        monsterHp = monsterHp[going]
+        monsterDamage = monsterDamage[going]
+        kinds = kinds[going]
+
+def main(battles = 1000000):
+    """
+    Prints simulated battle outcomes for every space with random battles, at
+    several player levels. Player has the starting weapon and armor and three
+    potions that each heal half his maximum HP.
+
+    @keyword battles:    Number of battles per space and level.
+    """
+    import game_loader
+    from items.unique_items import sting, leatherCloak
+
+    levels = [1, 5, 10, 15, 20]
+
+    print "%-20s %5s %8s %7s %9s %8s %7s" % ("Space", "Level", "Win rate",
+        "Rounds", "Exp", "Money", "Potions")
+    for space in game_loader.buildWorld():
+        if not space.getBattleProbability():
+            continue
+        for level in levels:
+            playerStats = getPlayerStats(level, sting.getAttack(),
+                leatherCloak.getDefense())
+            report = simulateBattles(space.getRegion(),
+                space.getBattleBonusDifficulty(), playerStats, battles,
+                potions = 3, potionHealing = playerStats[0] // 2)
+            print "%-20s %5s %8.3f %7.2f %9.1f %8.1f %7.2f" % (
+                space.getName(), level, report["winRate"], report["rounds"],
+                report["experience"], report["money"], report["potions"])
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,75 @@
+#!/usr/bin/python
+
+"""
+Measures how long it takes to start the game.
+
+Each measurement runs in a fresh interpreter so that nothing is already 
+imported. Two cases are measured:
+
+    main.py:           Importing the game, as main.py does before play begins.
+    headless worker:   Importing the game and creating a Game driven by a 
+                       HeadlessIO, as a worker process would.
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MAIN = """
+import sys, time
+start = time.time()
+from game import Game
+print time.time() - start, len(sys.modules)
+"""
+
+WORKER = """
+import sys, time
+start = time.time()
+from game import Game
+from game_io import HeadlessIO
+Game(HeadlessIO())
+print time.time() - start, len(sys.modules)
+"""
+
+def measure(code, runs):
+    """
+    Runs code in fresh interpreters and collects its timings.
+
+    @param code:    Python source that prints elapsed seconds and number of 
+                    loaded modules.
+    @param runs:    Number of interpreters to start.
+
+    @return:        Median time in milliseconds and number of loaded modules.
+    """
+    times = []
+    for run in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code], 
+            cwd = ROOT)
+        elapsed, modules = output.split()
+        times.append(float(elapsed) * 1000)
+    
+    times.sort()
+    return times[len(times) // 2], int(modules)
+
+def main(runs = 20):
+    """
+    Prints startup timings.
+
+    @keyword runs:    Number of runs per case.
+    """
+    #Make sure compiled modules are up to date before timing
+    measure(WORKER, 1)
+
+    for name, code in [("main.py", MAIN), ("headless worker", WORKER)]:
+        elapsed, modules = measure(code, runs)
+        print "%-16s %8.2f ms %6d modules" % (name, elapsed, modules)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main()
@@ -2,6 +2,7 @@
 
 from place import Place
 from cities.building import Building
+from util.prefix_trie import PrefixTrie
 
 class City(Place):
     """
@@ -79,21 +80,25 @@ class City(Place):
                 
         return buildingDictionary
     
-    def _printBuildings(self):
+    def _printBuildings(self, player):
         """
         Helper method that prints the building contained in city.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         buildings = self.getBuildings()
         
         #If there is one building
         if isinstance(buildings, Building):
-            print "\t%s: %s" % (buildings.getName(), buildings.getDescription())
+            io.output("\t%s: %s" % (buildings.getName(), buildings.getDescription()))
             
         #If there are multiple buildings
         elif isinstance(buildings, list):
             for building in buildings:
-                print "\t%s: %s" % (building.getName(), building.getDescription())
-        print ""
+                io.output("\t%s: %s" % (building.getName(), building.getDescription()))
+        io.output()
         
     def enter(self, player):
         """
@@ -101,37 +106,41 @@ class City(Place):
 
         @param player:       The current player.
         """
+        io = player.getIo()
+
         buildingDictionary = self._createDictionaryOfBuildings()
+        buildingNames = PrefixTrie(buildingDictionary)
 
-        print "Entering %s!" % self.getName()
-        print "%s" % self.getDescription()
-        print "%s" % self.getGreetings()
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Entering %s!" % self.getName())
+        io.output("%s" % self.getDescription())
+        io.output("%s" % self.getGreetings())
+        io.pause()
+        io.output()
         
         while True:
-            print "You have found the following:"
+            io.output("You have found the following:")
             
             #Print list of buildings
-            self._printBuildings()
+            self._printBuildings(player)
             
-            print "To go to a building type its name. Otherwise, type 'leave.'"
-            command = raw_input("Where would you like to go?\n")
+            io.output("To go to a building type its name. Otherwise, type 'leave.'")
+            command = io.input("Where would you like to go?\n")
             
             #If player chooses to leave the city
             if command == 'leave':
-                print ""
-                print "Leaving %s." % self.getName()
+                io.output()
+                io.output("Leaving %s." % self.getName())
                 return
                 
-            #For other choices
-            if command in buildingDictionary.keys():
+            #For other choices, which may be shortened
+            command = buildingNames.resolve(command) or command
+            if command in buildingDictionary:
             
                 #Enter building
                 buildingDictionary[command].enter(player)
                 
                 #Prompt for next action
-                print "\nYou are now back in %s." % self.getName()
-                print ""
+                io.output("\nYou are now back in %s." % self.getName())
+                io.output()
             else:
-                print "\nI did not recognize %s. Try again.\n" % command
\ No newline at end of file
+                io.output("\nI did not recognize %s. Try again.\n" % command)
\ No newline at end of file
@@ -28,21 +28,23 @@ class Inn(Building):
         
         @param player:     The player object.
         """
+        io = player.getIo()
+
         cost = self.getCost()
 
-        print ""
-        print "- - - %s - - -" % self.getName()
-        print "\"%s\"" % self._greetings
-        print "Cost to stay: %s." % cost
-        raw_input("Press enter to continue. ")
+        io.output()
+        io.output("- - - %s - - -" % self.getName())
+        io.output("\"%s\"" % self._greetings)
+        io.output("Cost to stay: %s." % cost)
+        io.pause()
 
         #Determine player choice
         choice = None
         while choice != "no":
-            print ""
-            choice = raw_input("\"Would you like to stay for the night?\"" 
+            io.output()
+            choice = io.input("\"Would you like to stay for the night?\"" 
             " \nResponse: \"yes\" or \"no.\" ")
-            print ""
+            io.output()
             
             #User chooses to heal
             if choice == "yes":
@@ -51,24 +53,24 @@ class Inn(Building):
                     player.decreaseMoney(cost)
                     #Heal player
                     self._heal(player)
-                    print "%s was healed at %s cost! %s has %s %s remaining." \
+                    io.output("%s was healed at %s cost! %s has %s %s remaining."
                           % (player.getName(), cost, player.getName(), 
-                          player.getMoney(), constants.CURRENCY)
+                          player.getMoney(), constants.CURRENCY))
                 #If player does not have enough money
                 else:
-                    print "%s doesn't have enough money." % player.getName()
-                raw_input("Press enter to continue. ")
+                    io.output("%s doesn't have enough money." % player.getName())
+                io.pause()
                 return
                 
             #User chooses not to heal
             elif choice == "no":
-                print "\"Thanks for coming to %s.\"" % self._name
-                raw_input("Press enter to continue. ")
+                io.output("\"Thanks for coming to %s.\"" % self._name)
+                io.pause()
                 
             #User inputs something invalid
             else:
-                print "\"What?\""
-                raw_input("Press enter to continue. ")
+                io.output("\"What?\"")
+                io.pause()
     
     def getCost(self):
         """
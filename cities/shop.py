@@ -1,5 +1,7 @@
 #!/usr/bin/python
 
+import random
+
 from cities.building import Building
 import factories.shop_factory
 from items.item import Item
@@ -8,7 +10,6 @@ from items.armor import Armor
 from items.potion import Potion
 from items.charm import Charm
 from items.unique_items import theOneRing
-from util.helpers import sortItems
 import constants
 
 class Shop(Building):
@@ -38,11 +39,17 @@ class Shop(Building):
         self._numItems = numItems
         self._quality = quality
         
-        self._items = factories.shop_factory.getItems(region, numItems, 
-            quality)
-        
-        #Sort items
-        sortItems(self._items)
+        self.restock()
+
+    def restock(self, random = random):
+        """
+        Replaces the shop's stock with a freshly generated selection of items.
+
+        @keyword random:    (Optional) The random.Random to draw from. 
+                            Defaults to the random module.
+        """
+        self._items = factories.shop_factory.getItems(self._region, 
+            self._numItems, self._quality, random)
     
     def enter(self, player):
         """
@@ -50,63 +57,68 @@ class Shop(Building):
         
         @param player:    The player object.
         """
-        print ""
-        print "- - - %s - - -" % self._name
-        print "\"%s\"" % self._greetings
+        io = player.getIo()
+
+        io.output()
+        io.output("- - - %s - - -" % self._name)
+        io.output("\"%s\"" % self._greetings)
 
         #Determine and carry out player choice
         choice = None
         while choice != "quit":
-            print \
-"""
+            io.output("""
 What is your choice?
 \tCheck items             - 'check'
 \tCheck item stats        - 'check stats'
 \tSell item in inventory  - 'sell'
 \tPurchase item           - 'purchase'
 \tQuit                    - 'quit'
-"""
-            choice = raw_input("\"What do you want to do?\" ")
-            print ""
+""")
+            choice = io.input("\"What do you want to do?\" ")
+            io.output()
             
             if choice == "check":
-                self.checkItems()
+                self.checkItems(player)
             elif choice == "check stats":
-                self.checkItemsStats()
+                self.checkItemsStats(player)
             elif choice == "sell":
                 self.sellItems(player)
             elif choice == "purchase":
                 self.buyItems(player)
             elif choice == "quit":
-                self.leaveShop()
+                self.leaveShop(player)
                 break
             else:
-                print "\"What?\""
+                io.output("\"What?\"")
                 
-            print ""
-            raw_input("Press enter to continue. ")
+            io.output()
+            io.pause()
             
     #Gives basic descriptions of items
-    def checkItems(self):
+    def checkItems(self, player):
         """
         Lists shop items in brief.
+        
+        @param player:   The current player.
         """
-        print "Here are our wares:"
+        io = player.getIo()
+
+        io.output("Here are our wares:")
         for item in self._items:
-            print "\t%s: %s." % (item.getName(), item.getDescription())
+            io.output("\t%s: %s." % (item.getName(), item.getDescription()))
             if isinstance(item, Weapon):
-                print "\t\tAttack: %s" % item.getAttack()
+                io.output("\t\tAttack: %s" % item.getAttack())
             elif isinstance(item, Armor):
-                print "\t\tDefense: %s" % item.getDefense()
+                io.output("\t\tDefense: %s" % item.getDefense())
             elif isinstance(item, Charm):
                 if item.getAttack():
-                    print "\t\tAttack: %s" % item.getAttack()
+                    io.output("\t\tAttack: %s" % item.getAttack())
                 if item.getDefense():
-                    print "\t\tDefense: %s" % item.getDefense()
+                    io.output("\t\tDefense: %s" % item.getDefense())
                 if item.getHp():
-                    print "\t\tHP Bonus: %s" % item.getHp()
+                    io.output("\t\tHP Bonus: %s" % item.getHp())
             elif isinstance(item, Potion):
-                print "\t\tHealing: %s" % item.getHealing()
+                io.output("\t\tHealing: %s" % item.getHealing())
             elif isinstance(item, Item):
                 pass
             else:
@@ -114,10 +126,14 @@ What is your choice?
                 raise AssertionError(errorMsg)
                 
     #Gives advanced descriptions of items 
-    def checkItemsStats(self):
+    def checkItemsStats(self, player):
         """
         Lists shop items in detail.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         #Generate list of items without duplicates
         uniqueItems = []
         for item in self._items:
@@ -125,33 +141,33 @@ What is your choice?
                 uniqueItems.append(item)
                 
         #Print stats
-        print "Item stats:"
+        io.output("Item stats:")
         for item in uniqueItems:
-            print "\t%s: %s." % (item.getName(), item.getDescription())
+            io.output("\t%s: %s." % (item.getName(), item.getDescription()))
             if isinstance(item, Weapon):
-                print "\t\t-Attack: %s" % item.getAttack()
-                print "\t\t-Weight: %s" % item.getWeight()
-                print "\t\t-Cost: %s" % item.getCost()
+                io.output("\t\t-Attack: %s" % item.getAttack())
+                io.output("\t\t-Weight: %s" % item.getWeight())
+                io.output("\t\t-Cost: %s" % item.getCost())
             elif isinstance(item, Armor):
-                print "\t\t-Defense: %s" % item.getDefense()
-                print "\t\t-Weight: %s" % item.getWeight()
-                print "\t\t-Cost: %s" % item.getCost()
+                io.output("\t\t-Defense: %s" % item.getDefense())
+                io.output("\t\t-Weight: %s" % item.getWeight())
+                io.output("\t\t-Cost: %s" % item.getCost())
             elif isinstance(item, Charm):
                 if item.getAttack():
-                    print "\t\t-Attack: %s" % item.getAttack()
+                    io.output("\t\t-Attack: %s" % item.getAttack())
                 if item.getDefense():
-                    print "\t\t-Defense: %s" % item.getDefense()
+                    io.output("\t\t-Defense: %s" % item.getDefense())
                 if item.getHp():
-                    print "\t\t-HP Bonus: %s" % item.getHp()
-                print "\t\t-Weight: %s" % item.getWeight()
-                print "\t\t-Cost: %s" % item.getCost()
+                    io.output("\t\t-HP Bonus: %s" % item.getHp())
+                io.output("\t\t-Weight: %s" % item.getWeight())
+                io.output("\t\t-Cost: %s" % item.getCost())
             elif isinstance(item, Potion):
-                print "\t\t-Healing: %s" % item.getHealing()
-                print "\t\t-Weight: %s" % item.getWeight()
-                print "\t\t-Cost: %s" % item.getCost()
+                io.output("\t\t-Healing: %s" % item.getHealing())
+                io.output("\t\t-Weight: %s" % item.getWeight())
+                io.output("\t\t-Cost: %s" % item.getCost())
             elif isinstance(item, Item):
-                print "\t\t-Weight: %s" % item.getWeight()
-                print "\t\t-Cost: %s" % item.getCost()
+                io.output("\t\t-Weight: %s" % item.getWeight())
+                io.output("\t\t-Cost: %s" % item.getCost())
             else:
                 errorMsg = "Invalid item - Shop, checkItemsStats()"
                 raise AssertionError(errorMsg)
@@ -167,17 +183,20 @@ What is your choice?
         
         @param player:    The player object.
         """
+        io = player.getIo()
+
         inventory = player.getInventory()
         itemValues = {}
         
         #User prompt
-        print "Current inventory:"
+        io.output("Current inventory:")
         for item in player.getInventory():
             sellValue = constants.SELL_LOSS_PERCENTAGE * item.getCost()
             itemValues[item] = sellValue
-            print "\t%s... with sell value: %s %s." % (item.getName(), 
-            sellValue, constants.CURRENCY)
-        itemToSell = raw_input("\nWhich item would you like to sell? ")
+            io.output("\t%s... with sell value: %s %s." % (item.getName(), 
+            sellValue, constants.CURRENCY))
+        itemToSell = io.input("\nWhich item would you like to sell? ")
+        itemToSell = inventory.getNameTrie().resolve(itemToSell) or itemToSell
         
         #Find if item exists in inventory
         for item in inventory:
@@ -185,7 +204,7 @@ What is your choice?
                 sellValue = itemValues[item]
                 
                 #Is user sure?
-                choice = raw_input("Would you like to sell %s for %s %s?"
+                choice = io.input("Would you like to sell %s for %s %s?"
                 " Response: yes/no. " % (item.getName(), sellValue, 
                 constants.CURRENCY))
                 
@@ -194,21 +213,21 @@ What is your choice?
                     player.removeFromInventory(item)
                     player.increaseMoney(sellValue)
                     self._items.addItem(item)
-                    print "Sold %s for %s." % (item.getName(), sellValue)
+                    io.output("Sold %s for %s." % (item.getName(), sellValue))
                     
                     #Special sequence for theOneRing
                     result = self._checkTheOneRingSale(item)
                     if result:
-                        print "\nSome strange men come by."
+                        io.output("\nSome strange men come by.")
                         self._items.removeItem(item)
                 
                 #User changes mind
                 elif choice.lower() == "no":
-                    print "Didn't sell item."
+                    io.output("Didn't sell item.")
                 
                 #Invalid choice
                 else:
-                    print "Invalid choice."
+                    io.output("Invalid choice.")
                 break
                     
     #Checks if sold item was theOneRing
@@ -235,15 +254,19 @@ What is your choice?
         
         @param player:     The player object.
         """
+        io = player.getIo()
+
         #User prompt
-        print "Items available for purchase:"
+        io.output("Items available for purchase:")
         for item in self._items:
-            print "\t%s... with cost of %s." % (item.getName(), item.getCost())
-        print ""
-        print "%s has %s %s with which to spend." % (player.getName(), 
-        player.getMoney(), constants.CURRENCY)
-        print ""
-        itemToPurchase = raw_input("Which item would you like to purchase? ")
+            io.output("\t%s... with cost of %s." % (item.getName(), item.getCost()))
+        io.output()
+        io.output("%s has %s %s with which to spend." % (player.getName(), 
+        player.getMoney(), constants.CURRENCY))
+        io.output()
+        itemToPurchase = io.input("Which item would you like to purchase? ")
+        itemToPurchase = (self._items.getNameTrie().resolve(itemToPurchase) 
+            or itemToPurchase)
         
         #Check to find object associated with user-given string
         for item in self._items:
@@ -251,21 +274,23 @@ What is your choice?
             
                 #Check to see if player has enough money to purchase item
                 if player.getMoney() <= item.getCost():
-                    print "Not enough money to purchase item."
+                    io.output("Not enough money to purchase item.")
                     return
-                print ""
+                io.output()
                 
                 #Actual purchase execution
                 if not player.addToInventory(item):
                     return
                 self._items.removeItem(item)
                 player.decreaseMoney(item.getCost())
-                print "%s puchased %s!" % (player.getName(), item.getName())
+                io.output("%s puchased %s!" % (player.getName(), item.getName()))
                 break
         else:
-            print "Can't purchase this item."
+            io.output("Can't purchase this item.")
 
     #To leave shop
-    def leaveShop(self):
-        print "\"Have a good day.\""
-        raw_input("Press enter to continue. ")
\ No newline at end of file
+    def leaveShop(self, player):
+        io = player.getIo()
+
+        io.output("\"Have a good day.\"")
+        io.pause()
\ No newline at end of file
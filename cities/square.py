@@ -2,6 +2,7 @@
 
 from cities.building import Building
 from items.item import Item
+from util.prefix_trie import PrefixTrie
 
 class Square(Building):
     """
@@ -23,12 +24,21 @@ class Square(Building):
         @param talk:           A dictionary of names-responses used for 
                                dialogue.
         @param items:          A dictionary of names-items that serve as 
-                               bonuses for dialoguing with people.
+                               bonuses for dialoguing with people. Entries 
+                               may be a single item or a list or tuple of 
+                               items. The square keeps its own copy.
         """
         Building.__init__(self, name, description, greetings)
 
         self._talk = talk
-        self._items = items
+        
+        #Copy gifts since they are removed as they are given away
+        self._items = {}
+        if items:
+            for person, gift in items.items():
+                if isinstance(gift, (list, tuple)):
+                    gift = list(gift)
+                self._items[person] = gift
         
     def enter(self, player):
         """
@@ -36,52 +46,57 @@ class Square(Building):
         
         @param player:     The player object.
         """
-        print ""
-        print "- - - %s - - -" % self._name
-        print "\"%s\"" % self._greetings
-        print ""
+        io = player.getIo()
+
+        io.output()
+        io.output("- - - %s - - -" % self._name)
+        io.output("\"%s\"" % self._greetings)
+        io.output()
 
         #If square is empty
         if self._talk == None:
-            print "You find %s completely deserted." % self._name
+            io.output("You find %s completely deserted." % self._name)
             return
 
         #User prompt
         numPeople = len(self._talk)
+        people = PrefixTrie(self._talk)
         
         choice = None
         while choice != "quit":
-            print "There are %s people to talk to in %s:" % (numPeople, 
-            self._name)
+            io.output("There are %s people to talk to in %s:" % (numPeople, 
+            self._name))
             for person in self._talk:
-                print "\t %s" % person
+                io.output("\t %s" % person)
 
             prompt = "\nWhom would you like to talk to (\"quit\" to quit)? "
-            choice = raw_input(prompt)
+            choice = io.input(prompt)
+            if choice != "quit":
+                choice = people.resolve(choice) or choice
 
             #The option to leave
             if choice == "quit":
-                print "Leaving %s." % self._name
+                io.output("Leaving %s." % self._name)
 
             #If person exists
             elif choice in self._talk:
-                print ""
-                print "\"%s\"" %  self._talk[choice]
+                io.output()
+                io.output("\"%s\"" %  self._talk[choice])
 
                 #If target person has items
                 if choice in self._items:
-                    print ""
+                    io.output()
                     gift = self._items[choice]
                     self._giveItem(player, choice)
                     
             #If person doesn't exist
             else:
-                print ""
-                print "Alas, '%s' could not be found in %s." % (choice, 
-                self._name)
+                io.output()
+                io.output("Alas, '%s' could not be found in %s." % (choice, 
+                self._name))
      
-            raw_input("\nPress enter to continue. ")
-            print ""
+            io.pause("\nPress enter to continue. ")
+            io.output()
             
     def _giveItem(self, player, choice):
         """
@@ -90,12 +105,14 @@ class Square(Building):
         @param player:  The player object.
         @param choice:  The person that the user has chosen to talk to.
         """
+        io = player.getIo()
+
         gift = self._items[choice]
         
         #If entry is single item
         if isinstance(gift, Item):
-            print "%s gave %s to %s." % (choice, gift.getName(),
-                player.getName())
+            io.output("%s gave %s to %s." % (choice, gift.getName(),
+                player.getName()))
             if player.addToInventory(gift):
                 del self._items[choice]
             
@@ -103,8 +120,8 @@ class Square(Building):
         elif isinstance(gift, list):
             successfulItems = []
             for item in gift:
-                print "%s gave %s to %s." %(choice, item.getName(),
-                     player.getName())
+                io.output("%s gave %s to %s." %(choice, item.getName(),
+                     player.getName()))
                 if player.addToInventory(item):
                     successfulItems.append(item)
                     
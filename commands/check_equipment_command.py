@@ -26,37 +26,39 @@ class CheckEquipmentCommand(Command):
         """
         Equips player with item in inventory.
         """
+        io = self._player.getIo()
+
         playerName = self._player.getName()
         equipment = self._player.getEquipped()
         
         #Prints currently equipped items
-        print "%s's currently equipped items:\n" % playerName
+        io.output("%s's currently equipped items:\n" % playerName)
         
         for item in equipment:
             itemName = item.getName()
             if isinstance(item, Weapon):
                 attack = item.getAttack()
-                print "\tWeapon: %s." % itemName
-                print "\t%s yields a %s attack bonus." % (itemName, attack)
+                io.output("\tWeapon: %s." % itemName)
+                io.output("\t%s yields a %s attack bonus." % (itemName, attack))
             elif isinstance(item, Armor):
                 defense = item.getDefense()
-                print "\tArmor: %s." % itemName
-                print "\t%s yields a %s defense bonus." % (itemName, defense)
+                io.output("\tArmor: %s." % itemName)
+                io.output("\t%s yields a %s defense bonus." % (itemName, defense))
             elif isinstance(item, Charm):
                 attack = item.getAttack()
                 defense = item.getDefense()
                 hp = item.getHp()
-                print "\tCharm: %s:" % itemName
+                io.output("\tCharm: %s:" % itemName)
                 if item.getAttack():
-                    print "\t%s yields a %s attack bonus." % (itemName, 
-                    attack)
+                    io.output("\t%s yields a %s attack bonus." % (itemName, 
+                    attack))
                 if item.getDefense():
-                    print "\t%s yields a %s defense bonus." % (itemName, 
-                    defense)
+                    io.output("\t%s yields a %s defense bonus." % (itemName, 
+                    defense))
                 if item.getHp():
-                    print "\t%s yields a %s HP bonus." % (itemName, hp)
+                    io.output("\t%s yields a %s HP bonus." % (itemName, hp))
             else:
                 errorMsg = ("CheckEquipmentCommand command given invalid item" 
                 " type.")
                 raise AssertionError(errorMsg)
-            print ""
\ No newline at end of file
+            io.output()
\ No newline at end of file
@@ -28,13 +28,15 @@ class CheckInventoryCommand(Command):
         """
         Displays character inventory.
         """
+        io = self._player.getIo()
+
         #Get basic player information
         playerName = self._player.getName()
         inventory = self._player.getInventory()
         inventoryList = inventory.getItems()
 
         #Cycle through player's inventory, obtaining item stats
-        print "%s's inventory:\n" % playerName
+        io.output("%s's inventory:\n" % playerName)
         for item in inventoryList:
             itemName = item.getName()
             itemDescription = item.getDescription()
@@ -58,17 +60,17 @@ class CheckInventoryCommand(Command):
                 raise AssertionError(errorMsg)
 
             #Print stats of given item in inventory
-            print "\t%s: %s." % (itemName, itemDescription)
+            io.output("\t%s: %s." % (itemName, itemDescription))
 
             if isinstance(item, Armor):
-                print "\t%s has a defense of %s." % (itemName, itemDefense)
+                io.output("\t%s has a defense of %s." % (itemName, itemDefense))
             elif isinstance(item, Weapon):
-                print "\t%s has an attack value of %s." % (itemName, 
-                    itemAttack)
+                io.output("\t%s has an attack value of %s." % (itemName, 
+                    itemAttack))
             elif isinstance(item, Potion):
-                print "\t%s has a healing value of %s." % (itemName, itemHeal)
+                io.output("\t%s has a healing value of %s." % (itemName, itemHeal))
             elif isinstance(item, Charm):
-                print ("\t%s has an attack bonus of %s, a defense bonus of %s," 
+                io.output("\t%s has an attack bonus of %s, a defense bonus of %s," 
                     " and a HP bonus of %s." % (itemName, itemAttack, 
                     itemDefense, itemHp))
             elif isinstance(item, Item):
@@ -77,8 +79,8 @@ class CheckInventoryCommand(Command):
                 errorMsg = "CheckInventoryCommand given invalid item type."
                 raise AssertionError(errorMsg)
             
-            print "\t%s weighs %s and costs %s." % (itemName, itemWeight, 
-                itemCost)
-            print ""
+            io.output("\t%s weighs %s and costs %s." % (itemName, itemWeight, 
+                itemCost))
+            io.output()
 
-        print "\tTotal weight of inventory: %s." % inventory.getWeight()
\ No newline at end of file
+        io.output("\tTotal weight of inventory: %s." % inventory.getWeight())
\ No newline at end of file
@@ -24,7 +24,9 @@ class CheckMoneyCommand(Command):
         """
         Prints player money.
         """
+        io = self._player.getIo()
+
         money = self._player.getMoney()
         name = self._player.getName()
 
-        print "%s currently has %s %s!" % (name, money, constants.CURRENCY)
\ No newline at end of file
+        io.output("%s currently has %s %s!" % (name, money, constants.CURRENCY))
\ No newline at end of file
@@ -1,9 +1,7 @@
 #!/usr/bin/python
 
 from command import Command
-from items.weapon import Weapon
-from items.armor import Armor
-from items.charm import Charm
+from constants import ItemType
 
 class CheckStatsCommand(Command):
     """
@@ -26,6 +24,8 @@ class CheckStatsCommand(Command):
         """
         Displays player stats.
         """
+        io = self._player.getIo()
+
         #Get player stats
         name = self._player.getName()
         experience = self._player.getExperience()
@@ -46,49 +46,40 @@ class CheckStatsCommand(Command):
         charmDefense = self._player.getCharmDefense()
         totalDefense = self._player.getTotalDefense()
 
-        #Create defaults - for determining of weapon and armor exist
-        weapon = None
-        armor = None
-        charm = None
-        
         #Get equipment bonuses
         equipment = self._player.getEquipped()
-        equipmentList = equipment.getItems()
-        for item in equipmentList:
-            if isinstance(item, Weapon):
-                weaponsAttack = item.getAttack()
-                weapon = True
-            if isinstance(item, Armor):
-                armorDefense = item.getDefense()
-                armor = True
+        weapon = equipment.getItemInSlot(ItemType.WEAPON)
+        armor = equipment.getItemInSlot(ItemType.ARMOR)
+        weaponsAttack = equipment.getWeaponAttack()
+        armorDefense = equipment.getArmorDefense()
 
         #Print player stats
-        print "%s's stats: \n" % name
-        print "\t%s is level %s and has %s experience." % (name, level, 
-        experience)
-        print "\t%s's HP: %s/%s." % (name, hp, totalMaxHp)
-        print "\t%s gets a %s HP bonus from charms." % (name, charmHp)
-        print ""
+        io.output("%s's stats: \n" % name)
+        io.output("\t%s is level %s and has %s experience." % (name, level, 
+        experience))
+        io.output("\t%s's HP: %s/%s." % (name, hp, totalMaxHp))
+        io.output("\t%s gets a %s HP bonus from charms." % (name, charmHp))
+        io.output()
         
         #For attack
-        print "\tCharacter-based attack is %s." % attack
+        io.output("\tCharacter-based attack is %s." % attack)
         if weapon:
-            print ("\tWeapons bonus is %s and charm bonus is %s." 
+            io.output("\tWeapons bonus is %s and charm bonus is %s." 
             % (weaponsAttack, charmAttack))
-            print "\tTotal attack is %s." % totalAttack
+            io.output("\tTotal attack is %s." % totalAttack)
         else:
-            print "\tWeapon: [Unequipped]."
-        print ""
+            io.output("\tWeapon: [Unequipped].")
+        io.output()
         
         #For defense
         if armor:
-            print "\tArmor-based defense is %s." % armorDefense
-            print "\tCharm-based defense is %s." % charmDefense
-            print "\tTotal defense is %s." % totalDefense
+            io.output("\tArmor-based defense is %s." % armorDefense)
+            io.output("\tCharm-based defense is %s." % charmDefense)
+            io.output("\tTotal defense is %s." % totalDefense)
         else:
-            print "\tArmor:  [Unequipped]" 
-        print ""
+            io.output("\tArmor:  [Unequipped]") 
+        io.output()
         
         #Player weight limit
-        print "\tPlayer weight limit is %s." % weightLimit
-        print ""
\ No newline at end of file
+        io.output("\tPlayer weight limit is %s." % weightLimit)
+        io.output()
\ No newline at end of file
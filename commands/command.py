@@ -1,21 +1,29 @@
 #!/usr/bin/python
 
+from util.prefix_trie import PrefixTrie
+
 class Command(object):
     """
     Parent class for all Command objects.
     """
-    def __init__(self, name, explanation, time = False):
+    def __init__(self, name, explanation, time = False, 
+        takesArgument = False):
         """
         Initializes new command object.
 
-        @param name:          Command name.
-        @param explanation:   Explanation of command.
-        @param time:          True if time passes with command.
-                              False otherwise.
+        @param name:           Command name.
+        @param explanation:    Explanation of command.
+        @param time:           True if time passes with command.
+                               False otherwise.
+        @keyword takesArgument: (Optional) True if command may be given an
+                               argument on the command line, such as the
+                               item in "equip Sting". False by default.
         """
         self._name = name
         self._explanation = explanation
         self._time = time
+        self._takesArgument = takesArgument
+        self._argument = None
 
     def getName(self):
         """
@@ -43,6 +51,73 @@ class Command(object):
         """
         return self._time
 
+    def takesArgument(self):
+        """
+        Returns whether command may be given an argument.
+
+        @return:   True if command takes an argument, False otherwise.
+        """
+        return self._takesArgument
+
+    def setArgument(self, argument):
+        """
+        Sets the argument given with the command on the command line. The
+        next execution answers its prompt with the argument instead of asking
+        the user.
+
+        @param argument:    The argument, or None.
+        """
+        self._argument = argument
+
+    def getArgumentNames(self):
+        """
+        Returns the names that the command's argument may currently take, 
+        used to complete arguments as they are typed.
+
+        Commands that take an argument from a known set of names should
+        override this method.
+
+        @return:   PrefixTrie of names, or None if the command does not 
+                   complete its argument.
+        """
+        return None
+
+    def _takeArgument(self):
+        """
+        Helper method that returns the command's argument and clears it, so
+        that it is only used once.
+
+        @return:            The argument, or None.
+        """
+        argument = self._argument
+        self._argument = None
+
+        return argument
+
+    def _getResponse(self, io, prompt, names = ()):
+        """
+        Helper method that returns the command's argument, if it was given 
+        one, and asks the user otherwise. The argument is only used once. An 
+        argument that matches one of names in a different case, or that only
+        one of names starts with, is replaced with that name.
+
+        @param io:          The GameIO object through which the user is 
+                            prompted.
+        @param prompt:      The prompt displayed to the user.
+        @keyword names:     (Optional) The names the user may choose from, as
+                            a list or a PrefixTrie.
+
+        @return:            The argument or the user's response.
+        """
+        argument = self._takeArgument()
+        if argument is None:
+            return io.input(prompt)
+
+        if not isinstance(names, PrefixTrie):
+            names = PrefixTrie(names)
+
+        return names.resolve(argument) or argument
+
     def execute(self):
         """
         Default execute method. By default,
@@ -1,14 +1,20 @@
 #!/usr/bin/python
 
+from util.prefix_trie import PrefixTrie
+
 class CommandWords(object):
     """
     Dictionary of all Command objects used in the game.
+
+    Command names are also indexed by prefix, so that commands may be 
+    abbreviated and completed.
     """
     def __init__(self):
         """
         Initializes new dictionary of commands.
         """
         self._commandWords = {}
+        self._nameTrie = PrefixTrie()
 
     def addCommand(self, name, command):
         """
@@ -27,6 +33,7 @@ class CommandWords(object):
 
         #Add command
         self._commandWords[name] = command
+        self._nameTrie.add(name)
 
     def getCommand(self, name):
         """
@@ -67,6 +74,27 @@ class CommandWords(object):
             " recognized." % name)
             raise AssertionError(errorMsg)
         del self._commandWords[name]
+        self._nameTrie.remove(name)
+
+    def resolveCommand(self, prefix):
+        """
+        Finds the command name that a prefix stands for: the name itself, or 
+        the only name that starts with it.
+
+        @param prefix:  Command name or the start of one, in any case.
+        @return:        Command name, or None if no command or several 
+                        commands start with prefix.
+        """
+        return self._nameTrie.resolve(prefix)
+
+    def getCompletions(self, prefix):
+        """
+        Returns the command names that start with a prefix.
+
+        @param prefix:  The start of a command name, in any case.
+        @return:        Sorted list of command names.
+        """
+        return self._nameTrie.getCompletions(prefix)
 
     def isCommand(self, name):
         """
@@ -77,5 +105,5 @@ class CommandWords(object):
         @return:        True if command has been defined,
                         False otherwise.
         """
-        exists = name in self._commandWords.keys()
-        return exists
\ No newline at end of file
+        exists = name in self._commandWords
+        return exists
@@ -27,6 +27,8 @@ class DescribeCommand(Command):
         """
         Command execution.
         """
+        io = self._player.getIo()
+
         #Create variables
         location = self._player.getLocation()
         locationName = location.getName()
@@ -37,42 +39,42 @@ class DescribeCommand(Command):
         uniquePlace = location.getUniquePlace()
         
         #Print space name and description
-        print "%s: %s" % (locationName, locationDescription)
+        io.output("%s: %s" % (locationName, locationDescription))
 
         #If there are no cities or uniquePlaces in space
         if not city and not uniquePlace:
-            print "%s has no places for you to enter." % locationName
+            io.output("%s has no places for you to enter." % locationName)
 
         #If there is at least one city or uniquePlace
         else:
-            print "\nThe following are contained in %s:\n" % locationName
+            io.output("\nThe following are contained in %s:\n" % locationName)
             
             #If space has one city:
             if isinstance(city, City):
                 cityName = city.getName()
-                print "%s:\n%s" % (cityName, city.getDescription())
+                io.output("%s:\n%s" % (cityName, city.getDescription()))
             
             #If space has multiple cities:
             elif isinstance(city, list):
                 for eachCity in city:
                     eachCityName = eachCity.getName()
-                    print "%s:\n%s" % (eachCityName, eachCity.getDescription())
+                    io.output("%s:\n%s" % (eachCityName, eachCity.getDescription()))
 
             #If space has one uniquePlace object
             if isinstance(uniquePlace, UniquePlace):
                 uniquePlaceName = uniquePlace.getName() 
-                print "%s:\n%s" % (uniquePlaceName, 
-                uniquePlace.getDescription())
+                io.output("%s:\n%s" % (uniquePlaceName, 
+                uniquePlace.getDescription()))
             
             #If space has multiple uniquePlaces
             if isinstance(uniquePlace, list):
                 for eachUniquePlace in uniquePlace:
                     eachUniquePlaceName = eachUniquePlace.getName()
-                    print "%s:\n%s" % (eachUniquePlaceName, 
-                    eachUniquePlace.getDescription())
+                    io.output("%s:\n%s" % (eachUniquePlaceName, 
+                    eachUniquePlace.getDescription()))
         
         #If space has items
         if len(itemsList) > 0:
-            print "The following items are in %s:" % locationName
+            io.output("The following items are in %s:" % locationName)
             for item in itemsList:
-                print "\t-%s." % item.getName()
\ No newline at end of file
+                io.output("\t-%s." % item.getName())
\ No newline at end of file
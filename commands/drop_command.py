@@ -15,25 +15,37 @@ class DropCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation)
+        Command.__init__(self, name, explanation, takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the items in inventory.
+
+        @return:    PrefixTrie of item names.
+        """
+        return self._player.getInventory().getNameTrie()
+
     def execute(self):
         """
         Drops an item from inventory into space.
         """
+        io = self._player.getIo()
+
         name = self._player.getName()
         inventory = self._player.getInventory()
         
         #Display inventory contents
-        print "The following may be dropped by %s:" % name
+        io.output("The following may be dropped by %s:" % name)
         for item in inventory:
-            print "\t%s" % item.getName()
-        print ""
+            io.output("\t%s" % item.getName())
+        io.output()
         
-        itemToRemove = raw_input("Which item do you want to drop? \n")
-        print ""
+        itemToRemove = self._getResponse(io, 
+            "Which item do you want to drop? \n", 
+            inventory.getNameTrie())
+        io.output()
         
         #Create references
         equipped = self._player.getEquipped()
@@ -41,11 +53,11 @@ class DropCommand(Command):
 
         #Check if item is in inventory
         if not item:
-            print "%s is not in your inventory!" % itemToRemove
+            io.output("%s is not in your inventory!" % itemToRemove)
             return
 
-        print "Dropping %s" % itemToRemove
-        print "Unequipping %s" % itemToRemove
+        io.output("Dropping %s" % itemToRemove)
+        io.output("Unequipping %s" % itemToRemove)
         
         inventory.removeItem(item)
         
@@ -55,4 +67,5 @@ class DropCommand(Command):
         
         #Add item to space
         location = self._player.getLocation()
-        location.addItem(item)
\ No newline at end of file
+        if not location.addItem(item):
+            io.output("\nYou see some strange men walk by.")
\ No newline at end of file
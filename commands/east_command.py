@@ -1,6 +1,8 @@
 #!/usr/bin/python
 
 from command import Command
+from constants import Direction
+from util.prefix_trie import PrefixTrie
 
 class EastCommand(Command):
     """
@@ -15,32 +17,45 @@ class EastCommand(Command):
         @param player:          Reference to command.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation, time = True)
+        Command.__init__(self, name, explanation, time = True, 
+            takesArgument = True)
 
         self._player = player
         
+    def getArgumentNames(self):
+        """
+        Returns the names of the spaces to the East.
+
+        @return:    PrefixTrie of space names.
+        """
+        location = self._player.getLocation()
+        return PrefixTrie(space.getName() for space in 
+            location.getExitList(Direction.EAST))
+
     def execute(self):
         """
         Run east command.
         """
+        io = self._player.getIo()
+
         #Make sure that exit exists
         if not self._player.canMoveEast():
-            print "Cannot move East."
+            io.output("Cannot move East.")
             return
 
         #User graphic
-        print "--------------------------------"
-        print "         Moving East"
-        print "      ----------------->        "
-        print ""
-        print "--------------------------------"
+        io.output("--------------------------------")
+        io.output("         Moving East")
+        io.output("      ----------------->        ")
+        io.output()
+        io.output("--------------------------------")
         
         #Actual move execution and user output
-        self._player.moveEast()
+        self._player.moveEast(self._takeArgument())
 
         space = self._player.getLocation()
         name = space.getName()
         description = space.getDescription()
         
-        print "Welcome to %s." % name 
-        print description
\ No newline at end of file
+        io.output("Welcome to %s." % name) 
+        io.output(description)
\ No newline at end of file
@@ -3,11 +3,10 @@
 from command import Command
 from cities.city import City
 from unique_place import UniquePlace
+from util.prefix_trie import PrefixTrie
 import battle_engine
 import constants
 
-import random
-
 class EnterCommand(Command):
     """
     Allows player to enter a city or unique place.
@@ -21,7 +20,8 @@ class EnterCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation, time = False)
+        Command.__init__(self, name, explanation, time = False, 
+            takesArgument = True)
 
         self._player = player
     
@@ -30,6 +30,8 @@ class EnterCommand(Command):
         Displays the possible places that player may enter. Places are either
         cities or unique places.
         """
+        io = self._player.getIo()
+
         playerName = self._player.getName()
         space = self._player.getLocation()
         city = space.getCity()
@@ -37,25 +39,35 @@ class EnterCommand(Command):
         
         #If there are no cities or unique places
         if not (city or uniquePlace):
-            print "No place to enter."
+            io.output("No place to enter.")
         
         #Otherwise print the possible places to enter
         else:
-            print "%s may enter the following:" % playerName
+            io.output("%s may enter the following:" % playerName)
             if isinstance(city, City):
-                print "\t-%s" % city.getName()
+                io.output("\t-%s" % city.getName())
             elif isinstance(city, list):
                 for eachCity in city:
-                    print "\t-%s" % eachCity.getName()
+                    io.output("\t-%s" % eachCity.getName())
             
             #Display uniquePlaces that player may enter
             if isinstance(uniquePlace, UniquePlace):
-                print "\t-%s" % uniquePlace.getName()
+                io.output("\t-%s" % uniquePlace.getName())
             elif isinstance(uniquePlace, list):
                 for eachUniquePlace in uniquePlace:
-                    print "\t-%s" % eachUniquePlace.getName()
-            print ""
+                    io.output("\t-%s" % eachUniquePlace.getName())
+            io.output()
         
+    def getArgumentNames(self):
+        """
+        Returns the names of the places that player may enter. The places 
+        are not created or copied for the session, since that draws random
+        numbers.
+
+        @return:    PrefixTrie of place names.
+        """
+        return PrefixTrie(self._player.getLocation().getPlaceNames())
+
     def _createDictionaryOfPlaces(self):
         """
         Creates a dictionary of the places that are within space. Key-value 
@@ -87,6 +99,8 @@ class EnterCommand(Command):
         """
         Allows player to enter a city or uniquePlace.
         """
+        io = self._player.getIo()
+
         #Show the places that player may enter
         self._displayPlacesToEnter()
         
@@ -103,15 +117,21 @@ class EnterCommand(Command):
             return
         
         #Entering the place that the player chooses to enter
-        choice = raw_input("Which of these would you like to enter?\n")
+        fromArgument = self._argument is not None
+        choice = self._getResponse(io, 
+            "Which of these would you like to enter?\n", PrefixTrie(dictionary))
         while (choice not in dictionary.keys()) or choice == "cancel":
             if choice == "cancel":
                 break 
-            print "\n\"Huh?\""
-            print "Try again, or type \"cancel.\"\n"
-            choice = raw_input("Where would you like to enter?\n")
+            #A wrong argument is not asked again
+            if fromArgument:
+                io.output("%s is not here." % choice)
+                break
+            io.output("\n\"Huh?\"")
+            io.output("Try again, or type \"cancel.\"\n")
+            choice = io.input("Where would you like to enter?\n")
         else:
-            print "\n"
+            io.output("\n")
             self._battlePhase()
             dictionary[choice].enter(self._player)
             
@@ -124,7 +144,8 @@ class EnterCommand(Command):
         battleProbability = currentLocation.getBattleProbability()
         
         #Determines if random battle will occur
-        if random.random() < battleProbability:
+        spawn = self._player.getRandom(constants.RandomStream.SPAWN)
+        if spawn.random() < battleProbability:
             #Call on battle to resolve battle
             battle_engine.battle(self._player, 
             constants.BattleEngineContext.RANDOM)
\ No newline at end of file
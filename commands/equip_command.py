@@ -19,41 +19,63 @@ class EquipCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation)
+        Command.__init__(self, name, explanation, takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the items that player may equip.
+
+        @return:    PrefixTrie of item names.
+        """
+        return self._getEquippable().getNameTrie()
+
     def execute(self):
         """
         Equips player with item in inventory.
         """
+        io = self._player.getIo()
+
         #Create variables
         inventory = self._player.getInventory()
-        equipped = self._player.getEquipped()
-        equippable = ItemSet()
-        
-        #Create list of equippable items
-        for item in inventory:
-            if (isinstance(item, Weapon) or isinstance(item, Armor) or 
-            isinstance(item, Charm)) and item not in equipped:
-                equippable.addItem(item)
+        equippable = self._getEquippable()
         
         #If no equippable items
         if equippable.count() == 0:
-            print "No equippable items in inventory."
+            io.output("No equippable items in inventory.")
             return
 
         #User prompt   
-        print "%s may equip:" % self._player.getName()
+        io.output("%s may equip:" % self._player.getName())
         for item in equippable:
-            print "\t%s" % item.getName()
-        print ""
-        itemToEquip = raw_input("Which item do you want to equip? ")
+            io.output("\t%s" % item.getName())
+        io.output()
+        itemToEquip = self._getResponse(io, 
+            "Which item do you want to equip? ", 
+            equippable.getNameTrie())
 
         #Attempt to equip item
         item = inventory.getItemByName(itemToEquip)
         if item:
             statement = self._player.equip(item)
-            print statement
+            io.output(statement)
         else:
-            print "Item not in inventory."
\ No newline at end of file
+            io.output("Item not in inventory.")
+
+    def _getEquippable(self):
+        """
+        Helper method that finds the items in inventory that are not yet
+        equipped and can be.
+
+        @return:    ItemSet of equippable items.
+        """
+        equipped = self._player.getEquipped()
+        equippable = ItemSet()
+        
+        for item in self._player.getInventory():
+            if (isinstance(item, Weapon) or isinstance(item, Armor) or 
+            isinstance(item, Charm)) and item not in equipped:
+                equippable.addItem(item)
+
+        return equippable
@@ -1,32 +1,37 @@
 #!/usr/bin/python
 
 from command import Command
+import constants
 
 class HelpCommand(Command):
     """
     Help command.
     """
-    def __init__(self, name, explanation, commandWords):
+    def __init__(self, name, explanation, commandWords, player):
         """
         Initializes help command.
         
         @param commandWords:        CommandWords used in game.
+        @param player:              The player object.
         """
         #Call parent's init method
         Command.__init__(self, name, explanation)
 
         self._commandWords = commandWords
+        self._player = player
 
     def execute(self):
         """
         Run Help command.
         """
+        io = self._player.getIo()
+
         #Print header
-        print "--------------------------------"
-        print "Lord of the Rings Adventure Game"
-        print "--------------------------------"
-        print "The following commands may be used during the game:"
-        print ""
+        io.output("--------------------------------")
+        io.output("Lord of the Rings Adventure Game")
+        io.output("--------------------------------")
+        io.output("The following commands may be used during the game:")
+        io.output()
         
         #Calculate some variables
         words = self._commandWords
@@ -44,4 +49,10 @@ class HelpCommand(Command):
             command = words.getCommand(name)
             explanation = command.getExplanation()
             whiteSpace = (12 - len(name)) * " "
-            print "%s%s%s" % (name, whiteSpace, explanation)
\ No newline at end of file
+            io.output("%s%s%s" % (name, whiteSpace, explanation))
+        #Print out command line syntax
+        io.output()
+        io.output("Commands that ask for an item, place or destination may be "
+            "given it directly, as in \"equip Sting\" or \"enter Bree\".")
+        io.output("Several commands may be separated with '%s', as in "
+            "\"north; enter Rivendell\"." % constants.COMMAND_SEPARATOR)
@@ -15,29 +15,41 @@ class PickUpCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation)
+        Command.__init__(self, name, explanation, takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the items in player's location.
+
+        @return:    PrefixTrie of item names.
+        """
+        return self._player.getLocation().getItems().getNameTrie()
+
     def execute(self):
         """
         Picks up an item from a room and adds it to inventory.
         """
+        io = self._player.getIo()
+
         name = self._player.getName()
         location = self._player.getLocation()
         locationItems = location.getItems()
 
         #User prompt
-        print "The following may be picked up by %s:" % name
+        io.output("The following may be picked up by %s:" % name)
         for item in locationItems:
-            print "\t%s" % item.getName()
-        print ""
+            io.output("\t%s" % item.getName())
+        io.output()
         
-        itemToAdd = raw_input("Which item do you want to pick up? ")
+        itemToAdd = self._getResponse(io, 
+            "Which item do you want to pick up? ", 
+            locationItems.getNameTrie())
         item = locationItems.getItemByName(itemToAdd)
         
         if not item:
-            print "%s does not contain item." % location.getName()
+            io.output("%s does not contain item." % location.getName())
             return
 
         #Successful execution
@@ -7,24 +7,29 @@ class QuitCommand(Command):
     """
     Quit command.
     """
-    def __init__(self, name, explanation):
+    def __init__(self, name, explanation, player):
         """
         Initializes quit command.
 
         @param name:          The name of the command.
         @param explanation:   Explanation of the Command.
+        @param player:        The player object.
         """
         #Call parent's init method
         Command.__init__(self, name, explanation)
 
+        self._player = player
+
     def execute(self):
         """
         Run Help command.
         """
+        io = self._player.getIo()
+
         #Confirm quit
-        response = raw_input( "Are you sure you want to quit? (yes/no): ")
+        response = io.input( "Are you sure you want to quit? (yes/no): ")
         response = response.strip().lower()
 
         if 'yes' in response:
-            print "Exiting...."
+            io.output("Exiting....")
             exit(0)
\ No newline at end of file
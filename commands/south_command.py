@@ -1,6 +1,8 @@
 #!/usr/bin/python
 
 from command import Command
+from constants import Direction
+from util.prefix_trie import PrefixTrie
 
 class SouthCommand(Command):
     """
@@ -15,33 +17,46 @@ class SouthCommand(Command):
         @param player:          Reference to command.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation, time = True)
+        Command.__init__(self, name, explanation, time = True, 
+            takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the spaces to the South.
+
+        @return:    PrefixTrie of space names.
+        """
+        location = self._player.getLocation()
+        return PrefixTrie(space.getName() for space in 
+            location.getExitList(Direction.SOUTH))
+
     def execute(self):
         """
         Run South command.
         """
+        io = self._player.getIo()
+
         #Make sure that exit exists
         if not self._player.canMoveSouth():
-            print "Cannot move South."
+            io.output("Cannot move South.")
             return
 
         #User graphic
-        print "--------------------------------"
-        print "         Moving South"
-        print "              ||                "
-        print "              ||                "
-        print "              \/                "
-        print ""
+        io.output("--------------------------------")
+        io.output("         Moving South")
+        io.output("              ||                ")
+        io.output("              ||                ")
+        io.output("              \/                ")
+        io.output()
         
         #Actual move execution and user output
-        self._player.moveSouth()
+        self._player.moveSouth(self._takeArgument())
 
         space = self._player.getLocation()
         name = space.getName()
         description = space.getDescription()
         
-        print "Welcome to %s." % name 
-        print description
\ No newline at end of file
+        io.output("Welcome to %s." % name) 
+        io.output(description)
\ No newline at end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/python
+
+from command import Command
+import battle_engine
+import constants
+
+class TravelCommand(Command):
+    """
+    Moves player along the shortest or the safest route to a named space.
+    """
+    def __init__(self, name, explanation, player, risk = None):
+        """
+        Initializes travel command.
+
+        @param name:         Command name.
+        @param explanation:  Explanation of command.
+        @param player:       The player object.
+        @keyword risk:       (Optional) The constants.RouteRisk to minimize
+                             for player's level. By default, the route with
+                             the fewest steps is taken.
+        """
+        #Random battles are rolled at every step instead of once by the game
+        Command.__init__(self, name, explanation, time = False, 
+            takesArgument = True)
+
+        self._player = player
+        self._risk = risk
+
+    def getArgumentNames(self):
+        """
+        Returns the names of the spaces in Middle Earth.
+
+        @return:    PrefixTrie of space names.
+        """
+        return self._player.getLocation().getWorldGraph().getNameTrie()
+
+    def execute(self):
+        """
+        Asks for a destination and walks the route there one space at a time.
+        Each step has the same chance of a random battle as a movement
+        command. Travel ends early if player loses a battle.
+        """
+        io = self._player.getIo()
+
+        graph = self._player.getLocation().getWorldGraph()
+        destinationName = self._getResponse(io, 
+            "Where would you like to travel to? ", graph.getNameTrie())
+        io.output()
+        self.travelTo(destinationName)
+
+    def travelTo(self, destinationName):
+        """
+        Walks the route to a space.
+
+        @param destinationName:    Name or qualified name of the space, or 
+                                   name of a city or unique place in it, in 
+                                   any case, or the start of only one of 
+                                   them. May be preceded by "to".
+        """
+        io = self._player.getIo()
+
+        location = self._player.getLocation()
+        graph = location.getWorldGraph()
+        destinationIds = self._findDestination(graph, destinationName)
+
+        #Check that destination exists, is unambiguous and can be reached
+        if not destinationIds:
+            io.output("%s is not in Middle Earth." % destinationName)
+            return
+        if len(destinationIds) > 1:
+            io.output("Several places are called %s: %s." % (destinationName,
+                ", ".join(graph.getQualifiedName(spaceId) 
+                for spaceId in destinationIds)))
+            return
+        destinationId = destinationIds[0]
+        if self._risk:
+            planner = graph.getSafeRoutePlanner(self._player.getLevel(), 
+                self._risk)
+        else:
+            planner = graph.getRoutePlanner()
+        route = planner.getRoute(graph.getSpaceId(location), destinationId)
+        if route is None:
+            io.output("There is no known route to %s." %
+                graph.getSpace(destinationId).getName())
+            return
+        if not route:
+            io.output("You are already in %s." % location.getName())
+            return
+
+        for spaceId in route:
+            space = graph.getSpace(spaceId)
+            self._player.setLocation(space)
+            io.output("Traveling to %s." % space.getName())
+
+            if not self._battlePhase():
+                io.output("Travel interrupted.")
+                return
+
+        io.output()
+        io.output("Welcome to %s." % space.getName())
+        io.output(space.getDescription())
+
+    def _findDestination(self, graph, destinationName):
+        """
+        Helper method that finds the spaces a destination may stand for.
+
+        @param graph:              The WorldGraph.
+        @param destinationName:    The destination, as given to travelTo().
+
+        @return:                   List of space IDs. Empty if there is no
+                                   such space.
+        """
+        names = graph.getNameTrie()
+        name = destinationName.strip()
+        destinationIds = graph.getIdsByName(names.resolve(name) or name)
+
+        #As in "travel to Bree"
+        words = name.split(None, 1)
+        if (not destinationIds and len(words) == 2 and 
+            words[0].lower() == "to"):
+            destinationIds = graph.getIdsByName(names.resolve(words[1]) or 
+                words[1])
+
+        return destinationIds
+
+    def _battlePhase(self):
+        """
+        Evaluates if a random battle will occur. If so, battle_engine.battle()
+        is called to execute the battle.
+
+        @return:    False if player lost a battle, True otherwise.
+        """
+        currentLocation = self._player.getLocation()
+        battleProbability = currentLocation.getBattleProbability()
+
+        #Determines if random battle will occur
+        spawn = self._player.getRandom(constants.RandomStream.SPAWN)
+        if spawn.random() < battleProbability:
+            #Call on battle to resolve battle
+            return battle_engine.battle(self._player,
+                constants.BattleEngineContext.RANDOM)
+
+        return True
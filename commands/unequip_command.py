@@ -15,36 +15,48 @@ class UnequipCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation)
+        Command.__init__(self, name, explanation, takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the items that player has equipped.
+
+        @return:    PrefixTrie of item names.
+        """
+        return self._player.getEquipped().getNameTrie()
+
     def execute(self):
         """
         Unequips player with item in inventory.
         """
+        io = self._player.getIo()
+
         equipped = self._player.getEquipped()
 
         #If no items to unequip
         if equipped.count() == 0:
-            print "No items to unequip."
+            io.output("No items to unequip.")
             return
 
         #User prompt
-        print "%s may unequip:" % self._player.getName()
+        io.output("%s may unequip:" % self._player.getName())
         for item in equipped:
-            print "\t%s" % item.getName()
-        print ""
+            io.output("\t%s" % item.getName())
+        io.output()
         
-        itemToUnequip = raw_input("Which item do you want to unequip? \n")
+        itemToUnequip = self._getResponse(io, 
+            "Which item do you want to unequip? \n", 
+            equipped.getNameTrie())
         itemEquipment = equipped.getItemByName(itemToUnequip)
         
         #Check if item is currently equipped
         if not itemEquipment:
-            print ""
-            print "%s is not currently equipped!" % itemToUnequip
+            io.output()
+            io.output("%s is not currently equipped!" % itemToUnequip)
             return
 
         #Unequips player with item
         statement = self._player.unequip(itemEquipment)
-        print statement
\ No newline at end of file
+        io.output(statement)
\ No newline at end of file
@@ -17,52 +17,87 @@ class UsePotionCommand(Command):
         @param player:       The player object.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation)
+        Command.__init__(self, name, explanation, takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the potions in inventory.
+
+        @return:    PrefixTrie of potion names.
+        """
+        return self._getPotions().getNameTrie()
+
     def execute(self):
         """
         Uses potion in inventory to heal player.
         """
+        io = self._player.getIo()
+
         #Check that potions in inventory
-        inventory = self._player.getInventory()
-        potions = ItemSet()
-        
-        for item in inventory:
-            if isinstance(item, Potion):
-                potions.addItem(item)
+        potions = self._getPotions()
         if potions.count() == 0:
-            print "%s has no potions." % self._player.getName()
+            io.output("%s has no potions." % self._player.getName())
             return
         
         #User prompt
-        print "%s currently has:" % self._player.getName()
+        io.output("%s currently has:" % self._player.getName())
         for potion in potions:
-            print "\t%s with %s healing power." % (potion.getName(), 
-            potion.getHealing())
-        print ""
+            io.output("\t%s with %s healing power." % (potion.getName(), 
+            potion.getHealing()))
+        io.output()
     
+        names = potions.getNameTrie()
         choice = None
         while True:
-            choice = raw_input("Which potion would you like to use? ")
+            fromArgument = self._argument is not None
+            choice = self._getResponse(io, 
+                "Which potion would you like to use? ", names)
             if potions.containsItemWithName(choice):
                 break
             else:
-                print "%s does not have that potion." % self._player.getName()
-                print ""
+                io.output("%s does not have that potion." % self._player.getName())
+                io.output()
+                #A wrong argument is not asked again
+                if fromArgument:
+                    return
+
+        self.usePotion(potions.getItemByName(choice))
+
+    def _getPotions(self):
+        """
+        Helper method that finds the potions in inventory.
+
+        @return:    ItemSet of potions.
+        """
+        potions = ItemSet()
+        
+        for item in self._player.getInventory():
+            if isinstance(item, Potion):
+                potions.addItem(item)
+
+        return potions
+
+    def usePotion(self, potion):
+        """
+        Heals player with a given potion and removes it from inventory.
+
+        @param potion:     The potion in player's inventory to use.
+        """
+        io = self._player.getIo()
+        inventory = self._player.getInventory()
 
         #Healing mechanics
-        potionChoice = potions.getItemByName(choice)
-        healing = potionChoice.getHealing()
+        healing = potion.getHealing()
         
         preHealedHealth = self._player.getHp()
         self._player.heal(healing)
         postHealedHealth = self._player.getHp()
         healed = postHealedHealth - preHealedHealth
         
-        inventory.removeItem(potionChoice)
+        inventory.removeItem(potion)
         
-        print "%s was healed by %s! %s's health is now %s." \
+        io.output("%s was healed by %s! %s's health is now %s."
         % (self._player.getName(), healed, self._player.getName(), 
-        self._player.getHp())
\ No newline at end of file
+        self._player.getHp()))
\ No newline at end of file
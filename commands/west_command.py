@@ -1,6 +1,8 @@
 #!/usr/bin/python
 
 from command import Command
+from constants import Direction
+from util.prefix_trie import PrefixTrie
 
 class WestCommand(Command):
     """
@@ -15,32 +17,45 @@ class WestCommand(Command):
         @param player:          Reference to command.
         """
         #Call parent's init method
-        Command.__init__(self, name, explanation, time = True)
+        Command.__init__(self, name, explanation, time = True, 
+            takesArgument = True)
 
         self._player = player
 
+    def getArgumentNames(self):
+        """
+        Returns the names of the spaces to the West.
+
+        @return:    PrefixTrie of space names.
+        """
+        location = self._player.getLocation()
+        return PrefixTrie(space.getName() for space in 
+            location.getExitList(Direction.WEST))
+
     def execute(self):
         """
         Run west command.
         """
+        io = self._player.getIo()
+
         #Make sure that exit exists
         if not self._player.canMoveWest():
-            print "Cannot move west."
+            io.output("Cannot move west.")
             return
 
         #User graphic
-        print "--------------------------------"
-        print "         Moving West"
-        print "      <-----------------        "
-        print ""
-        print "--------------------------------"
+        io.output("--------------------------------")
+        io.output("         Moving West")
+        io.output("      <-----------------        ")
+        io.output()
+        io.output("--------------------------------")
 
         #Actual move execution and user output
-        self._player.moveWest()
+        self._player.moveWest(self._takeArgument())
 
         space = self._player.getLocation()
         name = space.getName()
         description = space.getDescription()
         
-        print "Welcome to %s." % name 
-        print description
\ No newline at end of file
+        io.output("Welcome to %s." % name) 
+        io.output(description)
\ No newline at end of file
@@ -1,45 +1,25 @@
 #!/usr/bin/python
 
-from monsters.barrow_wight import BarrowWight
-from monsters.goblin import Goblin
-from monsters.great_goblin import GreatGoblin
-from monsters.king_of_the_barrows import KingOfTheBarrows
-from monsters.nazgul import Nazgul
-from monsters.nazgul_ii import Nazgul_II
-from monsters.nazgul_iii import Nazgul_III
-from monsters.troll import Troll
-from monsters.warg_rider import WargRider
-from monsters.uruk_hai import UrukHai
-from monsters.uruk_hai_archer import UrukHaiArcher
-from monsters.elite_uruk_hai import EliteUrukHai
-from monsters.dunlending import Dunlending
-from monsters.orc import Orc
-from monsters.orc_archer import OrcArcher
-from monsters.siege_works import SiegeWorks
-from monsters.dragon_of_mordor import DragonOfMordor
-from monsters.corsair_of_umbar import CorsairOfUmbar
-from monsters.armored_mumakil import ArmoredMumakil
-from monsters.black_numernorian import BlackNumernorian
-from monsters.easterling_warrior import EasterlingWarrior
-from monsters.sauroman import Sauroman
-from monsters.mouth_of_sauron import MouthOfSauron
-from monsters.witch_king import WitchKing
-from monsters.shelob import Shelob
-from monsters.balrog import Balrog
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.troll_ii import Troll_II
-from monsters.black_numernorian_ii import BlackNumernorian_II
-
 """
 Constants used in Lord of the Rings.
 """
 #Game constants
 COMMAND_PROMPT           = "> "
+COMMAND_SEPARATOR        = ";"
 CURRENCY                 = "rubles"
 SPACES_WITH_UNIQUE_ITEMS = 4
 ELVEN_RING_PROB          = .3
 
+#Game server constants
+SERVER_HOST = "localhost"
+SERVER_PORT = 4000
+#Directory that session transcripts are saved to, or None to not save them
+SERVER_TRANSCRIPT_DIRECTORY = None
+#Sessions a server hosts at once; further connections are turned away
+SERVER_MAX_SESSIONS = 1000
+#Stack size of session threads, in bytes
+SERVER_THREAD_STACK_SIZE = 256 * 1024
+
 #Player initialization
 class PlayerInitialization(object):
     """
@@ -128,90 +108,6 @@ class RegionBaseSpawn(object):
     GONDOR        = 8
     MORDOR        = 8
 
-#Space spawn probability
-class SpaceSpawnProb(object):
-    """
-    Used to store space spawn probabilities.
-    """
-    shire               = 0
-    oldForest           = .7
-    weatherHills        = .75
-    trollshaws          = .85
-    mistyMountainsNorth = .85
-    highPass            = 0
-    mirkwood            = .4
-    southernMirkwood    = .9
-    barrowDowns         = .85
-    bruinen             = .75
-    mitheithel          = .75
-    swanfleet           = .75
-    dunland             = .85
-    mistyMountainsSouth = 0
-    lorien              = .4
-    fangorn             = .4
-    theWold             = .4
-    fieldOfCelebrant    = .25
-    calenardhon         = .95
-    westfold            = .85
-    westemnet           = .8
-    eastemnet           = .6
-    emynMuil            = .4
-    eastfold            = .5
-    nindalf             = .8
-    deadMarshes         = .5
-    udun                = .95
-    cairAndros          = .8
-    orodruin            = .95
-    anorien             = .75
-    anduin              = .85
-    ephelDuath          = .9
-    cirithUngol         = .9
-    plateauOfGorgoth    = .95
-    lossamarch          = .6
-    ithilien            = .85
-
-#Space bonusDifficulty
-class SpaceBonusDiff(object):
-    """
-    Used to store space bonus difficulty probabilities.
-    """
-    shire               = 0
-    oldForest           = 0
-    weatherHills        = 0
-    trollshaws          = .2
-    mistyMountainsNorth = 0
-    highPass            = 0
-    mirkwood            = 0
-    southernMirkwood    = .2
-    barrowDowns         = 0
-    bruinen             = 0
-    mitheithel          = .2
-    swanfleet           = .2
-    dunland             = 0
-    mistyMountainsSouth = 0
-    lorien              = 0
-    fangorn             = 0
-    theWold             = -.3
-    fieldOfCelebrant    = -.3
-    calenardhon         = .5
-    westfold            = .3
-    westemnet           = .15
-    eastemnet           = 0
-    emynMuil            = -.2
-    eastfold            = 0
-    nindalf             = -.2
-    deadMarshes         = .2
-    udun                = .3
-    cairAndros          = .2
-    orodruin            = .3
-    anorien             = .3
-    anduin              = 0
-    ephelDuath          = .2
-    cirithUngol         = .2
-    plateauOfGorgoth    = .2
-    lossamarch          = 0
-    ithilien            = .2
-
 #Monster names
 class MonsterNames(object):
     """
@@ -360,52 +256,52 @@ class MonsterDeathStrings(object):
 #Region monster distribution
 """
 A dictionary of dictionaries where the higher-level keys are regions. 
-The inner set contains the monster class-probability pairs that are 
+The inner set contains the monster kind-probability pairs that are 
 used as probability distribution functions for monster spawn.
 
 monster_factory's getMonsters() generates a random number between [0, 1). If 
-the randomly generated number falls within the range of each class, a monster 
-of that class is spawned.
+the randomly generated number falls within the range of each kind, a monster 
+of that kind is spawned.
 """
 REGIONAL_MONSTER_DISTRIBUTION = {
-    RegionType.ERIADOR:      {Nazgul: [0, 1]},
-    RegionType.BARROW_DOWNS: {BarrowWight: [0, .9], 
-                              KingOfTheBarrows: [.9, 1]},
-    RegionType.HIGH_PASS:    {Goblin: [0, 1]},
-    RegionType.ENEDWAITH:    {WargRider: [0, .3], 
-                              Dunlending: [.3, .6], 
-                              UrukHai: [.6, .8], 
-                              UrukHaiArcher: [.8, .9], 
-                              EliteUrukHai: [.9, 1]},
-     RegionType.MORIA:       {Orc: [0, .7], 
-                              OrcArcher: [.7, .925], 
-                              Troll: [.925, .98], 
-                              Balrog: [.98, 1]},
-     RegionType.RHOVANION:   {Orc: [0, .5], 
-                              OrcArcher: [.5, .7], 
-                              Nazgul_II: [.7, .85], 
-                              BlackNumernorian: [.85, 1]},
-     RegionType.ROHAN:       {UrukHai: [0, .5], 
-                              UrukHaiArcher: [.5, .7], 
-                              EliteUrukHai: [.7, .8], 
-                              WargRider: [.8, 1]},
-     RegionType.GONDOR:      {Orc: [0, .45], 
-                              OrcArcher: [.45, .6],
-                              EasterlingWarrior: [.6, .65],
-                              Troll: [.65, .75], 
-                              Nazgul_II: [.75, .785], 
-                              DragonOfMordor: [.785, .8], 
-                              CorsairOfUmbar: [.8, .85], 
-                              ArmoredMumakil: [.85, .9], 
-                              SiegeWorks: [.9, .95], 
-                              BlackNumernorian: [.95, 1]},
-     RegionType.MORDOR:      {Orc_II: [0, .5], 
-                              OrcArcher_II: [.5, .7], 
-                              Troll_II: [.7, .8], 
-                              Nazgul_III: [.8, .85], 
-                              DragonOfMordor: [.85, .875], 
-                              BlackNumernorian_II: [.875, .95], 
-                              SiegeWorks: [.95, 1]}
+    RegionType.ERIADOR:      {"Nazgul": [0, 1]},
+    RegionType.BARROW_DOWNS: {"BarrowWight": [0, .9], 
+                              "KingOfTheBarrows": [.9, 1]},
+    RegionType.HIGH_PASS:    {"Goblin": [0, 1]},
+    RegionType.ENEDWAITH:    {"WargRider": [0, .3], 
+                              "Dunlending": [.3, .6], 
+                              "UrukHai": [.6, .8], 
+                              "UrukHaiArcher": [.8, .9], 
+                              "EliteUrukHai": [.9, 1]},
+     RegionType.MORIA:       {"Orc": [0, .7], 
+                              "OrcArcher": [.7, .925], 
+                              "Troll": [.925, .98], 
+                              "Balrog": [.98, 1]},
+     RegionType.RHOVANION:   {"Orc": [0, .5], 
+                              "OrcArcher": [.5, .7], 
+                              "Nazgul_II": [.7, .85], 
+                              "BlackNumernorian": [.85, 1]},
+     RegionType.ROHAN:       {"UrukHai": [0, .5], 
+                              "UrukHaiArcher": [.5, .7], 
+                              "EliteUrukHai": [.7, .8], 
+                              "WargRider": [.8, 1]},
+     RegionType.GONDOR:      {"Orc": [0, .45], 
+                              "OrcArcher": [.45, .6],
+                              "EasterlingWarrior": [.6, .65],
+                              "Troll": [.65, .75], 
+                              "Nazgul_II": [.75, .785], 
+                              "DragonOfMordor": [.785, .8], 
+                              "CorsairOfUmbar": [.8, .85], 
+                              "ArmoredMumakil": [.85, .9], 
+                              "SiegeWorks": [.9, .95], 
+                              "BlackNumernorian": [.95, 1]},
+     RegionType.MORDOR:      {"Orc_II": [0, .5], 
+                              "OrcArcher_II": [.5, .7], 
+                              "Troll_II": [.7, .8], 
+                              "Nazgul_III": [.8, .85], 
+                              "DragonOfMordor": [.85, .875], 
+                              "BlackNumernorian_II": [.875, .95], 
+                              "SiegeWorks": [.95, 1]}
      }
 
 #Monster base stats
@@ -413,37 +309,41 @@ REGIONAL_MONSTER_DISTRIBUTION = {
 Monster base stats are the only paramater used in monster creation.
 Stats are a 3-element list whose elements are: hp, attack, and
 experience (in that order).
+
+Keys are monster kind names. To add a kind of monster, add its stats here and 
+its strings to MonsterNames, MonsterDescriptions, MonsterAttackStrings and 
+MonsterDeathStrings under the same name.
 """
-MONSTER_STATS = {BarrowWight:          [18, 2, 6],
-                 Goblin:               [28, 5, 12],
-                 GreatGoblin:          [72, 8, 42],
-                 KingOfTheBarrows:     [72, 4, 32],
-                 Nazgul:               [44, 3, 12],
-                 Nazgul_II:            [82, 10, 52],
-                 Nazgul_III:           [240, 48, 120],
-                 Troll:                [86, 8, 36],
-                 WargRider:            [32, 5, 14],
-                 UrukHai:              [54, 5, 18],
-                 UrukHaiArcher:        [32, 6, 16],
-                 EliteUrukHai:         [72, 8, 28],
-                 Dunlending:           [26, 5, 12],
-                 Orc:                  [26, 5, 12],
-                 OrcArcher:            [22, 7, 16],
-                 SiegeWorks:           [220, 0, 52],
-                 DragonOfMordor:       [300, 67, 176],
-                 CorsairOfUmbar:       [76, 12, 48],
-                 ArmoredMumakil:       [264, 42, 96],
-                 BlackNumernorian:     [66, 12, 48],
-                 EasterlingWarrior:    [74, 8, 30],
-                 Sauroman:             [342, 52, 170],
-                 MouthOfSauron:        [480, 72, 250],
-                 WitchKing:            [600, 84, 320],
-                 Shelob:               [450, 70, 140],
-                 Balrog:               [1840, 162, 860],
-                 Orc_II:               [72, 10, 35],
-                 OrcArcher_II:         [66, 12, 40],
-                 Troll_II:             [166, 16, 80],
-                 BlackNumernorian_II:  [152, 24, 92]}
+MONSTER_STATS = {"BarrowWight":          [18, 2, 6],
+                 "Goblin":               [28, 5, 12],
+                 "GreatGoblin":          [72, 8, 42],
+                 "KingOfTheBarrows":     [72, 4, 32],
+                 "Nazgul":               [44, 3, 12],
+                 "Nazgul_II":            [82, 10, 52],
+                 "Nazgul_III":           [240, 48, 120],
+                 "Troll":                [86, 8, 36],
+                 "WargRider":            [32, 5, 14],
+                 "UrukHai":              [54, 5, 18],
+                 "UrukHaiArcher":        [32, 6, 16],
+                 "EliteUrukHai":         [72, 8, 28],
+                 "Dunlending":           [26, 5, 12],
+                 "Orc":                  [26, 5, 12],
+                 "OrcArcher":            [22, 7, 16],
+                 "SiegeWorks":           [220, 0, 52],
+                 "DragonOfMordor":       [300, 67, 176],
+                 "CorsairOfUmbar":       [76, 12, 48],
+                 "ArmoredMumakil":       [264, 42, 96],
+                 "BlackNumernorian":     [66, 12, 48],
+                 "EasterlingWarrior":    [74, 8, 30],
+                 "Sauroman":             [342, 52, 170],
+                 "MouthOfSauron":        [480, 72, 250],
+                 "WitchKing":            [600, 84, 320],
+                 "Shelob":               [450, 70, 140],
+                 "Balrog":               [1840, 162, 860],
+                 "Orc_II":               [72, 10, 35],
+                 "OrcArcher_II":         [66, 12, 40],
+                 "Troll_II":             [166, 16, 80],
+                 "BlackNumernorian_II":  [152, 24, 92]}
     
 #Battle engine context
 class BattleEngineContext(object):
@@ -453,6 +353,14 @@ class BattleEngineContext(object):
     RANDOM = 1
     STORY  = 2
 
+class BattleAction(object):
+    """
+    Actions player may take in battle. Values match the battle prompt.
+    """
+    ATTACK     = "attack"
+    USE_POTION = "use potion"
+    RUN        = "run"
+
 #Battle engine     
 class ItemFind(object):
     """
@@ -472,6 +380,39 @@ class BattleEngine(object):
     STANDARD_DEVIATION      = 3
     MONEY_CONSTANT          = 3
 
+#Random number constants
+class RandomStream(object):
+    """
+    The independent streams of random numbers of a game session.
+    """
+    #Random battles and the monsters in them
+    SPAWN  = "spawn"
+    #Chances taken during battle
+    COMBAT = "combat"
+    #Items found in battle and scattered across the world
+    LOOT   = "loot"
+    #Shop wares
+    SHOP   = "shop"
+    #Events in unique places
+    STORY  = "story"
+
+    ALL    = (SPAWN, COMBAT, LOOT, SHOP, STORY)
+
+#Route planning constants
+class RouteRisk(object):
+    """
+    Measures of danger that safe routes minimize.
+    """
+    ENCOUNTERS = "encounters"
+    DAMAGE     = "damage"
+
+class RoutePlanning(object):
+    """
+    Constants for route planning. Safe routes are shared by players whose 
+    levels fall in the same bracket.
+    """
+    LEVEL_BRACKET = 5
+
 #Shop factory probability constants
 class ShopFactoryConstants(object):
     """
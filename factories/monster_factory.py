@@ -1,40 +1,123 @@
 #!/usr/bin/python
 
+from bisect import bisect_right
 from math import floor
 import random
 
-from monsters.monster import Monster
+from monsters.monster import Monster, MonsterKind
 import constants
 
-def getMonsters(number, region, bonusDifficulty):
+#Monster kinds created so far, keyed by kind name and bonus difficulty
+_monsterKinds = {}
+
+#Compiled spawn distributions, keyed by region. Each is stored with the
+#distribution it was compiled from.
+_spawnTables = {}
+
+def getMonsterKind(kindName, bonusDifficulty = 0):
+    """
+    Returns the shared MonsterKind for a kind of monster in the monster tables
+    of constants.
+
+    @param kindName:          Key of the kind in constants.MONSTER_STATS. For
+                              instance, "Orc_II".
+    @keyword bonusDifficulty: (Optional) Percentage increase over base
+                              monster stats.
+
+    @return:                  The MonsterKind.
+    """
+    key = (kindName, bonusDifficulty)
+    kind = _monsterKinds.get(key)
+
+    if kind is None:
+        if kindName not in constants.MONSTER_STATS:
+            errorMsg = "Invalid monster kind: %s" % kindName
+            raise AssertionError(errorMsg)
+
+        #Modify monster stats for bonusDifficulty
+        stats = []
+        for stat in constants.MONSTER_STATS[kindName]:
+            stat = int(floor(stat * (1 + bonusDifficulty)))
+            stats.append(stat)
+
+        kind = MonsterKind(kindName,
+            getattr(constants.MonsterNames, kindName),
+            getattr(constants.MonsterDescriptions, kindName), stats,
+            getattr(constants.MonsterAttackStrings, kindName),
+            getattr(constants.MonsterDeathStrings, kindName))
+        _monsterKinds[key] = kind
+
+    return kind
+
+def getMonster(kindName, bonusDifficulty = 0):
+    """
+    Creates a single monster.
+
+    @param kindName:          Key of the kind in constants.MONSTER_STATS.
+    @keyword bonusDifficulty: (Optional) Percentage increase over base
+                              monster stats.
+
+    @return:                  The monster.
+    """
+    return Monster.fromKind(getMonsterKind(kindName, bonusDifficulty))
+
+def getSpawnTable(region):
+    """
+    Returns a region's spawn distribution compiled for lookup by bisection.
+
+    Kinds are sorted by the lower limit of their spawn range. A random number
+    in [0, 1) spawns the first kind whose upper limit is above it.
+
+    @param region:      The region to spawn monsters in.
+
+    @return:            2-element tuple of a list of upper limits and a list
+                        of kind names, in the same order.
+    """
+    distribution = constants.REGIONAL_MONSTER_DISTRIBUTION.get(region)
+    if distribution is None:
+        errorMsg = "Invalid region - monster spawn distribution."
+        raise AssertionError(errorMsg)
+
+    #Recompile if the distribution has been replaced since it was compiled
+    compiled, spawnTable = _spawnTables.get(region, (None, None))
+    if compiled is not distribution:
+        kindNames = sorted(distribution, key = lambda kindName:
+            distribution[kindName][0])
+        upperLimits = [distribution[kindName][1] for kindName in kindNames]
+        spawnTable = (upperLimits, kindNames)
+        _spawnTables[region] = (distribution, spawnTable)
+
+    return spawnTable
+
+def getMonsterKinds(number, region, bonusDifficulty, random = random):
+    """
+    Picks the kinds of a number of monsters spawned in a region.
+
+    @param number:           The number of monsters to spawn.
+    @param region:           The region to spawn monsters in.
+    @param bonusDifficulty:  Percentage increase over base monster stats.
+    @keyword random:         (Optional) The random.Random to draw from.
+                             Defaults to the random module.
+
+    @return:                 List of MonsterKinds, one per monster.
+    """
+    upperLimits, kindNames = getSpawnTable(region)
+    kinds = [getMonsterKind(kindName, bonusDifficulty)
+        for kindName in kindNames]
+    last = len(kinds) - 1
+
+    return [kinds[min(bisect_right(upperLimits, random.random()), last)]
+        for numSpawn in range(number)]
+
+def getMonsters(number, region, bonusDifficulty, random = random):
     """
     Generates enemies for the battle sequence.
 
     @param number:      The number of monsters to generate.
     @param region:      The region of the map Player is currently in.
     @param difficulty:  The number of enemies to generate.
+    @keyword random:    (Optional) The random.Random to draw from. Defaults 
+                        to the random module.
     """
-    monsters = []
-    monsterDistribution = constants.REGIONAL_MONSTER_DISTRIBUTION[region]
-
-    for numSpawn in range(number):
-        randomNum = random.random()
-        for Monster in monsterDistribution:
-            lowerLimit = monsterDistribution[Monster][0]
-            upperLimit = monsterDistribution[Monster][1]
-            if lowerLimit <= randomNum < upperLimit:
-                #Find monster stats
-                stats = constants.MONSTER_STATS[Monster]
-                #Modify monster stats for bonusDifficulty
-                modifiedStats = []
-                for stat in stats:
-                    modifiedStat = stat * (1 + bonusDifficulty)
-                    modifiedStat = floor(modifiedStat)
-                    modifiedStats.append(modifiedStat)
-                #Instantiate and append monster to monsters
-                monsterSpawn = Monster(modifiedStats)
-                monsters.append(monsterSpawn)
-                #There should only be one monster spawned per iteration
-                break
-    
-    return monsters
\ No newline at end of file
+    return [Monster.fromKind(kind) for kind in 
+        getMonsterKinds(number, region, bonusDifficulty, random)]
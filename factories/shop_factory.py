@@ -6,11 +6,12 @@ import random
 from items.weapon import Weapon
 from items.armor import Armor
 from items.potion import Potion
-from items.item_set import ItemSet
+from items.sorted_item_set import SortedItemSet
 from items.unique_items import lowLevelFindableUniques, shopWeaponDist, shopArmorDist, shopPotionDist
+from items.item_catalog import getItemCatalog
 import constants
 
-def getItems(region, numItems, quality):
+def getItems(region, numItems, quality, random = random):
     """
     Generates random items for shop.
 
@@ -18,35 +19,39 @@ def getItems(region, numItems, quality):
     @param numItems:     The number of items to generate
     @param quality:      Integer from 0-20 that determines quality of items 
                          generated.
+    @keyword random:     (Optional) The random.Random to draw from. Defaults
+                         to the random module.
     @return:             A list of randomly generated item objects.
     """
-    items = ItemSet()
+    items = SortedItemSet()
 
     for item in range(numItems):
         #Generate random number used in determining item type
         randType = random.random()
         
         #Randomize quality
-        quality = qualityRandomizer(quality)
+        quality = qualityRandomizer(quality, random)
         
         #Generate items and append to items list
         if randType < constants.ShopFactoryConstants.WEAPON_UPPER_LIMIT:
-            item = genWeapon(quality, region)
+            item = genWeapon(quality, region, random)
             items.addItem(item)
         elif randType < constants.ShopFactoryConstants.ARMOR_UPPER_LIMIT:
-            item = genArmor(quality, region)
+            item = genArmor(quality, region, random)
             items.addItem(item)
         else:
-            item = genPotion(quality, region)
+            item = genPotion(quality, region, random)
             items.addItem(item)
                 
     return items
     
-def qualityRandomizer(quality):
+def qualityRandomizer(quality, random = random):
     """
     Randomizes quality with a normal distribution.
     
     @param quality:    Shop item quality.
+    @keyword random:   (Optional) The random.Random to draw from. Defaults to
+                       the random module.
     
     @return:           Randomized quality.
     """
@@ -63,20 +68,22 @@ def qualityRandomizer(quality):
     
     return quality
     
-def genWeapon(quality, region):
+def genWeapon(quality, region, random = random):
     """
     Generates a weapon.
     
     @param quality:     Quality of item.
     @param region:      Shop region.
+    @keyword random:    (Optional) The random.Random to draw from. Defaults to
+                        the random module.
     
     @return:            Spawned weapon.
     """
     regionalDist = shopWeaponDist[region]
     acceptableItems = []
     
-    #Create bounds
-    for weapon in regionalDist:
+    #Create bounds, in the same order in every process
+    for weapon in sorted(regionalDist, key = getItemCatalog().getId):
         lowerBound = regionalDist[weapon][0]
         higherBound = regionalDist[weapon][1]
         
@@ -88,20 +95,22 @@ def genWeapon(quality, region):
     item = random.choice(acceptableItems)
     return item
     
-def genArmor(quality, region):
+def genArmor(quality, region, random = random):
     """
     Generates a piece of armor.
     
     @param quality:     Quality of item.
     @param region:      Shop region.
+    @keyword random:    (Optional) The random.Random to draw from. Defaults to
+                        the random module.
     
     @return:            Spawned weapon.
     """
     regionalDist = shopArmorDist[region]
     acceptableItems = []
     
-    #Create bounds
-    for armor in regionalDist:
+    #Create bounds, in the same order in every process
+    for armor in sorted(regionalDist, key = getItemCatalog().getId):
         lowerBound = regionalDist[armor][0]
         higherBound = regionalDist[armor][1]
         
@@ -113,20 +122,22 @@ def genArmor(quality, region):
     item = random.choice(acceptableItems)
     return item
     
-def genPotion(quality, region):
+def genPotion(quality, region, random = random):
     """
     Generates a potion.
     
     @param quality:     Quality of item.
     @param region:      Shop region.
+    @keyword random:    (Optional) The random.Random to draw from. Defaults to
+                        the random module.
     
     @return:            Spawned weapon.
     """
     regionalDist = shopPotionDist[region]
     acceptableItems = []
     
-    #Create bounds
-    for potion in regionalDist:
+    #Create bounds, in the same order in every process
+    for potion in sorted(regionalDist, key = getItemCatalog().getId):
         lowerBound = regionalDist[potion][0]
         higherBound = regionalDist[potion][1]
         
@@ -1,10 +1,10 @@
 #!/usr/bin/python
 
-import random
 import sys
 
 import game_loader
 import battle_engine
+import snapshot
 from parser import Parser
 from commands.north_command import NorthCommand
 from commands.south_command import SouthCommand
@@ -12,33 +12,86 @@ from commands.east_command import EastCommand
 from commands.west_command import WestCommand
 from commands.enter_command import EnterCommand
 from items.unique_items import theOneRing
+from game_io import ConsoleIO
+from session_random import SessionRandom
 import constants
 
 class Game(object):
     """
     Prepares and executes turn-based game.
     """
-    def __init__(self):
+    def __init__(self, io = None, seed = None):
         """
         Initializes game.
+
+        @keyword io:     (Optional) The GameIO object through which the game 
+                         is played. Defaults to the terminal.
+        @keyword seed:   (Optional) Seed of the session's random numbers. 
+                         Games with the same seed and the same input play out
+                         the same. By default, a random seed is used.
         """
-        print "...Game Loading..."
-        print "..."
+        if io is None:
+            io = ConsoleIO()
+        self._io = io
+
+        self._io.output("...Game Loading...")
+        self._io.output("...")
         
         #Initializes game objects
-        self._world = game_loader.getWorld()
+        sessionRandom = SessionRandom(seed)
+        world = game_loader.getWorld(sessionRandom)
+        startingInventory = game_loader.getStartingInventory()
+        player = game_loader.getPlayer(world[0], startingInventory, self._io,
+            sessionRandom)
+        self._startSession(world, player)
+        
+        self._io.output("...")
+        self._io.output("$$$Loading Complete$$$")
+
+    def _startSession(self, world, player):
+        """
+        Sets up the game objects that depend on the world and player.
+
+        @param world:    List of spaces, as returned by game_loader.getWorld().
+        @param player:   The player object.
+        """
+        self._world = world
         self._shire = self._world[0]
-        self._orodruin = self._world[26]
+        self._worldGraph = self._shire.getWorldGraph()
+        self._orodruin = self._worldGraph.getSpaceByName("Orodruin")
         
-        startingInventory = game_loader.getStartingInventory()
-        self._player = game_loader.getPlayer(self._shire, startingInventory)
+        self._player = player
+        self._sessionRandom = player.getSessionRandom()
         self._commandList = game_loader.getCommandList(self._player)
         
-        print "..."
-        print "$$$Loading Complete$$$"
-        
         #Creates parser
-        self._parser = Parser(self._commandList)
+        self._parser = Parser(self._commandList, self._io)
+        self._io.setCompleter(self._parser.complete)
+
+    def getSeed(self):
+        """
+        Returns the seed of the session's random numbers.
+
+        @return:    The seed.
+        """
+        return self._sessionRandom.getSeed()
+
+    def saveSnapshot(self):
+        """
+        Saves the current state of the game.
+
+        @return:    The snapshot, as a string.
+        """
+        return snapshot.saveSnapshot(self._player)
+
+    def loadSnapshot(self, data):
+        """
+        Replaces the current state of the game with a saved one.
+
+        @param data:    The snapshot, as returned by saveSnapshot().
+        """
+        world, player = snapshot.loadSnapshot(data, self._io)
+        self._startSession(world, player)
 
     def play(self):
         """
@@ -46,15 +99,15 @@ class Game(object):
         """
         splashScreen = """
         """
-        print splashScreen
-        print ("An adventure game where Russian tries to take on the hoards of" 
+        self._io.output(splashScreen)
+        self._io.output("An adventure game where Russian tries to take on the hoards of" 
         " Mordor.")
-        print ("A little help from Dear Ladd Jr., Miles, Seth, and C-$ along" 
+        self._io.output("A little help from Dear Ladd Jr., Miles, Seth, and C-$ along" 
         " the way.")
-        print "...~Money~..."
-        print ""
-        print "(Type 'help' for a list of available commands)"
-        print ""
+        self._io.output("...~Money~...")
+        self._io.output()
+        self._io.output("(Type 'help' for a list of available commands)")
+        self._io.output()
 
         while(True):
             self._nextTurn()
@@ -79,7 +132,7 @@ class Game(object):
                 #If passing of time... chance a random battle will occur
                 if nextCommand.getTime():
                     self._battlePhase()
-            print ""
+            self._io.output()
             
         else:
             errorMsg = "Failed to receive command from parser."
@@ -87,9 +140,9 @@ class Game(object):
         
         #If player has won the game
         if self._winningConditions():
-            print ("Congratulations! %s has saved Middle Earth!" 
+            self._io.output("Congratulations! %s has saved Middle Earth!" 
             % self._player.getName())
-            raw_input("Press enter to exit. ")
+            self._io.pause("Press enter to exit. ")
             sys.exit()
             
     def _executionCheck(self, nextCommand):
@@ -106,19 +159,19 @@ class Game(object):
         #Check movement commands
         if isinstance(nextCommand, NorthCommand):
             if not self._player.canMoveNorth():
-                print "Cannot move north."
+                self._io.output("Cannot move north.")
                 return False
         elif isinstance(nextCommand, SouthCommand):
             if not self._player.canMoveSouth():
-                print "Cannot move south."
+                self._io.output("Cannot move south.")
                 return False
         elif isinstance(nextCommand, EastCommand):
             if not self._player.canMoveEast():
-                print "Cannot move east."
+                self._io.output("Cannot move east.")
                 return False
         elif isinstance(nextCommand, WestCommand):
             if not self._player.canMoveWest():
-                print "Cannot move west."
+                self._io.output("Cannot move west.")
                 return False
         
         return True
@@ -132,7 +185,8 @@ class Game(object):
         battleProbability = currentLocation.getBattleProbability()
         
         #Determines if random battle will occur
-        if random.random() < battleProbability:
+        spawn = self._sessionRandom.getStream(constants.RandomStream.SPAWN)
+        if spawn.random() < battleProbability:
             #Call on battle to resolve battle
             battle_engine.battle(self._player, 
             constants.BattleEngineContext.RANDOM)
@@ -0,0 +1,266 @@
+#!/usr/bin/python
+
+from collections import deque
+
+import constants
+
+class GameIO(object):
+    """
+    Parent class for the input/output channels used by the game.
+
+    Every prompt and every line of game text goes through a GameIO object
+    instead of raw_input and print, so that a game may be played through a
+    terminal or driven by a program.
+
+    Prompts that only wait for the user to press enter go through pause().
+    A channel may be set to skip them, which saves a round-trip per pause
+    when the game is driven by a program.
+    """
+    #Changed with setSkipPauses()
+    _skipPauses = False
+
+    def input(self, prompt = ""):
+        """
+        Solicits a line of input from the user.
+
+        This method should be overridden by child classes.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The user's response.
+        """
+        errorMsg = "GameIO.input() should be overridden by child class."
+        raise AssertionError(errorMsg)
+
+    def output(self, text = ""):
+        """
+        Displays a line of text to the user.
+
+        This method should be overridden by child classes.
+
+        @param text:       The text to display.
+        """
+        errorMsg = "GameIO.output() should be overridden by child class."
+        raise AssertionError(errorMsg)
+
+    def pause(self, prompt = "Press enter to continue. "):
+        """
+        Waits for the user to press enter. The response is ignored.
+
+        If pauses are skipped, returns at once without displaying the prompt
+        or reading input.
+
+        @keyword prompt:   (Optional) The prompt displayed to the user.
+        """
+        if not self._skipPauses:
+            self.input(prompt)
+
+    def setSkipPauses(self, skipPauses):
+        """
+        Sets whether pause() waits for the user.
+
+        @param skipPauses: True to skip pauses, False to wait for the user.
+        """
+        self._skipPauses = skipPauses
+
+    def getSkipPauses(self):
+        """
+        Returns whether pauses are skipped.
+
+        @return:           True if pauses are skipped, False otherwise.
+        """
+        return self._skipPauses
+
+    def setCompleter(self, complete):
+        """
+        Registers the function used to complete commands as they are typed.
+        By default, commands are not completed.
+
+        @param complete:   Function that takes a partly typed command and 
+                           returns a list of completed commands, such as 
+                           Parser.complete().
+        """
+        pass
+
+class ConsoleIO(GameIO):
+    """
+    Input/output through the terminal. This is the default channel.
+    """
+    def input(self, prompt = ""):
+        """
+        Solicits a line of input from the terminal.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The user's response.
+        """
+        return raw_input(prompt)
+
+    def output(self, text = ""):
+        """
+        Prints a line of text to the terminal.
+
+        @param text:       The text to display.
+        """
+        print text
+
+    def setCompleter(self, complete):
+        """
+        Completes commands with the tab key, if the readline module is 
+        available. Each of several commands on a line is completed on its 
+        own.
+
+        @param complete:   Function that takes a partly typed command and 
+                           returns a list of completed commands.
+        """
+        try:
+            import readline
+        except ImportError:
+            return
+
+        completions = []
+
+        def completer(text, state):
+            #Leading spaces are kept, since readline replaces all of text
+            if state == 0:
+                command = text.lstrip()
+                indent = text[:len(text) - len(command)]
+                completions[:] = [indent + completion 
+                    for completion in complete(command)]
+            if state < len(completions):
+                return completions[state]
+            return None
+
+        readline.set_completer_delims(constants.COMMAND_SEPARATOR)
+        readline.set_completer(completer)
+        readline.parse_and_bind("tab: complete")
+
+class HeadlessIO(GameIO):
+    """
+    In-memory input/output channel used to drive the game without a terminal.
+
+    Input is supplied ahead of time with push() and output is collected in a
+    buffer that may be read with getOutput().
+    """
+    def __init__(self, commands = None, skipPauses = False):
+        """
+        Initializes headless channel.
+
+        @keyword commands:   (Optional) A list of responses to queue up.
+        @keyword skipPauses: (Optional) True to skip pauses, so that queued 
+                             responses only answer real prompts. False by 
+                             default.
+        """
+        self._pending = deque()
+        self._buffer = []
+        self._skipPauses = skipPauses
+
+        if commands:
+            self.pushAll(commands)
+
+    def push(self, command):
+        """
+        Queues up a single response.
+
+        @param command:    The response to queue up.
+        """
+        self._pending.append(command)
+
+    def pushAll(self, commands):
+        """
+        Queues up a list of responses.
+
+        @param commands:   List of responses, in the order they are to be
+                           given.
+        """
+        self._pending.extend(commands)
+
+    def pendingCount(self):
+        """
+        Returns the number of queued responses that have not been consumed.
+
+        @return:           Number of queued responses.
+        """
+        return len(self._pending)
+
+    def input(self, prompt = ""):
+        """
+        Returns the next queued response. The prompt is recorded in the output
+        buffer.
+
+        Raises EOFError if no responses are queued, the same way raw_input
+        does at the end of input.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The next queued response.
+        """
+        self._buffer.append(prompt)
+        if not self._pending:
+            raise EOFError("HeadlessIO has no queued input.")
+
+        return self._pending.popleft()
+
+    def output(self, text = ""):
+        """
+        Records a line of text in the output buffer.
+
+        @param text:       The text to record.
+        """
+        self._buffer.append("%s\n" % text)
+
+    def getOutput(self):
+        """
+        Returns everything that has been written to the channel.
+
+        @return:           Collected output as a single string.
+        """
+        return "".join(self._buffer)
+
+    def clearOutput(self):
+        """
+        Clears the output buffer.
+        """
+        self._buffer = []
+
+class StreamIO(GameIO):
+    """
+    Input/output over a pair of file-like streams, such as the two ends of a 
+    network connection.
+    """
+    def __init__(self, inStream, outStream):
+        """
+        Initializes stream channel.
+
+        @param inStream:     File-like object that responses are read from.
+        @param outStream:    File-like object that text is written to.
+        """
+        self._inStream = inStream
+        self._outStream = outStream
+
+    def input(self, prompt = ""):
+        """
+        Writes the prompt and reads a line from the input stream.
+
+        Raises EOFError if the input stream has been closed.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The user's response, without its line ending.
+        """
+        self._outStream.write(prompt)
+        self._outStream.flush()
+
+        line = self._inStream.readline()
+        if not line:
+            raise EOFError("StreamIO input stream closed.")
+
+        return line.rstrip("\r\n")
+
+    def output(self, text = ""):
+        """
+        Writes a line of text to the output stream.
+
+        @param text:       The text to display.
+        """
+        self._outStream.write("%s\n" % text)
@@ -59,4 +59,4 @@ class Charm(Item):
 
         @return:   Item's type.
         """
-        return ItemType.charm
\ No newline at end of file
+        return ItemType.CHARM
\ No newline at end of file
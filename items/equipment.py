@@ -0,0 +1,172 @@
+#!/usr/bin/python
+
+from items.sorted_item_set import SortedItemSet
+import constants
+from constants import ItemType
+
+class Equipment(SortedItemSet):
+    """
+    The items a player has equipped, arranged in slots.
+
+    There is one weapon slot and one armor slot. Charms share a charm slot
+    with no limit on the number of charms. Adding a weapon or armor to a full
+    slot displaces the item already there.
+
+    The stat bonuses of equipped items are kept up to date as items are added
+    and removed. Every change increments a version number so that holders of
+    derived stats know when to recompute them.
+    """
+    #Types of items that may be equipped
+    _SLOT_TYPES = (ItemType.WEAPON, ItemType.ARMOR, ItemType.CHARM)
+
+    def __init__(self, itemSet=None):
+        """
+        Initializes equipment.
+
+        @keyword itemSet:     (Optional) A single Item object or a
+                               list of Item objects.
+        """
+        self._clearSlots()
+        self._version = 0
+
+        SortedItemSet.__init__(self, itemSet)
+
+    def addItem(self, item):
+        """
+        Equips an item. A weapon or armor already equipped in the same slot
+        is removed.
+
+        @param item:    A weapon, armor or charm.
+        """
+        if not self.canEquip(item):
+            errorMsg = ("Equipment.addItem() passed item that cannot be "
+                "equipped.")
+            raise AssertionError(errorMsg)
+
+        itemType = item.getType()
+        displaced = self._slots.get(itemType)
+        if displaced:
+            self.removeItem(displaced)
+
+        SortedItemSet.addItem(self, item)
+
+        if itemType == ItemType.CHARM:
+            self._charmAttack += item.getAttack()
+            self._charmDefense += item.getDefense()
+            self._charmHp += item.getHp()
+        else:
+            self._slots[itemType] = item
+        self._version += 1
+
+    def removeItem(self, item):
+        """
+        Unequips an item.
+
+        @param item:    An equipped item.
+        """
+        SortedItemSet.removeItem(self, item)
+
+        itemType = item.getType()
+        if itemType == ItemType.CHARM:
+            self._charmAttack -= item.getAttack()
+            self._charmDefense -= item.getDefense()
+            self._charmHp -= item.getHp()
+        elif self._slots[itemType] is item:
+            self._slots[itemType] = None
+        self._version += 1
+
+    def clearItems(self):
+        """
+        Unequips all items.
+        """
+        SortedItemSet.clearItems(self)
+        self._clearSlots()
+        self._version += 1
+
+    def canEquip(self, item):
+        """
+        Determines whether an item may be equipped.
+
+        @param item:    An item.
+
+        @return:        True if item is a weapon, armor or charm, False
+                        otherwise.
+        """
+        return item.getType() in Equipment._SLOT_TYPES
+
+    def getItemInSlot(self, itemType):
+        """
+        Returns the item equipped in the weapon or armor slot.
+
+        @param itemType:   Type of item.
+
+        @return:           The equipped weapon or armor, or None if the slot
+                           is empty. Always None for charms, which do not
+                           displace each other.
+        """
+        return self._slots.get(itemType)
+
+    def getWeaponAttack(self):
+        """
+        Returns attack of equipped weapon.
+
+        @return:    Weapon attack, or zero if no weapon is equipped.
+        """
+        weapon = self._slots[ItemType.WEAPON]
+        if weapon:
+            return weapon.getAttack()
+
+        return constants.PlayerInitialization.WEAPON_ATTACK
+
+    def getArmorDefense(self):
+        """
+        Returns defense of equipped armor.
+
+        @return:    Armor defense, or zero if no armor is equipped.
+        """
+        armor = self._slots[ItemType.ARMOR]
+        if armor:
+            return armor.getDefense()
+
+        return constants.PlayerInitialization.ARMOR_DEFENSE
+
+    def getCharmAttack(self):
+        """
+        Returns total attack of equipped charms.
+
+        @return:    Charm attack.
+        """
+        return self._charmAttack
+
+    def getCharmDefense(self):
+        """
+        Returns total defense of equipped charms.
+
+        @return:    Charm defense.
+        """
+        return self._charmDefense
+
+    def getCharmHp(self):
+        """
+        Returns total HP bonus of equipped charms.
+
+        @return:    Charm HP.
+        """
+        return self._charmHp
+
+    def getVersion(self):
+        """
+        Returns a number that changes whenever equipment changes.
+
+        @return:    Version number.
+        """
+        return self._version
+
+    def _clearSlots(self):
+        """
+        Helper method that empties all slots.
+        """
+        self._slots = {ItemType.WEAPON: None, ItemType.ARMOR: None}
+        self._charmAttack = constants.PlayerInitialization.CHARM_ATTACK
+        self._charmDefense = constants.PlayerInitialization.CHARM_DEFENSE
+        self._charmHp = constants.PlayerInitialization.CHARM_HP
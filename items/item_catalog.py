@@ -0,0 +1,252 @@
+#!/usr/bin/python
+
+from array import array
+import hashlib
+import importlib
+import threading
+import weakref
+
+from items.item import Item
+import items.unique_items
+
+class ItemCatalog(object):
+    """
+    Assigns every item definition a stable integer ID.
+
+    An item definition is an item's class and attributes. Items with the same
+    definition are interchangeable, so they share an ID: the first item
+    registered for a definition is its canonical item, returned for the ID
+    from then on.
+
+    The catalog starts with the built-in items, which get IDs 0 to
+    getBuiltInCount() - 1 in a fixed order. These IDs are the same in every
+    process with the same built-in items, as identified by getFingerprint().
+    Other items get the next ID the first time they are registered, so their
+    IDs are only meaningful within a process; use getDefinition() and
+    addDefinition() to carry them to another.
+
+    The IDs of items other than canonical ones are only remembered while the
+    items exist, so items created for each game session are not kept alive
+    by the catalog.
+
+    A catalog may be shared by sessions running on several threads.
+    """
+    def __init__(self, builtInItems = ()):
+        """
+        Initializes catalog.
+
+        @keyword builtInItems:  (Optional) List of the built-in items.
+        """
+        self._items = []
+        self._ids = weakref.WeakKeyDictionary()
+        self._definitionIds = {}
+
+        #IDs are assigned and looked up one thread at a time
+        self._lock = threading.RLock()
+
+        for item in builtInItems:
+            self.getId(item)
+        self._builtInCount = len(self._items)
+
+        definitions = [repr(self.getDefinition(itemId))
+            for itemId in range(self._builtInCount)]
+        self._fingerprint = hashlib.sha1("\n".join(definitions)).hexdigest()
+
+    def getId(self, item):
+        """
+        Returns the ID of an item's definition, registering the definition if
+        it is new.
+
+        @param item:      The item.
+
+        @return:          ID of the item's definition.
+        """
+        if not isinstance(item, Item):
+            errorMsg = "ItemCatalog.getId() passed non-Item object."
+            raise AssertionError(errorMsg)
+
+        with self._lock:
+            itemId = self._ids.get(item)
+            if itemId is not None:
+                return itemId
+
+            definition = _getDefinition(item)
+            key = (definition[0], tuple(definition[1]))
+            itemId = self._definitionIds.get(key)
+            if itemId is None:
+                itemId = len(self._items)
+                self._items.append(item)
+                self._definitionIds[key] = itemId
+            self._ids[item] = itemId
+
+            return itemId
+
+    def getItem(self, itemId):
+        """
+        Returns the canonical item of an ID.
+
+        @param itemId:    ID of an item definition.
+
+        @return:          The item.
+        """
+        with self._lock:
+            return self._items[itemId]
+
+    def intern(self, item):
+        """
+        Returns the canonical item with the same definition as an item.
+
+        @param item:      The item.
+
+        @return:          The canonical item.
+        """
+        with self._lock:
+            return self._items[self.getId(item)]
+
+    def getIds(self, itemList):
+        """
+        Returns the IDs of a list of items as a compact array.
+
+        @param itemList:  List of items.
+
+        @return:          array("i") of IDs.
+        """
+        getId = self.getId
+        with self._lock:
+            return array("i", [getId(item) for item in itemList])
+
+    def getItems(self, itemIds):
+        """
+        Returns the canonical items of a sequence of IDs.
+
+        @param itemIds:   Sequence of IDs, such as returned by getIds().
+
+        @return:          List of items.
+        """
+        itemList = self._items
+        with self._lock:
+            return [itemList[itemId] for itemId in itemIds]
+
+    def getDefinition(self, itemId):
+        """
+        Returns the definition of an ID in a form that marshal and repr()
+        handle.
+
+        @param itemId:    ID of an item definition.
+
+        @return:          2-element tuple of the item's class, as a dotted
+                          path, and a sorted list of (attribute, value) pairs.
+        """
+        with self._lock:
+            return _getDefinition(self._items[itemId])
+
+    def addDefinition(self, definition):
+        """
+        Returns the ID of an item definition, creating an item for it if it
+        is new.
+
+        @param definition:  Definition, as returned by getDefinition().
+
+        @return:            ID of the definition.
+        """
+        classPath, attributes = definition
+        with self._lock:
+            itemId = self._definitionIds.get((classPath, tuple(attributes)))
+        if itemId is not None:
+            return itemId
+
+        moduleName, className = classPath.rsplit(".", 1)
+        cls = getattr(importlib.import_module(moduleName), className)
+        if not issubclass(cls, Item):
+            errorMsg = "Item definition has non-Item class: %s" % classPath
+            raise AssertionError(errorMsg)
+
+        #Another thread may have added the definition; getId() finds it
+        item = object.__new__(cls)
+        item.__dict__ = dict(attributes)
+        return self.getId(item)
+
+    def getItemCount(self):
+        """
+        Returns the number of item definitions in the catalog.
+
+        @return:          Number of definitions.
+        """
+        return len(self._items)
+
+    def getBuiltInCount(self):
+        """
+        Returns the number of built-in item definitions.
+
+        @return:          Number of built-in definitions.
+        """
+        return self._builtInCount
+
+    def getFingerprint(self):
+        """
+        Returns a hash of the built-in item definitions.
+
+        @return:          The fingerprint, as a hex string.
+        """
+        return self._fingerprint
+
+_catalog = None
+_catalogLock = threading.Lock()
+
+def getItemCatalog():
+    """
+    Returns the process-wide item catalog, creating it on first use. Its
+    built-in items are those in items.unique_items.
+
+    @return:    The ItemCatalog.
+    """
+    global _catalog
+
+    #Game servers may start several sessions at once
+    with _catalogLock:
+        if _catalog is None:
+            _catalog = ItemCatalog(_findBuiltInItems())
+
+    return _catalog
+
+def _getDefinition(item):
+    """
+    Helper function that returns the definition of an item.
+    """
+    cls = item.__class__
+    return ("%s.%s" % (cls.__module__, cls.__name__),
+        sorted(item.__dict__.items()))
+
+def _getSortKey(value):
+    """
+    Helper function that orders dictionary keys the same way in every
+    process, whether they are items or not.
+    """
+    if isinstance(value, Item):
+        return (1, _getDefinition(value))
+
+    return (0, value)
+
+def _findBuiltInItems():
+    """
+    Helper function that lists the items in items.unique_items, in a fixed
+    order.
+    """
+    builtInItems = []
+
+    def collect(value):
+        if isinstance(value, Item):
+            builtInItems.append(value)
+        elif isinstance(value, (list, tuple)):
+            for element in value:
+                collect(element)
+        elif isinstance(value, dict):
+            #Shop distributions are keyed by item
+            for key in sorted(value, key = _getSortKey):
+                collect(key)
+                collect(value[key])
+
+    for name in sorted(vars(items.unique_items)):
+        collect(getattr(items.unique_items, name))
+
+    return builtInItems
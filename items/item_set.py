@@ -1,10 +1,28 @@
 #!/usr/bin/python
 
+from bisect import bisect_left, insort
+
 from items.item import Item
+from util.prefix_trie import PrefixTrie
 
 class ItemSet(object):
     """
     A collection of items.
+
+    Each addition of an item is stored under a serial number that is unique
+    within the collection and increases with every addition. Indexes from
+    item and from item name to their serial numbers make lookups and
+    removals constant time. An item may be added more than once, in which
+    case it is counted once per addition.
+
+    Items are visited in order of their sort key, and in the order they were
+    added among equal keys. Keys are kept sorted as items are added and
+    removed, so reading items never sorts. ItemSet gives every item the same
+    key; child classes may override _sortKey() to order items differently.
+
+    Item names may also be looked up by prefix through getNameTrie(). The
+    trie is built the first time it is requested and kept up to date from
+    then on.
     """
     def __init__(self, itemSet=None):
         """
@@ -13,7 +31,12 @@ class ItemSet(object):
         @keyword itemSet:     (Optional) A single Item object or a
                                list of Item objects.
         """
-        self._items = []
+        self._nextSerial = 0
+        self._items = {}
+        self._order = []
+        self._itemIndex = {}
+        self._nameIndex = {}
+        self._nameTrie = None
         self._weight = 0
 
         #Received single item
@@ -35,7 +58,15 @@ class ItemSet(object):
             errorMsg = "ItemSet.addItem() passed non-Item object."
             raise AssertionError(errorMsg)
 
-        self._items.append(item)
+        serial = self._nextSerial
+        self._nextSerial += 1
+        self._items[serial] = item
+        insort(self._order, (self._sortKey(item), serial))
+        self._itemIndex.setdefault(item, []).append(serial)
+        serials = self._nameIndex.setdefault(item.getName(), [])
+        serials.append(serial)
+        if self._nameTrie is not None and len(serials) == 1:
+            self._nameTrie.add(item.getName())
         self._weight += item.getWeight()
         
     def addItems(self, items):
@@ -62,9 +93,11 @@ class ItemSet(object):
         """
         Returns list of items contained by ItemSet.
 
-        @return:     List of items contained by ItemSet.
+        @return:     List of items contained by ItemSet. Changing the list does
+                     not change the ItemSet.
         """
-        return self._items
+        items = self._items
+        return [items[serial] for key, serial in self._order]
 
     def getItemByName(self, name):
         """
@@ -75,28 +108,67 @@ class ItemSet(object):
                         Returns None if the item
                         cannot be found.
         """
-        for item in self._items:
-            if item.getName() == name:
-                return item
-                
-        return None
+        serials = self._nameIndex.get(name)
+        if not serials:
+            return None
+
+        return self._items[serials[0]]
     
     def removeItem(self, item):
         """
         Removes an item.
 
-        @param item:    An item in this collection.
+        @param item:    An item in this collection. If it was added more than
+                        once, its earliest addition is removed.
         """
-        self._items.remove(item)
-        self._weight -= int(item.getWeight())
+        serials = self._itemIndex.get(item)
+        if not serials:
+            errorMsg = "ItemSet.removeItem() given item not in ItemSet."
+            raise AssertionError(errorMsg)
+
+        serial = serials.pop(0)
+        if not serials:
+            del self._itemIndex[item]
+
+        #Only items with the same name share this list, so it is short
+        serials = self._nameIndex[item.getName()]
+        serials.remove(serial)
+        if not serials:
+            del self._nameIndex[item.getName()]
+            if self._nameTrie is not None:
+                self._nameTrie.remove(item.getName())
+
+        entry = (self._sortKey(item), serial)
+        del self._order[bisect_left(self._order, entry)]
+        del self._items[serial]
+        self._weight -= item.getWeight()
+        #Rounding errors of fractional weights do not outlast the items
+        if not self._items:
+            self._weight = 0
         
     def clearItems(self):
         """
         Clears items stored in ItemSet.
         """
-        self._items = []
+        self._items = {}
+        self._order = []
+        self._itemIndex = {}
+        self._nameIndex = {}
+        self._nameTrie = None
         self._weight = 0
    
+    def getNameTrie(self):
+        """
+        Returns the names of the items, indexed by prefix.
+
+        @return:        PrefixTrie of item names. It changes as items are added
+                        and removed and must not be changed by the caller.
+        """
+        if self._nameTrie is None:
+            self._nameTrie = PrefixTrie(self._nameIndex)
+
+        return self._nameTrie
+
     def containsItem(self, item):
         """
         Determines if item is contained in this collection.
@@ -104,7 +176,7 @@ class ItemSet(object):
         @param item:    An item.
         @return:        True if item is in this collection, False otherwise.
         """
-        return (item in self._items)
+        return item in self._itemIndex
 
     def containsItemWithName(self, itemName):
         """
@@ -115,11 +187,7 @@ class ItemSet(object):
         @return:             True if item with given name is present,
                              False otherwise
         """
-        for item in self._items:
-            if item._name == itemName:
-                return True
-                
-        return False
+        return itemName in self._nameIndex
 
     def count(self):
         """
@@ -139,6 +207,21 @@ class ItemSet(object):
  
     def __iter__(self):
         """
-        Provides an iterator for sets of items.
+        Provides an iterator for sets of items. Items may be added or removed
+        while iterating.
+        """
+        return iter(self.getItems())
+
+    def _sortKey(self, item):
+        """
+        Determines where an item goes in the order of items. Items with lower
+        keys come first.
+
+        Child classes may override this method. Keys must be comparable with
+        each other and must not change while the item is in the collection.
+
+        @param item:    An item.
+
+        @return:        The item's sort key.
         """
-        return iter(self._items)
\ No newline at end of file
+        return ()
@@ -0,0 +1,35 @@
+#!/usr/bin/python
+
+from items.item_set import ItemSet
+from items.weapon import Weapon
+from items.armor import Armor
+from items.charm import Charm
+from items.potion import Potion
+
+class SortedItemSet(ItemSet):
+    """
+    A collection of items kept in display order: weapons, then armor, then
+    charms, potions and other items, each of the last three sorted by name.
+
+    Weapons and armor, and items with the same name, keep the order in which
+    they were added. Used for player inventory and equipment and for shop
+    wares.
+    """
+    def _sortKey(self, item):
+        """
+        Determines where an item goes in display order.
+
+        @param item:    An item.
+
+        @return:        The item's sort key.
+        """
+        if isinstance(item, Weapon):
+            return (0,)
+        elif isinstance(item, Armor):
+            return (1,)
+        elif isinstance(item, Charm):
+            return (2, item.getName())
+        elif isinstance(item, Potion):
+            return (3, item.getName())
+        else:
+            return (4, item.getName())
@@ -11,6 +11,11 @@ import constants
 A storing place for some of the unique items of the game.
 
 For instance, "The One Ring."
+
+Items are immutable, so the same objects are shared by every game in the 
+process. The collections below are templates: they are tuples where possible, 
+and games work on their own copies (see game_loader.getStartingInventory() and 
+Square) instead of modifying them.
 """
 #Items - Story
 #Starting Inventory
@@ -18,7 +23,7 @@ sting = Weapon("Sting", "Elvish - made in Gondolin", 2, 22, 8)
 theOneRing = Item("The One Ring", "Very important", 6, 540)
 leatherCloak = Armor("Leather Cloak", "Travel tunic", 3, 8, 1)
 vodka = Potion("Vodka", "Good for health", 1, 4, 5)
-startingInventory = [sting, theOneRing, leatherCloak, vodka]
+startingInventory = (sting, theOneRing, leatherCloak, vodka)
 
 #Hobbiton Square
 walkingCane = Item("Walking Cane", "Dubiously helpful", 2, 2)
@@ -26,7 +31,7 @@ tea = Potion("Tea", "A delightful refreshment", 1, 4, 6)
 newspaper = Item("The Shire Newspaper", "Mostly tabloids... about hobbits", 
 0, 0)
 hobbitonSquareItems = {"Naftel Took": walkingCane, 
-"Amaranth Brandybuck": [tea, newspaper]}
+"Amaranth Brandybuck": (tea, newspaper)}
 
 #Council of Elrond
 legolasHair = Item("Legolas' Hair", "Industrial applications", 0, 12)
@@ -55,7 +60,7 @@ prancingPonyItems = {"Harry Goatleaf": bulletin, "Dudo Baggins": tea}
 elvenCloak = Armor("Elven Cloak", "A gift from Galadriel", 4, 62, 3)
 phialOfGaladriel = Item("Phial of Galadriel", 
 "\"May it be a light for you in dark places\"", 1, 92)
-galadrielsMirrorItems = {"Galadriel": [elvenCloak, phialOfGaladriel]}
+galadrielsMirrorItems = {"Galadriel": (elvenCloak, phialOfGaladriel)}
 
 #Helm's Deep Commons
 vodka = Potion("Koskenkorva", "Rohirric Poisons", 1, 12, 32)
@@ -91,7 +96,7 @@ executorSword = Weapon("Executor Sword", "A gift from Prince Imrahil",
 12, 112, 26)
 journal = Item("Swan Knight's Journal", "Details experiences on the eastern front",
 1, 42)
-towerOfEchelionItems = {"Denethor": [palatir, windbeam], 
+towerOfEchelionItems = {"Denethor": (palatir, windbeam), 
 "Prince Imrahil": executorSword, "Swan Knight": journal}
 
 #Beach
@@ -99,14 +104,14 @@ draagz = Item("Draagz", "Bad for health", 2, 76)
 vodka = Potion("Vodka", "From the Gondorian heartland", 1, 52, 48)
 flowersAndTrinkets = Charm("Flowers and Trinkets", "Mental health bonuses", 
     5, 72, 6, 0, 18)
-beachItems = {"Gondorian bro #3": [draagz, vodka], 
+beachItems = {"Gondorian bro #3": (draagz, vodka), 
 "Gondorian bro #2": flowersAndTrinkets}
 
 #Elven Rings
 narya = Charm("Nanya", "Elven Ring of Fire", 0, 270, 100, 0, 0)
 nenya = Charm("Nenya", "Elven Ring of Water", 0, 280, 0, 0, 500)
 vilya = Charm("Vilya", "Elven Ring of Air", 0, 265, 0, 15, 0)
-elvenRings = [narya, nenya, vilya]
+elvenRings = (narya, nenya, vilya)
 
 #Shop weapons
 #Eriador Shops
@@ -337,12 +342,12 @@ crownOfElendil = Armor("Crown of Elendil",
 ironCrown = Armor("Iron Crown", "Forged by Morgoth to hold the Silmaril", 
     10, 316, 22)
 
-lowLevelFindableUniques = [guthwine, herugrim, orchrist, tarhelmCrown, 
-    snowclash, razortail, nightsmoke, peasantCrown, crownOfThieves]
+lowLevelFindableUniques = (guthwine, herugrim, orchrist, tarhelmCrown, 
+    snowclash, razortail, nightsmoke, peasantCrown, crownOfThieves)
 
-highLevelFindableUniques = [glamdring, anglachel, angrist, anguirel, 
+highLevelFindableUniques = (glamdring, anglachel, angrist, anguirel, 
     belthronding, dramborleg, scepterOfAnnuminas, helmOfHador, 
-    harlequinCrestShako, templarsMight, tyraelsMight]
+    harlequinCrestShako, templarsMight, tyraelsMight)
 
-eliteLevelFindableUniques = [aeglos, ananruth, ringil, grond, crownOfElendil, 
-    ironCrown]
+eliteLevelFindableUniques = (aeglos, ananruth, ringil, grond, crownOfElendil, 
+    ironCrown)
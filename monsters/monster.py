@@ -1,25 +1,31 @@
 #!/usr/bin/python
 
-class Monster(object):
+class MonsterKind(object):
     """
-    A generic monster to be used as a parent for specific future monster 
-    classes.
+    A kind of monster, such as an Orc or the Witch King.
+
+    Kinds hold everything that monsters of that kind have in common and are
+    shared by all of them. They should not be modified after creation.
     """
-    def __init__(self, name, description, stats, attackString, deathString):
+    __slots__ = ("_kindName", "_name", "_description", "_hp", "_attack",
+        "_experience", "_attackString", "_deathString")
+
+    def __init__(self, kindName, name, description, stats, attackString,
+        deathString):
         """
-        Initializes a monster object.
+        Initializes a monster kind.
 
+        @param kindName:      Key of the kind in the monster tables in
+                              constants. For instance, "Orc_II". None for
+                              kinds that are not in the tables.
         @param name:          Name of monster.
         @param description:   Description of monster.
-        @param stats:         3-element list of Monster stats including 
-                              attack, hp, and experience (in that order).
-        @param attackString:  The string displayed with an monster attack. For 
-                              instance, Miles "got really pissed and started 
-                              charging around."
-        @param deathString:   The string displayed with monster death. For 
-                              instance, "Miles decided that he's had enough 
-                              and went back home."
+        @param stats:         3-element list of Monster stats including
+                              hp, attack, and experience (in that order).
+        @param attackString:  The string displayed with a monster attack.
+        @param deathString:   The string displayed with monster death.
         """
+        self._kindName = kindName
         self._name = name
         self._description = description
         self._hp = stats[0]
@@ -27,7 +33,15 @@ class Monster(object):
         self._experience = stats[2]
         self._attackString = attackString
         self._deathString = deathString
-        
+
+    def getKindName(self):
+        """
+        Gets the key of the kind in the monster tables.
+
+        @return: Kind name.
+        """
+        return self._kindName
+
     def getName(self):
         """
         Gets monster name.
@@ -35,40 +49,162 @@ class Monster(object):
         @return: Monster name.
         """
         return self._name
-    
+
     def getDescription(self):
         """
-        Gets monster's description.
+        Gets monster description.
 
         @return: Monster description.
         """
         return self._description
 
+    def getHp(self):
+        """
+        Gets starting HP of monsters of this kind.
+
+        @return: Monster HP.
+        """
+        return self._hp
+
+    def getAttack(self):
+        """
+        Gets monster attack.
+
+        @return: Monster attack.
+        """
+        return self._attack
+
+    def getExperience(self):
+        """
+        Gets monster experience.
+
+        @return: Monster experience.
+        """
+        return self._experience
+
+    def getAttackString(self):
+        """
+        Gets monster attack string.
+
+        @return: Monster attack string.
+        """
+        return self._attackString
+
+    def getDeathString(self):
+        """
+        Gets monster death string.
+
+        @return: Monster death string.
+        """
+        return self._deathString
+
+class Monster(object):
+    """
+    A monster in battle.
+
+    Monsters only keep track of their own HP. Everything else comes from their
+    MonsterKind. Monsters of the kinds in the game's monster tables are
+    created by factories.monster_factory.
+
+    Large battles create many monsters, so monsters use slots instead of an
+    attribute dictionary.
+    """
+    __slots__ = ("_kind", "_hp")
+
+    def __init__(self, name, description, stats, attackString, deathString):
+        """
+        Initializes a monster object of a new, one-off kind.
+
+        @param name:          Name of monster.
+        @param description:   Description of monster.
+        @param stats:         3-element list of Monster stats including
+                              hp, attack, and experience (in that order).
+        @param attackString:  The string displayed with an monster attack. For
+                              instance, Miles "got really pissed and started
+                              charging around."
+        @param deathString:   The string displayed with monster death. For
+                              instance, "Miles decided that he's had enough
+                              and went back home."
+        """
+        self._kind = MonsterKind(None, name, description, stats,
+            attackString, deathString)
+        self._hp = self._kind.getHp()
+
+    @classmethod
+    def fromKind(cls, kind):
+        """
+        Creates a monster of an existing kind.
+
+        @param kind:   The MonsterKind.
+
+        @return:       The new monster, at full HP.
+        """
+        monster = cls.__new__(cls)
+        monster._kind = kind
+        monster._hp = kind.getHp()
+
+        return monster
+
+    def copy(self):
+        """
+        Creates a monster of the same kind with the same HP.
+
+        @return:       The new monster.
+        """
+        monster = self.fromKind(self._kind)
+        monster._hp = self._hp
+
+        return monster
+
+    def getKind(self):
+        """
+        Gets monster's kind.
+
+        @return: Monster kind.
+        """
+        return self._kind
+
+    def getName(self):
+        """
+        Gets monster name.
+
+        @return: Monster name.
+        """
+        return self._kind.getName()
+
+    def getDescription(self):
+        """
+        Gets monster's description.
+
+        @return: Monster description.
+        """
+        return self._kind.getDescription()
+
     def getHp(self):
         """
         Get monster's HP.
-        
+
         @return: Monster HP.
         """
         return self._hp
-    
+
     def attack(self, target):
         """
         Simulates attacking a given target.
 
         @param target: Target to attack.
         """
-        target.takeAttack(self._attack)
+        target.takeAttack(self._kind.getAttack())
 
     def getAttack(self):
         """
         Get monster's attack.
-        
+
         @return: Monster attack.
         """
-        return self._attack
-        
-    def takeAttack(self, attack): 
+        return self._kind.getAttack()
+
+    def takeAttack(self, attack):
         """
         Simulates taking an attack.
         HP cannot be less than zero.
@@ -76,14 +212,14 @@ class Monster(object):
         @param attack: Amount of attack taken.
         """
         self._hp = max(self._hp - attack, 0)
-        
+
     def getExperience(self):
         """
         Gets monster's experience.
 
         @return: Monster experience.
         """
-        return self._experience
+        return self._kind.getExperience()
 
     def getAttackString(self):
         """
@@ -91,7 +227,7 @@ class Monster(object):
 
         @return: Monster attack string.
         """
-        return self._attackString
+        return self._kind.getAttackString()
 
     def getDeathString(self):
         """
@@ -99,4 +235,4 @@ class Monster(object):
 
         @return: Monster death string.
         """
-        return self._deathString
\ No newline at end of file
+        return self._kind.getDeathString()
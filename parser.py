@@ -1,41 +1,120 @@
 #!/usr/bin/python
 
+from collections import deque
+
 import constants
 from commands.command_words import CommandWords
+from game_io import ConsoleIO
 
 class Parser(object):
     """
     Parses user input, searching for registered commands.
     """
-    def __init__(self, commandWords):
+    def __init__(self, commandWords, io = None):
         """
         Initializes parser.
 
         @param commandWords:     List of commands.
+        @keyword io:             (Optional) The GameIO object commands are 
+                                 read from. Defaults to the terminal.
         """
         if not commandWords:
             errorMsg = "Parser must be initialized with CommandWords object."
             raise AssertionError(errorMsg)
 
         self._commandWords = commandWords
+        self._pending = deque()
+
+        if io is None:
+            io = ConsoleIO()
+        self._io = io
 
     def getNextCommand(self):
         """
         Retrieves next command from user.
+
+        A line of input may hold several commands separated by 
+        constants.COMMAND_SEPARATOR, which are returned one per call before 
+        the user is prompted again. A command may be followed by an argument, 
+        as in "equip Sting", which answers the command's prompt. Commands and
+        arguments may be shortened to any prefix that only one name starts
+        with, as in "un sti".
+
+        @return:    The command, with its argument set.
         """
-        userInput = raw_input(constants.COMMAND_PROMPT)
-        userInput = userInput.strip().lower()
+        while True:
+            if not self._pending:
+                userInput = self._io.input(constants.COMMAND_PROMPT)
+                self._pending.extend(part.strip() for part in 
+                    userInput.split(constants.COMMAND_SEPARATOR))
+
+            userInput = self._pending.popleft()
+            name, argument = self._splitArgument(userInput)
+            if self._commandRecognized(name):
+                command = self._commandWords.getCommand(name)
+                if argument is None or command.takesArgument():
+                    command.setArgument(argument)
+                    return command
 
-        while not self._commandRecognized(userInput):
-            print ("Command '%s' not recognized. Type 'help' for help." 
-            % userInput)
-            print ""
+            #Rest of the line depended on this command
+            self._pending.clear()
+            self._io.output("Command '%s' not recognized. Type 'help' for help." 
+            % userInput.lower())
+            self._io.output()
 
-            userInput = raw_input(constants.COMMAND_PROMPT)
-            userInput = userInput.strip().lower()
+    def complete(self, text):
+        """
+        Returns the ways that a partly typed command may be completed. Command
+        names are completed until one is typed in full, followed by a space;
+        after that, its argument is completed from the names it accepts.
+
+        @param text:        A single command, as typed so far.
+
+        @return:            Sorted list of completed commands, in lower case
+                            up to the argument.
+        """
+        words = text.split()
+        lowerWords = [word.lower() for word in words]
+
+        #A command name typed in full, followed by at least a space
+        for length in range(len(words), 0, -1):
+            name = " ".join(lowerWords[:length])
+            if (length == len(words) and not text[-1:].isspace() or
+                not self._commandWords.isCommand(name)):
+                continue
+
+            names = self._commandWords.getCommand(name).getArgumentNames()
+            if names is None:
+                return []
+            argument = " ".join(words[length:])
+            return ["%s %s" % (name, completion) for completion in 
+                names.getCompletions(argument)]
+
+        return self._commandWords.getCompletions(" ".join(lowerWords))
+
+    def _splitArgument(self, userInput):
+        """
+        Helper method that splits input into a command name and an argument.
+        The longest run of words that is a command name, or the start of only 
+        one command name, in any case, is taken.
+
+        @param userInput:   A single command, as typed by user.
+
+        @return:            2-element tuple of the command name and the rest 
+                            of the input, or None if there is nothing more.
+                            The command name is in lower case if it was not
+                            recognized.
+        """
+        words = userInput.split()
+        lowerWords = [word.lower() for word in words]
+        
+        for length in range(len(words), 0, -1):
+            name = self._commandWords.resolveCommand(
+                " ".join(lowerWords[:length]))
+            if name:
+                return name, " ".join(words[length:]) or None
 
-        command = self._commandWords.getCommand(userInput)
-        return command
+        return " ".join(lowerWords), None
 
     def _commandRecognized(self, name):
         """
@@ -51,7 +51,7 @@ class Place(object):
         self._space = space
         self._targetSpace = targetSpace
         
-    def _createPort(self, direction, executed = False):
+    def _createPort(self, direction, player):
         """
         Creates a port between the space and targetSpace. In this
         construction, targetSpace is to the direction of space.
@@ -61,9 +61,11 @@ class Place(object):
         
         @param direction:     The direction targetSpace is in with 
                               respect to space.
-        @param executed:      If this method has been executed. False by 
-                              default.
+        @param player:        The current player, who is told of the new 
+                              port.
         """
+        io = player.getIo()
+
         #If already executed, no need to create additional port
         if self._portCreated:
             return
@@ -73,8 +75,8 @@ class Place(object):
             outgoingOnly = False)
         string = "%s is now accessible to the %s" % (self._targetSpace.getName(), 
             direction)
-        print string.upper()
-        print ""
+        io.output(string.upper())
+        io.output()
         
         self._portCreated = True
         
@@ -84,4 +86,6 @@ class Place(object):
         
         @param player:  The current player.
         """
-        print "This enter method should be overridden by child class."
\ No newline at end of file
+        io = player.getIo()
+
+        io.output("This enter method should be overridden by child class.")
\ No newline at end of file
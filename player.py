@@ -1,30 +1,88 @@
 #!/usr/bin/python
 
+from bisect import bisect_right
 from math import floor
 
 from items.item import Item
-from items.weapon import Weapon
-from items.armor import Armor
-from items.potion import Potion
-from items.charm import Charm
-from items.item_set import ItemSet
-from util.helpers import sortItems
+from items.sorted_item_set import SortedItemSet
+from items.equipment import Equipment
+from game_io import ConsoleIO
+from util.prefix_trie import PrefixTrie
+from session_random import SessionRandom
 import constants
 
+def _buildLevelTables():
+    """
+    Helper function that calculates the experience required for and the stats
+    gained at every level, the same way stats grow one level at a time.
+
+    @return:    2-element tuple. The first element is a list of experience
+                requirements ordered by level. The second is a list of 
+                3-element tuples of maximum HP, attack and weight limit; its 
+                element i holds the stats at level i + 1.
+    """
+    levelExperience = []
+    levelStats = []
+
+    maxHp = constants.PlayerInitialization.MAX_HP
+    attack = constants.PlayerInitialization.ATTACK
+    weightLimit = constants.PlayerInitialization.WEIGHT_LIMIT
+    for level in range(1, constants.MAX_LEVEL + 1):
+        if level > 1:
+            maxHp = floor(maxHp * constants.HP_STAT)
+            attack = floor(attack * constants.ATTACK_STAT)
+            weightLimit = floor(weightLimit * constants.WEIGHT_LIMIT_STAT)
+        levelExperience.append(constants.LEVEL_EXP_REQUIREMENT[level])
+        levelStats.append((maxHp, attack, weightLimit))
+
+    return levelExperience, levelStats
+
+#Calculated once, at import
+_LEVEL_EXPERIENCE, _LEVEL_STATS = _buildLevelTables()
+
+def getLevelStats(level):
+    """
+    Returns player stats at a given level, excluding items.
+
+    @param level:    Player level.
+
+    @return:         3-element tuple of maximum HP, attack and weight limit.
+    """
+    return _LEVEL_STATS[level - 1]
+
 class Player(object):
     """
     Represents the (human) player.
     """
-    def __init__(self, name, location):
+    def __init__(self, name, location, io = None, battlePolicy = None,
+        sessionRandom = None):
         """
         Initializes the player.
         
         @param name:             The name of the player (e.g. "Frodo").
         @param location:         The location of player. When initialized,
                                  given space "shire."
+        @keyword io:             (Optional) The GameIO object through which 
+                                 the player is prompted. Defaults to the 
+                                 terminal.
+        @keyword battlePolicy:   (Optional) The BattlePolicy that fights 
+                                 battles for the player. Defaults to 
+                                 prompting the user.
+        @keyword sessionRandom:  (Optional) The SessionRandom of player's 
+                                 session. Defaults to a new one with a 
+                                 random seed.
         """
         self._name      = name
         self._location  = location
+
+        if io is None:
+            io = ConsoleIO()
+        self._io = io
+        self._battlePolicy = battlePolicy
+
+        if sessionRandom is None:
+            sessionRandom = SessionRandom()
+        self._sessionRandom = sessionRandom
         
         #Initialize player stats
         self._money      = constants.PlayerInitialization.MONEY
@@ -37,22 +95,12 @@ class Player(object):
         self._weightLimit = constants.PlayerInitialization.WEIGHT_LIMIT
         
         #Initialize player inventory and equipment
-        self._inventory = ItemSet()
-        self._equipped  = ItemSet()
+        self._inventory = SortedItemSet()
+        self._equipped  = Equipment()
 
-        #Initialize item-based bonuses
-        self._weaponAttack = constants.PlayerInitialization.WEAPON_ATTACK
-        self._armorDefense = constants.PlayerInitialization.ARMOR_DEFENSE
-        
-        self._charmAttack   = constants.PlayerInitialization.CHARM_ATTACK
-        self._charmDefense  = constants.PlayerInitialization.CHARM_DEFENSE
-        self._charmHp       = constants.PlayerInitialization.CHARM_HP
-
-        #Update player stats for item-based bonuses
-        self._totalAttack    = (self._attack + self._weaponAttack + 
-            self._charmAttack)
-        self._totalDefense   = self._armorDefense + self._charmDefense
-        self._totalMaxHp     = self._maxHp + self._charmHp
+        #Calculate player stats including item-based bonuses
+        self._statsDirty = True
+        self._updateStats()
         
     def getName(self):
         """
@@ -62,13 +110,56 @@ class Player(object):
         """
         return self._name
 
+    def getIo(self):
+        """
+        Returns the GameIO object through which the player is prompted.
+
+        @return:          Player's GameIO object.
+        """
+        return self._io
+
+    def getSessionRandom(self):
+        """
+        Returns the random number generators of player's session.
+
+        @return:          Player's SessionRandom.
+        """
+        return self._sessionRandom
+
+    def getRandom(self, stream):
+        """
+        Returns a stream of random numbers of player's session.
+
+        @param stream:    A constants.RandomStream.
+
+        @return:          The stream's random.Random.
+        """
+        return self._sessionRandom.getStream(stream)
+
+    def getBattlePolicy(self):
+        """
+        Returns the BattlePolicy that fights battles for the player.
+
+        @return:          Player's BattlePolicy, or None if the user is 
+                          prompted.
+        """
+        return self._battlePolicy
+
+    def setBattlePolicy(self, battlePolicy):
+        """
+        Sets the BattlePolicy that fights battles for the player.
+
+        @param battlePolicy:   The BattlePolicy, or None to prompt the user.
+        """
+        self._battlePolicy = battlePolicy
+
     def attack(self, target):
         """
         Allows player to attack target. 
 
         @param target:    The target player is to attack.
         """
-        target.takeAttack(self._totalAttack)
+        target.takeAttack(self.getTotalAttack())
         
     def getAttack(self):
         """
@@ -84,6 +175,7 @@ class Player(object):
 
         @return:          Total player attack value.
         """
+        self._updateStats()
         return self._totalAttack
 
     def takeAttack(self, attack):
@@ -92,7 +184,7 @@ class Player(object):
 
         @param attack:     The attack player is to receive.
         """
-        self._hp = max(self._hp - max(attack - self._totalDefense, 0), 0)
+        self._hp = max(self._hp - max(attack - self.getTotalDefense(), 0), 0)
         
     def getTotalDefense(self):
         """
@@ -100,6 +192,7 @@ class Player(object):
         
         @return:     Player's total defense stat.
         """
+        self._updateStats()
         return self._totalDefense
         
     def getCharmAttack(self):
@@ -108,7 +201,7 @@ class Player(object):
         
         @return:     Player's charm attack stat.
         """
-        return self._charmAttack
+        return self._equipped.getCharmAttack()
         
     def getCharmDefense(self):
         """
@@ -116,7 +209,7 @@ class Player(object):
         
         @return:     Player's charm defense stat.
         """
-        return self._charmDefense
+        return self._equipped.getCharmDefense()
         
     def getCharmHp(self):
         """
@@ -124,7 +217,7 @@ class Player(object):
         
         @return:     Player's charm hp stat.
         """
-        return self._charmHp
+        return self._equipped.getCharmHp()
         
     def getWeightLimit(self):
         """
@@ -164,44 +257,26 @@ class Player(object):
         
     def _updateLevel(self):
         """
-        Levels up player and updates player stats. This method creates a list 
-        of levels for which player experiences qualifies. Player level is the 
-        highest level for which player experience qualifies. 
+        Levels up player and updates player stats. Player level is the 
+        highest level for which player experience qualifies, found by 
+        bisection of the experience requirements.
         
-        After level-up is determined, player stats are updated.
+        After level-up is determined, player stats are looked up in a table 
+        calculated at import.
         """
-        #Checks to see if player is max level
-        if self._level == constants.MAX_LEVEL:
-            return
-            
-        #Check to see if player has leveled up
-        currentLevel = self._level
-        potentialLevels = []
-        
-        #Create list of levels for which player experience qualifies
-        for level in constants.LEVEL_EXP_REQUIREMENT:
-            if self._experience >= constants.LEVEL_EXP_REQUIREMENT[level]:
-                potentialLevels.append(level)
-        
-        #Player level is the highest of the qualified levels
-        potentialNewLevel = max(potentialLevels)
+        #Highest level for which player experience qualifies
+        newLevel = bisect_right(_LEVEL_EXPERIENCE, self._experience)
         
         #If player has leveled up
-        if currentLevel != potentialNewLevel:
-            numberLevelUp = potentialNewLevel - currentLevel
-            self._level = potentialNewLevel
-            print "\n%s leveled up! %s is now level %s!" \
-                  % (self._name, self._name, self._level)
+        if newLevel > self._level:
+            self._level = newLevel
+            self._io.output("\n%s leveled up! %s is now level %s!"
+                  % (self._name, self._name, self._level))
                   
-            #Updates player level and stats
-            for level in range(numberLevelUp):
-                self._maxHp = floor(self._maxHp * constants.HP_STAT)
-                self._totalMaxHp = self._maxHp + self._charmHp
-                self._attack = floor(self._attack * constants.ATTACK_STAT)
-                self._totalAttack = (self._attack + self._weaponAttack + 
-                    self._charmAttack)
-                self._weightLimit = floor(self._weightLimit * 
-                    constants.WEIGHT_LIMIT_STAT)
+            #Updates player stats
+            self._maxHp, self._attack, self._weightLimit = getLevelStats(
+                newLevel)
+            self._statsDirty = True
             
     def getHp(self):
         """
@@ -225,6 +300,7 @@ class Player(object):
 
         @return:    Player maximum hp.
         """
+        self._updateStats()
         return self._totalMaxHp
         
     def heal(self, amount):
@@ -233,9 +309,11 @@ class Player(object):
 
         @param amount:    The amount of hp to be healed.
         """
+        totalMaxHp = self.getTotalMaxHp()
+
         #If amount that player may be healed is less than amount possible
-        if self._totalMaxHp - self._hp < amount:
-            amountHealed = self._totalMaxHp - self._hp
+        if totalMaxHp - self._hp < amount:
+            amountHealed = totalMaxHp - self._hp
             
         #If amount that player may be healed is greater than or equal to the 
         #amount possible
@@ -256,47 +334,26 @@ class Player(object):
         @param item:    The item to be equipped.
         """
         #Check to see that preconditions are met
-        if item not in self._inventory:
+        if not self._inventory.containsItem(item):
             statement =  "%s not currently in inventory." % item.getName()
             return statement
-        if not (isinstance(item, Armor) or isinstance(item, Weapon) or 
-            isinstance(item, Charm)):
+        if not self._equipped.canEquip(item):
             statement = "Item must be a weapon, armor, or charm."
             return statement
-        if item in self._equipped:
+        if self._equipped.containsItem(item):
             statement =  "%s already equipped." % item.getName()
             return statement
         
         #Unequip currently equipped armor/weapon if necessary
-        for currentItem in self._equipped:
-            if isinstance(item, Weapon) and isinstance(currentItem, Weapon):  
-                self.unequip(currentItem)
-            elif isinstance(item, Armor) and isinstance(currentItem, Armor):
-                self.unequip(currentItem)
+        currentItem = self._equipped.getItemInSlot(item.getType())
+        if currentItem:
+            self.unequip(currentItem)
 
         #Equip new item
         self._equipped.addItem(item)
-        if isinstance(item, Weapon):
-            self._weaponAttack = item.getAttack()
-            self._totalAttack = (self._attack + self._weaponAttack + 
-                self._charmAttack)
-        elif isinstance(item, Armor):
-            self._armorDefense = item.getDefense()
-            self._totalDefense = self._armorDefense + self._charmDefense
-        elif isinstance(item, Charm):
-            self._charmAttack += item.getAttack()
-            self._charmDefense += item.getDefense()
-            self._charmHp += item.getHp()
-            self._totalAttack = (self._attack + self._weaponAttack + 
-                self._charmAttack)
-            self._totalDefense = self._armorDefense + self._charmDefense
-            self._totalMaxHp = self._maxHp + self._charmHp
         
         statement = "%s equipped %s." %(self._name, item.getName())
         
-        #Sort self._equipped
-        sortItems(self._equipped)
-        
         return statement
         
     def unequip(self, item):
@@ -306,40 +363,16 @@ class Player(object):
         @param item:    The item to be unequipped.
         """
         #Precondition - that item is currently equipped.
-        if item not in self._equipped:
+        if not self._equipped.containsItem(item):
             statement = "%s not in equipped items." % item.getName()
             return statement
         
-        #Unequip item and update player stats
+        #Unequip item
         self._equipped.removeItem(item)
         
-        if isinstance(item, Weapon):
-            self._weaponAttack = 0
-            self._totalAttack = (self._attack + self._weaponAttack + 
-                self._charmAttack)
-        if isinstance(item, Armor):
-            self._armorDefense = 0
-            self._totalDefense = self._armorDefense + self._charmDefense
-        if isinstance(item, Charm):
-            charmAttack = item.getAttack()
-            charmDefense = item.getDefense()
-            charmHp = item.getHp()
-            
-            self._charmAttack -= charmAttack
-            self._charmDefense -= charmDefense
-            self._charmHp -= charmHp
-            
-            self._totalAttack = (self._attack + self._weaponAttack + 
-                self._charmAttack)
-            self._totalDefense = self._armorDefense + self._charmDefense
-            self._totalMaxHp = self._maxHp + self._charmHp
-        
         #Update player Hp for charms
         self._updateHpForCharms()
         
-        #Sort self._equipped
-        sortItems(self._equipped)
-        
         statement = "%s unequipped %s." % (self._name, item.getName())
         return statement
         
@@ -349,8 +382,29 @@ class Player(object):
         totalMaxHp.
         """
         currentHp = self._hp
-        if self._totalMaxHp < currentHp:
-            self._hp = self._totalMaxHp
+        totalMaxHp = self.getTotalMaxHp()
+        if totalMaxHp < currentHp:
+            self._hp = totalMaxHp
+
+    def _updateStats(self):
+        """
+        Recalculates total attack, total defense and total maximum HP if 
+        player's level or equipment has changed since they were last 
+        calculated.
+        """
+        equipmentVersion = self._equipped.getVersion()
+        if not self._statsDirty and equipmentVersion == self._equipmentVersion:
+            return
+
+        equipped = self._equipped
+        self._totalAttack = (self._attack + equipped.getWeaponAttack() + 
+            equipped.getCharmAttack())
+        self._totalDefense = (equipped.getArmorDefense() + 
+            equipped.getCharmDefense())
+        self._totalMaxHp = self._maxHp + equipped.getCharmHp()
+
+        self._equipmentVersion = equipmentVersion
+        self._statsDirty = False
     
     def getEquipped(self):
         """
@@ -358,8 +412,6 @@ class Player(object):
 
         @return:    Player's current gear.
         """
-        sortItems(self._equipped)
-        
         return self._equipped
     
     def addToInventory(self, item):
@@ -383,13 +435,12 @@ class Player(object):
         inventoryWeight = inventory.getWeight()
         
         if itemWeight + inventoryWeight > self._weightLimit:
-            print "You are overburdened."
+            self._io.output("You are overburdened.")
             return False
         
         #Successful execution
         inventory.addItem(item)
-        sortItems(inventory)
-        print "Added %s to inventory." % item.getName()
+        self._io.output("Added %s to inventory." % item.getName())
         return True
             
     def removeFromInventory(self, item):
@@ -400,15 +451,14 @@ class Player(object):
         @param item:   The item to be removed.
         """
         #Item must be in inventory
-        if not item in self._inventory:
+        if not self._inventory.containsItem(item):
             return
         
         #Unequip if necessary
-        if item in self._equipped:
+        if self._equipped.containsItem(item):
             self.unequip(item)
             
         self._inventory.removeItem(item)
-        sortItems(self._inventory)
     
     def getInventory(self):
         """
@@ -416,8 +466,6 @@ class Player(object):
 
         @return:    Player's inventory.
         """
-        sortItems(self._inventory)
-        
         return self._inventory
    
     def getMoney(self):
@@ -454,12 +502,7 @@ class Player(object):
 
         @return:    True if possible, False otherwise.
         """
-        exit = self._location.getExit(constants.Direction.NORTH)
-
-        if exit:
-            return True
-            
-        return False
+        return self._canMove(constants.Direction.NORTH)
 
     def canMoveSouth(self):
         """
@@ -467,12 +510,7 @@ class Player(object):
 
         @return:    True if possible, False otherwise.
         """
-        exit = self._location.getExit(constants.Direction.SOUTH)
-
-        if exit:
-            return True
-            
-        return False
+        return self._canMove(constants.Direction.SOUTH)
 
     def canMoveEast(self):
         """
@@ -480,12 +518,7 @@ class Player(object):
 
         @return:    True if possible, False otherwise.
         """
-        exit = self._location.getExit(constants.Direction.EAST)
-
-        if exit:
-            return True
-            
-        return False
+        return self._canMove(constants.Direction.EAST)
 
     def canMoveWest(self):
         """
@@ -493,77 +526,93 @@ class Player(object):
 
         @return:    True if possible, False otherwise.
         """
-        exit = self._location.getExit(constants.Direction.WEST)
-
-        if exit:
-            return True
-            
-        return False
+        return self._canMove(constants.Direction.WEST)
 
-    def moveNorth(self):
+    def moveNorth(self, destination = None):
         """
         Moves player north one space.
+
+        @keyword destination:   (Optional) Name of the space to move to, in
+                                any case, if there are several to the north. 
+                                Player is asked otherwise.
         """
-        northSpace = self._location.getExit(constants.Direction.NORTH) 
-        
-        #If north space does not exist, do nothing
-        if not northSpace:
-            return
-            
-        #...Otherwise, move to new space
-        if not isinstance(northSpace, list):
-            self._location = northSpace
-        else:
-            self._moveList(northSpace)
+        self._move(constants.Direction.NORTH, destination)
 
-    def moveSouth(self):
+    def moveSouth(self, destination = None):
         """
         Moves player south one space.
-        """
-        southSpace = self._location.getExit(constants.Direction.SOUTH)
 
-        #If south space does not exist, do nothing
-        if not southSpace:
-            return
-            
-        #...Otherwise, move to new space 
-        if not isinstance(southSpace, list):
-            self._location = southSpace
-        else:
-            self._moveList(southSpace)
+        @keyword destination:   (Optional) Name of the space to move to, in
+                                any case, if there are several to the south. 
+                                Player is asked otherwise.
+        """
+        self._move(constants.Direction.SOUTH, destination)
 
-    def moveEast(self):
+    def moveEast(self, destination = None):
         """
         Moves player east one space.
-        """
-        eastSpace = self._location.getExit(constants.Direction.EAST)
 
-        #If east space does not exist, do nothing
-        if not eastSpace:
-            return
-            
-        #...Otherwise, move to new space 
-        if not isinstance(eastSpace, list):
-            self._location = eastSpace
-        else:
-            self._moveList(eastSpace)
+        @keyword destination:   (Optional) Name of the space to move to, in
+                                any case, if there are several to the east. 
+                                Player is asked otherwise.
+        """
+        self._move(constants.Direction.EAST, destination)
 
-    def moveWest(self):
+    def moveWest(self, destination = None):
         """
         Moves player west one space.
+
+        @keyword destination:   (Optional) Name of the space to move to, in
+                                any case, if there are several to the west. 
+                                Player is asked otherwise.
+        """
+        self._move(constants.Direction.WEST, destination)
+
+    def _canMove(self, direction):
+        """
+        Helper method for the four movement checks.
+
+        @param direction:   Direction of movement.
+
+        @return:            True if there is an exit in direction, False
+                            otherwise.
+        """
+        graph = self._location.getWorldGraph()
+        spaceId = graph.getSpaceId(self._location)
+
+        return len(graph.getExitIds(spaceId, direction)) > 0
+
+    def _move(self, direction, destination = None):
+        """
+        Helper method for the four movement commands. Looks up the spaces in
+        direction in the world graph.
+
+        @param direction:       Direction of movement.
+        @keyword destination:   (Optional) Name of the space to move to if
+                                there are several, or the start of only one
+                                of their names.
         """
-        westSpace = self._location.getExit(constants.Direction.WEST)
+        spaces = self._location.getWorldGraph().getExits(self._location, 
+            direction)
 
-        #If west space does not exist, do nothing
-        if not westSpace:
+        #If no space exists in direction, do nothing
+        if not spaces:
             return
-            
-        #...Otherwise, move to new space 
-        if not isinstance(westSpace, list):
-            self._location = westSpace
-        else:
-            self._moveList(westSpace)
-    
+
+        #...Otherwise, move to new space
+        if len(spaces) == 1:
+            self._location = spaces[0]
+            return
+
+        if destination:
+            names = PrefixTrie(space.getName() for space in spaces)
+            name = names.resolve(destination)
+            for space in spaces:
+                if space.getName() == name:
+                    self._location = space
+                    return
+        self._moveList(spaces)
+
     def _moveList(self, spaces):
         """
         Helper method for the four movement commands. Processes cases when 
@@ -573,14 +622,14 @@ class Player(object):
         choice = None
         
         #Solicit user input
-        print "You may move to the following:"
+        self._io.output("You may move to the following:")
         for space in spaces:
-            print "\t-%s" % space.getName()
+            self._io.output("\t-%s" % space.getName())
             acceptableChoices[space] = space.getName()
-        print ""
+        self._io.output()
         
         while choice not in acceptableChoices.values():
-            choice = raw_input("Where would you like to go? ")
+            choice = self._io.input("Where would you like to go? ")
 
         #Move to new space
         for pair in acceptableChoices.items():
@@ -596,3 +645,11 @@ class Player(object):
         @return:    Player current location.
         """
         return self._location
+
+    def setLocation(self, location):
+        """
+        Moves player directly to a space.
+
+        @param location:    The new location.
+        """
+        self._location = location
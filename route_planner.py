@@ -0,0 +1,258 @@
+#!/usr/bin/python
+
+from array import array
+from collections import deque
+import heapq
+
+import battle_engine
+import player
+import constants
+
+#Distance between spaces with no route between them
+UNREACHABLE = 2 ** 30
+
+class RoutePlanner(object):
+    """
+    Shortest routes between every pair of spaces in a WorldGraph.
+
+    Every exit counts as one step. Distances and the first step of every
+    shortest route are computed for all pairs up front, by a breadth-first
+    search from each space, so a route is read off one step at a time without
+    searching.
+
+    Adding an exit updates the tables in place; anything else requires a new
+    planner.
+    """
+    def __init__(self, graph):
+        """
+        Computes shortest routes.
+
+        @param graph:     The WorldGraph.
+        """
+        self._graph = graph
+        self._distances = []
+        self._nextHops = []
+
+        for sourceId in range(graph.spaceCount()):
+            distances, nextHops = self._search(sourceId)
+            self._distances.append(distances)
+            self._nextHops.append(nextHops)
+
+    def _search(self, sourceId):
+        """
+        Helper method that finds shortest routes from one space.
+
+        @param sourceId:  ID of the space routes start from.
+
+        @return:          2-element tuple of arrays indexed by target ID: the
+                          distance to the target, and the ID of the first
+                          space on the route to it.
+        """
+        spaceCount = self._graph.spaceCount()
+        distances = array("i", [UNREACHABLE]) * spaceCount
+        nextHops = array("i", [-1]) * spaceCount
+        distances[sourceId] = 0
+        nextHops[sourceId] = sourceId
+
+        queue = deque([sourceId])
+        while queue:
+            spaceId = queue.popleft()
+            for neighborId in self._graph.getNeighborIds(spaceId):
+                if distances[neighborId] != UNREACHABLE:
+                    continue
+                distances[neighborId] = distances[spaceId] + 1
+                #First step is inherited, except from source itself
+                if spaceId == sourceId:
+                    nextHops[neighborId] = neighborId
+                else:
+                    nextHops[neighborId] = nextHops[spaceId]
+                queue.append(neighborId)
+
+        return distances, nextHops
+
+    def addExit(self, spaceId, targetId):
+        """
+        Updates routes for a new exit. Only routes that become shorter by
+        taking the exit change. Called by WorldGraph.addExit().
+
+        @param spaceId:   ID of the space the exit leads from.
+        @param targetId:  ID of the space the exit leads to.
+        """
+        if self._distances[spaceId][targetId] <= 1:
+            return
+
+        targetDistances = self._distances[targetId]
+        for sourceId in range(len(self._distances)):
+            distances = self._distances[sourceId]
+            if distances[spaceId] == UNREACHABLE:
+                continue
+
+            nextHops = self._nextHops[sourceId]
+            if sourceId == spaceId:
+                firstHop = targetId
+            else:
+                firstHop = nextHops[spaceId]
+
+            viaExit = distances[spaceId] + 1
+            for otherId in range(len(targetDistances)):
+                if targetDistances[otherId] == UNREACHABLE:
+                    continue
+                distance = viaExit + targetDistances[otherId]
+                if distance < distances[otherId]:
+                    distances[otherId] = distance
+                    nextHops[otherId] = firstHop
+
+    def getDistance(self, sourceId, targetId):
+        """
+        Returns the number of steps on the shortest route between spaces.
+
+        @param sourceId:  ID of the space the route starts from.
+        @param targetId:  ID of the space the route leads to.
+
+        @return:          Number of steps, or None if there is no route.
+        """
+        distance = self._distances[sourceId][targetId]
+        if distance == UNREACHABLE:
+            return None
+
+        return distance
+
+    def getRoute(self, sourceId, targetId):
+        """
+        Returns the shortest route between spaces.
+
+        @param sourceId:  ID of the space the route starts from.
+        @param targetId:  ID of the space the route leads to.
+
+        @return:          List of IDs of the spaces entered along the route,
+                          ending with targetId. Empty if the spaces are the
+                          same, None if there is no route.
+        """
+        if self._distances[sourceId][targetId] == UNREACHABLE:
+            return None
+
+        route = []
+        spaceId = sourceId
+        while spaceId != targetId:
+            spaceId = self._nextHops[spaceId][targetId]
+            route.append(spaceId)
+
+        return route
+
+class SafeRoutePlanner(object):
+    """
+    Routes between spaces that minimize danger rather than steps.
+
+    Entering a space costs its battle probability times the danger of a
+    battle there: one for constants.RouteRisk.ENCOUNTERS, or the damage
+    estimated by battle_engine.getExpectedDamage() for
+    constants.RouteRisk.DAMAGE. Among equally safe routes the shortest is
+    taken.
+
+    Routes from a space are found by Dijkstra's algorithm the first time they
+    are requested and kept for later requests.
+    """
+    def __init__(self, graph, level, risk = constants.RouteRisk.DAMAGE):
+        """
+        Computes the cost of entering every space.
+
+        @param graph:     The WorldGraph.
+        @param level:     Level of player. Damage is estimated for a player of
+                          this level with nothing equipped.
+        @keyword risk:    (Optional) The constants.RouteRisk to minimize.
+        """
+        if risk not in (constants.RouteRisk.ENCOUNTERS, 
+            constants.RouteRisk.DAMAGE):
+            errorMsg = "Invalid route risk: %s" % risk
+            raise AssertionError(errorMsg)
+
+        self._graph = graph
+        self._searches = {}
+
+        maxHp, attack, weightLimit = player.getLevelStats(level)
+        defense = constants.PlayerInitialization.ARMOR_DEFENSE
+
+        self._costs = array("d")
+        for spaceId in range(graph.spaceCount()):
+            space = graph.getSpace(spaceId)
+            cost = space.getBattleProbability()
+            if cost and risk == constants.RouteRisk.DAMAGE:
+                cost *= battle_engine.getExpectedDamage(space.getRegion(),
+                    space.getBattleBonusDifficulty(), attack, defense)
+            self._costs.append(cost)
+
+    def _search(self, sourceId):
+        """
+        Helper method that finds the safest routes from one space.
+
+        @param sourceId:  ID of the space routes start from.
+
+        @return:          2-element tuple of lists indexed by target ID: the
+                          risk and step count of the route to the target, or
+                          None if there is no route, and the ID of the space
+                          before the target on the route.
+        """
+        search = self._searches.get(sourceId)
+        if search:
+            return search
+
+        spaceCount = self._graph.spaceCount()
+        best = [None] * spaceCount
+        previous = [-1] * spaceCount
+        best[sourceId] = (0, 0)
+
+        heap = [(0, 0, sourceId)]
+        while heap:
+            risk, steps, spaceId = heapq.heappop(heap)
+            if (risk, steps) > best[spaceId]:
+                continue
+            for neighborId in self._graph.getNeighborIds(spaceId):
+                candidate = (risk + self._costs[neighborId], steps + 1)
+                if best[neighborId] is None or candidate < best[neighborId]:
+                    best[neighborId] = candidate
+                    previous[neighborId] = spaceId
+                    heapq.heappush(heap, candidate + (neighborId,))
+
+        search = (best, previous)
+        self._searches[sourceId] = search
+        return search
+
+    def getRisk(self, sourceId, targetId):
+        """
+        Returns the risk of the safest route between spaces.
+
+        @param sourceId:  ID of the space the route starts from.
+        @param targetId:  ID of the space the route leads to.
+
+        @return:          Expected encounters or damage along the route, or
+                          None if there is no route.
+        """
+        best, previous = self._search(sourceId)
+        if best[targetId] is None:
+            return None
+
+        return best[targetId][0]
+
+    def getRoute(self, sourceId, targetId):
+        """
+        Returns the safest route between spaces.
+
+        @param sourceId:  ID of the space the route starts from.
+        @param targetId:  ID of the space the route leads to.
+
+        @return:          List of IDs of the spaces entered along the route,
+                          ending with targetId. Empty if the spaces are the
+                          same, None if there is no route.
+        """
+        best, previous = self._search(sourceId)
+        if best[targetId] is None:
+            return None
+
+        route = []
+        spaceId = targetId
+        while spaceId != sourceId:
+            route.append(spaceId)
+            spaceId = previous[spaceId]
+        route.reverse()
+
+        return route
@@ -0,0 +1,153 @@
+#!/usr/bin/python
+
+import os
+import socket
+import SocketServer
+import sys
+import threading
+import time
+
+from game import Game
+from game_io import StreamIO
+from session_random import newSeed
+from transcript import RecordingIO
+import constants
+
+class GameSessionHandler(SocketServer.StreamRequestHandler):
+    """
+    Plays a single game session over a client connection.
+    """
+    #Buffer output; StreamIO flushes whenever it waits for input
+    wbufsize = -1
+
+    def handle(self):
+        """
+        Creates a game for the connected client and plays it until the player
+        quits, wins or disconnects. If constants.SERVER_TRANSCRIPT_DIRECTORY
+        is set, the session's transcript is saved there when it ends.
+        """
+        io = StreamIO(self.rfile, self.wfile)
+        directory = constants.SERVER_TRANSCRIPT_DIRECTORY
+        if directory:
+            io = RecordingIO(io)
+
+        #Known before the game starts, so that any session may be replayed
+        seed = newSeed()
+        try:
+            game = Game(io, seed)
+            game.play()
+        #Player disconnected, quit or won
+        except (EOFError, SystemExit, socket.error):
+            pass
+        finally:
+            #Errors are saved too, so that they may be reproduced
+            if directory:
+                self._saveTranscript(io.getTranscript(seed), directory)
+
+    def _saveTranscript(self, transcript, directory):
+        """
+        Helper method that saves a session's transcript. Failures are 
+        reported on standard error, so that they do not hide an error raised
+        by the game.
+
+        @param transcript:  The Transcript of the session.
+        @param directory:   Directory to save the transcript to.
+        """
+        fileName = "%d-%s.json" % (time.time() * 1000, transcript.getSeed())
+        try:
+            transcript.save(os.path.join(directory, fileName))
+        except (IOError, OSError, ValueError) as error:
+            sys.stderr.write("Could not save transcript: %s\n" % error)
+
+class GameServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    """
+    TCP server that hosts many independent game sessions in one process. Each
+    connection gets its own Game, played on its own thread.
+
+    Each session costs a thread, whose stack main() limits to 
+    constants.SERVER_THREAD_STACK_SIZE, and about 250 KB for its copy of the
+    world. Threads share one core through the interpreter lock, so a process
+    hosts up to a few thousand mostly idle sessions. The server turns away 
+    connections beyond a limit, constants.SERVER_MAX_SESSIONS by default; 
+    run more processes to host more.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, address, handlerClass, 
+        maxSessions = constants.SERVER_MAX_SESSIONS):
+        """
+        Initializes server.
+
+        @param address:         (host, port) to listen on.
+        @param handlerClass:    The request handler class.
+        @keyword maxSessions:   (Optional) Number of sessions hosted at once.
+        """
+        SocketServer.TCPServer.__init__(self, address, handlerClass)
+        self._sessionSlots = threading.BoundedSemaphore(maxSessions)
+
+    def process_request(self, request, clientAddress):
+        """
+        Starts a session thread for a connection, or turns the connection 
+        away if the server is full.
+
+        @param request:         The client socket.
+        @param clientAddress:   Address of the client.
+        """
+        if not self._sessionSlots.acquire(False):
+            try:
+                request.sendall("The server is full. Try again later.\n")
+            except socket.error:
+                pass
+            self.shutdown_request(request)
+            return
+
+        try:
+            SocketServer.ThreadingMixIn.process_request(self, request, 
+                clientAddress)
+        except:
+            self._sessionSlots.release()
+            raise
+
+    def process_request_thread(self, request, clientAddress):
+        """
+        Plays a session and frees its slot when it ends, before the 
+        connection is closed.
+
+        @param request:         The client socket.
+        @param clientAddress:   Address of the client.
+        """
+        try:
+            self.finish_request(request, clientAddress)
+        except:
+            self.handle_error(request, clientAddress)
+        finally:
+            self._sessionSlots.release()
+            self.shutdown_request(request)
+
+def main(host = constants.SERVER_HOST, port = constants.SERVER_PORT):
+    """
+    Serves games until interrupted.
+
+    @keyword host:     Address to listen on.
+    @keyword port:     Port to listen on.
+    """
+    #Most of the default stack (often 8 MB) would go unused
+    threading.stack_size(constants.SERVER_THREAD_STACK_SIZE)
+
+    server = GameServer((host, port), GameSessionHandler)
+    print "Serving Lord of the Rings on %s:%s" % server.server_address
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(port = int(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+
+from array import array
+import hashlib
+import random
+
+import constants
+
+def newSeed():
+    """
+    Draws a random session seed from the operating system.
+
+    @return:          The seed, a 63-bit integer.
+    """
+    return random.SystemRandom().getrandbits(63)
+
+class SessionRandom(object):
+    """
+    The random number generators of a single game session.
+
+    Randomness is split into independent streams, one per 
+    constants.RandomStream. Each stream is a random.Random seeded from the 
+    session seed and the name of the stream, so that drawing from one stream
+    never shifts the numbers drawn from another. Sessions with the same seed
+    and the same input play out identically, however many other sessions run
+    in the same process.
+    """
+    def __init__(self, seed = None):
+        """
+        Initializes the streams of a session.
+
+        @keyword seed:    (Optional) The session seed, an integer or string.
+                          By default, a seed is drawn from the operating 
+                          system.
+        """
+        if seed is None:
+            seed = newSeed()
+        self._seed = seed
+
+        self._streams = {}
+        for stream in constants.RandomStream.ALL:
+            digest = hashlib.sha1("%s:%s" % (seed, stream)).hexdigest()
+            self._streams[stream] = random.Random(int(digest, 16))
+
+    def getSeed(self):
+        """
+        Returns the session seed.
+
+        @return:          The seed.
+        """
+        return self._seed
+
+    def getStream(self, stream):
+        """
+        Returns the generator of a stream.
+
+        @param stream:    A constants.RandomStream.
+
+        @return:          The stream's random.Random.
+        """
+        return self._streams[stream]
+
+    def getState(self):
+        """
+        Returns the state of every stream in a form that marshal handles.
+
+        @return:          Tuple with the state of each stream, in the order 
+                          of constants.RandomStream.ALL.
+        """
+        states = []
+        for stream in constants.RandomStream.ALL:
+            version, internalState, gauss = self._streams[stream].getstate()
+            states.append((version, array("I", internalState).tostring(), 
+                gauss))
+
+        return tuple(states)
+
+    def setState(self, state):
+        """
+        Restores the state of every stream.
+
+        @param state:     State, as returned by getState().
+        """
+        for stream, streamState in zip(constants.RandomStream.ALL, state):
+            version, internalState, gauss = streamState
+            internalState = tuple(array("I", internalState))
+            self._streams[stream].setstate((version, internalState, gauss))
@@ -0,0 +1,386 @@
+#!/usr/bin/python
+
+"""
+Saves and loads the state of a game session as a compact binary snapshot.
+
+A snapshot holds player and, for every space, its items, its exits (which
+quest ports add to) and, once the session has used them, its cities and
+unique places. Spaces are identified by their WorldGraph IDs, which are
+assigned when the world is created and do not change as exits are added.
+
+Other state is saved generically, much as world_template copies it:
+objects are stored once each in an object table by class and attribute
+dictionary, so that references between them survive a save and load. Items
+are stored by their IDs in the item catalog, item sets as lists of item IDs
+and monsters as kind and HP. Built-in items keep their IDs in every process,
+so loaded games keep using the same objects (the game checks for theOneRing
+by identity); the definitions of other items are saved with the snapshot.
+
+The session's random number streams are saved too, so that a loaded game
+rolls the same numbers the saved one would have.
+
+The snapshot is marshalled, so saving and loading takes a fraction of a
+millisecond.
+"""
+
+import importlib
+import marshal
+
+from space import Space
+from player import Player
+from items.item import Item
+from items.item_set import ItemSet
+from items.item_catalog import getItemCatalog
+from monsters.monster import Monster
+from world_graph import WorldGraph, DIRECTIONS
+from session_random import SessionRandom
+import game_loader
+
+#Identifies snapshots and the version of their format
+MAGIC = "LOTRSAVE"
+VERSION = 3
+
+#Tags of encoded references. Encoded values only use tuples for these.
+_OBJECT = 0
+_ITEM = 1
+_SPACE = 2
+_TUPLE = 3
+_CLASS = 4
+
+#Player attributes that belong to the session rather than the game
+_PLAYER_EXCLUDED = ("_io", "_battlePolicy", "_location", "_sessionRandom")
+
+#Values of these types are stored as they are
+_ATOMIC_TYPES = (type(None), bool, int, long, float, str, unicode)
+
+class _Encoder(object):
+    """
+    Turns game state into values that marshal can store.
+    """
+    def __init__(self, graph):
+        """
+        Initializes encoder.
+
+        @param graph:     WorldGraph of the session being saved.
+        """
+        self._graph = graph
+        self._catalog = getItemCatalog()
+        self._objectIds = {}
+        self.objects = []
+        self.definitions = {}
+
+    def encode(self, value):
+        """
+        Encodes a value, adding the objects it refers to to the object table.
+
+        @param value:     The value.
+
+        @return:          Encoded value.
+        """
+        valueType = type(value)
+        if valueType in _ATOMIC_TYPES:
+            return value
+        elif valueType is list:
+            return [self.encode(element) for element in value]
+        elif valueType is dict:
+            return dict((self.encode(key), self.encode(element))
+                for key, element in value.iteritems())
+        elif valueType is tuple:
+            return (_TUPLE, [self.encode(element) for element in value])
+        elif isinstance(value, Space):
+            return (_SPACE, self._graph.getSpaceId(value))
+        elif isinstance(value, type):
+            return (_CLASS, _getClassPath(value))
+
+        elif isinstance(value, Item):
+            return (_ITEM, self.encodeItem(value))
+
+        objectId = self._objectIds.get(id(value))
+        if objectId is None:
+            objectId = len(self.objects)
+            self._objectIds[id(value)] = objectId
+            self.objects.append(None)
+            self.objects[objectId] = (_getClassPath(value.__class__),
+                self._encodeState(value))
+
+        return (_OBJECT, objectId)
+
+    def encodeItem(self, item):
+        """
+        Encodes an item as its catalog ID, saving its definition if it is not
+        built in.
+
+        @param item:      The item.
+
+        @return:          ID of the item.
+        """
+        itemId = self._catalog.getId(item)
+        if (itemId >= self._catalog.getBuiltInCount() and 
+            itemId not in self.definitions):
+            self.definitions[itemId] = self._catalog.getDefinition(itemId)
+
+        return itemId
+
+    def _encodeState(self, value):
+        """
+        Helper method that encodes the state of an object.
+        """
+        if isinstance(value, ItemSet):
+            return [self.encodeItem(item) for item in value.getItems()]
+        elif isinstance(value, Monster):
+            return [self.encode(value.getKind()), value.getHp()]
+        elif hasattr(value, "__slots__"):
+            return dict((name, self.encode(getattr(value, name)))
+                for name in value.__slots__)
+        elif hasattr(value, "__dict__"):
+            return self.encode(value.__dict__)
+
+        errorMsg = "Cannot save value of type %s." % type(value).__name__
+        raise AssertionError(errorMsg)
+
+class _Decoder(object):
+    """
+    Turns values stored by _Encoder back into game state.
+    """
+    def __init__(self, spaces, objects, definitions):
+        """
+        Initializes decoder and recreates the objects in the object table.
+
+        @param spaces:       List of the spaces of the session being loaded
+                             into, indexed by WorldGraph ID.
+        @param objects:      The encoded object table.
+        @param definitions:  Dictionary mapping the saved IDs of items that
+                             are not built in to their definitions.
+        """
+        self._spaces = spaces
+
+        #Items that are not built in may have other IDs in this process
+        self._catalog = getItemCatalog()
+        self._builtInCount = self._catalog.getBuiltInCount()
+        self._itemIds = dict((itemId, self._catalog.addDefinition(definition))
+            for itemId, definition in definitions.iteritems())
+        self._objects = [object.__new__(_getClass(classPath))
+            for classPath, state in objects]
+
+        #Item sets sort their items, so their items are restored first
+        itemSets = []
+        for instance, (classPath, state) in zip(self._objects, objects):
+            if isinstance(instance, ItemSet):
+                itemSets.append((instance, state))
+            elif isinstance(instance, Monster):
+                instance._kind = self.decode(state[0])
+                instance._hp = state[1]
+            elif hasattr(instance, "__slots__"):
+                for name, element in state.iteritems():
+                    setattr(instance, name, self.decode(element))
+            else:
+                instance.__dict__ = self.decode(state)
+
+        for instance, state in itemSets:
+            instance.__init__(self.decodeItems(state))
+
+    def decode(self, value):
+        """
+        Decodes a value.
+
+        @param value:     The encoded value.
+
+        @return:          Decoded value.
+        """
+        valueType = type(value)
+        if valueType is list:
+            return [self.decode(element) for element in value]
+        elif valueType is dict:
+            return dict((self.decode(key), self.decode(element))
+                for key, element in value.iteritems())
+        elif valueType is not tuple:
+            return value
+
+        tag, reference = value
+        if tag == _OBJECT:
+            return self._objects[reference]
+        elif tag == _ITEM:
+            return self.decodeItems([reference])[0]
+        elif tag == _SPACE:
+            return self._spaces[reference]
+        elif tag == _TUPLE:
+            return tuple(self.decode(element) for element in reference)
+
+        return _getClass(reference)
+
+    def decodeItems(self, itemIds):
+        """
+        Decodes a list of item IDs.
+
+        @param itemIds:   List of IDs.
+
+        @return:          List of items.
+        """
+        items = []
+        for itemId in itemIds:
+            if not 0 <= itemId < self._builtInCount:
+                if itemId not in self._itemIds:
+                    errorMsg = "Snapshot refers to an unknown item."
+                    raise AssertionError(errorMsg)
+                itemId = self._itemIds[itemId]
+            items.append(self._catalog.getItem(itemId))
+
+        return items
+
+_classes = {}
+
+def _getClassPath(cls):
+    """
+    Helper function that returns the dotted path of a class.
+    """
+    return "%s.%s" % (cls.__module__, cls.__name__)
+
+def _getClass(classPath):
+    """
+    Helper function that imports a class by its dotted path.
+    """
+    cls = _classes.get(classPath)
+    if cls is None:
+        moduleName, className = classPath.rsplit(".", 1)
+        cls = getattr(importlib.import_module(moduleName), className)
+        _classes[classPath] = cls
+
+    return cls
+
+def saveSnapshot(player):
+    """
+    Saves the game session player is in.
+
+    @param player:    The player object.
+
+    @return:          The snapshot, as a string.
+    """
+    graph = player.getLocation().getWorldGraph()
+    encoder = _Encoder(graph)
+
+    playerState = dict((key, encoder.encode(value))
+        for key, value in player.__dict__.iteritems()
+        if key not in _PLAYER_EXCLUDED)
+
+    spaces = []
+    for spaceId in range(graph.spaceCount()):
+        space = graph.getSpace(spaceId)
+
+        #Places the session has not used are still as created
+        places = None
+        if not space._clonePlace:
+            places = (encoder.encode(space._city),
+                encoder.encode(space._uniquePlace))
+
+        spaceItems = [encoder.encodeItem(item)
+            for item in space.getItems().getItems()]
+        spaces.append((spaceItems, places))
+
+    sessionRandom = player.getSessionRandom()
+
+    return marshal.dumps((MAGIC, VERSION, getItemCatalog().getFingerprint(),
+        encoder.definitions, encoder.objects,
+        graph.getSpaceId(player.getLocation()), playerState, spaces,
+        graph.getExitTable(), sessionRandom.getSeed(), 
+        sessionRandom.getState()))
+
+def loadSnapshot(snapshot, io = None):
+    """
+    Creates a game session from a snapshot.
+
+    @param snapshot:  The snapshot, as returned by saveSnapshot().
+    @keyword io:      (Optional) The GameIO object through which the player is
+                      prompted.
+
+    @return:          2-element tuple of the list of spaces making up the
+                      world, as returned by game_loader.getWorld(), and the
+                      player.
+    """
+    try:
+        fields = marshal.loads(snapshot)
+        magic, version = fields[:2]
+    except (EOFError, ValueError, TypeError):
+        errorMsg = "Snapshot is corrupt."
+        raise AssertionError(errorMsg)
+    if magic != MAGIC or version != VERSION:
+        errorMsg = "Snapshot format is not supported."
+        raise AssertionError(errorMsg)
+    try:
+        (magic, version, fingerprint, definitions, objects, locationId,
+            playerState, spaces, exitTable, seed, randomState) = fields
+    except ValueError:
+        errorMsg = "Snapshot is corrupt."
+        raise AssertionError(errorMsg)
+    if fingerprint != getItemCatalog().getFingerprint():
+        errorMsg = "Snapshot was saved with different built-in items."
+        raise AssertionError(errorMsg)
+
+    sessionRandom = SessionRandom(seed)
+    sessionRandom.setState(randomState)
+
+    #Fresh world, with no findable unique items placed yet
+    world = game_loader.getWorldTemplate().createWorld(sessionRandom)
+    graph = world[0].getWorldGraph()
+    if graph.spaceCount() != len(spaces):
+        errorMsg = "Snapshot was saved with a different world."
+        raise AssertionError(errorMsg)
+    allSpaces = [graph.getSpace(spaceId) for spaceId in range(len(spaces))]
+
+    decoder = _Decoder(allSpaces, objects, definitions)
+    for space, (spaceItems, places) in zip(allSpaces, spaces):
+        if spaceItems or space.getItems().getItems():
+            space._items = ItemSet(decoder.decodeItems(spaceItems))
+        if places:
+            space._clonePlace = None
+            space._city = decoder.decode(places[0])
+            space._uniquePlace = decoder.decode(places[1])
+
+    if exitTable != graph.getExitTable():
+        _restoreExits(graph, exitTable)
+
+    player = Player(playerState["_name"], allSpaces[locationId], io,
+        sessionRandom = sessionRandom)
+    player.__dict__.update(decoder.decode(playerState))
+    player._statsDirty = True
+
+    return world, player
+
+def _restoreExits(graph, exitTable):
+    """
+    Helper function that changes the exits of a fresh world to those saved.
+    Exits the session added, such as quest ports, are added to the graph as
+    they were in the game; any other change compiles the graph again.
+
+    @param graph:      WorldGraph of the fresh world.
+    @param exitTable:  The saved exits, as returned by
+                       WorldGraph.getExitTable().
+    """
+    spaceCount = graph.spaceCount()
+    spaces = [graph.getSpace(spaceId) for spaceId in range(spaceCount)]
+
+    recompile = False
+    for direction, savedExits, currentExits in zip(DIRECTIONS, exitTable,
+        graph.getExitTable()):
+        if savedExits == currentExits:
+            continue
+
+        offsets, targets = savedExits
+        for spaceId in range(spaceCount):
+            savedIds = targets[offsets[spaceId]:offsets[spaceId + 1]]
+            currentIds = graph.getExitIds(spaceId, direction).tolist()
+            if savedIds == currentIds:
+                continue
+
+            space = spaces[spaceId]
+            if savedIds[:len(currentIds)] == currentIds and not recompile:
+                for targetId in savedIds[len(currentIds):]:
+                    space.createExit(direction, spaces[targetId],
+                        outgoingOnly = True)
+            else:
+                space.setExitList(direction,
+                    [spaces[targetId] for targetId in savedIds])
+                recompile = True
+
+    #Listing every space keeps IDs as they were
+    if recompile:
+        WorldGraph(spaces)
@@ -4,6 +4,8 @@ from items.item import Item
 from items.item_set import ItemSet
 from constants import Direction, RegionType
 from items.unique_items import theOneRing
+from unique_place import LazyUniquePlace
+from world_graph import WorldGraph
 
 class Space(object):
     """
@@ -38,7 +40,10 @@ class Space(object):
                                        or a list.
         @keyword uniquePlace:          (Optional) Reference to unique places 
                                        in space. May be a reference to an 
-                                       individual object or a list.
+                                       individual object or a list. 
+                                       LazyUniquePlace objects are replaced 
+                                       by their unique place when first 
+                                       requested.
         """
         self._exits = {Direction.NORTH : None,
                        Direction.SOUTH : None,
@@ -53,6 +58,12 @@ class Space(object):
         self._items = ItemSet()
         self._city = city
         self._uniquePlace = uniquePlace
+        
+        #Set on session copies whose places are still shared with the template
+        self._clonePlace = None
+
+        #Compiled on first request
+        self._worldGraph = None
 
     def getName(self):
         """
@@ -91,11 +102,13 @@ class Space(object):
         Adds an item to the space.
 
         @param item:    Item to add.
+
+        @return:        True if item was added, False if it was carried 
+                        off (theOneRing outside of Orodruin).
         """
-        #Special prompt for theOneRing
+        #theOneRing does not stay put outside of Orodruin
         if item == theOneRing and self._name != "Orodruin":
-            print "\nYou see some strange men walk by."
-            return
+            return False
             
         if isinstance(item, Item):
             self._items.addItem(item)
@@ -105,6 +118,8 @@ class Space(object):
             errorMsg = "space.AddItem() was given invalid item type."
             raise AssertionError(errorMsg)
 
+        return True
+
     def removeItem(self, item):
         """
         Removes an item from the space.
@@ -143,6 +158,9 @@ class Space(object):
         @return:    Reference to cit(ies).
                     May refer to a single city or list of cities.
         """
+        if self._clonePlace:
+            self._claimPlaces()
+            
         return self._city
 
     def getUniquePlace(self):
@@ -153,8 +171,84 @@ class Space(object):
                     May be reference to a single unique
                     place or a list of unique places.
         """
+        if self._clonePlace:
+            self._claimPlaces()
+        
+        #Create unique places on first use
+        if isinstance(self._uniquePlace, LazyUniquePlace):
+            self._uniquePlace = self._uniquePlace.create()
+        elif isinstance(self._uniquePlace, list):
+            for index, place in enumerate(self._uniquePlace):
+                if isinstance(place, LazyUniquePlace):
+                    self._uniquePlace[index] = place.create()
+            
         return self._uniquePlace
 
+    def getPlaceNames(self):
+        """
+        Returns the names of the cities and unique places in the space, 
+        without creating or copying them.
+
+        @return:    List of names, cities first.
+        """
+        names = []
+        for places in (self._city, self._uniquePlace):
+            if isinstance(places, list):
+                names.extend(place.getName() for place in places)
+            elif places:
+                names.append(places.getName())
+
+        return names
+
+    def clone(self, clonePlace):
+        """
+        Returns a copy of the space for a new game session. 
+        
+        The copy gets its own exits and items but shares its city and unique 
+        place with this space until they are first requested. At that point, 
+        they are copied using I{clonePlace}.
+        
+        Exits still point to this space's neighbors. Use relinkExits() once 
+        all spaces have been copied.
+
+        @param clonePlace:   Function that copies a city or unique place 
+                             (or a list of them) for the session.
+
+        @return:             Copy of the space.
+        """
+        space = object.__new__(self.__class__)
+        space.__dict__ = self.__dict__.copy()
+        
+        space._exits = self._exits.copy()
+        space._items = ItemSet(list(self._items))
+        space._clonePlace = clonePlace
+        space._worldGraph = None
+        
+        return space
+
+    def relinkExits(self, spaces):
+        """
+        Points exits at the session copies of adjacent spaces.
+
+        @param spaces:    Dictionary mapping template spaces to their copies.
+        """
+        for direction, exit in self._exits.items():
+            if isinstance(exit, list):
+                self._exits[direction] = [spaces[space] for space in exit]
+            elif exit:
+                self._exits[direction] = spaces[exit]
+
+    def _claimPlaces(self):
+        """
+        Helper method that replaces the template's city and unique place with 
+        session copies.
+        """
+        clonePlace = self._clonePlace
+        self._clonePlace = None
+        
+        self._city = clonePlace(self._city)
+        self._uniquePlace = clonePlace(self._uniquePlace)
+
     def getBattleProbability(self):
         """
         Returns probability of a random battle.
@@ -191,6 +285,16 @@ class Space(object):
             errorMsg = "Direction not valid: %s" % direction
             raise AssertionError(errorMsg)
         
+        #Keep compiled graph in step
+        graph = self._worldGraph
+        if graph and space._worldGraph is graph:
+            graph.addExit(self, direction, space)
+        else:
+            if graph:
+                graph.detach()
+            if space._worldGraph:
+                space._worldGraph.detach()
+
         #Set exit to other space - if a space already exists
         if self._exits[direction]:
             currentSpace = self._exits[direction]
@@ -235,8 +339,14 @@ class Space(object):
         
         if isinstance(self._exits[direction], list):
             self._exits[direction].remove(space)
+            removedSpace = space
         else:
             self._exits[direction] = None
+            removedSpace = adjSpace
+
+        #Keep compiled graph in step
+        if self._worldGraph:
+            self._worldGraph.removeExit(self, direction, removedSpace)
             
         if not outgoingOnly:
             oppositeDirection = self._oppositeDirection(direction)
@@ -258,6 +368,67 @@ class Space(object):
         space = self._exits[direction]
         return space
 
+    def getExitList(self, direction):
+        """
+        Returns the spaces adjacent to this space in a direction, as a list 
+        whether there are none, one or several.
+
+        @param direction:   Direction of adjacent spaces.
+
+        @return:            List of adjacent spaces.
+        """
+        exit = self._exits[direction]
+        if isinstance(exit, list):
+            return list(exit)
+        elif exit:
+            return [exit]
+
+        return []
+
+    def setExitList(self, direction, spaces):
+        """
+        Replaces the exits of this space in a direction. Exits from the
+        adjacent spaces are left as they are. Detaches the compiled graph,
+        which has to be compiled again.
+
+        @param direction:   Direction of exits.
+        @param spaces:      List of adjacent spaces.
+        """
+        if not self._isExit(direction):
+            errorMsg = "Direction not valid: %s" % direction
+            raise AssertionError(errorMsg)
+
+        if self._worldGraph:
+            self._worldGraph.detach()
+
+        if len(spaces) > 1:
+            self._exits[direction] = list(spaces)
+        elif spaces:
+            self._exits[direction] = spaces[0]
+        else:
+            self._exits[direction] = None
+
+    def getWorldGraph(self):
+        """
+        Returns the compiled graph of the spaces connected to this space, 
+        compiling it if needed.
+
+        @return:            The WorldGraph.
+        """
+        if self._worldGraph is None:
+            WorldGraph([self])
+
+        return self._worldGraph
+
+    def setWorldGraph(self, worldGraph):
+        """
+        Sets the compiled graph that this space belongs to. Called by 
+        WorldGraph.
+
+        @param worldGraph:  The WorldGraph, or None.
+        """
+        self._worldGraph = worldGraph
+
     def getExits(self):
         """
         Returns dictionary of direction-space pairs.
@@ -214,15 +214,15 @@ class BattlePhaseTest(unittest.TestCase):
         g._player = MagicMock()
         g._player.getLocation = MagicMock(return_value = space)
        
-        battle_engine.battle = MagicMock()
         constants.BattleEngine.RUN_PROBABILITY_SUCCESS = 1
        
        #Assert that battle() is called when it should be called
         rawInputMock = MagicMock(return_value = "run")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
-            g._battlePhase()
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
+            with patch.object(battle_engine, "battle") as battle:
+                g._battlePhase()
         errorMsg = "battle() should have been called but was not."
-        self.assertTrue(battle_engine.battle.called, errorMsg)       
+        self.assertTrue(battle.called, errorMsg)       
     
     def testNegativeCase(self):
         """
@@ -242,15 +242,15 @@ class BattlePhaseTest(unittest.TestCase):
         g._player = MagicMock()
         g._player.getLocation = MagicMock(return_value = space)
        
-        battle_engine.battle = MagicMock()
         constants.BattleEngine.RUN_PROBABILITY_SUCCESS = 1
        
        #Assert that battle() is called when it should be called
         rawInputMock = MagicMock(return_value = "run")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
-            g._battlePhase()
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
+            with patch.object(battle_engine, "battle") as battle:
+                g._battlePhase()
         errorMsg = "battle() should have been called but was not."
-        self.assertFalse(battle_engine.battle.called, errorMsg)       
+        self.assertFalse(battle.called, errorMsg)       
 
 class battleSetupTest(unittest.TestCase):
     """
@@ -284,6 +284,21 @@ class battleSetupTest(unittest.TestCase):
         for object in result[1]:
             self.assertTrue(isinstance(object, Monster), errorMsg)
     
+    def testNoMonsters(self):
+        """
+        A random battle without monsters counts as won.
+        """
+        import battle_engine
+        import constants
+
+        with patch.object(battle_engine, "_battleSetup", 
+            return_value = (0, [])):
+            result = battle_engine.battle(MagicMock(), 
+                constants.BattleEngineContext.RANDOM)
+
+        errorMsg = "Battle without monsters should return True."
+        self.assertTrue(result is True, errorMsg)
+
     def testStoryBattle(self):
         from battle_engine import _battleSetup
         import constants
@@ -410,7 +425,7 @@ class MonsterAttackPhaseTest(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "enter")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _monsterAttackPhase(player, monsters)
         errorMsg = "Player health should be at 14 but is not."
         self.assertEqual(player._hp, 14, errorMsg)
@@ -440,7 +455,7 @@ class MonsterAttackPhaseTest(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "enter")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             result =_monsterAttackPhase(player, monsters)
         errorMsg = "Player health should be at 0 but is not."
         self.assertEqual(player._hp, 0, errorMsg)
@@ -480,7 +495,7 @@ class PlayerAttackPhase(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "Target")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
 
         errorMsg = "Target monster health not reduced."
@@ -515,7 +530,7 @@ class PlayerAttackPhase(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "gobbledigook")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
 
         errorMsg = "Test monster health reduced when it should not have been."
@@ -548,7 +563,7 @@ class PlayerAttackPhase(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
 
         errorMsg = "monster._hp is not correct. "
@@ -583,7 +598,7 @@ class PlayerAttackPhase(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "monsters was not adjusted for monster kill."
@@ -618,7 +633,7 @@ class PlayerAttackPhase(unittest.TestCase):
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "monsters was not adjusted for monster kill."
@@ -652,12 +667,12 @@ class PlayerAttackPhase(unittest.TestCase):
 
         monsters = [monster, monster2, monster3]
     
-        targetExperience = monster._experience
+        targetExperience = monster.getExperience()
         targetMoney = math.floor(targetExperience/constants.BattleEngine.MONEY_CONSTANT)
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             result = _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "Check that monsters list was updated correctly."
@@ -699,7 +714,7 @@ class PlayerAttackPhase(unittest.TestCase):
     
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             result = _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "Check that monsters list is unchanged."
@@ -740,12 +755,12 @@ class PlayerAttackPhase(unittest.TestCase):
 
         monsters = [monster, monster2, monster3]
     
-        targetExperience = monster._experience * (1 + bonusDifficulty)
+        targetExperience = monster.getExperience() * (1 + bonusDifficulty)
         targetMoney = math.floor(targetExperience/constants.BattleEngine.MONEY_CONSTANT)
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             result = _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "Check that monsters list is unchanged."
@@ -785,12 +800,12 @@ class PlayerAttackPhase(unittest.TestCase):
 
         monsters = [monster, monster2, monster3]
     
-        targetExperience = monster._experience * (1 + bonusDifficulty)
+        targetExperience = monster.getExperience() * (1 + bonusDifficulty)
         targetMoney = math.floor(targetExperience/constants.BattleEngine.MONEY_CONSTANT)
 
         #Test
         rawInputMock = MagicMock(return_value = "Jack")
-        with patch('battle_engine.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             result = _playerAttackPhase(player, monsters, bonusDifficulty, earnings)
         
         errorMsg = "Check that monsters list is unchanged."
@@ -804,6 +819,91 @@ class PlayerAttackPhase(unittest.TestCase):
         errorMsg = "experience not returned correctly."
         self.assertEqual(result[1], targetExperience + 100, errorMsg)
 
+class BattlePolicyTest(unittest.TestCase):
+    """
+    Tests battle policies and policy-driven battles.
+    """
+    def testTargeting(self):
+        from battle_policy import FocusLowestHpPolicy, FocusHighestAttackPolicy
+        from space import Space
+        from player import Player
+        from monsters.monster import Monster
+        import constants
+
+        player = Player("Frodo", Space("Shire", "", "Eregion"))
+        monsters = [Monster("Orc", "", [8, 4, 1], "", ""),
+            Monster("Troll", "", [30, 9, 5], "", ""),
+            Monster("Goblin", "", [3, 2, 1], "", "")]
+
+        errorMsg = "Policy should attack the monster with the least HP."
+        self.assertEqual(FocusLowestHpPolicy().chooseAction(player, monsters),
+            (constants.BattleAction.ATTACK, 2), errorMsg)
+        errorMsg = "Policy should attack the monster with the highest attack."
+        self.assertEqual(
+            FocusHighestAttackPolicy().chooseAction(player, monsters),
+            (constants.BattleAction.ATTACK, 1), errorMsg)
+
+    def testPotionAndRun(self):
+        from battle_policy import FocusLowestHpPolicy, RunBelowThresholdPolicy
+        from space import Space
+        from player import Player
+        from monsters.monster import Monster
+        from items.potion import Potion
+        import constants
+
+        player = Player("Frodo", Space("Shire", "", "Eregion"))
+        monsters = [Monster("Orc", "", [8, 4, 1], "", "")]
+        weakPotion = Potion("Weak Potion", "Watery", 1, 1, 5)
+        strongPotion = Potion("Strong Potion", "Thick", 1, 1, 15)
+        player.addToInventory(weakPotion)
+        player.addToInventory(strongPotion)
+        player.takeAttack(15)
+
+        errorMsg = "Hurt player should drink his strongest potion."
+        self.assertEqual(FocusLowestHpPolicy().chooseAction(player, monsters),
+            (constants.BattleAction.USE_POTION, strongPotion), errorMsg)
+        errorMsg = "Hurt player should run."
+        self.assertEqual(
+            RunBelowThresholdPolicy().chooseAction(player, monsters),
+            (constants.BattleAction.RUN, None), errorMsg)
+
+        player.heal(15)
+        errorMsg = "Healthy player should fight."
+        self.assertEqual(
+            RunBelowThresholdPolicy().chooseAction(player, monsters),
+            (constants.BattleAction.ATTACK, 0), errorMsg)
+
+    def testPolicyBattle(self):
+        """
+        A policy-driven battle should run to the end without prompting.
+        """
+        from battle_engine import battle
+        from battle_policy import FocusLowestHpPolicy
+        from game_io import HeadlessIO
+        from space import Space
+        from player import Player
+        from monsters.monster import Monster
+        from items.potion import Potion
+        import constants
+
+        io = HeadlessIO()
+        space = Space("Shire", "", "Eregion")
+        player = Player("Frodo", space, io, FocusLowestHpPolicy(.5))
+        potion = Potion("Potion", "Red", 1, 1, 10)
+        player.addToInventory(potion)
+        monsters = [Monster("Orc", "", [10, 6, 1], "", ""),
+            Monster("Goblin", "", [5, 2, 1], "", "")]
+
+        result = battle(player, constants.BattleEngineContext.STORY, monsters)
+
+        errorMsg = "Player should have won the battle."
+        self.assertTrue(result, errorMsg)
+        self.assertEqual(monsters, [], errorMsg)
+        errorMsg = "Player should have drunk his potion."
+        self.assertFalse(player.getInventory().containsItem(potion), errorMsg)
+        errorMsg = "Battle should not have prompted the user."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
+
 class ItemFindTest(unittest.TestCase):
     """
     Tests _itemFind of battle_engine.py
@@ -825,7 +925,7 @@ class ItemFindTest(unittest.TestCase):
         experience = 5000 
         
         #Pretest
-        inventory = player._inventory._items
+        inventory = player._inventory.getItems()
         errorMsg = "Player inventory was not empty to start with."
         self.assertEqual(inventory, [], errorMsg)
        
@@ -833,17 +933,17 @@ class ItemFindTest(unittest.TestCase):
         _itemFind(player, experience)
 
         lowLevelInInventory = 0
-        for item in player._inventory._items:
+        for item in player._inventory.getItems():
             if item in items.unique_items.lowLevelFindableUniques:
                 lowLevelInInventory += 1
 
         highLevelInInventory = 0
-        for item in player._inventory._items:
+        for item in player._inventory.getItems():
             if item in items.unique_items.highLevelFindableUniques:
                 highLevelInInventory += 1
 
         eliteLevelInInventory = 0
-        for item in player._inventory._items:
+        for item in player._inventory.getItems():
             if item in items.unique_items.eliteLevelFindableUniques:
                 eliteLevelInInventory += 1
 
@@ -874,7 +974,7 @@ class ItemFindTest(unittest.TestCase):
         experience = 5000
                                 
         #Pretest
-        inventory = player._inventory._items
+        inventory = player._inventory.getItems()
         errorMsg = "Player inventory was not empty to start with."
         self.assertEqual(inventory, [], errorMsg)
        
@@ -882,7 +982,7 @@ class ItemFindTest(unittest.TestCase):
         _itemFind(player, experience)
         
         lowLevelInInventory = 0
-        for item in player._inventory._items:
+        for item in player._inventory.getItems():
             if item in items.unique_items.lowLevelFindableUniques:
                 lowLevelInInventory += 1
        
@@ -905,7 +1005,7 @@ class ItemFindTest(unittest.TestCase):
         experience = 5000
 
         #Pretest
-        inventory = player._inventory._items
+        inventory = player._inventory.getItems()
         errorMsg = "Player inventory was not empty to start with."
         self.assertEqual(inventory, [], errorMsg)
 
@@ -913,7 +1013,7 @@ class ItemFindTest(unittest.TestCase):
         _itemFind(player, experience)
 
         errorMsg = "Space is supposed to have three items but does not."
-        self.assertEqual(len(space._items._items), 3, errorMsg)
+        self.assertEqual(len(space._items.getItems()), 3, errorMsg)
 
 class EndSequenceTest(unittest.TestCase):
     """
@@ -969,7 +1069,7 @@ class ParserTest(unittest.TestCase):
 
         #Patch raw_input and call getNextCommand()
         rawInputMock = MagicMock(side_effect=["unrecognized cmd", "valid cmd"])
-        with patch('parser.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             command = p.getNextCommand()
 
         #Assert calls made
@@ -989,7 +1089,990 @@ class ParserTest(unittest.TestCase):
         result = p._commandRecognized("valid command")
 
         errorMsg = "Expected Parser._commandRecognized() to return True."
-        self.assertTrue(result, errorMsg) 
+        self.assertTrue(result, errorMsg)
+
+    def testArgumentsAndBatches(self):
+        import game_loader
+        from parser import Parser
+        from game_io import HeadlessIO
+
+        io = HeadlessIO()
+        world = game_loader.getWorld()
+        player = game_loader.getPlayer(world[0],
+            game_loader.getStartingInventory(), io)
+        p = Parser(game_loader.getCommandList(player), io)
+        sting = player.getInventory().getItemByName("Sting")
+
+        #Two commands with arguments, in any case, from one line
+        io.push("UNEQUIP sting;  Equip  STING ")
+        command = p.getNextCommand()
+        errorMsg = "Parser should split off the argument."
+        self.assertEqual(command.getName(), "unequip", errorMsg)
+        command.execute()
+        errorMsg = "Argument should answer the command's prompt."
+        self.assertFalse(player.getEquipped().containsItem(sting), errorMsg)
+
+        command = p.getNextCommand()
+        command.execute()
+        errorMsg = "Second command should come from the same line."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
+        self.assertTrue(player.getEquipped().containsItem(sting), errorMsg)
+
+        #Unknown command drops the rest of the line
+        io.pushAll(["dance; money", "money extra", "pick up"])
+        command = p.getNextCommand()
+        errorMsg = "Parser should reject unknown commands and arguments."
+        self.assertEqual(command.getName(), "pick up", errorMsg)
+        self.assertTrue("Command 'dance' not recognized" in io.getOutput(),
+            errorMsg)
+        self.assertTrue("Command 'money extra' not recognized" in
+            io.getOutput(), errorMsg)
+
+        #Argument chooses between several spaces in a direction
+        player.setLocation(world[14])
+        io.push("east the wold")
+        p.getNextCommand().execute()
+        errorMsg = "Movement argument should choose the space."
+        self.assertEqual(player.getLocation().getName(), "The Wold", errorMsg)
+
+    def testPrefixesAndCompletion(self):
+        import game_loader
+        from parser import Parser
+        from game_io import HeadlessIO
+
+        io = HeadlessIO()
+        world = game_loader.getWorld()
+        player = game_loader.getPlayer(world[0],
+            game_loader.getStartingInventory(), io)
+        p = Parser(game_loader.getCommandList(player), io)
+        sting = player.getInventory().getItemByName("Sting")
+
+        #Unambiguous prefixes of commands and arguments
+        io.push("inv; equipm; un st")
+        names = [p.getNextCommand().getName() for i in range(2)]
+        errorMsg = "Parser should accept unambiguous prefixes."
+        self.assertEqual(names, ["inventory", "equipment"], errorMsg)
+        p.getNextCommand().execute()
+        self.assertFalse(player.getEquipped().containsItem(sting), errorMsg)
+
+        #Ambiguous prefix
+        io.pushAll(["e", "money"])
+        errorMsg = "Parser should reject ambiguous prefixes."
+        self.assertEqual(p.getNextCommand().getName(), "money", errorMsg)
+        self.assertTrue("Command 'e' not recognized" in io.getOutput(),
+            errorMsg)
+
+        #Completion of command names and arguments
+        errorMsg = "Parser.complete() gave wrong completions."
+        self.assertEqual(p.complete("u"), ["unequip", "use potion"], errorMsg)
+        self.assertEqual(p.complete("Pick"), ["pick up"], errorMsg)
+        self.assertEqual(p.complete("equip "), ["equip Sting"], errorMsg)
+        self.assertEqual(p.complete("money "), [], errorMsg)
+        player.setLocation(world[14])
+        self.assertEqual(p.complete("east the"), ["east The Wold"], errorMsg)
+
+class PrefixTrieTest(unittest.TestCase):
+    """
+    Tests PrefixTrie class.
+    """
+    def testPrefixTrie(self):
+        from util.prefix_trie import PrefixTrie
+
+        trie = PrefixTrie(["Sting", "Staff", "Sword", "St"])
+        errorMsg = "PrefixTrie.add() should ignore names already present."
+        self.assertFalse(trie.add("STING"), errorMsg)
+        self.assertEqual(trie.count(), 4, errorMsg)
+
+        errorMsg = "PrefixTrie.resolve() gave wrong name."
+        self.assertEqual(trie.resolve("st"), "St", errorMsg)
+        self.assertEqual(trie.resolve("sti"), "Sting", errorMsg)
+        self.assertEqual(trie.resolve("s"), None, errorMsg)
+        self.assertEqual(trie.resolve("stingy"), None, errorMsg)
+
+        errorMsg = "PrefixTrie.getCompletions() gave wrong names."
+        self.assertEqual(trie.getCompletions("ST"), ["St", "Staff", "Sting"],
+            errorMsg)
+        self.assertEqual(trie.getCompletions("x"), [], errorMsg)
+
+        copy = trie.copy()
+        errorMsg = "PrefixTrie.remove() did not remove name."
+        self.assertTrue(trie.remove("st"), errorMsg)
+        self.assertFalse(trie.remove("st"), errorMsg)
+        self.assertFalse(trie.contains("St"), errorMsg)
+        self.assertEqual(trie.resolve("sw"), "Sword", errorMsg)
+        self.assertEqual(trie.resolve("st"), None, errorMsg)
+        errorMsg = "PrefixTrie.copy() should not share names."
+        self.assertTrue(copy.contains("St"), errorMsg)
+
+class HeadlessIOTest(unittest.TestCase):
+    """
+    Tests HeadlessIO and a game driven through it.
+    """
+    def testInputOutput(self):
+        from game_io import HeadlessIO
+        io = HeadlessIO(["first", "second"])
+
+        errorMsg = "HeadlessIO.input() did not return queued input in order."
+        self.assertEqual(io.input("> "), "first", errorMsg)
+        self.assertEqual(io.input("> "), "second", errorMsg)
+        errorMsg = "HeadlessIO.input() should raise EOFError when empty."
+        self.assertRaises(EOFError, io.input, "> ")
+
+        io.clearOutput()
+        io.output("Hello")
+        io.output()
+        errorMsg = "HeadlessIO.output() did not record output."
+        self.assertEqual(io.getOutput(), "Hello\n\n", errorMsg)
+
+    def testHeadlessGame(self):
+        """
+        Drives a game with queued commands; no terminal should be touched.
+        """
+        from game import Game
+        from game_io import HeadlessIO
+
+        io = HeadlessIO()
+        g = Game(io)
+        io.pushAll(["help", "money", "stats"])
+        for turn in range(3):
+            g._nextTurn()
+
+        output = io.getOutput()
+        errorMsg = "Headless game did not collect command output."
+        self.assertTrue("Lord of the Rings Adventure Game" in output, errorMsg)
+        self.assertTrue("Russian currently has" in output, errorMsg)
+        self.assertTrue("Russian's stats:" in output, errorMsg)
+
+    def testSkipPauses(self):
+        """
+        Pauses are skipped without consuming queued input.
+        """
+        from game import Game
+        from game_io import HeadlessIO
+
+        io = HeadlessIO(skipPauses = True)
+        g = Game(io)
+        self.assertEqual(g._player.getLocation().getBattleProbability(), 0)
+        io.pushAll(["enter Hobbiton", "Sally's Inn", "no", "Sally's Shop", 
+            "quit", "leave"])
+        g._nextTurn()
+
+        output = io.getOutput()
+        errorMsg = "Queued input should only answer real prompts."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
+        self.assertTrue("Thanks for coming to Sally's Inn." in output, 
+            errorMsg)
+        self.assertTrue("Leaving Hobbiton." in output, errorMsg)
+        errorMsg = "Pause prompts should not be displayed."
+        self.assertFalse("Press enter" in output, errorMsg)
+
+class StreamIOTest(unittest.TestCase):
+    """
+    Tests StreamIO.
+    """
+    def testInputOutput(self):
+        from StringIO import StringIO
+        from game_io import StreamIO
+
+        inStream = StringIO("north\r\nquit\n")
+        outStream = StringIO()
+        io = StreamIO(inStream, outStream)
+
+        errorMsg = "StreamIO.input() did not strip line endings."
+        self.assertEqual(io.input("> "), "north", errorMsg)
+        self.assertEqual(io.input("> "), "quit", errorMsg)
+        errorMsg = "StreamIO.input() should raise EOFError when stream closes."
+        self.assertRaises(EOFError, io.input, "> ")
+
+        io.output("Hello")
+        errorMsg = "StreamIO did not write prompts and output."
+        self.assertEqual(outStream.getvalue(), "> > > Hello\n", errorMsg)
+
+class GameServerTest(unittest.TestCase):
+    """
+    Tests that server.py hosts independent sessions over TCP.
+    """
+    def testSessions(self):
+        import socket
+        import threading
+        from server import GameServer, GameSessionHandler
+
+        server = GameServer(("localhost", 0), GameSessionHandler)
+        thread = threading.Thread(target = server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        try:
+            clients = []
+            for session in range(2):
+                client = socket.create_connection(server.server_address)
+                client.sendall("money\nquit\nyes\n")
+                clients.append(client)
+
+            for client in clients:
+                received = []
+                while True:
+                    data = client.recv(4096)
+                    if not data:
+                        break
+                    received.append(data)
+                client.close()
+
+                output = "".join(received)
+                errorMsg = "Session did not play the client's commands."
+                self.assertTrue("Russian currently has" in output, errorMsg)
+                self.assertTrue("Exiting...." in output, errorMsg)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def testSessionLimit(self):
+        import socket
+        import threading
+        from server import GameServer, GameSessionHandler
+
+        server = GameServer(("localhost", 0), GameSessionHandler, 
+            maxSessions = 1)
+        thread = threading.Thread(target = server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        def receiveAll(client):
+            received = []
+            while True:
+                data = client.recv(4096)
+                if not data:
+                    break
+                received.append(data)
+            client.close()
+            return "".join(received)
+
+        try:
+            first = socket.create_connection(server.server_address)
+            first.recv(1)
+            second = socket.create_connection(server.server_address)
+            errorMsg = "Connection beyond the limit should be turned away."
+            self.assertEqual(receiveAll(second), 
+                "The server is full. Try again later.\n", errorMsg)
+
+            first.sendall("quit\nyes\n")
+            receiveAll(first)
+            third = socket.create_connection(server.server_address)
+            third.sendall("quit\nyes\n")
+            errorMsg = "Finished session should free its slot."
+            self.assertTrue("Exiting...." in receiveAll(third), errorMsg)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def testTranscripts(self):
+        import os
+        import shutil
+        import tempfile
+        from StringIO import StringIO
+        from server import GameSessionHandler
+        from transcript import Transcript
+        import constants
+
+        #Handler without a connection
+        class Handler(GameSessionHandler):
+            def __init__(self):
+                pass
+
+        handler = Handler()
+        handler.rfile = StringIO("money\nquit\nyes\n")
+        handler.wfile = StringIO()
+        directory = tempfile.mkdtemp()
+        try:
+            #Session that fails before the game is created
+            with patch.object(constants, "SERVER_TRANSCRIPT_DIRECTORY", 
+                directory):
+                with patch("server.Game", side_effect = KeyError("bug")):
+                    self.assertRaises(KeyError, handler.handle)
+            fileNames = os.listdir(directory)
+            errorMsg = "Failed session should be saved."
+            self.assertEqual(len(fileNames), 1, errorMsg)
+            transcript = Transcript.load(os.path.join(directory, 
+                fileNames[0]))
+            self.assertTrue(fileNames[0].endswith("-%s.json" % 
+                transcript.getSeed()), errorMsg)
+
+            #Failure to save does not hide the game's error
+            missing = os.path.join(directory, "missing")
+            with patch.object(constants, "SERVER_TRANSCRIPT_DIRECTORY", 
+                missing):
+                with patch("server.Game", side_effect = KeyError("bug")):
+                    with patch("sys.stderr", new_callable = StringIO) as err:
+                        self.assertRaises(KeyError, handler.handle)
+            errorMsg = "Failure to save should be reported."
+            self.assertTrue("Could not save transcript" in err.getvalue(),
+                errorMsg)
+
+            #Input that is not UTF-8 is saved with the session
+            os.remove(os.path.join(directory, fileNames[0]))
+            handler.rfile = StringIO("caf\xe9\n")
+            with patch.object(constants, "SERVER_TRANSCRIPT_DIRECTORY", 
+                directory):
+                handler.handle()
+            fileNames = os.listdir(directory)
+            errorMsg = "Non-ASCII input should be saved."
+            self.assertEqual(len(fileNames), 1, errorMsg)
+            transcript = Transcript.load(os.path.join(directory, 
+                fileNames[0]))
+            self.assertEqual(transcript.getEntries()[0], ("> ", "caf\xe9"),
+                errorMsg)
+        finally:
+            shutil.rmtree(directory)
+
+class WorldTemplateTest(unittest.TestCase):
+    """
+    Tests for worlds copied from the world template.
+    """
+    def testIndependentWorlds(self):
+        import game_loader
+        from items.item import Item
+
+        world = game_loader.getWorld()
+        world2 = game_loader.getWorld()
+
+        #Spaces are linked within their own world
+        errorMsg = "Worlds should not share spaces."
+        self.assertFalse(world[0] is world2[0], errorMsg)
+        errorMsg = "Exits should lead to spaces in the same world."
+        for space in world:
+            for exit in space.getExits().values():
+                if isinstance(exit, list):
+                    for adjacent in exit:
+                        self.assertFalse(adjacent in world2, errorMsg)
+                elif exit:
+                    self.assertFalse(exit in world2, errorMsg)
+
+        #Items dropped in one world do not show up in another
+        blade = Item("blade", "appears to be dull", 1, 1)
+        world[0].addItem(blade)
+        errorMsg = "Item added to one world showed up in another."
+        self.assertFalse(world2[0].containsItem(blade), errorMsg)
+
+    def testCopyOnWrite(self):
+        import game_loader
+
+        template = game_loader.getWorldTemplate()
+        world = template.createWorld()
+        world2 = template.createWorld()
+
+        #Moria is found in Misty Mountains South
+        moria = world[12].getUniquePlace()
+        moria2 = world2[12].getUniquePlace()
+        errorMsg = "Worlds should not share unique places."
+        self.assertFalse(moria is moria2, errorMsg)
+        
+        #Quest-dependent ports are created in the session's own spaces
+        errorMsg = "Unique place should refer to spaces in its own world."
+        self.assertTrue(moria._space is world[12], errorMsg)
+        self.assertTrue(moria._targetSpace is world[13], errorMsg)
+
+        moria._portCreated = True
+        moria._loot.pop()
+        errorMsg = "Unique place state leaked between worlds."
+        self.assertFalse(moria2._portCreated, errorMsg)
+        self.assertNotEqual(len(moria._loot), len(moria2._loot), errorMsg)
+
+        #Monster waves are copied
+        goblinTown = world[5].getUniquePlace()
+        goblinTown2 = world2[5].getUniquePlace()
+        errorMsg = "Worlds should not share monsters."
+        self.assertFalse(goblinTown._wave[0] is goblinTown2._wave[0], 
+            errorMsg)
+
+class WorldDataTest(unittest.TestCase):
+    """
+    Tests for loading the world from its data file.
+    """
+    def testWorld(self):
+        import world_data
+        from cities.city import City
+
+        world = world_data.buildWorld(world_data.loadWorldData())
+        errorMsg = "World should hold the spaces listed in world data."
+        self.assertEqual(len(world), 34, errorMsg)
+        self.assertEqual(world[0].getName(), "Shire", errorMsg)
+        self.assertEqual(world[26].getName(), "Orodruin", errorMsg)
+
+        #Several exits in one direction keep their order
+        fangorn = world[14]
+        errorMsg = "Fangorn should lead east to two spaces."
+        self.assertEqual([space.getName() for space in 
+            fangorn.getExitList("east")], ["Field of Celebrant", "The Wold"],
+            errorMsg)
+
+        #Spaces only reachable through exits
+        barrowDowns = world[1].getExit("south")
+        errorMsg = "Barrow Downs should be reachable but not listed."
+        self.assertEqual(barrowDowns.getName(), "Barrow Downs", errorMsg)
+        self.assertFalse(barrowDowns in world, errorMsg)
+
+        errorMsg = "Space with one city should hold the city itself."
+        self.assertTrue(isinstance(world[0].getCity(), City), errorMsg)
+        errorMsg = "Space with two cities should hold a list."
+        self.assertEqual([city.getName() for city in world[21].getCity()], 
+            ["Edoras", "Aldburg"], errorMsg)
+
+        errorMsg = "Unique place should receive its quest port."
+        goblinTown = world[5]._uniquePlace
+        self.assertTrue(goblinTown._space is world[5], errorMsg)
+        self.assertTrue(goblinTown._targetSpace is world[6], errorMsg)
+
+    def testCache(self):
+        import json
+        import os
+        import shutil
+        import tempfile
+        import world_data
+
+        directory = tempfile.mkdtemp()
+        try:
+            dataPath = os.path.join(directory, "world.json")
+            cachePath = dataPath + ".cache"
+            shutil.copy(world_data.WORLD_DATA_PATH, dataPath)
+
+            compiled = world_data.loadWorldData(dataPath)
+            errorMsg = "Compiled world data should be cached."
+            self.assertTrue(os.path.exists(cachePath), errorMsg)
+
+            #Cache is used while data is unchanged
+            with patch.object(world_data, "compileWorldData") as compile:
+                cached = world_data.loadWorldData(dataPath)
+            errorMsg = "Cached world data should be used."
+            self.assertFalse(compile.called, errorMsg)
+            self.assertEqual(cached, compiled, errorMsg)
+
+            #Changed data is compiled again
+            with open(dataPath) as dataFile:
+                data = json.load(dataFile)
+            data["spaces"][0]["name"] = "Bag End"
+            with open(dataPath, "w") as dataFile:
+                json.dump(data, dataFile)
+            world = world_data.buildWorld(world_data.loadWorldData(dataPath))
+            errorMsg = "Changed world data should be compiled again."
+            self.assertEqual(world[0].getName(), "Bag End", errorMsg)
+
+            #Unwritable cache is not an error
+            world_data.loadWorldData(dataPath, os.path.join(directory, 
+                "missing", "world.cache"))
+        finally:
+            shutil.rmtree(directory)
+
+    def testInvalidData(self):
+        import world_data
+
+        data = {"spaces": [{"id": "shire", "name": "Shire", 
+            "description": "Hobbits", "region": "ERIADOR"}], 
+            "exits": [], "world": ["shire"]}
+        world_data.compileWorldData(data)
+
+        data["exits"] = [["shire", "east", "bree"]]
+        #Exit to unknown space
+        self.assertRaises(AssertionError, world_data.compileWorldData, data)
+
+        data["exits"] = [["shire", "up", "shire"]]
+        #Invalid direction
+        self.assertRaises(AssertionError, world_data.compileWorldData, data)
+
+        data["exits"] = []
+        data["spaces"][0]["region"] = "NUMENOR"
+        #Unknown region
+        self.assertRaises(AssertionError, world_data.compileWorldData, data)
+
+class ItemCatalogTest(unittest.TestCase):
+    """
+    Tests for the item catalog.
+    """
+    def testIds(self):
+        from items.item_catalog import ItemCatalog
+        from items.potion import Potion
+        from items.weapon import Weapon
+
+        tea = Potion("Tea", "A delightful refreshment", 1, 4, 6)
+        strongTea = Potion("Tea", "Secret recipies", 1, 14, 42)
+        sword = Weapon("Sword", "A sword", 2, 10, 3)
+        catalog = ItemCatalog([tea, strongTea])
+
+        errorMsg = "Built-in items should get the first IDs in order."
+        self.assertEqual(catalog.getBuiltInCount(), 2, errorMsg)
+        self.assertEqual(catalog.getId(tea), 0, errorMsg)
+        self.assertEqual(catalog.getId(strongTea), 1, errorMsg)
+
+        errorMsg = "Other items should get the next ID."
+        self.assertEqual(catalog.getId(sword), 2, errorMsg)
+        self.assertEqual(catalog.getItemCount(), 3, errorMsg)
+
+        errorMsg = "Identical definitions should be interned."
+        sameTea = Potion("Tea", "A delightful refreshment", 1, 4, 6)
+        self.assertEqual(catalog.getId(sameTea), 0, errorMsg)
+        self.assertTrue(catalog.intern(sameTea) is tea, errorMsg)
+
+        errorMsg = "Items should convert to and from ID arrays."
+        itemIds = catalog.getIds([sword, sameTea, tea])
+        self.assertEqual(list(itemIds), [2, 0, 0], errorMsg)
+        self.assertEqual(catalog.getItems(itemIds), [sword, tea, tea],
+            errorMsg)
+
+        self.assertRaises(AssertionError, catalog.getId, "Tea")
+
+    def testDefinitions(self):
+        from items.item_catalog import ItemCatalog, getItemCatalog
+        from items.weapon import Weapon
+        from items.unique_items import theOneRing
+
+        catalog = getItemCatalog()
+        errorMsg = "Catalog should be shared."
+        self.assertTrue(getItemCatalog() is catalog, errorMsg)
+        errorMsg = "Unique items should be built in."
+        self.assertTrue(catalog.getId(theOneRing) <
+            catalog.getBuiltInCount(), errorMsg)
+
+        #Definition carried to a catalog without it
+        sword = Weapon("Sword", "A sword", 2, 10, 3)
+        definition = catalog.getDefinition(catalog.getId(sword))
+        otherCatalog = ItemCatalog()
+        otherSword = otherCatalog.getItem(
+            otherCatalog.addDefinition(definition))
+        errorMsg = "Item should be created from its definition."
+        self.assertTrue(isinstance(otherSword, Weapon), errorMsg)
+        self.assertEqual(otherSword.getAttack(), 3, errorMsg)
+        self.assertEqual(otherCatalog.addDefinition(definition),
+            otherCatalog.getId(otherSword), errorMsg)
+
+        self.assertRaises(AssertionError, otherCatalog.addDefinition,
+            ("space.Space", []))
+
+    def testThreads(self):
+        """
+        Sessions on several threads get distinct IDs for distinct items.
+        """
+        import threading
+        import time
+        from items.item_catalog import ItemCatalog
+        from items.weapon import Weapon
+
+        #Lets other threads run between counting and adding items
+        class SlowList(list):
+            def __len__(self):
+                length = list.__len__(self)
+                time.sleep(.001)
+                return length
+
+        catalog = ItemCatalog()
+        catalog._items = SlowList()
+        swords = [[Weapon("Sword %s-%s" % (thread, index), "A sword", 2, 10, 
+            index) for index in range(20)] for thread in range(4)]
+        threads = [threading.Thread(target = catalog.getIds, 
+            args = (threadSwords,)) for threadSwords in swords]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        errorMsg = "Every item should get its own ID."
+        self.assertEqual(catalog.getItemCount(), 80, errorMsg)
+        for threadSwords in swords:
+            for sword in threadSwords:
+                self.assertTrue(catalog.getItem(catalog.getId(sword)) is 
+                    sword, errorMsg)
+
+    def testSessionsDoNotGrowCatalog(self):
+        """
+        Items created for a session are forgotten with the session.
+        """
+        import gc
+        from game import Game
+        from game_io import HeadlessIO
+        from items.item_catalog import getItemCatalog
+
+        def playSession():
+            game = Game(HeadlessIO(), 3)
+            for space in game._world:
+                space.getUniquePlace()
+            game.saveSnapshot()
+
+        catalog = getItemCatalog()
+        playSession()
+        gc.collect()
+        idCount = len(catalog._ids)
+        for session in range(3):
+            playSession()
+        gc.collect()
+
+        errorMsg = "Catalog should not keep items of finished sessions."
+        self.assertEqual(len(catalog._ids), idCount, errorMsg)
+
+class SnapshotTest(unittest.TestCase):
+    """
+    Tests for saving and loading game sessions.
+    """
+    def testRoundTrip(self):
+        import game_loader
+        import snapshot
+        from game_io import HeadlessIO
+        from items.unique_items import theOneRing
+        from items.weapon import Weapon
+
+        world = game_loader.getWorld()
+        player = game_loader.getPlayer(world[0],
+            game_loader.getStartingInventory(), HeadlessIO())
+
+        #Play a little
+        sword = Weapon("Sword", "A sword", 2, 10, 3)
+        player.addToInventory(theOneRing)
+        player.addToInventory(sword)
+        player.equip(sword)
+        player.increaseExperience(3000)
+        player.takeAttack(5)
+        player.setLocation(world[6])
+        world[6].addItem(sword)
+        goblinTown = world[5].getUniquePlace()
+        goblinTown._loot.pop()
+        goblinTown._createPort("south", player)
+
+        data = snapshot.saveSnapshot(player)
+        world2, player2 = snapshot.loadSnapshot(data, HeadlessIO())
+        graph2 = world2[0].getWorldGraph()
+
+        errorMsg = "Loaded world should be a new one."
+        self.assertFalse(world2[0] is world[0], errorMsg)
+        self.assertEqual([space.getName() for space in world2],
+            [space.getName() for space in world], errorMsg)
+
+        errorMsg = "Player should be restored."
+        self.assertEqual(player2.getLevel(), player.getLevel(), errorMsg)
+        self.assertEqual(player2.getHp(), player.getHp(), errorMsg)
+        self.assertEqual(player2.getTotalAttack(), player.getTotalAttack(),
+            errorMsg)
+        self.assertTrue(player2.getLocation() is world2[6], errorMsg)
+        self.assertEqual([item.getName() for item in
+            player2.getInventory().getItems()], [item.getName() for item in
+            player.getInventory().getItems()], errorMsg)
+
+        errorMsg = "Items should be shared as they were."
+        loadedSword = player2.getEquipped().getItemByName("Sword")
+        self.assertTrue(player2.getInventory().containsItem(loadedSword),
+            errorMsg)
+        self.assertTrue(world2[6].containsItem(loadedSword), errorMsg)
+        errorMsg = "Unique items should stay the same objects."
+        self.assertTrue(player2.getInventory().containsItem(theOneRing),
+            errorMsg)
+
+        errorMsg = "Unique place should be restored."
+        goblinTown2 = world2[5].getUniquePlace()
+        self.assertEqual(len(goblinTown2._loot), 2, errorMsg)
+        self.assertEqual(len(goblinTown2._wave4), 15, errorMsg)
+        self.assertTrue(goblinTown2._wave4[0] is goblinTown2._wave[0],
+            errorMsg)
+        self.assertTrue(goblinTown2._space is world2[5], errorMsg)
+
+        errorMsg = "Port should be restored in world and graph."
+        self.assertTrue(world2[6] in world2[5].getExitList("south"), errorMsg)
+        self.assertEqual(graph2.getExitTable(),
+            world[0].getWorldGraph().getExitTable(), errorMsg)
+
+        errorMsg = "Unused places should be left as created."
+        self.assertTrue(world2[0]._clonePlace, errorMsg)
+
+    def testInvalidSnapshot(self):
+        import marshal
+        import game_loader
+        import snapshot
+        from game_io import HeadlessIO
+
+        world = game_loader.getWorld()
+        player = game_loader.getPlayer(world[0], [], HeadlessIO())
+        data = snapshot.saveSnapshot(player)
+
+        #Truncated
+        self.assertRaises(AssertionError, snapshot.loadSnapshot, data[:20])
+        #Other format version
+        fields = list(marshal.loads(data))
+        fields[1] += 1
+        self.assertRaises(AssertionError, snapshot.loadSnapshot,
+            marshal.dumps(tuple(fields)))
+
+    def testSpeed(self):
+        import game_loader
+        import snapshot
+        import time
+        from game_io import HeadlessIO
+
+        world = game_loader.getWorld()
+        player = game_loader.getPlayer(world[0],
+            game_loader.getStartingInventory(), HeadlessIO())
+        world[5].getUniquePlace()
+
+        start = time.time()
+        for i in range(100):
+            data = snapshot.saveSnapshot(player)
+            snapshot.loadSnapshot(data)
+        elapsed = (time.time() - start) / 100
+
+        errorMsg = "Saving and loading took %.2f ms." % (elapsed * 1000)
+        self.assertTrue(elapsed < 0.01, errorMsg)
+
+class SessionRandomTest(unittest.TestCase):
+    """
+    Tests SessionRandom and seeded game sessions.
+    """
+    def testStreams(self):
+        from session_random import SessionRandom
+        from constants import RandomStream
+
+        first = SessionRandom(7)
+        second = SessionRandom(7)
+        second.getStream(RandomStream.SHOP).random()
+
+        errorMsg = "Streams with the same seed should match."
+        self.assertEqual(first.getStream(RandomStream.SPAWN).random(),
+            second.getStream(RandomStream.SPAWN).random(), errorMsg)
+        errorMsg = "Streams of a session should differ."
+        self.assertNotEqual(first.getStream(RandomStream.LOOT).random(),
+            first.getStream(RandomStream.STORY).random(), errorMsg)
+
+        state = first.getState()
+        numbers = [first.getStream(stream).random() 
+            for stream in RandomStream.ALL]
+        third = SessionRandom(8)
+        third.setState(state)
+        errorMsg = "SessionRandom.setState() did not restore streams."
+        self.assertEqual([third.getStream(stream).random() 
+            for stream in RandomStream.ALL], numbers, errorMsg)
+
+    def testReproducibleGames(self):
+        """
+        Interleaved games with the same seed play out the same.
+        """
+        from game import Game
+        from game_io import HeadlessIO
+        from battle_policy import FocusLowestHpPolicy
+
+        games = []
+        for seed in (7, 7, 8):
+            io = HeadlessIO(skipPauses = True)
+            game = Game(io, seed)
+            game._player.setBattlePolicy(FocusLowestHpPolicy())
+            games.append((game, io))
+
+        for command in ["travel Trollshaws", "travel Dunland", 
+            "travel Fangorn", "travel Calenardhon"]:
+            for game, io in games:
+                io.push(command)
+                game._nextTurn()
+
+        outputs = [io.getOutput() for game, io in games]
+        errorMsg = "Games with the same seed should play out the same."
+        self.assertTrue("Wild monsters appeared!" in outputs[0], errorMsg)
+        self.assertEqual(outputs[0], outputs[1], errorMsg)
+        errorMsg = "Games with different seeds should differ."
+        self.assertNotEqual(outputs[0], outputs[2], errorMsg)
+        self.assertEqual(games[0][0].getSeed(), 7)
+
+        #Completing a command draws no random numbers
+        game = Game(HeadlessIO(), 7)
+        state = game._sessionRandom.getState()
+        errorMsg = "Completion should not use the session's random numbers."
+        self.assertEqual(game._parser.complete("enter "), 
+            ["enter Hobbiton"], errorMsg)
+        self.assertEqual(game._sessionRandom.getState(), state, errorMsg)
+
+        #Loaded game rolls the same numbers
+        game, io = games[0]
+        loaded = Game(HeadlessIO(), 9)
+        loaded.loadSnapshot(game.saveSnapshot())
+        errorMsg = "Snapshot should keep the random number streams."
+        self.assertEqual(loaded.getSeed(), 7, errorMsg)
+        self.assertEqual(game._sessionRandom.getState(), 
+            loaded._sessionRandom.getState(), errorMsg)
+
+class TranscriptTest(unittest.TestCase):
+    """
+    Tests recording and replaying game sessions.
+    """
+    def testRecordAndReplay(self):
+        from game import Game
+        from game_io import HeadlessIO
+        from transcript import RecordingIO, Transcript, replay
+
+        #Pauses go to the recorded channel, but are not recorded
+        io = HeadlessIO(["travel Trollshaws"] + ["attack"] * 30 + 
+            ["quit", "yes"], skipPauses = True)
+        recorder = RecordingIO(io)
+        game = Game(recorder, 1)
+        self.assertRaises(SystemExit, 
+            lambda: [game._nextTurn() for turn in range(20)])
+        transcript = Transcript.loads(recorder.getTranscript(
+            game.getSeed()).dumps())
+
+        self.assertEqual(transcript.getSeed(), 1)
+        self.assertEqual(len(transcript.getEntries()), 33)
+        self.assertEqual(transcript.getEntries()[0], 
+            ("> ", "travel Trollshaws"))
+        self.assertTrue(recorder.getSkipPauses())
+
+        report = replay(transcript)
+        errorMsg = "Replay should follow the transcript."
+        self.assertEqual(report["divergence"], None, errorMsg)
+        self.assertEqual(report["responses"], 33, errorMsg)
+        self.assertEqual(report["turns"], 2, errorMsg)
+        self.assertTrue(report["ended"], errorMsg)
+        self.assertEqual(report["output"][-1], "Exiting....", errorMsg)
+
+        #Without the recorded battle, the game asks for a command instead
+        report = replay(Transcript(101, transcript.getEntries()))
+        errorMsg = "Replay should detect the unexpected prompt."
+        self.assertEqual(report["divergence"], {"index": 1, 
+            "expected": "You may: 'attack', 'use potion', 'run.' ",
+            "actual": "> "}, errorMsg)
+
+        #Session that went on after the game ended
+        entries = transcript.getEntries() + [("> ", "describe")]
+        report = replay(Transcript(1, entries))
+        self.assertEqual(report["divergence"]["index"], 33, errorMsg)
+        self.assertEqual(report["divergence"]["actual"], None, errorMsg)
+
+    def testNonAsciiInput(self):
+        """
+        Input in any encoding is saved and loaded byte for byte.
+        """
+        import os
+        import tempfile
+        from transcript import Transcript
+
+        entries = [("> ", "caf\xe9"), ("> ", "caf\xc3\xa9"), ("\xff ", "")]
+        path = tempfile.mktemp(suffix = ".json")
+        try:
+            Transcript(5, entries).save(path)
+            transcript = Transcript.load(path)
+        finally:
+            os.remove(path)
+
+        errorMsg = "Transcript did not keep non-ASCII input."
+        self.assertEqual(transcript.getEntries(), entries, errorMsg)
+        self.assertTrue(all(isinstance(response, str) 
+            for prompt, response in transcript.getEntries()), errorMsg)
+
+        self.assertRaises(AssertionError, lambda: Transcript.loads(
+            '{"version": 2, "seed": 1, "entries": [["> ", "\\u20ac"]]}'))
+
+    def testCheckReplay(self):
+        from transcript import Transcript, checkReplay
+
+        self.assertRaises(AssertionError, 
+            lambda: Transcript.loads('{"version": 0}'))
+        self.assertRaises(AssertionError, lambda: Transcript.loads("{"))
+
+        #Errors are reported instead of raised
+        with patch("game.Game._nextTurn", side_effect = KeyError("bug")):
+            report = checkReplay(Transcript(1, [("> ", "describe")]))
+        self.assertTrue("KeyError: 'bug'" in report["error"])
+
+        report = checkReplay(Transcript(1, [("> ", "describe")]))
+        self.assertEqual(report["error"], None)
+        self.assertEqual(report["turns"], 1)
+        self.assertFalse(report["ended"])
+
+class LazyLoadingTest(unittest.TestCase):
+    """
+    Tests for lazily imported unique place classes.
+    """
+    def testLazyClass(self):
+        from util.lazy_class import LazyClass
+        from unique_places.tharbad import Tharbad
+
+        lazyTharbad = LazyClass("unique_places.tharbad", "Tharbad")
+        
+        errorMsg = "LazyClass did not load the right class."
+        self.assertTrue(lazyTharbad.load() is Tharbad, errorMsg)
+        errorMsg = "LazyClass did not create an instance of the real class."
+        tharbad = lazyTharbad("Tharbad", "Ruins", "Welcome")
+        self.assertTrue(isinstance(tharbad, Tharbad), errorMsg)
+
+    def testLazyUniquePlace(self):
+        from space import Space
+        from unique_place import LazyUniquePlace
+        from unique_places.moria import Moria
+        from util.lazy_class import LazyClass
+
+        lazyMoria = LazyUniquePlace(LazyClass("unique_places.moria", "Moria"), 
+            "Moria", "Dark", "Welcome")
+        space = Space("Misty Mountains", "Cold", 1, uniquePlace = lazyMoria)
+        targetSpace = Space("Lorien", "Golden", 1)
+        lazyMoria.receiveSpaces(space, targetSpace)
+        
+        moria = space.getUniquePlace()
+        errorMsg = "Space did not create unique place on first use."
+        self.assertTrue(isinstance(moria, Moria), errorMsg)
+        self.assertTrue(space.getUniquePlace() is moria, errorMsg)
+        errorMsg = "Unique place did not receive its spaces."
+        self.assertTrue(moria._targetSpace is targetSpace, errorMsg)
+        errorMsg = "Unique place was not initialized correctly."
+        self.assertEqual(moria.getName(), "Moria", errorMsg)
+
+class BattleSimulatorTest(unittest.TestCase):
+    """
+    Tests for the batched random battle simulator.
+    """
+    def setUp(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not installed.")
+
+    def testOverpoweredPlayer(self):
+        import battle_simulator
+        import factories.monster_factory
+        from constants import RegionType, REGIONAL_MONSTER_DISTRIBUTION
+
+        playerStats = (1000, 1000, 1000)
+        report = battle_simulator.simulateBattles(RegionType.ERIADOR, 0,
+            playerStats, 1000, seed = 0)
+        
+        errorMsg = "Player who cannot be hurt should win every battle."
+        self.assertEqual(report["winRate"], 1, errorMsg)
+        errorMsg = "Player should not drink potions he does not have."
+        self.assertEqual(report["potions"], 0, errorMsg)
+        
+        #Every monster in Eriador is slain in one hit, so one round per monster
+        experiences = set()
+        for kindName in REGIONAL_MONSTER_DISTRIBUTION[RegionType.ERIADOR]:
+            kind = factories.monster_factory.getMonsterKind(kindName)
+            experiences.add(kind.getExperience())
+        errorMsg = "Experience earned does not match monsters slain."
+        self.assertTrue(min(experiences) * report["rounds"] <= 
+            report["experience"] <= max(experiences) * report["rounds"], 
+            errorMsg)
+
+    def testHopelessPlayer(self):
+        import battle_simulator
+        from constants import RegionType
+
+        report = battle_simulator.simulateBattles(RegionType.MORDOR, .5, 
+            (1, 0, 0), 1000, potions = 2, potionHealing = 1, seed = 0)
+        
+        errorMsg = "Player without attack should never win."
+        self.assertEqual(report["winRate"], 0, errorMsg)
+        errorMsg = "Lost battles should not earn experience or money."
+        self.assertEqual(report["experience"], 0, errorMsg)
+        self.assertEqual(report["money"], 0, errorMsg)
+
+    def testSeed(self):
+        import battle_simulator
+        from constants import RegionType
+
+        playerStats = battle_simulator.getPlayerStats(5, 8, 1)
+        first = battle_simulator.simulateBattles(RegionType.RHOVANION, .1,
+            playerStats, 1000, potions = 3, potionHealing = 20, seed = 7)
+        second = battle_simulator.simulateBattles(RegionType.RHOVANION, .1,
+            playerStats, 1000, potions = 3, potionHealing = 20, seed = 7)
+
+        errorMsg = "Same seed should give the same outcomes."
+        self.assertEqual(first, second, errorMsg)
 
 class ItemTest(unittest.TestCase):
     """
@@ -1035,15 +2118,31 @@ class ItemSetTest(unittest.TestCase):
     def tearDown(self):
         self._itemList = self._items = None
 
+    def testFractionalWeights(self):
+        from items.item import Item
+        from items.item_set import ItemSet
+
+        feather = Item("feather", "light", .5, 1)
+        leaf = Item("leaf", "lighter", .25, 1)
+        items = ItemSet([feather, leaf, feather])
+
+        errorMsg = "Fractional weights should be added and removed alike."
+        self.assertEqual(items.getWeight(), 1.25, errorMsg)
+        items.removeItem(feather)
+        self.assertEqual(items.getWeight(), .75, errorMsg)
+        items.removeItem(leaf)
+        items.removeItem(feather)
+        self.assertEqual(items.getWeight(), 0, errorMsg)
+
     def testInitItemSet(self):
         errorMsg = "ItemSet object has more objects than it was given " \
                     "during initialization."
-        self.assertEqual(len(self._items._items), ItemSetTest.INITIAL_COUNT, errorMsg)
+        self.assertEqual(len(self._items.getItems()), ItemSetTest.INITIAL_COUNT, errorMsg)
 
         errorMsg = "ItemSet object does not include all objects given " \
                     "during initialization."
         for item in self._itemList:
-            self.assertTrue(item in self._items._items, errorMsg)
+            self.assertTrue(item in self._items.getItems(), errorMsg)
 
     def testCountItems(self):
         expectedCount = ItemSetTest.INITIAL_COUNT
@@ -1117,6 +2216,155 @@ class ItemSetTest(unittest.TestCase):
         errorMsg = "ItemSet object contained Item not added during initialization."
         self.assertEqual(len(self._itemList), 0, errorMsg)
 
+    def testDuplicateItems(self):
+        from items.item import Item
+
+        tea = Item("Tea", "hot", 1, 1)
+        tea2 = Item("Tea", "cold", 1, 1)
+        self._items.addItem(tea)
+        self._items.addItem(tea2)
+        self._items.addItem(tea)
+
+        errorMsg = "ItemSet should count each addition of an item."
+        self.assertEqual(self._items.count(), ItemSetTest.INITIAL_COUNT + 3, 
+            errorMsg)
+        errorMsg = "getItemByName() should return the earliest item with name."
+        self.assertTrue(self._items.getItemByName("Tea") is tea, errorMsg)
+
+        self._items.removeItem(tea)
+        errorMsg = "removeItem() should remove the earliest addition of item."
+        self.assertEqual(self._items.getItems()[-2:], [tea2, tea], errorMsg)
+        self.assertTrue(self._items.getItemByName("Tea") is tea2, errorMsg)
+
+        self._items.removeItem(tea)
+        self._items.removeItem(tea2)
+        errorMsg = "ItemSet claimed to contain removed items."
+        self.assertFalse(self._items.containsItem(tea), errorMsg)
+        self.assertFalse(self._items.containsItemWithName("Tea"), errorMsg)
+        self.assertEqual(self._items.getItemByName("Tea"), None, errorMsg)
+        errorMsg = "removeItem() should reject items not in ItemSet."
+        self.assertRaises(AssertionError, self._items.removeItem, tea)
+
+    def testRemoveWhileIterating(self):
+        for item in self._items:
+            self._items.removeItem(item)
+
+        errorMsg = "Removing items while iterating skipped items."
+        self.assertEqual(self._items.count(), 0, errorMsg)
+        self.assertEqual(self._items.getWeight(), 0, errorMsg)
+
+    def testNameTrie(self):
+        from items.item import Item
+
+        trie = self._items.getNameTrie()
+        errorMsg = "ItemSet.getNameTrie() did not list item names."
+        self.assertEqual(trie.getCompletions(""), ["helmet", "potion", 
+            "sword"], errorMsg)
+
+        #Kept up to date once built
+        shield = Item("shield", "made by dwarves", 1, 1)
+        self._items.addItem(shield)
+        self._items.removeItem(self._itemList[0])
+        errorMsg = "ItemSet name trie not kept up to date."
+        self.assertEqual(trie.resolve("s"), "shield", errorMsg)
+        self._items.clearItems()
+        self.assertEqual(self._items.getNameTrie().count(), 0, errorMsg)
+
+class SortedItemSetTest(unittest.TestCase):
+    """
+    Tests SortedItemSet class.
+    """
+    def testOrder(self):
+        from items.sorted_item_set import SortedItemSet
+        from items.item import Item
+        from items.weapon import Weapon
+        from items.armor import Armor
+        from items.charm import Charm
+        from items.potion import Potion
+
+        rock = Item("Rock", "Grey", 1, 1)
+        sword = Weapon("Sword", "Sharp", 1, 1, 1)
+        dagger = Weapon("Dagger", "Short", 1, 1, 1)
+        shield = Armor("Shield", "Round", 1, 1, 1)
+        ring = Charm("Ring", "Gold", 1, 1, 1, 1, 1)
+        tea = Potion("Tea", "Hot", 1, 1, 1)
+        tea2 = Potion("Tea", "Cold", 1, 1, 1)
+        ale = Potion("Ale", "Brown", 1, 1, 1)
+
+        items = SortedItemSet([rock, tea, sword, ring, tea2, shield, ale, 
+            dagger])
+
+        errorMsg = "SortedItemSet did not keep items in display order."
+        self.assertEqual(items.getItems(), [sword, dagger, shield, ring, ale, 
+            tea, tea2, rock], errorMsg)
+
+        items.removeItem(tea)
+        items.removeItem(sword)
+        items.addItem(tea)
+        errorMsg = "SortedItemSet did not keep order after removals."
+        self.assertEqual(items.getItems(), [dagger, shield, ring, ale, tea2, 
+            tea, rock], errorMsg)
+
+class EquipmentTest(unittest.TestCase):
+    """
+    Tests Equipment class and the player stats derived from it.
+    """
+    def testSlots(self):
+        from items.equipment import Equipment
+        from items.weapon import Weapon
+        from items.charm import Charm
+        from items.potion import Potion
+        from constants import ItemType
+
+        sword = Weapon("Sword", "Sharp", 1, 1, 4)
+        dagger = Weapon("Dagger", "Short", 1, 1, 2)
+        ring = Charm("Ring", "Gold", 1, 1, 1, 2, 3)
+        ring2 = Charm("Ring", "Silver", 1, 1, 1, 2, 3)
+        equipment = Equipment([sword, ring, ring2])
+        
+        errorMsg = "Charm bonuses were not added up."
+        self.assertEqual(equipment.getCharmAttack(), 2, errorMsg)
+        self.assertEqual(equipment.getCharmDefense(), 4, errorMsg)
+        self.assertEqual(equipment.getCharmHp(), 6, errorMsg)
+
+        equipment.addItem(dagger)
+        errorMsg = "New weapon should displace equipped weapon."
+        self.assertTrue(equipment.getItemInSlot(ItemType.WEAPON) is dagger, 
+            errorMsg)
+        self.assertFalse(equipment.containsItem(sword), errorMsg)
+        self.assertEqual(equipment.getWeaponAttack(), 2, errorMsg)
+
+        equipment.removeItem(ring)
+        errorMsg = "Charm bonuses were not updated on removal."
+        self.assertEqual(equipment.getCharmAttack(), 1, errorMsg)
+        errorMsg = "Equipment should reject items that cannot be equipped."
+        self.assertRaises(AssertionError, equipment.addItem, 
+            Potion("Tea", "Hot", 1, 1, 1))
+
+    def testStatCache(self):
+        from space import Space
+        from player import Player
+        from items.weapon import Weapon
+        from game_io import HeadlessIO
+
+        player = Player("Frodo", Space("Shire", "Green", 1), HeadlessIO())
+        sword = Weapon("Sword", "Sharp", 1, 1, 4)
+        player.addToInventory(sword)
+        player.equip(sword)
+
+        errorMsg = "Total attack should include weapon."
+        self.assertEqual(player.getTotalAttack(), player.getAttack() + 4, 
+            errorMsg)
+
+        player.increaseExperience(1000)
+        errorMsg = "Total attack should be recalculated after level up."
+        self.assertEqual(player.getTotalAttack(), player.getAttack() + 4, 
+            errorMsg)
+
+        player.getEquipped().removeItem(sword)
+        errorMsg = "Total attack should be recalculated after equipment change."
+        self.assertEqual(player.getTotalAttack(), player.getAttack(), errorMsg)
+
 class SpaceTest(unittest.TestCase):
     """
     Test for spaces.
@@ -1209,6 +2457,349 @@ class SpaceTest(unittest.TestCase):
         errorMsg = "space.getUniquePlace() should return dmitriyHouse but does not."
         self.assertEqual(chocolateMountain.getUniquePlace(), dmitriyHouse, errorMsg)
         
+class WorldGraphTest(unittest.TestCase):
+    """
+    Tests the compiled world graph.
+    """
+    def testCompile(self):
+        from space import Space
+        from world_graph import WorldGraph
+        import constants
+
+        shire = Space("Shire", "Hobbits", constants.RegionType.ERIADOR)
+        bree = Space("Bree", "Men", constants.RegionType.ERIADOR)
+        oldForest = Space("Old Forest", "Trees", constants.RegionType.ERIADOR)
+        barrowDowns = Space("Barrow Downs", "Wights", 
+            constants.RegionType.ERIADOR)
+        shire.createExit("east", bree, outgoingOnly = False)
+        shire.createExit("east", oldForest, outgoingOnly = False)
+        oldForest.createExit("south", barrowDowns, outgoingOnly = False)
+
+        #Barrow Downs is only reachable through exits
+        graph = WorldGraph([shire, bree, oldForest])
+        errorMsg = "Graph should contain every connected space."
+        self.assertEqual(graph.spaceCount(), 4, errorMsg)
+        errorMsg = "IDs should follow the order of spaces given."
+        self.assertEqual(graph.getSpaceId(shire), 0, errorMsg)
+        self.assertEqual(graph.getSpaceId(oldForest), 2, errorMsg)
+        self.assertEqual(graph.getSpaceId(barrowDowns), 3, errorMsg)
+        self.assertEqual(graph.getSpace(1), bree, errorMsg)
+
+        errorMsg = "Name lookup failed."
+        self.assertEqual(graph.getSpaceByName("Barrow Downs"), barrowDowns, 
+            errorMsg)
+        self.assertEqual(graph.getIdByName("Bree"), 1, errorMsg)
+        self.assertEqual(graph.getSpaceByName("Mordor"), None, errorMsg)
+
+        #Direction with several exits
+        errorMsg = "Exits should be returned in the order they were created."
+        self.assertEqual(list(graph.getExitIds(0, "east")), [1, 2], errorMsg)
+        self.assertEqual(graph.getExits(shire, "east"), [bree, oldForest], 
+            errorMsg)
+        errorMsg = "Direction without exit should have no exits."
+        self.assertEqual(graph.getExits(shire, "north"), [], errorMsg)
+        self.assertEqual(sorted(graph.getNeighborIds(2)), [0, 3], errorMsg)
+
+        errorMsg = "Spaces should be attached to the graph."
+        self.assertTrue(barrowDowns.getWorldGraph() is graph, errorMsg)
+
+    def testExitChanges(self):
+        from space import Space
+        import constants
+
+        shire = Space("Shire", "Hobbits", constants.RegionType.ERIADOR)
+        bree = Space("Bree", "Men", constants.RegionType.ERIADOR)
+        weatherHills = Space("Weather Hills", "Hills", 
+            constants.RegionType.ERIADOR)
+        rivendell = Space("Rivendell", "Elves", constants.RegionType.ERIADOR)
+        shire.createExit("east", bree, outgoingOnly = False)
+        bree.createExit("east", weatherHills, outgoingOnly = False)
+
+        #Graph compiled on first request
+        graph = shire.getWorldGraph()
+        self.assertEqual(graph.spaceCount(), 3)
+
+        #Exit between spaces of the graph is added in place
+        shire.createExit("north", weatherHills, outgoingOnly = False)
+        errorMsg = "Graph should follow new exits."
+        self.assertTrue(shire.getWorldGraph() is graph, errorMsg)
+        self.assertEqual(graph.getExits(shire, "north"), [weatherHills], 
+            errorMsg)
+        self.assertEqual(graph.getExits(weatherHills, "south"), [shire], 
+            errorMsg)
+        self.assertEqual(graph.getExits(bree, "east"), [weatherHills], 
+            errorMsg)
+
+        #Cleared exit is removed in place
+        shire.clearExit("north", False)
+        errorMsg = "Graph should forget cleared exits."
+        self.assertEqual(graph.getExits(shire, "north"), [], errorMsg)
+        self.assertEqual(graph.getExits(weatherHills, "south"), [], errorMsg)
+        self.assertEqual(graph.getExits(bree, "west"), [shire], errorMsg)
+
+        #Exit to a new space causes recompile
+        weatherHills.createExit("east", rivendell, outgoingOnly = False)
+        newGraph = shire.getWorldGraph()
+        errorMsg = "Graph should be recompiled to include new space."
+        self.assertFalse(newGraph is graph, errorMsg)
+        self.assertEqual(newGraph.spaceCount(), 4, errorMsg)
+        self.assertTrue(rivendell.getWorldGraph() is newGraph, errorMsg)
+        self.assertEqual(newGraph.getExits(rivendell, "west"), 
+            [weatherHills], errorMsg)
+
+class RoutePlannerTest(unittest.TestCase):
+    """
+    Tests shortest routes and the travel command.
+    """
+    def testRoutes(self):
+        import game_loader
+        from space import Space
+        from world_graph import WorldGraph
+        from route_planner import RoutePlanner
+
+        world = game_loader.getWorld()
+        graph = world[0].getWorldGraph()
+        planner = graph.getRoutePlanner()
+
+        #Routes lead one exit at a time to destination
+        shireId = graph.getIdByName("shire")
+        for targetId in range(graph.spaceCount()):
+            route = planner.getRoute(shireId, targetId)
+            if route is None:
+                continue
+            errorMsg = "Route length should match distance."
+            self.assertEqual(len(route), planner.getDistance(shireId, 
+                targetId), errorMsg)
+            if route:
+                self.assertEqual(route[-1], targetId, errorMsg)
+            self._assertFollowsExits(graph, shireId, route)
+
+        #Quest exits are added to routes in place
+        spaces = [Space("Space %s" % index, "Test", "Eriador") 
+            for index in range(12)]
+        for index in range(0, 12, 3):
+            spaces[index].createExit("east", spaces[index + 1], 
+                outgoingOnly = False)
+            spaces[index + 1].createExit("north", spaces[index + 2], 
+                outgoingOnly = True)
+        graph = WorldGraph(spaces)
+        planner = graph.getRoutePlanner()
+        ports = [(2, 3), (5, 0), (8, 9), (11, 6), (4, 7), (10, 1), (1, 2)]
+        for spaceIndex, targetIndex in ports:
+            spaces[spaceIndex].createExit("south", spaces[targetIndex], 
+                outgoingOnly = True)
+            errorMsg = "Planner should be updated rather than replaced."
+            self.assertTrue(graph.getRoutePlanner() is planner, errorMsg)
+
+            errorMsg = "Updated routes should match routes computed anew."
+            fresh = RoutePlanner(graph)
+            for sourceId in range(graph.spaceCount()):
+                for targetId in range(graph.spaceCount()):
+                    distance = fresh.getDistance(sourceId, targetId)
+                    self.assertEqual(planner.getDistance(sourceId, targetId),
+                        distance, errorMsg)
+                    route = planner.getRoute(sourceId, targetId)
+                    if distance is None:
+                        self.assertEqual(route, None, errorMsg)
+                    else:
+                        self.assertEqual(len(route), distance, errorMsg)
+                        self._assertFollowsExits(graph, sourceId, route)
+
+    def _assertFollowsExits(self, graph, sourceId, route):
+        """
+        Asserts that every step of a route takes an exit.
+        """
+        spaceId = sourceId
+        for nextId in route:
+            errorMsg = "Route should only follow exits."
+            self.assertTrue(nextId in graph.getNeighborIds(spaceId), errorMsg)
+            spaceId = nextId
+
+    def testSafeRoutes(self):
+        from space import Space
+        from world_graph import WorldGraph
+        import battle_engine
+        import constants
+
+        #Short route through Mordor and long route through Eriador
+        start = Space("Start", "Test", constants.RegionType.ERIADOR, 
+            battleProbability = 0)
+        mordor = Space("Mordor", "Test", constants.RegionType.MORDOR, 
+            battleProbability = .2, battleBonusDifficulty = .5)
+        eriador1 = Space("Eriador 1", "Test", constants.RegionType.ERIADOR, 
+            battleProbability = .1)
+        eriador2 = Space("Eriador 2", "Test", constants.RegionType.ERIADOR, 
+            battleProbability = .1)
+        end = Space("End", "Test", constants.RegionType.ERIADOR, 
+            battleProbability = 0)
+        start.createExit("east", mordor, outgoingOnly = False)
+        mordor.createExit("east", end, outgoingOnly = False)
+        start.createExit("north", eriador1, outgoingOnly = False)
+        eriador1.createExit("east", eriador2, outgoingOnly = False)
+        eriador2.createExit("south", end, outgoingOnly = False)
+
+        graph = WorldGraph([start, mordor, eriador1, eriador2, end])
+        startId = graph.getSpaceId(start)
+        endId = graph.getSpaceId(end)
+
+        errorMsg = "Fewest encounters route should go through Mordor."
+        planner = graph.getSafeRoutePlanner(1, constants.RouteRisk.ENCOUNTERS)
+        self.assertEqual(planner.getRoute(startId, endId), 
+            [graph.getSpaceId(mordor), endId], errorMsg)
+        self.assertAlmostEqual(planner.getRisk(startId, endId), .2)
+
+        errorMsg = "Least damage route should avoid Mordor."
+        planner = graph.getSafeRoutePlanner(1)
+        self.assertEqual(planner.getRoute(startId, endId), 
+            [graph.getSpaceId(eriador1), graph.getSpaceId(eriador2), endId], 
+            errorMsg)
+        self.assertEqual(planner.getRoute(endId, endId), [])
+
+        #Expected damage falls as player grows stronger
+        errorMsg = "Expected damage should fall with player stats."
+        damage = battle_engine.getExpectedDamage(constants.RegionType.MORDOR,
+            .5, 5, 0)
+        self.assertTrue(damage > 0, errorMsg)
+        self.assertTrue(battle_engine.getExpectedDamage(
+            constants.RegionType.MORDOR, .5, 10, 0) < damage, errorMsg)
+        self.assertTrue(battle_engine.getExpectedDamage(
+            constants.RegionType.MORDOR, .5, 5, 3) < damage, errorMsg)
+
+        #Routes are shared within a level bracket
+        errorMsg = "Levels in one bracket should share routes."
+        bracket = constants.RoutePlanning.LEVEL_BRACKET
+        self.assertTrue(graph.getSafeRoutePlanner(bracket) is planner, 
+            errorMsg)
+        errorMsg = "Levels in different brackets should not share routes."
+        self.assertFalse(graph.getSafeRoutePlanner(bracket + 1) is planner, 
+            errorMsg)
+
+        #New exit replaces routes
+        start.createExit("south", end, outgoingOnly = False)
+        errorMsg = "Routes should be planned again after a new exit."
+        planner = graph.getSafeRoutePlanner(1)
+        self.assertEqual(planner.getRoute(startId, endId), [endId], errorMsg)
+
+    def testTravelCommand(self):
+        from space import Space
+        from player import Player
+        from game_io import HeadlessIO
+        from commands.travel_command import TravelCommand
+        import battle_engine
+        import commands.travel_command
+
+        shire = Space("Shire", "Hobbits", "Eriador", battleProbability = 0)
+        bree = Space("Bree", "Men", "Eriador", battleProbability = 1)
+        weatherHills = Space("Weather Hills", "Hills", "Eriador", 
+            battleProbability = 1)
+        rivendell = Space("Rivendell", "Elves", "Eriador")
+        moria = Space("Moria", "Dwarves", "Misty Mountains")
+        shire.createExit("east", bree, outgoingOnly = False)
+        bree.createExit("east", weatherHills, outgoingOnly = False)
+        weatherHills.createExit("east", rivendell, outgoingOnly = False)
+
+        io = HeadlessIO(["rivendell", "Moria"])
+        player = Player("Frodo", shire, io)
+        travelCmd = TravelCommand("travel", "Test command", player)
+
+        #Battle at every step with battle probability
+        with patch.object(battle_engine, "battle", 
+            return_value = True) as battle:
+            travelCmd.execute()
+        errorMsg = "Player should have arrived at destination."
+        self.assertEqual(player.getLocation(), rivendell, errorMsg)
+        errorMsg = "A battle should be rolled at every step."
+        self.assertEqual(battle.call_count, 2, errorMsg)
+
+        #Unreachable destination
+        travelCmd.execute()
+        errorMsg = "Player should not move without a route."
+        self.assertEqual(player.getLocation(), rivendell, errorMsg)
+
+        #Lost battle ends travel
+        with patch.object(battle_engine, "battle", 
+            return_value = False) as battle:
+            travelCmd.travelTo("Shire")
+        errorMsg = "Travel should end at lost battle."
+        self.assertEqual(player.getLocation(), weatherHills, errorMsg)
+        self.assertEqual(battle.call_count, 1, errorMsg)
+
+    def testDuplicateNames(self):
+        """
+        Spaces that share a name are reached by their qualified names.
+        """
+        import game_loader
+        from player import Player
+        from game_io import HeadlessIO
+        from commands.travel_command import TravelCommand
+
+        world = game_loader.getWorld()
+        graph = world[0].getWorldGraph()
+        rivendellId, moriaId = graph.getIdsByName("Misty Mountains")
+        errorMsg = "Spaces that share a name should get qualified names."
+        self.assertEqual(graph.getQualifiedName(rivendellId), 
+            "Misty Mountains (Rivendell)", errorMsg)
+        self.assertEqual(graph.getIdsByName("misty mountains (moria)"), 
+            [moriaId], errorMsg)
+        self.assertEqual(graph.getQualifiedName(0), "Shire", errorMsg)
+        self.assertEqual(graph.getNameTrie().getCompletions("Misty"), 
+            ["Misty Mountains", "Misty Mountains (Moria)", 
+            "Misty Mountains (Rivendell)"], errorMsg)
+
+        io = HeadlessIO()
+        player = Player("Frodo", world[0], io)
+        travelCmd = TravelCommand("travel", "Test command", player)
+        with patch.object(travelCmd, "_battlePhase", return_value = True):
+            travelCmd.travelTo("Misty Mountains")
+            errorMsg = "Ambiguous destination should list its places."
+            self.assertEqual(player.getLocation(), world[0], errorMsg)
+            self.assertTrue("Misty Mountains (Rivendell), Misty Mountains "
+                "(Moria)." in io.getOutput(), errorMsg)
+
+            travelCmd.travelTo("Misty Mountains (Moria)")
+        errorMsg = "Qualified name should lead to its space."
+        self.assertEqual(player.getLocation(), graph.getSpace(moriaId), 
+            errorMsg)
+
+    def testPlaceNames(self):
+        """
+        Destinations may be named by their cities and places, after "to".
+        """
+        import game_loader
+        from player import Player
+        from game_io import HeadlessIO
+        from commands.travel_command import TravelCommand
+
+        world = game_loader.getWorld()
+        graph = world[0].getWorldGraph()
+        player = Player("Frodo", world[0], HeadlessIO())
+        travelCmd = TravelCommand("travel", "Test command", player)
+
+        def travel(argument):
+            travelCmd.setArgument(argument)
+            with patch.object(travelCmd, "_battlePhase", return_value = True):
+                travelCmd.execute()
+            return player.getLocation()
+
+        errorMsg = "Cities should stand for their spaces."
+        self.assertEqual(graph.getSpaceByName("minas tirith").getName(),
+            "Anorien", errorMsg)
+        self.assertEqual(graph.getNameTrie().resolve("Minas T"), 
+            "Minas Tirith", errorMsg)
+
+        errorMsg = "Travel should reach the space of a city."
+        self.assertEqual(travel("Rivendell").getPlaceNames(), ["Rivendell"],
+            errorMsg)
+
+        errorMsg = "Travel should accept a leading 'to'."
+        self.assertEqual(travel("to Bree").getPlaceNames(), ["Bree"], 
+            errorMsg)
+        self.assertEqual(travel("TO shire"), world[0], errorMsg)
+        self.assertEqual(travel("to Misty Mountains (Mor"), 
+            graph.getSpace(graph.getIdsByName("Moria")[0]), errorMsg)
+        self.assertEqual(graph.getIdsByName("Moria"), 
+            graph.getIdsByName("Misty Mountains (Moria)"), errorMsg)
+
 class MovementTest(unittest.TestCase):
     """
     Tests the movement methods of space and movement commands.  
@@ -1433,7 +3024,7 @@ class PickUpTest(unittest.TestCase):
             
         #Execute pickUpCmd and assert item in player inventory but not in space and not in equipment
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.pick_up_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             pickUpCmd.execute()
             
         self.assertFalse(space.containsItem(item), "Space should not have item but does.")
@@ -1457,18 +3048,18 @@ class PickUpTest(unittest.TestCase):
         pickUpCmd = PickUpCommand("pick up", "Picks up an object", player)
 
         #Test pre-test conditions
-        self.assertEqual(space._items._items, [], "Space should have no items but does.")
-        self.assertEqual(player._inventory._items, [], "player._inventory should have no items but does.")
-        self.assertEqual(player._equipped._items, [], "player._equipped should have no items but does.")
+        self.assertEqual(space._items.getItems(), [], "Space should have no items but does.")
+        self.assertEqual(player._inventory.getItems(), [], "player._inventory should have no items but does.")
+        self.assertEqual(player._equipped.getItems(), [], "player._equipped should have no items but does.")
             
         #Execute pickUpCmd and test that nothing has changed
         rawInputMock = MagicMock(return_value="Shiny Acorns")
-        with patch('commands.pick_up_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             pickUpCmd.execute()
             
-        self.assertEqual(space._items._items, [], "Space should have no items but does - post-test.")
-        self.assertEqual(player._inventory._items, [], "player._inventory should have no items but does - post-test.")
-        self.assertEqual(player._equipped._items, [], "player._equipped should have no items but does - post-test.")
+        self.assertEqual(space._items.getItems(), [], "Space should have no items but does - post-test.")
+        self.assertEqual(player._inventory.getItems(), [], "player._inventory should have no items but does - post-test.")
+        self.assertEqual(player._equipped.getItems(), [], "player._equipped should have no items but does - post-test.")
         
 class DropTest(unittest.TestCase):
     """
@@ -1510,10 +3101,10 @@ class DropTest(unittest.TestCase):
 
         #Assert item in space but not in player inventory and not in equipment
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.drop_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             dropCmd.execute()
         rawInputMock = MagicMock(return_value="Shield of Faith")
-        with patch('commands.drop_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             dropCmd.execute()
             
         self.assertTrue(space.containsItemString("Dagger"), "Space should have weapon but does not.")
@@ -1561,10 +3152,10 @@ class DropTest(unittest.TestCase):
 
         #Assert item in space but not in player inventory and not in equipment
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.drop_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             dropCmd.execute()
         rawInputMock = MagicMock(return_value="Shield of Faith")
-        with patch('commands.drop_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             dropCmd.execute()
             
         self.assertTrue(space.containsItemString("Dagger"), "Space should have weapon but does not.")
@@ -1591,18 +3182,18 @@ class DropTest(unittest.TestCase):
         dropCmd = DropCommand("drop", "Drops an object from inventory to space", player)
         
         #Test pre-test conditions
-        self.assertEqual(space._items._items, [], "Space should have no items but does.")
-        self.assertEqual(player._inventory._items, [], "player._inventory should have no items but does.")
-        self.assertEqual(player._equipped._items, [], "player._equipped should have no items but does.")
+        self.assertEqual(space._items.getItems(), [], "Space should have no items but does.")
+        self.assertEqual(player._inventory.getItems(), [], "player._inventory should have no items but does.")
+        self.assertEqual(player._equipped.getItems(), [], "player._equipped should have no items but does.")
 
         #Attempt to drop item that does not exist
         rawInputMock = MagicMock(return_value="Melted Cheese")
-        with patch('commands.drop_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             dropCmd.execute()
             
-        self.assertEqual(space._items._items, [], "Space should have no items but does - post-test.")
-        self.assertEqual(player._inventory._items, [], "player._inventory should have no items but does - post-test.")
-        self.assertEqual(player._equipped._items, [], "player._equipped should have no items but does - post-test.")
+        self.assertEqual(space._items.getItems(), [], "Space should have no items but does - post-test.")
+        self.assertEqual(player._inventory.getItems(), [], "player._inventory should have no items but does - post-test.")
+        self.assertEqual(player._equipped.getItems(), [], "player._equipped should have no items but does - post-test.")
 
 class EquipTest(unittest.TestCase):
     """
@@ -1631,11 +3222,11 @@ class EquipTest(unittest.TestCase):
 
         #Equipping equippable items
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
 
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
             
         equipped = player.getEquipped()
@@ -1669,11 +3260,11 @@ class EquipTest(unittest.TestCase):
         
         #Trying to equip items not in inventory
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
 
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
 
         errorMsg = "player._inventory is supposed to be empty but is not."
@@ -1703,7 +3294,7 @@ class EquipTest(unittest.TestCase):
 
         #Trying to equip item that cannot be equipped
         rawInputMock = MagicMock(return_value="Charm")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
 
         self.assertTrue(inventory.containsItem(item), "Inventory should have item.")
@@ -1738,8 +3329,8 @@ class EquipTest(unittest.TestCase):
 
         #Test - preconditions
         errorMsg = "Weapon and armor are supposed to be in inventory but are not."
-        self.assertTrue(weapon in inventory._items, errorMsg)
-        self.assertTrue(armor in inventory._items, errorMsg)
+        self.assertTrue(weapon in inventory.getItems(), errorMsg)
+        self.assertTrue(armor in inventory.getItems(), errorMsg)
         errorMsg = "Inventory is supposed to have two items."
         self.assertEqual(player._inventory.count(), 2, errorMsg)
         
@@ -1752,11 +3343,11 @@ class EquipTest(unittest.TestCase):
 
         #Equipping an item that is already equipped
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute() 
             
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute() 
 
         #Test still only two equipped items
@@ -1788,17 +3379,17 @@ class EquipTest(unittest.TestCase):
         player.addToInventory(weapon)
 
         #Test preconditions
-        errorMsg = "Weapon should be in player._inventory._items but is not."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        errorMsg = "Weapon shoud not be in player._equipped._items but is not."
-        self.assertTrue(weapon not in player._equipped._items, errorMsg)
+        errorMsg = "Weapon should be in player._inventory.getItems() but is not."
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        errorMsg = "Weapon shoud not be in player._equipped.getItems() but is not."
+        self.assertTrue(weapon not in player._equipped.getItems(), errorMsg)
 
         #Equip weapon and check that _totalAttack and _weaponAttack update
         rawInputMock = MagicMock(return_value="Sword of the Spirit")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute() 
 
-        errorMsg = "Weapon should be in player._inventory._items but is not."
+        errorMsg = "Weapon should be in player._inventory.getItems() but is not."
         self.assertTrue(player._inventory.containsItem(weapon), errorMsg)
         errorMsg = "Weapon should be equipped but is not."
         self.assertTrue(player._equipped.containsItem(weapon), errorMsg)
@@ -1807,9 +3398,9 @@ class EquipTest(unittest.TestCase):
         errorMsg = "player._attack changed with weapon equip when it should not have."
         self.assertEqual(player._attack, defaultAttack, errorMsg)
         errorMsg = "player._weaponAttack not updated to correct value."
-        self.assertEqual(player._weaponAttack, weapon._attack, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), weapon._attack, errorMsg)
         errorMsg = "player._totalAttack not updated to correct value."
-        self.assertEqual(player._totalAttack, defaultAttack + weapon._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), defaultAttack + weapon._attack, errorMsg)
 
     def testPlayerArmorStats(self):
         from player import Player
@@ -1825,14 +3416,14 @@ class EquipTest(unittest.TestCase):
         player.addToInventory(armor)
 
         #Test preconditions
-        errorMsg = "Armor should be in player._inventory._items but is not."
-        self.assertTrue(armor in player._inventory._items, errorMsg)
-        errorMsg = "Armor should not be in player._equipped._items but is not."
-        self.assertTrue(armor not in player._equipped._items, errorMsg)
+        errorMsg = "Armor should be in player._inventory.getItems() but is not."
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
+        errorMsg = "Armor should not be in player._equipped.getItems() but is not."
+        self.assertTrue(armor not in player._equipped.getItems(), errorMsg)
 
         #Equip armor and check that player._defense updates
         rawInputMock = MagicMock(return_value="Shield of Faith")
-        with patch('commands.equip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             equipCmd.execute()
 
         errorMsg = "Armor should be in inventory but is not."
@@ -1842,7 +3433,7 @@ class EquipTest(unittest.TestCase):
         
         #Test for change
         errorMsg = "player._armorDefense stat was not updated correctly."
-        self.assertEqual(player._armorDefense, armor._defense, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), armor._defense, errorMsg)
                          
 class UnequipTest(unittest.TestCase):
     """
@@ -1872,24 +3463,24 @@ class UnequipTest(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "Weapon and Armor should be in inventory but are not."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
 
         errroMsg = "Weapon and Armor should be in equipped but are not."
-        self.assertTrue(weapon in player._equipped._items, errorMsg)
-        self.assertTrue(armor in player._equipped._items, errorMsg)
+        self.assertTrue(weapon in player._equipped.getItems(), errorMsg)
+        self.assertTrue(armor in player._equipped.getItems(), errorMsg)
         
         #Attempting to unequip item not currently equipped
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
 
         errorMsg = "Weapon and Armor should be in inventory but are not."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
 
         errorMsg = "Player should not have weapon in equipped."
         self.assertFalse(player._equipped.containsItem(weapon), errorMsg)
@@ -1919,20 +3510,20 @@ class UnequipTest(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "Weapon and Armor should be in inventory but are not."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
         
         #Attempting to unequip item not currently equipped
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
 
         errorMsg = "Weapon and Armor should be in inventory but are not."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
 
         errorMsg = "Player should not have weapon in equipped but does."
         self.assertFalse(player._equipped.containsItem(weapon), errorMsg)
@@ -1960,10 +3551,10 @@ class UnequipTest(unittest.TestCase):
         
         #Attempting to unequip item not currently equipped
         rawInputMock = MagicMock(return_value="Dagger")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
         rawInputMock = MagicMock(return_value="Shield")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute()
 
         errorMsg = "Inventory should still be empty."
@@ -1973,8 +3564,8 @@ class UnequipTest(unittest.TestCase):
         
     def testPlayerWeaponStats(self):
         """
-        Tests that player-specific attributes such as player._totalAttack
-        and player._weaponAttack reset with unequip.
+        Tests that player-specific attributes such as total attack and weapon
+        attack reset with unequip.
         """
         from player import Player
         from space import Space
@@ -1992,17 +3583,17 @@ class UnequipTest(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "Weapon should be in inventory and equipped."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
 
         #Test player-specific attributes to change back to defaults
         rawInputMock = MagicMock(return_value="Sword of the Spirit")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute() 
 
         errorMsg = "player._weaponAttack should be zero but it is not."
-        self.assertEqual(player._weaponAttack, 0, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), 0, errorMsg)
         errorMsg = "player._totalAttack should be player._attack but it is not."
-        self.assertEqual(player._totalAttack, player._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack, errorMsg)
         
     def testPlayerArmorStats(self):
         """
@@ -2024,16 +3615,16 @@ class UnequipTest(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "Armor should be in player inventory and equipped."
-        self.assertTrue(armor in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._equipped._items , errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._equipped.getItems() , errorMsg)
 
         #Test for change back to player defaults        
         rawInputMock = MagicMock(return_value="Shield of Faith")
-        with patch('commands.unequip_command.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             unequipCmd.execute() 
 
         errorMsg = "player._armorDefense should be zero after unequip."
-        self.assertEqual(player._armorDefense, 0, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), 0, errorMsg)
 
 class UsePotionTest(unittest.TestCase):
     """
@@ -2063,13 +3654,13 @@ class UsePotionTest(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "Potion should be in player._inventory but is not."
-        self.assertTrue(potion in player._inventory._items, errorMsg)
+        self.assertTrue(potion in player._inventory.getItems(), errorMsg)
         errorMsg = "player._hp should be 1 but is not."
         self.assertEqual(player._hp, 1, errorMsg)
         
         #Test for proper change in player._inventory and player._hp
         rawInputMock = MagicMock(return_value="Enormous Potion")
-        with patch('commands.use_potion_command.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             usePotionCmd.execute()
             
         errorMsg = "Inventory still contains potion when it should not."
@@ -2100,9 +3691,9 @@ class UsePotionTest(unittest.TestCase):
         errorMsg = "player._hp should be 10 but is not."
         self.assertEqual(player._hp, 10, errorMsg)
 
-        #Tests that player._inventory._items and player._hp do not change
+        #Tests that player._inventory.getItems() and player._hp do not change
         rawInputMock = MagicMock(return_value="Enormous Potion")
-        with patch('commands.use_potion_command.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             usePotionCmd.execute()
             
         errorMsg = "Inventory should still not have any potions."
@@ -2196,24 +3787,24 @@ class PlayerTest(unittest.TestCase):
         self.assertEqual(player._equipped.getItems(), emptyList, errorMsg)
 
         errorMsg = "player._weaponAttack was not initialized correctly."
-        self.assertEqual(player._weaponAttack, constants.PlayerInitialization.WEAPON_ATTACK, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), constants.PlayerInitialization.WEAPON_ATTACK, errorMsg)
         errorMsg = "player._armorDefense was not initialized correctly."
-        self.assertEqual(player._armorDefense, constants.PlayerInitialization.ARMOR_DEFENSE, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), constants.PlayerInitialization.ARMOR_DEFENSE, errorMsg)
         
         errorMsg = "self._charmAttack did not initialize correctly."
-        self.assertEqual(player._charmAttack, constants.PlayerInitialization.CHARM_ATTACK, errorMsg)
+        self.assertEqual(player.getCharmAttack(), constants.PlayerInitialization.CHARM_ATTACK, errorMsg)
         errorMsg = "self._charmDefense did not initialize correctly."
-        self.assertEqual(player._charmDefense, constants.PlayerInitialization.CHARM_DEFENSE, errorMsg)
+        self.assertEqual(player.getCharmDefense(), constants.PlayerInitialization.CHARM_DEFENSE, errorMsg)
         errorMsg = "self._charmHp did not initialize correctly."
-        self.assertEqual(player._charmHp, constants.PlayerInitialization.CHARM_HP, errorMsg)
+        self.assertEqual(player.getCharmHp(), constants.PlayerInitialization.CHARM_HP, errorMsg)
         
         errorMsg = "player._totalAttack did not initiate correctly."
-        self.assertEqual(player._totalAttack, player._attack + player._weaponAttack + 
-            player._charmAttack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack + player._equipped.getWeaponAttack() + 
+            player.getCharmAttack(), errorMsg)
         errorMsg = "player._totalDefense did not initialize correctly."
-        self.assertEqual(player._totalDefense, player._armorDefense + player._charmDefense, errorMsg)
+        self.assertEqual(player.getTotalDefense(), player._equipped.getArmorDefense() + player.getCharmDefense(), errorMsg)
         errorMsg = "player._totalMaxHp did not initialize correctly."
-        self.assertEqual(player._totalMaxHp, player._maxHp + player._charmHp, errorMsg)
+        self.assertEqual(player.getTotalMaxHp(), player._maxHp + player.getCharmHp(), errorMsg)
         
     def testAttack(self):
         from player import Player
@@ -2242,7 +3833,7 @@ class PlayerTest(unittest.TestCase):
         space = Space("Shire", "Home of the Hobbits.", "Mordor")
         player = Player("Frodo", space)
         
-        OVERKILL = player._totalMaxHp + 10000
+        OVERKILL = player.getTotalMaxHp() + 10000
 
         player.takeAttack(OVERKILL)
         errorMsg = "player._hp should be 0 but is not."
@@ -2259,7 +3850,7 @@ class PlayerTest(unittest.TestCase):
         space = Space("Shire", "Home of the Hobbits.", "Mordor")
         player = Player("Frodo", space)
         
-        UNDERKILL = player._totalMaxHp - 1
+        UNDERKILL = player.getTotalMaxHp() - 1
 
         player.takeAttack(UNDERKILL)
         errorMsg = "player._hp should be 1 but is not."
@@ -2326,9 +3917,9 @@ class PlayerTest(unittest.TestCase):
 
         #Determine default player stats
         defaultLevel = player._level
-        defaultMaxHp = player._totalMaxHp
+        defaultMaxHp = player.getTotalMaxHp()
         defaultAttack = player._attack
-        defaultTotalAttack = player._totalAttack
+        defaultTotalAttack = player.getTotalAttack()
 
         #Increase player experience and run player._updateLevel
         originalExperience = player._experience
@@ -2339,11 +3930,11 @@ class PlayerTest(unittest.TestCase):
         errorMsg = "Player level did not increase."
         self.assertTrue(player._level > defaultLevel, errorMsg)
         errorMsg = "Player Hp did not increase."
-        self.assertTrue(player._totalMaxHp > defaultMaxHp, errorMsg)
+        self.assertTrue(player.getTotalMaxHp() > defaultMaxHp, errorMsg)
         errorMsg = "Player attack did not increase."
         self.assertTrue(player._attack > defaultAttack, errorMsg)
         errorMsg = "Player totalAttack did not increase."
-        self.assertTrue(player._totalAttack > defaultTotalAttack, errorMsg)
+        self.assertTrue(player.getTotalAttack() > defaultTotalAttack, errorMsg)
 
         #Test for proper player stat change
         errorMsg = "Player level is incorrect."
@@ -2352,6 +3943,40 @@ class PlayerTest(unittest.TestCase):
         self.assertEqual(player._maxHp, 571, errorMsg)
         errorMsg = "Player attack is incorrect %s."
         self.assertEqual(player._attack, 105, errorMsg)
+
+    def testLevelThresholds(self):
+        from math import floor
+
+        from player import Player
+        from space import Space
+        from game_io import HeadlessIO
+        import constants
+
+        player = Player("Frodo", Space("Shire", "Home of the Hobbits.", 1), 
+            HeadlessIO())
+
+        player.increaseExperience(constants.LEVEL_EXP_REQUIREMENT[2] - 1)
+        errorMsg = "Player leveled up without enough experience."
+        self.assertEqual(player.getLevel(), 1, errorMsg)
+
+        player.increaseExperience(1)
+        errorMsg = "Player did not level up at exact experience requirement."
+        self.assertEqual(player.getLevel(), 2, errorMsg)
+
+        #Jump several levels at once
+        player.increaseExperience(constants.LEVEL_EXP_REQUIREMENT[7] - 
+            player.getExperience())
+        errorMsg = "Player level is incorrect after gaining several levels."
+        self.assertEqual(player.getLevel(), 7, errorMsg)
+
+        maxHp = constants.PlayerInitialization.MAX_HP
+        weightLimit = constants.PlayerInitialization.WEIGHT_LIMIT
+        for level in range(6):
+            maxHp = floor(maxHp * constants.HP_STAT)
+            weightLimit = floor(weightLimit * constants.WEIGHT_LIMIT_STAT)
+        errorMsg = "Stats should match gaining one level at a time."
+        self.assertEqual(player.getMaxHp(), maxHp, errorMsg)
+        self.assertEqual(player.getWeightLimit(), weightLimit, errorMsg)
         
     def testHeal(self):
         """
@@ -2369,7 +3994,7 @@ class PlayerTest(unittest.TestCase):
         
         player.heal(healAmount)
 
-        self.assertEqual(player._hp, player._totalMaxHp, "Healing test #1 failed.")
+        self.assertEqual(player._hp, player.getTotalMaxHp(), "Healing test #1 failed.")
 
     def testHeal2(self):
         """
@@ -2410,27 +4035,27 @@ class PlayerTest(unittest.TestCase):
 
         #Pretest player-specific items-based attributes
         errorMsg = "_weaponAttack should be 0 but it is not."
-        self.assertEqual(player._weaponAttack, 0, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), 0, errorMsg)
         errorMsg = "_armorDefense should be 0 but it is not."
-        self.assertEqual(player._armorDefense, 0, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), 0, errorMsg)
         errorMsg = "_totalAttack should be simply attack but it is not."
-        self.assertEqual(player._totalAttack, player._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack, errorMsg)
 
         #Attempt to equip items
         player.equip(newItem)
-        self.assertFalse(newItem in player._equipped._items, "Equipped %s and should not have." % newItem)
+        self.assertFalse(newItem in player._equipped.getItems(), "Equipped %s and should not have." % newItem)
         player.equip(newWeapon)
-        self.assertTrue(newWeapon in player._equipped._items, "Failed to equip %s." % newWeapon)
+        self.assertTrue(newWeapon in player._equipped.getItems(), "Failed to equip %s." % newWeapon)
         player.equip(newArmor)
-        self.assertTrue(newArmor in player._equipped._items, "Failed to equip %s." % newArmor)
+        self.assertTrue(newArmor in player._equipped.getItems(), "Failed to equip %s." % newArmor)
 
         #Test for change in player's items-specific attributes
         errorMsg = "player._weaponAttack should be newWeapon._attack but is not."
-        self.assertEqual(player._weaponAttack, newWeapon._attack, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), newWeapon._attack, errorMsg)
         errorMsg = "_armorDefense should be newArmor._defense but is not."
-        self.assertEqual(player._armorDefense, newArmor._defense, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), newArmor._defense, errorMsg)
         errorMsg = "_totalAttack should have been updated but was not."
-        self.assertEqual(player._totalAttack, player._attack + newWeapon._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack + newWeapon._attack, errorMsg)
 
     def testUnequip(self):
         from player import Player
@@ -2455,17 +4080,17 @@ class PlayerTest(unittest.TestCase):
         
         #Attempt to unequip items
         player.unequip(newWeapon)
-        self.assertFalse(newWeapon in player._equipped._items, "Failed to unequip %s" % newWeapon)
+        self.assertFalse(newWeapon in player._equipped.getItems(), "Failed to unequip %s" % newWeapon)
         player.unequip(newArmor)
-        self.assertFalse(newArmor in player._equipped._items, "Failed to unequip %s" % newArmor)
+        self.assertFalse(newArmor in player._equipped.getItems(), "Failed to unequip %s" % newArmor)
 
         #Check to see that item-specific attributes reset to defaults
         errorMsg = "player._weaponAttack should be 0 but it is not."
-        self.assertEqual(player._weaponAttack, 0, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), 0, errorMsg)
         errorMsg = "player._armorDefense should be 0 but it is not."
-        self.assertEqual(player._armorDefense, 0, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), 0, errorMsg)
         errorMsg = "totalAttack should be simply attack but it is not."
-        self.assertEqual(player._totalAttack, player._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack, errorMsg)
         
     def testAddToInventory(self):
         from player import Player
@@ -2487,9 +4112,9 @@ class PlayerTest(unittest.TestCase):
         
         #Test add items to inventory
         errorMsg = "Failed to add item to inventory."
-        self.assertTrue(newItem in player._inventory._items, errorMsg)
-        self.assertTrue(newWeapon in player._inventory._items, errorMsg)
-        self.assertTrue(newArmor in player._inventory._items, errorMsg)
+        self.assertTrue(newItem in player._inventory.getItems(), errorMsg)
+        self.assertTrue(newWeapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(newArmor in player._inventory.getItems(), errorMsg)
 
     def testRemoveFromInventory(self):
         from player import Player
@@ -2515,9 +4140,9 @@ class PlayerTest(unittest.TestCase):
 
         #Pretest: items in player._inventory        
         errorMsg = "Failed to initialize test character correctly."
-        self.assertTrue(item in player._inventory._items, errorMsg)
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        self.assertTrue(item in player._inventory.getItems(), errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
 
         #Testing player.removeFromInventory()
         player.removeFromInventory(item)
@@ -2531,16 +4156,16 @@ class PlayerTest(unittest.TestCase):
 
         #Test that items get unequipped
         errorMsg = "Failed to remove item from equipped."
-        self.assertFalse(weapon in player._equipped._items, errorMsg)
-        self.assertFalse(armor in player._equipped._items, errorMsg)
+        self.assertFalse(weapon in player._equipped.getItems(), errorMsg)
+        self.assertFalse(armor in player._equipped.getItems(), errorMsg)
 
         #Test that item-specific character attributes are reset to original values
         errorMsg = "player._weaponAttack should be 0 but it is not."
-        self.assertEqual(player._weaponAttack, 0, errorMsg)
+        self.assertEqual(player._equipped.getWeaponAttack(), 0, errorMsg)
         errorMsg = "player._armorDefense should be 0 but it is not."
-        self.assertEqual(player._armorDefense, 0, errorMsg)
+        self.assertEqual(player._equipped.getArmorDefense(), 0, errorMsg)
         errorMsg = "player._totalAttack should be player._attack but it is not."
-        self.assertEqual(player._totalAttack, player._attack, errorMsg)
+        self.assertEqual(player.getTotalAttack(), player._attack, errorMsg)
 
     def testCanMoveDirection(self):
         """
@@ -2609,12 +4234,12 @@ class InnTest(unittest.TestCase):
 
         #Player chooses to stay at the inn
         rawInputMock = MagicMock(side_effect = ["enter", "yes", "enter"])
-        with patch('cities.inn.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             testInn.enter(player)
         
         #Test that player._money and player._hp are updated to correct values
         self.assertEqual(player._money, 5, "Player's money not decreased by correct amount.")
-        self.assertEqual(player._hp, player._totalMaxHp, "Player's health not increased to full health.")
+        self.assertEqual(player._hp, player.getTotalMaxHp(), "Player's health not increased to full health.")
         
     def testNegativeCase2(self):
         """
@@ -2635,7 +4260,7 @@ class InnTest(unittest.TestCase):
 
         #Player chooses to stay at the inn
         rawInputMock = MagicMock(side_effect = ["enter", "yes", "enter"])
-        with patch('cities.inn.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             testInn.enter(player)
         
         #Test that player._money and player._hp do not change
@@ -2661,7 +4286,7 @@ class InnTest(unittest.TestCase):
 
         #Player chooses not to stay at the inn
         rawInputMock = MagicMock(side_effect = ["enter", "no", "enter"])
-        with patch('cities.inn.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             testInn.enter(player)
         
         #Test that player._money and player._hp do not change
@@ -2685,7 +4310,7 @@ class InnTest(unittest.TestCase):
         #For invalid user input
         rawInputMock = MagicMock(side_effect = ["enter", "gobbledigook", 
             "enter", "no", "enter"])
-        with patch('cities.inn.raw_input', create=True, new=rawInputMock):
+        with patch('game_io.raw_input', create=True, new=rawInputMock):
             testInn.enter(player)
         
 class ShopSellItems(unittest.TestCase):
@@ -2715,7 +4340,7 @@ class ShopSellItems(unittest.TestCase):
         space = Space("Shire", "Home of the Hobbits.", "Mordor", city = testCity)
         player = Player("Frodo", space)
 
-        testShop._items._items = []
+        testShop._items.clearItems()
         
         #Create starting inventory and equipment
         weapon = Weapon("Knife", "Jack of all trades", 3, 1, 1)
@@ -2742,13 +4367,13 @@ class ShopSellItems(unittest.TestCase):
                         
         #Player chooses to sell items
         rawInputMock = MagicMock(side_effect = ["sell", "Knife", "yes", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
         rawInputMock = MagicMock(side_effect = ["sell", "Leather Tunic", "yes", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
         rawInputMock = MagicMock(side_effect = ["sell", "Potion", "yes", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
         
         #Test items no longer in player._inventory and player._equipped
@@ -2766,13 +4391,13 @@ class ShopSellItems(unittest.TestCase):
 
         #Test that items now appear in shop wares
         errorMsg = "Items are now supposed to be in shop inventory but are not."
-        self.assertTrue(weapon in testShop._items._items, errorMsg)
-        self.assertTrue(armor in testShop._items._items, errorMsg)
-        self.assertTrue(potion in testShop._items._items, errorMsg)
+        self.assertTrue(weapon in testShop._items.getItems(), errorMsg)
+        self.assertTrue(armor in testShop._items.getItems(), errorMsg)
+        self.assertTrue(potion in testShop._items.getItems(), errorMsg)
 
         #New shop wares' prices are set to full cost
         errorMsg = "Item costs not set back to full amount."
-        for item in testShop._items._items:
+        for item in testShop._items.getItems():
             self.assertEqual(item._cost, 1, errorMsg)
 
         #Player's money should increase by the half the cost of the items - 1.5 in our case
@@ -2800,16 +4425,16 @@ class ShopSellItems(unittest.TestCase):
 
         #Test preconditions
         errorMsg = "goldNugget is supposed to be in player._inventory."
-        self.assertTrue(goldNugget in player._inventory._items, errorMsg)
+        self.assertTrue(goldNugget in player._inventory.getItems(), errorMsg)
 
         #Player attempts to sell an invalid item
         rawInputMock = MagicMock(side_effect = ["sell", "gobbledigook", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
 
         #Player gives invalid input when prompted to confirm item sell
         rawInputMock = MagicMock(side_effect = ["sell", "Gold Nugget", "enter", "gobbledigook", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
             
 class ShopPurchaseItems(unittest.TestCase):
@@ -2854,18 +4479,18 @@ class ShopPurchaseItems(unittest.TestCase):
         errorMsg = "Our test shop was generated with the wrong number of items."
         self.assertEqual(testShop._items.count(), 3, errorMsg)
         errorMsg = "Items in shop inventory are of the wrong type."
-        for item in testShop._items._items:
+        for item in testShop._items.getItems():
             self.assertTrue(isinstance(item, Weapon) or isinstance(item, Armor) or isinstance(item, Potion), errorMsg)
 
         #Player purchases items
         rawInputMock = MagicMock(side_effect = ["purchase", "Knife", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
         rawInputMock = MagicMock(side_effect = ["purchase", "Shield of Faith", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
         rawInputMock = MagicMock(side_effect = ["purchase", "Medium Potion of Healing", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
        
         #Test items in inventory
@@ -2886,11 +4511,11 @@ class ShopPurchaseItems(unittest.TestCase):
         
         #Test items not in shop wares
         errorMsg = "Knife that was purchased is still in shop wares."
-        self.assertFalse(testPotion in testShop._items._items, errorMsg)
+        self.assertFalse(testPotion in testShop._items.getItems(), errorMsg)
         errorMsg = "Shield of Faith that was purchased is still in shop wares."
-        self.assertFalse(testPotion in testShop._items._items, errorMsg)
+        self.assertFalse(testPotion in testShop._items.getItems(), errorMsg)
         errorMsg = "Medium Potion that was purchased is still in shop wares."
-        self.assertFalse(testPotion in testShop._items._items, errorMsg)
+        self.assertFalse(testPotion in testShop._items.getItems(), errorMsg)
         
         #player._money should decrease by the cost of the purchases, which is 5
         errorMsg = "player._money not decreased by correct amount."
@@ -2928,11 +4553,11 @@ class ShopPurchaseItems(unittest.TestCase):
         errorMsg = "Our test shop was generated with the wrong number of items."
         self.assertEqual(testShop._items.count(), 1, errorMsg)
         errorMsg = "SuperDuperLegendary Potion not in testShop._items."
-        self.assertTrue(testPotion in testShop._items._items, errorMsg)
+        self.assertTrue(testPotion in testShop._items.getItems(), errorMsg)
         
         #Player attempts to purchase potion
         rawInputMock = MagicMock(side_effect = ["purchase", "SuperDuperLegendary Potion of Healing", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
 
         #Test potion not in inventory, not in equipped, in shop wares
@@ -2941,7 +4566,7 @@ class ShopPurchaseItems(unittest.TestCase):
         errorMsg = "SuperDuperLegendary Potion of Healing that was purchased is in equipped."
         self.assertFalse(player._equipped.containsItemWithName("SuperDuperLegendary Potion of Healing"), errorMsg)
         errorMsg = "SuperDuperLegendary Potion of Healing that was purchased is no longer in shop wares."
-        self.assertTrue(testPotion in testShop._items._items, errorMsg)
+        self.assertTrue(testPotion in testShop._items.getItems(), errorMsg)
         
         #player._money should be unchanged
         errorMsg = "player._money changed when it was not supposed to."
@@ -2974,22 +4599,22 @@ class ShopPurchaseItems(unittest.TestCase):
         errorMsg = "Player does not start with 20 rubles."
         self.assertEqual(player._money, 20, errorMsg)
         errorMsg = "Player inventory should be empty."
-        self.assertEqual(len(player._inventory._items), 0, errorMsg)
+        self.assertEqual(len(player._inventory.getItems()), 0, errorMsg)
         errorMsg = "Player equipment should be empty."
-        self.assertEqual(len(player._inventory._items), 0, errorMsg)
+        self.assertEqual(len(player._inventory.getItems()), 0, errorMsg)
         errorMsg = "Our test shop was generated with the wrong number of items."
         self.assertEqual(testShop._items.count(), 0, errorMsg)
 
         #Player attempts to purchase a non-existent item
         rawInputMock = MagicMock(side_effect = ["purchase", "gobbledigook", "enter", "quit", "enter"])
-        with patch('cities.shop.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testShop.enter(player)
 
         #Inventory, equipment, and shop wares should be unchanged
         errorMsg = "Player inventory changed when it should not have."
-        self.assertEqual(len(player._inventory._items), 0, errorMsg)
+        self.assertEqual(len(player._inventory.getItems()), 0, errorMsg)
         errorMsg = "Player equipment changed when it should not have."
-        self.assertEqual(len(player._equipped._items), 0, errorMsg)
+        self.assertEqual(len(player._equipped.getItems()), 0, errorMsg)
         errorMsg = "Shop wares changed when it should not have."
         self.assertEqual(testShop._items.count(), 0, errorMsg)
          
@@ -3035,7 +4660,7 @@ class Square(unittest.TestCase):
         
         #Test: talking to Master Wang (several items to give)
         rawInputMock = MagicMock(side_effect = ["Master Wang", "enter", "quit", "enter"])
-        with patch('cities.square.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testSquare.enter(player)
 
         #Check that Master Wang's items are now in inventory
@@ -3056,7 +4681,7 @@ class Square(unittest.TestCase):
         
         #Test: talking to Miles (one item to give)
         rawInputMock = MagicMock(side_effect = ["Miles", "enter", "quit", "enter"])
-        with patch('cities.square.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testSquare.enter(player)
 
         #Check that item associated with Miles is now in inventory
@@ -3069,7 +4694,7 @@ class Square(unittest.TestCase):
 
         #Test: talking to Putin (no items to give)
         rawInputMock = MagicMock(side_effect = ["Putin", "enter", "quit", "enter"])
-        with patch('cities.square.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testSquare.enter(player)
             
     def testNegativeCase(self):
@@ -3090,8 +4715,38 @@ class Square(unittest.TestCase):
         player = Player("Frodo", space)
         
         rawInputMock = MagicMock(side_effect = ["gobbledigook", "enter", "quit", "enter"])
-        with patch('cities.square.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             testSquare.enter(player)
+
+    def testSharedGifts(self):
+        """
+        Squares built from the same gift dictionary give items independently.
+        """
+        from player import Player
+        from space import Space
+        from cities.square import Square
+        from items.item import Item
+        from game_io import HeadlessIO
+
+        cookies = Item("Miles' Famous Cookies", "Gross this time", 1, 1)
+        milk = Item("Milk", "For the cookies", 1, 1)
+        
+        talk = {"Miles": "Hello, I am Miles, the cookie legend"}
+        items = {"Miles": (cookies, milk)}
+        testSquare = Square("Chris' Testing Square", "Testing Square", "Come test here", talk, items)
+        testSquare2 = Square("Chris' Testing Square", "Testing Square", "Come test here", talk, items)
+
+        io = HeadlessIO(["Miles", "enter", "quit", "enter"])
+        space = Space("Shire", "Home of the Hobbits.", "Mordor")
+        player = Player("Frodo", space, io)
+        testSquare.enter(player)
+
+        errorMsg = "Items were not given to player."
+        self.assertTrue(cookies in player._inventory, errorMsg)
+        errorMsg = "Shared gift dictionary was modified."
+        self.assertEqual(items, {"Miles": (cookies, milk)}, errorMsg)
+        errorMsg = "Second square lost its gifts."
+        self.assertEqual(testSquare2._items["Miles"], [cookies, milk], errorMsg)
             
 class City(unittest.TestCase):
     """
@@ -3104,6 +4759,7 @@ class City(unittest.TestCase):
     -Player "gobbledigooks", leave City.
     """
     def testCity(self):
+        from game_io import HeadlessIO
         from player import Player
         from space import Space
         from cities.city import City
@@ -3118,22 +4774,20 @@ class City(unittest.TestCase):
         testCity = City("TestCity", "Chris' unique testing city", "Come test here", buildings = [testInn, testShop, testSquare])
         
         space = Space("Shire", "Home of the Hobbits.", "Mordor", city = testCity)
-        player = Player("Frodo", space)
 
         #Test that City can handle a series of commands
-        cityInputMock = MagicMock(side_effect = ["Seth N' Breakfast Test Inn", "leave", "Pookie Tea Shop",
-            "leave", "Chocolate Mountain", "gobbledigook", "leave"])
-        innInputMock = MagicMock(side_effect = ["no"])
-        shopInputMock = MagicMock(side_effect = ["quit"])
-        squareInputMock = MagicMock(side_effect = ["quit"])
-        
-        with patch('cities.city.raw_input', create = True, new = cityInputMock):
-            with patch('cities.inn.raw_input', create = True, new = innInputMock):
-                testCity.enter(player)
-            with patch('cities.shop.raw_input', create = True, new = shopInputMock):
-                testCity.enter(player)
-            with patch('cities.square.raw_input', create = True, new = squareInputMock):
-                testCity.enter(player)
+        io = HeadlessIO()
+        player = Player("Frodo", space, io)
+
+        io.pushAll(["", "Seth N' Breakfast Test Inn", "", "no", "", "leave"])
+        testCity.enter(player)
+        io.pushAll(["", "Pookie Tea Shop", "quit", "", "leave"])
+        testCity.enter(player)
+        io.pushAll(["", "Chocolate Mountain", "gobbledigook", "leave"])
+        testCity.enter(player)
+
+        errorMsg = "City did not consume the expected series of commands."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
         
 class UniquePlace(unittest.TestCase):
     """
@@ -3173,6 +4827,7 @@ class EnterCommand(unittest.TestCase):
         -Enter UniquePlace
         """
         from commands.enter_command import EnterCommand
+        from game_io import HeadlessIO
         from player import Player
         from space import Space
         from cities.city import City
@@ -3182,17 +4837,18 @@ class EnterCommand(unittest.TestCase):
         testUniquePlace = UniquePlace("Master Wang's Magical Testing Place", "Come test here", "Hi I'm made of cheese.")
         
         space = Space("Shire", "Home of the Hobbits.", "Mordor", city = testCity, uniquePlace = testUniquePlace)
-        player = Player("The Funlaps", space)
+        io = HeadlessIO()
+        player = Player("The Funlaps", space, io)
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
-        
+
         #Testing enter command's ability to execute a series of commands
-        spaceInputMock = MagicMock(side_effect = 
-            ["Jim's Mobile Fun City", "Master Wang's Magical Testing Place"])
-        cityInputMock = MagicMock(side_effect = ["enter", "leave", "enter", "leave"])
-        
-        with patch('commands.enter_command.raw_input', create = True, new = spaceInputMock):
-            with patch('cities.city.raw_input', create = True, new = cityInputMock):
-                enterCmd.execute()
+        io.pushAll(["Jim's Mobile Fun City", "", "leave"])
+        enterCmd.execute()
+        io.push("Master Wang's Magical Testing Place")
+        enterCmd.execute()
+
+        errorMsg = "EnterCommand did not consume the expected series of commands."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
 
     def testPositiveCase2(self):
         """
@@ -3205,6 +4861,7 @@ class EnterCommand(unittest.TestCase):
         -Enter UniquePlace
         """
         from commands.enter_command import EnterCommand
+        from game_io import HeadlessIO
         from player import Player
         from space import Space
         from cities.city import City
@@ -3217,18 +4874,22 @@ class EnterCommand(unittest.TestCase):
         
         space = Space("Shire", "Home of the Hobbits", "Mordor",
             city = [testCity1, testCity2, testCity3], uniquePlace = testUniquePlace)
-        player = Player("The Funlaps", space)
+        io = HeadlessIO()
+        player = Player("The Funlaps", space, io)
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
 
         #Testing enter command's ability to execute a series of commands
-        spaceInputMock = MagicMock(side_effect = 
-            ["Jim's Mobile Fun City", "Seth's Sans-Shabbiness Shack Sh-City", 
-            "Miles' Magical Cookie Jail City", "Master Wang's Magical Testing Place"])
-        cityInputMock = MagicMock(side_effect = ["enter", "leave", "enter", "leave",
-            "enter", "leave", "enter", "leave"])
-        with patch('commands.enter_command.raw_input', create = True, new = spaceInputMock):
-            with patch('cities.city.raw_input', create = True, new = cityInputMock):
-                enterCmd.execute()
+        io.pushAll(["Jim's Mobile Fun City", "", "leave"])
+        enterCmd.execute()
+        io.pushAll(["Seth's Sans-Shabbiness Shack Sh-City", "", "leave"])
+        enterCmd.execute()
+        io.pushAll(["Miles' Magical Cookie Jail City", "", "leave"])
+        enterCmd.execute()
+        io.push("Master Wang's Magical Testing Place")
+        enterCmd.execute()
+
+        errorMsg = "EnterCommand did not consume the expected series of commands."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
 
     def testPositiveCase3(self):
         """
@@ -3241,6 +4902,7 @@ class EnterCommand(unittest.TestCase):
         -Enter UniquePlace
         """
         from commands.enter_command import EnterCommand
+        from game_io import HeadlessIO
         from player import Player
         from space import Space
         from cities.city import City
@@ -3253,18 +4915,22 @@ class EnterCommand(unittest.TestCase):
         
         space = Space("Shire", "Home of the Hobbits", "Mordor",
             city = testCity, uniquePlace = [testUniquePlace1, testUniquePlace2, testUniquePlace3])
-        player = Player("The Funlaps", space)
+        io = HeadlessIO()
+        player = Player("The Funlaps", space, io)
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
 
         #Testing enter command's ability to execute a series of commands
-        spaceInputMock = MagicMock(side_effect = 
-            ["Jim's Mobile Fun City", "Master Wang's Magical Testing Place", 
-            "Jim's Magic Castle of Time-Shifting", "Russian Armadillo Mound"])
-        cityInputMock = MagicMock(side_effect = ["enter", "leave", "enter",
-            "leave", "enter", "leave", "enter", "leave"])
-        with patch('commands.enter_command.raw_input', create = True, new = spaceInputMock):
-            with patch('cities.city.raw_input', create = True, new = cityInputMock):
-                enterCmd.execute()
+        io.pushAll(["Jim's Mobile Fun City", "", "leave"])
+        enterCmd.execute()
+        io.push("Master Wang's Magical Testing Place")
+        enterCmd.execute()
+        io.push("Jim's Magic Castle of Time-Shifting")
+        enterCmd.execute()
+        io.push("Russian Armadillo Mound")
+        enterCmd.execute()
+
+        errorMsg = "EnterCommand did not consume the expected series of commands."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
 
     def testPositiveCase4(self):
         """
@@ -3279,6 +4945,7 @@ class EnterCommand(unittest.TestCase):
         -Enter UniquePlace
         """
         from commands.enter_command import EnterCommand
+        from game_io import HeadlessIO
         from player import Player
         from space import Space
         from cities.city import City
@@ -3293,18 +4960,26 @@ class EnterCommand(unittest.TestCase):
         
         space = Space("Shire", "Home of the Hobbits.", "Mordor",
             city = [testCity1, testCity2, testCity3], uniquePlace = [testUniquePlace1, testUniquePlace2, testUniquePlace3])
-        player = Player("The Funlaps", space)
+        io = HeadlessIO()
+        player = Player("The Funlaps", space, io)
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
 
         #Testing enter command's ability to execute a series of commands
-        spaceInputMock = MagicMock(side_effect = 
-            ["Jim's Mobile Fun City", "Seth's Sans-Shabbiness Shack Sh-City", 
-            "Miles' Magical Cookie Jail City", "Master Wang's Magical Testing Place",
-            "Jim's Magic Castle of Time-Shifting", "Russian Armadillo Mound"])
-        cityInputMock = MagicMock(side_effect = ["enter", "leave", "enter", "leave", "enter", "leave", "enter", "leave"])
-        with patch('commands.enter_command.raw_input', create = True, new = spaceInputMock):
-            with patch('cities.city.raw_input', create = True, new = cityInputMock):
-                enterCmd.execute()
+        io.pushAll(["Jim's Mobile Fun City", "", "leave"])
+        enterCmd.execute()
+        io.pushAll(["Seth's Sans-Shabbiness Shack Sh-City", "", "leave"])
+        enterCmd.execute()
+        io.pushAll(["Miles' Magical Cookie Jail City", "", "leave"])
+        enterCmd.execute()
+        io.push("Master Wang's Magical Testing Place")
+        enterCmd.execute()
+        io.push("Jim's Magic Castle of Time-Shifting")
+        enterCmd.execute()
+        io.push("Russian Armadillo Mound")
+        enterCmd.execute()
+
+        errorMsg = "EnterCommand did not consume the expected series of commands."
+        self.assertEqual(io.pendingCount(), 0, errorMsg)
                 
     def testNegativeCase(self):
         """
@@ -3319,7 +4994,7 @@ class EnterCommand(unittest.TestCase):
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
 
         rawInputMock = MagicMock(side_effect = ["enter"])
-        with patch('commands.enter_command.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             enterCmd.execute()
             
     def testNegativeCase2(self):
@@ -3338,7 +5013,7 @@ class EnterCommand(unittest.TestCase):
         enterCmd = EnterCommand("Enter Command", "Tests Entering", player)
 
         rawInputMock = MagicMock(side_effect = ["enter", "gobbledigook", "cancel"])
-        with patch('commands.enter_command.raw_input', create = True, new = rawInputMock):
+        with patch('game_io.raw_input', create = True, new = rawInputMock):
             enterCmd.execute()
 
 class DescribeCommand(unittest.TestCase):
@@ -3428,7 +5103,7 @@ class CheckEquipmentCommand(unittest.TestCase):
         armor = Armor("Shield of Faith", "For fiery darts", 3, 3, 3)
         checkEquipmentCmd = CheckEquipmentCommand("Check Equipment Command", "Test command", player)
 
-        player._equipped._items = [weapon, armor]
+        player._equipped.addItems([weapon, armor])
 
         checkEquipmentCmd.execute()
 
@@ -3471,9 +5146,9 @@ class CheckInventoryCommand(unittest.TestCase):
         player.addToInventory(weapon)
         player.addToInventory(armor)
 
-        errorMsg = "weapon and armor should be in player._inventory._items"
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
+        errorMsg = "weapon and armor should be in player._inventory.getItems()"
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
         
         checkInventoryCmd.execute()
         
@@ -3504,11 +5179,11 @@ class CheckInventoryCommand(unittest.TestCase):
         player.addToInventory(item2)
 
         errorMsg = "Testing inventory was initialized incorrectly."
-        self.assertTrue(weapon in player._inventory._items, errorMsg)
-        self.assertTrue(armor in player._inventory._items, errorMsg)
-        self.assertTrue(potion in player._inventory._items, errorMsg)
-        self.assertTrue(item in player._inventory._items, errorMsg)
-        self.assertTrue(item2 in player._inventory._items, errorMsg)
+        self.assertTrue(weapon in player._inventory.getItems(), errorMsg)
+        self.assertTrue(armor in player._inventory.getItems(), errorMsg)
+        self.assertTrue(potion in player._inventory.getItems(), errorMsg)
+        self.assertTrue(item in player._inventory.getItems(), errorMsg)
+        self.assertTrue(item2 in player._inventory.getItems(), errorMsg)
         
         checkInventoryCmd.execute()
 
@@ -3657,19 +5332,19 @@ class monster(unittest.TestCase):
 
         #Test monster initialized correctly
         errorMsg = "monster._name should be 'Jack'"
-        self.assertEqual(monster._name, "Jack", errorMsg)
+        self.assertEqual(monster.getName(), "Jack", errorMsg)
         errorMsg = "monster._description should be '@$$'"
-        self.assertEqual(monster._description, "@$$", errorMsg)
+        self.assertEqual(monster.getDescription(), "@$$", errorMsg)
         errorMsg = "monster._hp should be 10"
         self.assertEqual(monster._hp, 10, errorMsg)
         errorMsg = "monster._attack should be 5"
-        self.assertEqual(monster._attack, 5, errorMsg)
+        self.assertEqual(monster.getAttack(), 5, errorMsg)
         errorMsg = "monster._experience should be 7"
-        self.assertEqual(monster._experience, 7, errorMsg)
+        self.assertEqual(monster.getExperience(), 7, errorMsg)
         errorMsg = "monster._attackString sound be 'Moof'"
-        self.assertEqual(monster._attackString, "Moof", errorMsg)
+        self.assertEqual(monster.getAttackString(), "Moof", errorMsg)
         errorMsg = "monster._deathString should be 'Meep'"
-        self.assertEqual(monster._deathString, "Meep", errorMsg)
+        self.assertEqual(monster.getDeathString(), "Meep", errorMsg)
 
     def testAttack(self):
         from monsters.monster import Monster
@@ -3699,6 +5374,24 @@ class monster(unittest.TestCase):
         errorMsg = "monster.takeAttack() testcase #2 failed"
         self.assertEqual(monster._hp, 0, errorMsg)
 
+    def testCopy(self):
+        from monsters.monster import Monster
+
+        monster = Monster("Jack", "@$$", [10, 5, 7], "Moof", "Meep")
+        monster.takeAttack(3)
+        copy = monster.copy()
+
+        errorMsg = "Monster copy should share kind and HP."
+        self.assertTrue(copy.getKind() is monster.getKind(), errorMsg)
+        self.assertEqual(copy.getHp(), 7, errorMsg)
+
+        copy.takeAttack(5)
+        errorMsg = "Damage to copy affected original monster."
+        self.assertEqual(monster.getHp(), 7, errorMsg)
+
+        errorMsg = "Monsters should not carry an attribute dictionary."
+        self.assertFalse(hasattr(monster, "__dict__"), errorMsg)
+
 class monsterFactory(unittest.TestCase):
     """
     Tests monster_factory's getMonsters().
@@ -3733,10 +5426,9 @@ class monsterFactory(unittest.TestCase):
         monster distribution.
         """
         from factories.monster_factory import getMonsters
-        from monsters.troll import Troll
         import constants
        
-        constants.REGIONAL_MONSTER_DISTRIBUTION = {1: {Troll: [0, 1]}}
+        constants.REGIONAL_MONSTER_DISTRIBUTION = {1: {"Troll": [0, 1]}}
 
         monsters = getMonsters(3, 1, 0)
 
@@ -3747,11 +5439,11 @@ class monsterFactory(unittest.TestCase):
         #Test that monsters are spawned with correct stats
         for monster in monsters:
             errorMsg = "monster._hp was not initiated correctly."
-            self.assertEqual(monster._hp, constants.MONSTER_STATS[Troll][0], errorMsg)
+            self.assertEqual(monster._hp, constants.MONSTER_STATS["Troll"][0], errorMsg)
             errorMsg = "monster._attack was not initiated correctly."
-            self.assertEqual(monster._attack, constants.MONSTER_STATS[Troll][1], errorMsg)
+            self.assertEqual(monster.getAttack(), constants.MONSTER_STATS["Troll"][1], errorMsg)
             errorMsg = "monster._experience was not initiated correctly."
-            self.assertEqual(monster._experience, constants.MONSTER_STATS[Troll][2], errorMsg)
+            self.assertEqual(monster.getExperience(), constants.MONSTER_STATS["Troll"][2], errorMsg)
             
     def testDifficultyBonusStats(self):
         #-Testing difficulty feature - that monster stats increase as
@@ -3762,10 +5454,9 @@ class monsterFactory(unittest.TestCase):
         of the time. getMonsters is to spawn Trolls with 200% base stats. 
         """
         from factories.monster_factory import getMonsters
-        from monsters.troll import Troll
         import constants
         
-        constants.REGIONAL_MONSTER_DISTRIBUTION = {1: {Troll: [0, 1]}}
+        constants.REGIONAL_MONSTER_DISTRIBUTION = {1: {"Troll": [0, 1]}}
 
         monsters = getMonsters(3, 1, 1)
 
@@ -3776,11 +5467,11 @@ class monsterFactory(unittest.TestCase):
         #Test that monsters have been spawned with double stats
         for monster in monsters:
             errorMsg = "monster._hp was not initiated correctly."
-            self.assertEqual(monster._hp, 2 * constants.MONSTER_STATS[Troll][0], errorMsg)
+            self.assertEqual(monster._hp, 2 * constants.MONSTER_STATS["Troll"][0], errorMsg)
             errorMsg = "monster._attack was not initiated correctly."
-            self.assertEqual(monster._attack, 2 * constants.MONSTER_STATS[Troll][1], errorMsg)
+            self.assertEqual(monster.getAttack(), 2 * constants.MONSTER_STATS["Troll"][1], errorMsg)
             errorMsg = "monster._experience was not initiated correctly."
-            self.assertEqual(monster._experience, 2 * constants.MONSTER_STATS[Troll][2], errorMsg)
+            self.assertEqual(monster.getExperience(), 2 * constants.MONSTER_STATS["Troll"][2], errorMsg)
     
     def testRegionalSpawn(self):
         #-Testing that regional spawns work: that monster spawn reflects
@@ -3790,14 +5481,10 @@ class monsterFactory(unittest.TestCase):
         spawn, given a large enough sample size.
         """
         from factories.monster_factory import getMonsters
-        from monsters.troll import Troll
-        from monsters.nazgul import Nazgul
-        from monsters.goblin import Goblin
-        from monsters.great_goblin import GreatGoblin
         import constants
         
         #Testcase #1: RegionType.ERIADOR
-        constants.REGIONAL_MONSTER_DISTRIBUTION = {constants.RegionType.ERIADOR: {Troll: [0, .5], Nazgul: [.5, 1]}}
+        constants.REGIONAL_MONSTER_DISTRIBUTION = {constants.RegionType.ERIADOR: {"Troll": [0, .5], "Nazgul": [.5, 1]}}
            
         monstersEriador = getMonsters(5000, constants.RegionType.ERIADOR, 0)
 
@@ -3805,9 +5492,9 @@ class monsterFactory(unittest.TestCase):
         numberNazgul = 0
         numberTroll = 0
         for monster in monstersEriador:
-            if isinstance(monster, Nazgul):
+            if monster.getKind().getKindName() == "Nazgul":
                 numberNazgul += 1
-            elif isinstance(monster, Troll):
+            elif monster.getKind().getKindName() == "Troll":
                 numberTroll += 1
             else:
                 raise AssertionError("Invalid monster type.")
@@ -3820,7 +5507,7 @@ class monsterFactory(unittest.TestCase):
         self.assertTrue(numberTroll != 0, errorMsg)
         
         #Testcase #2: RegionType.HIGH_PASS
-        constants.REGIONAL_MONSTER_DISTRIBUTION = {constants.RegionType.HIGH_PASS: {Goblin: [0, .5], GreatGoblin: [.5, 1]}}
+        constants.REGIONAL_MONSTER_DISTRIBUTION = {constants.RegionType.HIGH_PASS: {"Goblin": [0, .5], "GreatGoblin": [.5, 1]}}
         
         monstersHighPass = getMonsters(5000, constants.RegionType.HIGH_PASS, 0)
 
@@ -3828,9 +5515,9 @@ class monsterFactory(unittest.TestCase):
         numberGoblin = 0
         numberGreatGoblin = 0
         for monster in monstersHighPass:
-            if isinstance(monster, Goblin):
+            if monster.getKind().getKindName() == "Goblin":
                 numberGoblin += 1
-            elif isinstance(monster, GreatGoblin):
+            elif monster.getKind().getKindName() == "GreatGoblin":
                 numberGreatGoblin += 1
             else:
                 raise AssertionError("Invalid monster type.")
@@ -3841,6 +5528,61 @@ class monsterFactory(unittest.TestCase):
         self.assertTrue(numberGoblin != 0, errorMsg)
         errorMsg = "No great goblins spawned."
         self.assertTrue(numberGreatGoblin != 0, errorMsg)
+
+    def testMonsterKinds(self):
+        """
+        Tests that monsters of the same kind share their kind but not their 
+        HP.
+        """
+        from factories.monster_factory import getMonster
+        import constants
+
+        troll = getMonster("Troll")
+        troll2 = getMonster("Troll")
+
+        errorMsg = "Monsters of the same kind should share their kind."
+        self.assertTrue(troll.getKind() is troll2.getKind(), errorMsg)
+        errorMsg = "Monster strings were not taken from constants."
+        self.assertEqual(troll.getName(), constants.MonsterNames.Troll, errorMsg)
+        self.assertEqual(troll.getDeathString(), 
+            constants.MonsterDeathStrings.Troll, errorMsg)
+
+        troll.takeAttack(10)
+        errorMsg = "Damage to one monster affected another."
+        self.assertEqual(troll2.getHp(), constants.MONSTER_STATS["Troll"][0], errorMsg)
+
+        #Bonus difficulty gives a separate kind
+        errorMsg = "Bonus difficulty should increase monster stats."
+        strongTroll = getMonster("Troll", 1)
+        self.assertEqual(strongTroll.getAttack(), 2 * troll.getAttack(), errorMsg)
+
+        errorMsg = "getMonster() should reject unknown kinds."
+        self.assertRaises(AssertionError, getMonster, "Hobbit")
+
+    def testSpawnTable(self):
+        """
+        Tests that spawn ranges are looked up by bisection, including their
+        limits.
+        """
+        from factories.monster_factory import getSpawnTable, getMonsterKinds
+        import constants
+
+        constants.REGIONAL_MONSTER_DISTRIBUTION = {1: {"Nazgul": [.5, 1], 
+            "Troll": [0, .25], "Goblin": [.25, .5]}}
+
+        errorMsg = "Spawn table should be sorted by spawn range."
+        self.assertEqual(getSpawnTable(1), ([.25, .5, 1], 
+            ["Troll", "Goblin", "Nazgul"]), errorMsg)
+
+        randomMock = MagicMock(side_effect = [0, .24, .25, .7, .999])
+        with patch("factories.monster_factory.random.random", new=randomMock):
+            kinds = getMonsterKinds(5, 1, 0)
+        
+        errorMsg = "getMonsterKinds() spawned the wrong kinds."
+        self.assertEqual([kind.getKindName() for kind in kinds], 
+            ["Troll", "Troll", "Goblin", "Nazgul", "Nazgul"], errorMsg)
+        errorMsg = "getSpawnTable() should reject unknown regions."
+        self.assertRaises(AssertionError, getSpawnTable, 2)
         
 def handle_pdb(signal, frame):
     """
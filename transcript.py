@@ -0,0 +1,428 @@
+#!/usr/bin/python
+
+"""
+Records game sessions as transcripts and replays them, to reproduce bug
+reports and to check how balance changes play out on real sessions.
+
+A transcript holds the seed of a session's random numbers and every line the
+user typed, paired with the prompt it answered: the command prompt for
+commands and the prompt of the command, shop or battle for every answer after
+that. Pauses are not recorded, since their responses are ignored.
+
+Games with the same seed and the same input play out the same, so a replay
+feeds the transcript back through Game._nextTurn() without a terminal and
+with pauses skipped. If the game asks a prompt other than the one recorded
+next, the replay has diverged from the recorded session and stops there.
+
+Sessions are only replayable if they were played from the start by a single
+Game, without loading a snapshot, and with the same battle policy.
+
+Usage: python transcript.py transcript...
+"""
+
+from collections import deque
+import json
+import sys
+import time
+import traceback
+
+from game import Game
+from game_io import GameIO
+
+#Version of the transcript format
+VERSION = 2
+
+#Lines of game output kept to show where a replay stopped
+OUTPUT_CONTEXT = 20
+
+class Transcript(object):
+    """
+    The seed and input of a game session.
+    """
+    def __init__(self, seed, entries = None):
+        """
+        Initializes transcript.
+
+        @param seed:         Seed of the session's random numbers.
+        @keyword entries:    (Optional) List of (prompt, response) pairs, in
+                             the order they were given.
+        """
+        self._seed = seed
+        self._entries = entries if entries is not None else []
+
+    def getSeed(self):
+        """
+        Returns the seed of the session's random numbers.
+
+        @return:    The seed.
+        """
+        return self._seed
+
+    def getEntries(self):
+        """
+        Returns the input of the session.
+
+        @return:    List of (prompt, response) pairs. Must not be changed by
+                    the caller.
+        """
+        return self._entries
+
+    def addEntry(self, prompt, response):
+        """
+        Records a line of input.
+
+        @param prompt:      The prompt displayed to the user.
+        @param response:    The user's response.
+        """
+        self._entries.append((prompt, response))
+
+    def dumps(self):
+        """
+        Returns the transcript as a JSON string, one entry per line.
+
+        Input is kept byte for byte, whatever its encoding: each byte is
+        stored as the character with the same code (latin-1).
+
+        @return:    The transcript, as a string.
+        """
+        lines = ['{"version": %s, "seed": %s, "entries": [' % (VERSION,
+            json.dumps(self._seed))]
+        lines.append(",\n".join(json.dumps((_decode(prompt), 
+            _decode(response))) for prompt, response in self._entries))
+        lines.append("]}\n")
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def loads(data):
+        """
+        Reads a transcript saved with dumps().
+
+        @param data:    The transcript, as a string.
+
+        @return:        The Transcript.
+        """
+        try:
+            fields = json.loads(data)
+            version = fields["version"]
+        except (ValueError, TypeError, KeyError):
+            errorMsg = "Transcript is corrupt."
+            raise AssertionError(errorMsg)
+
+        if version != VERSION:
+            errorMsg = "Unsupported transcript version: %s" % version
+            raise AssertionError(errorMsg)
+
+        #json gives unicode strings, where raw_input() gives byte strings
+        try:
+            entries = [(prompt.encode("latin-1"), response.encode("latin-1"))
+                for prompt, response in fields["entries"]]
+            seed = fields["seed"]
+        except (ValueError, TypeError, KeyError, AttributeError):
+            errorMsg = "Transcript is corrupt."
+            raise AssertionError(errorMsg)
+
+        return Transcript(seed, entries)
+
+    def save(self, path):
+        """
+        Writes the transcript to a file.
+
+        @param path:    Path of the file.
+        """
+        #A transcript that cannot be converted leaves no file behind
+        data = self.dumps()
+        with open(path, "wb") as transcriptFile:
+            transcriptFile.write(data)
+
+    @staticmethod
+    def load(path):
+        """
+        Reads a transcript from a file written with save().
+
+        @param path:    Path of the file.
+
+        @return:        The Transcript.
+        """
+        with open(path, "rb") as transcriptFile:
+            return Transcript.loads(transcriptFile.read())
+
+def _decode(value):
+    """
+    Helper function that turns a byte string into the unicode string with
+    the same character codes. Unicode strings are returned as they are.
+    """
+    if isinstance(value, str):
+        return value.decode("latin-1")
+
+    return value
+
+class RecordingIO(GameIO):
+    """
+    Input/output channel that plays through another channel and records the
+    user's input in a transcript.
+    """
+    def __init__(self, io):
+        """
+        Initializes recording channel.
+
+        @param io:      The GameIO object the game is played through.
+        """
+        self._io = io
+        self._entries = []
+
+    def input(self, prompt = ""):
+        """
+        Solicits a line of input through the other channel and records it.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The user's response.
+        """
+        response = self._io.input(prompt)
+        self._entries.append((prompt, response))
+
+        return response
+
+    def output(self, text = ""):
+        """
+        Displays a line of text through the other channel.
+
+        @param text:       The text to display.
+        """
+        self._io.output(text)
+
+    def pause(self, prompt = "Press enter to continue. "):
+        """
+        Waits for the user through the other channel. Pauses are not
+        recorded.
+
+        @keyword prompt:   (Optional) The prompt displayed to the user.
+        """
+        self._io.pause(prompt)
+
+    def setSkipPauses(self, skipPauses):
+        """
+        Sets whether the other channel skips pauses.
+
+        @param skipPauses: True to skip pauses, False to wait for the user.
+        """
+        self._io.setSkipPauses(skipPauses)
+
+    def getSkipPauses(self):
+        """
+        Returns whether the other channel skips pauses.
+
+        @return:           True if pauses are skipped, False otherwise.
+        """
+        return self._io.getSkipPauses()
+
+    def setCompleter(self, complete):
+        """
+        Registers the command completer with the other channel.
+
+        @param complete:   Function that takes a partly typed command and
+                           returns a list of completed commands.
+        """
+        self._io.setCompleter(complete)
+
+    def getTranscript(self, seed):
+        """
+        Returns the transcript of the session so far.
+
+        @param seed:       Seed of the session's random numbers, as returned
+                           by Game.getSeed().
+
+        @return:           The Transcript. Input given later is added to it.
+        """
+        return Transcript(seed, self._entries)
+
+class ReplayIO(GameIO):
+    """
+    Input/output channel that answers prompts from a transcript. Pauses are
+    skipped and output is discarded, except for the last few lines.
+    """
+    def __init__(self, transcript):
+        """
+        Initializes replay channel.
+
+        @param transcript:  The Transcript to answer prompts from.
+        """
+        self._entries = transcript.getEntries()
+        self._index = 0
+        self._output = deque(maxlen = OUTPUT_CONTEXT)
+        self._skipPauses = True
+
+    def input(self, prompt = ""):
+        """
+        Returns the recorded response to a prompt.
+
+        Raises _ReplayFinished once every response has been given and
+        _ReplayDiverged if the prompt is not the one recorded next.
+
+        @param prompt:     The prompt displayed to the user.
+
+        @return:           The recorded response.
+        """
+        if self._index == len(self._entries):
+            raise _ReplayFinished()
+
+        expected, response = self._entries[self._index]
+        if prompt != expected:
+            raise _ReplayDiverged(expected, prompt)
+
+        self._index += 1
+        self._output.append(prompt + response)
+
+        return response
+
+    def output(self, text = ""):
+        """
+        Keeps a line of text if it is among the last few.
+
+        @param text:       The text to display.
+        """
+        self._output.append(text)
+
+    def getIndex(self):
+        """
+        Returns the number of recorded responses given so far.
+
+        @return:           Number of responses.
+        """
+        return self._index
+
+    def getRecentOutput(self):
+        """
+        Returns the last lines of output, prompts and responses.
+
+        @return:           List of lines.
+        """
+        return list(self._output)
+
+class _ReplayFinished(Exception):
+    """
+    Raised by ReplayIO when the game asks for input after the last recorded
+    response.
+    """
+
+class _ReplayDiverged(Exception):
+    """
+    Raised by ReplayIO when the game asks a prompt that was not recorded
+    next.
+    """
+    def __init__(self, expected, actual):
+        Exception.__init__(self, expected, actual)
+        self.expected = expected
+        self.actual = actual
+
+def replay(transcript, battlePolicy = None):
+    """
+    Replays a session as fast as possible.
+
+    Errors raised by the game are passed on, so that they may be debugged.
+
+    @param transcript:      The Transcript of the session.
+    @keyword battlePolicy:  (Optional) The BattlePolicy the session was
+                            played with, if any.
+
+    @return:                Dictionary describing the replay:
+                                -"turns": number of commands executed.
+                                -"responses": number of recorded responses
+                                 given.
+                                -"ended": True if the game exited, by the
+                                 player quitting or winning.
+                                -"divergence": None if the replay followed
+                                 the transcript, otherwise a dictionary with
+                                 the "index" of the entry where it diverged,
+                                 the "expected" prompt and the "actual"
+                                 prompt (None if the game ended instead).
+                                -"output": last lines of game output.
+    """
+    io = ReplayIO(transcript)
+    game = Game(io, transcript.getSeed())
+    if battlePolicy:
+        game._player.setBattlePolicy(battlePolicy)
+
+    report = {"turns": 0, "ended": False, "divergence": None}
+    try:
+        while True:
+            game._nextTurn()
+            report["turns"] += 1
+    except _ReplayFinished:
+        pass
+    except _ReplayDiverged as error:
+        report["divergence"] = {"index": io.getIndex(),
+            "expected": error.expected, "actual": error.actual}
+    except SystemExit:
+        report["turns"] += 1
+        report["ended"] = True
+        #Input left over means the recorded session went on
+        if io.getIndex() < len(transcript.getEntries()):
+            report["divergence"] = {"index": io.getIndex(),
+                "expected": transcript.getEntries()[io.getIndex()][0],
+                "actual": None}
+
+    report["responses"] = io.getIndex()
+    report["output"] = io.getRecentOutput()
+
+    return report
+
+def checkReplay(transcript, battlePolicy = None):
+    """
+    Replays a session, reporting errors raised by the game rather than
+    passing them on. Used to replay sessions in bulk.
+
+    @param transcript:      The Transcript of the session.
+    @keyword battlePolicy:  (Optional) The BattlePolicy the session was
+                            played with, if any.
+
+    @return:                Replay report, as returned by replay(), with the
+                            traceback of the error under "error", or None if
+                            there was no error.
+    """
+    try:
+        report = replay(transcript, battlePolicy)
+        report["error"] = None
+    except Exception:
+        report = {"turns": None, "responses": None, "ended": False,
+            "divergence": None, "output": [], "error": traceback.format_exc()}
+
+    return report
+
+def main(paths):
+    """
+    Replays transcript files and prints those that could not be read,
+    diverged or raised an error.
+
+    @param paths:    List of paths of transcript files.
+    """
+    start = time.time()
+    failures = 0
+
+    for path in paths:
+        try:
+            report = checkReplay(Transcript.load(path))
+        except (IOError, AssertionError) as error:
+            print "%s: %s" % (path, error)
+            failures += 1
+            continue
+
+        if report["error"]:
+            print "%s: error\n%s" % (path, report["error"])
+        elif report["divergence"]:
+            divergence = report["divergence"]
+            print "%s: diverged at entry %s, expected %r, got %r" % (path,
+                divergence["index"], divergence["expected"],
+                divergence["actual"])
+            for line in report["output"]:
+                print "    %s" % line
+        else:
+            continue
+        failures += 1
+
+    print "Replayed %s sessions in %.1f seconds, %s failed." % (len(paths),
+        time.time() - start, failures)
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -26,4 +26,64 @@ class UniquePlace(Place):
 
         @param player:  The current player.
         """
-        print self._greetings
\ No newline at end of file
+        io = player.getIo()
+
+        io.output(self._greetings)
+
+class LazyUniquePlace(object):
+    """
+    Placeholder for a unique place that has not been created yet.
+
+    Unique places build their monster waves when created and their modules 
+    import many monster classes. A space holding a LazyUniquePlace creates the
+    real unique place the first time it is asked for it.
+    """
+    def __init__(self, placeClass, name, description, greetings):
+        """
+        Initialize LazyUniquePlace object.
+        
+        @param placeClass:      The UniquePlace child class (or a LazyClass 
+                                for it).
+        @param name:            The name of the UniquePlace.
+        @param description:     A description of the UniquePlace.
+        @param greetings:       The greetings the user gets as he enters.
+        """
+        self._placeClass = placeClass
+        self._name = name
+        self._description = description
+        self._greetings = greetings
+        self._space = None
+        self._targetSpace = None
+
+    def getName(self):
+        """
+        Returns name of place.
+
+        @return:    The name of the place.
+        """
+        return self._name
+
+    def receiveSpaces(self, space, targetSpace):
+        """
+        Records the two spaces used in quest-dependent port creation. They are 
+        handed to the unique place when it is created.
+        
+        @param space:         Player's current space.
+        @param targetSpace:   The space to be linked with the 
+                              current space.
+        """
+        self._space = space
+        self._targetSpace = targetSpace
+
+    def create(self):
+        """
+        Creates the unique place.
+
+        @return:    The new UniquePlace.
+        """
+        place = self._placeClass(self._name, self._description, 
+            self._greetings)
+        if self._space:
+            place.receiveSpaces(self._space, self._targetSpace)
+
+        return place
@@ -27,6 +27,8 @@ class Argonath(UniquePlace):
 
         @param player:  The player object.
         """
+        io = player.getIo()
+
         #Generate reward
         name = player.getName()
         playerExperience = player.getExperience()
@@ -35,19 +37,19 @@ class Argonath(UniquePlace):
         maxHp = player.getMaxHp()
             
         #Story
-        print self._greetings
-        print ""
-        print ("As you gaze upon the kings of old, you think about the present"
+        io.output(self._greetings)
+        io.output()
+        io.output("As you gaze upon the kings of old, you think about the present"
             " age and its \ncurrent darkness.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
             
         #Player receives reward
-        print ("You draw up deep reserves of strength within yourself to" 
+        io.output("You draw up deep reserves of strength within yourself to" 
             " finish the quest. \nMordor awaits.")
-        print "\n%s gains %s experience.\n" % (name, experienceIncrease)
+        io.output("\n%s gains %s experience.\n" % (name, experienceIncrease))
         player.increaseExperience(experienceIncrease)
         player.heal(maxHp)
         
-        raw_input("Press enter to leave. ")
-        print ""
\ No newline at end of file
+        io.pause("Press enter to leave. ")
+        io.output()
\ No newline at end of file
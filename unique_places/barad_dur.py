@@ -1,14 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul_iii import Nazgul_III
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.troll_ii import Troll_II
-from monsters.black_numernorian_ii import BlackNumernorian_II
-from monsters.dragon_of_mordor import DragonOfMordor
-from monsters.witch_king import WitchKing
-from monsters.mouth_of_sauron import MouthOfSauron
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
@@ -42,49 +35,49 @@ class BaradDur(UniquePlace):
         
         #Create monster wave #1 
         for monster in range(12):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave.append(monster)
         for monster in range(7):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave.append(monster)
         for monster in range(5):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave.append(monster)
         for monster in range(3):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave.append(monster)
         
         #Create monster wave #2
         for monster in range(15):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave2.append(monster)
         for monster in range(6):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave2.append(monster)
         for monster in range(10):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave2.append(monster)
         for monster in range(4):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave2.append(monster)
             
         #Create monster wave #3
         for monster in range(5):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave3.append(monster)
-        monster = MouthOfSauron(constants.MONSTER_STATS[MouthOfSauron])
+        monster = getMonster("MouthOfSauron")
         self._wave3.append(monster)
          
         #Create monster wave #4 
         for monster in range(8):
-            monster = Nazgul_III(constants.MONSTER_STATS[Nazgul_III])
+            monster = getMonster("Nazgul_III")
             self._wave4.append(monster)
-        monster = WitchKing(constants.MONSTER_STATS[WitchKing])
+        monster = getMonster("WitchKing")
         self._wave4.append(monster)
             
         #Create monster wave #5
         for monster in range(14):
-            monster = DragonOfMordor(constants.MONSTER_STATS[DragonOfMordor])
+            monster = getMonster("DragonOfMordor")
             self._wave5.append(monster)
             
         #Create loot
@@ -103,13 +96,15 @@ class BaradDur(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
-        print ("A host of figures rise up to meet you as you approach Barad"
+        io.output(self._greetings)
+        io.output()
+        io.output("A host of figures rise up to meet you as you approach Barad"
             " Dur.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Calls the battle sequence
         self._battle(player)
@@ -120,44 +115,46 @@ class BaradDur(UniquePlace):
         
         @param player:   The player object.
         """
-        print "Orc Commander I: \"We're having a blast upstairs! Slumber party!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io = player.getIo()
+
+        io.output("Orc Commander I: \"We're having a blast upstairs! Slumber party!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave)
         if not result:
             return
             
-        print ("Orc Commander II: \"Didn't you read the sign? No %ss" 
+        io.output("Orc Commander II: \"Didn't you read the sign? No %ss" 
             " allowed.\"" % player.getName())
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
             return
             
-        print "Mouth of Sauron: \"You want ANOTHER slumber party?!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"You want ANOTHER slumber party?!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
             return
             
-        print "Nazgul: \"AAAAEEEEEEEEEEE!!!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Nazgul: \"AAAAEEEEEEEEEEE!!!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave4)
         if not result:
             return
             
-        print ("Lance of the Elite Four: \"I've been waiting for you, %s! I" 
+        io.output("Lance of the Elite Four: \"I've been waiting for you, %s! I" 
             " knew \nthat you, with your skills, would eventually reach me here.\"" 
             % player.getName())
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave5)
         if not result:
@@ -172,21 +169,23 @@ class BaradDur(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Story
-        print "You have defeated Lance, the Pokemon League champion!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("You have defeated Lance, the Pokemon League champion!")
+        io.pause()
+        io.output()
         
-        print "Congratulations on your accomplishments!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Congratulations on your accomplishments!")
+        io.pause()
+        io.output()
         
         #Give player loot
         if len(self._loot) != 0:
-            print ("While looting the battlefield, you find several" 
+            io.output("While looting the battlefield, you find several" 
                 " interesting items. The tower itself remains locked, however.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             
             toRemove = []
             for item in self._loot:
@@ -194,9 +193,9 @@ class BaradDur(UniquePlace):
                     toRemove.append(item)
             for item in toRemove:
                 self._loot.remove(item)
-            print ""
+            io.output()
         
         #Story
-        print "You set off for other ventures within the Dark Land."
-        raw_input("Press enter to leave. ")
-        print ""
\ No newline at end of file
+        io.output("You set off for other ventures within the Dark Land.")
+        io.pause("Press enter to leave. ")
+        io.output()
\ No newline at end of file
@@ -1,12 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul_iii import Nazgul_III
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.troll_ii import Troll_II
-from monsters.black_numernorian_ii import BlackNumernorian_II
-from monsters.mouth_of_sauron import MouthOfSauron
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
@@ -42,54 +37,54 @@ class BlackGate(UniquePlace):
         
         #Create monster wave #1 
         for monster in range(11):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave.append(monster)
         for monster in range(6):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave.append(monster)
         for monster in range(6):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave.append(monster)
         for monster in range(2):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave.append(monster)
         
         #Create monster wave #2
         for monster in range(12):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave2.append(monster)
         for monster in range(6):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave2.append(monster)
         for monster in range(8):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave2.append(monster)
         for monster in range(4):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave2.append(monster)
         for monster in range(9):
-            monster = Nazgul_III(constants.MONSTER_STATS[Nazgul_III])
+            monster = getMonster("Nazgul_III")
             self._wave2.append(monster)
             
         #Create monster wave #3
         for monster in range(6):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave3.append(monster)
-        monster = MouthOfSauron(constants.MONSTER_STATS[MouthOfSauron])
+        monster = getMonster("MouthOfSauron")
         self._wave3.append(monster)
          
         #Create monster wave #4 
         for monster in range(8):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave4.append(monster)
         for monster in range(5):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave4.append(monster)
         for monster in range(3):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave4.append(monster)
         for monster in range(4):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave4.append(monster)
         
         #Create loot
@@ -108,16 +103,18 @@ class BlackGate(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
-        print ("\"Several armies rise up to meet you as you approach the Black" 
+        io.output(self._greetings)
+        io.output()
+        io.output("\"Several armies rise up to meet you as you approach the Black" 
             " Gate.\"")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Solicit user choice
-        choice = self._choice()
+        choice = self._choice(player)
         
         #If player chooses to frontal assault
         if choice == "frontal assault":
@@ -127,16 +124,20 @@ class BlackGate(UniquePlace):
         if choice == "run":
             self._run(player)
             
-    def _choice(self):
+    def _choice(self, player):
         """
         Determines if user wants to attack or run.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         choice = None
         acceptable = ["frontal assault", "run"]
         while choice not in acceptable:
-            choice = raw_input("What do you want to do? Choices: 'frontal" 
+            choice = io.input("What do you want to do? Choices: 'frontal" 
                 " assault' or 'run.' ")
-        print ""
+        io.output()
         
         return choice
         
@@ -146,28 +147,30 @@ class BlackGate(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Battle wave 1
-        print "Mouth of Sauron: \"I'm so glad you came! Slumber party!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"I'm so glad you came! Slumber party!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave)
         if not result:
             return
             
         #Battle wave 2
-        print "Mouth of Sauron: \"Hmm. You appear to not like our house.\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"Hmm. You appear to not like our house.\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
             return
             
         #Battle wave 3
-        print "Mouth of Sauron: \"Time to DIE!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"Time to DIE!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
@@ -182,17 +185,19 @@ class BlackGate(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Story
-        print ("You have taken the Black Gate and secured part of the" 
+        io.output("You have taken the Black Gate and secured part of the" 
             " north-western route into \nMordor!")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Give player loot
         if len(self._loot) != 0:
-            print "While looting the battlefield, you find many items."
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("While looting the battlefield, you find many items.")
+            io.pause()
+            io.output()
             
             toRemove = []
             for item in self._loot:
@@ -200,15 +205,15 @@ class BlackGate(UniquePlace):
                     toRemove.append(item)
             for item in toRemove:
                 self._loot.remove(item)
-            print ""
+            io.output()
         
         #Story
-        print "You continue your quest for better night-time entertainment."
-        print ""
-        self._createPort("east")
+        io.output("You continue your quest for better night-time entertainment.")
+        io.output()
+        self._createPort("east", player)
         
-        raw_input("Press enter to leave. ")
-        print ""
+        io.pause("Press enter to leave. ")
+        io.output()
         
     def _run(self, player):
         """
@@ -217,16 +222,18 @@ class BlackGate(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Battle wave 4
-        print "The leading army catches up with you." 
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("The leading army catches up with you.") 
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave4)
         if not result:
             return
             
         #Story
-        print "You escape the rest of your pursuers!"
-        raw_input("Press enter to leave. ")
-        print ""
\ No newline at end of file
+        io.output("You escape the rest of your pursuers!")
+        io.pause("Press enter to leave. ")
+        io.output()
\ No newline at end of file
@@ -36,47 +36,53 @@ class Derningle(UniquePlace):
 
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
-        print ("You find yourself deep within Fangorn Forest and it appears" 
+        io.output(self._greetings)
+        io.output()
+        io.output("You find yourself deep within Fangorn Forest and it appears" 
             " as though the \ntrees are alive.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
 
         #Solicit user input for decision tree
-        print "You find yourself at a fork in the woods."
-        raw_input("Press enter to continue. ")
-        print ""
-        choice = self._fork()
+        io.output("You find yourself at a fork in the woods.")
+        io.pause()
+        io.output()
+        choice = self._fork(player)
         
         #Implement user choice
         if choice == "left":
             self._leftDestination(player)
         else:
             #Solicit user input for secondary decision tree
-            choice = self._straightDestination()
+            choice = self._straightDestination(player)
             
             #Implement user choice
             if choice == "yes":
                 self._continueDestination(player)
-                print "You leave Fangorn blessed."
-                print ""
+                io.output("You leave Fangorn blessed.")
+                io.output()
             else:
-                print ("You leave Fangorn in a hurry, feeling watched the" 
+                io.output("You leave Fangorn in a hurry, feeling watched the" 
                 " entire time.")
-                print ""
+                io.output()
             
-    def _fork(self):
+    def _fork(self, player):
         """
         Solicits user input.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         choice = None
         acceptable = ["left", "straight"]
         while choice not in acceptable:
-            choice = raw_input("What would you like to do? Options: 'left' or" 
+            choice = io.input("What would you like to do? Options: 'left' or" 
             " 'straight.' ")
-        print ""
+        io.output()
         
         return choice
 
@@ -87,47 +93,53 @@ class Derningle(UniquePlace):
         
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Calculate experience increase
         experienceIncrease = (player.getExperience() * 
             constants.DERINGLE_EXP_INCREASE)
         
         #Story
-        print ("You find yourself in a sunny pasture deep within the depths of"
+        io.output("You find yourself in a sunny pasture deep within the depths of"
         " Fangorn Forest.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
-        print ("You realize that you are not only fighting for yourself but" 
+        io.output("You realize that you are not only fighting for yourself but" 
         " for beautiful places \nsuch as this. Great strength wells up within" 
         " your inner man.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Player gets experience increase
-        print "Player gains %s experience." % experienceIncrease
+        io.output("Player gains %s experience." % experienceIncrease)
         player.increaseExperience(experienceIncrease)
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
 
-    def _straightDestination(self):
+    def _straightDestination(self, player):
         """
         Potentially non-terminal destination given that user choose to go 
         'straight.' User is prompted to go continue deeper into the forest or 
         turn around.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         #Story
-        print ("You find yourself in a dark passage in Fangorn and you feel" 
+        io.output("You find yourself in a dark passage in Fangorn and you feel" 
             " uneasy. You hear \nrustling about.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Solicit user choice
         choice = None
         acceptable = ["yes", "no"]
         while choice not in acceptable:
-            choice = raw_input("Would you like to continue venturing deeper" 
+            choice = io.input("Would you like to continue venturing deeper" 
                 " into the forest? \nOptions: 'yes' or 'no.' ")
-        print ""
+        io.output()
         
         return choice
 
@@ -138,22 +150,24 @@ class Derningle(UniquePlace):
                
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Story
-        print "You find yourself in an an opening surrounded by several ents!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("You find yourself in an an opening surrounded by several ents!")
+        io.pause()
+        io.output()
 
-        print "Treebeard: \"Are you a little orc?\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Treebeard: \"Are you a little orc?\"")
+        io.pause()
+        io.output()
 
-        print ("\"Ah I see. Please continue fighting for what is right and" 
+        io.output("\"Ah I see. Please continue fighting for what is right and" 
             " receive this blessing \nfrom us.\"")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Player receives gift
-        print ("\"Received three ent-draughts! These are legendary elixirs of" 
+        io.output("\"Received three ent-draughts! These are legendary elixirs of" 
             " incredible power.\"")
         toRemove = []
         for item in self._gift:
@@ -161,4 +175,4 @@ class Derningle(UniquePlace):
                 toRemove.append(item)
         for item in toRemove:
             self._gift.remove(item)
-        print ""
\ No newline at end of file
+        io.output()
\ No newline at end of file
@@ -1,12 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul_ii import Nazgul_II
-from monsters.orc import Orc
-from monsters.orc_archer import OrcArcher
-from monsters.troll import Troll
-from monsters.black_numernorian import BlackNumernorian
-from monsters.witch_king import WitchKing
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
@@ -14,8 +9,6 @@ from items.potion import Potion
 from items.item import Item
 import constants
 
-import random
-
 class DolGuldur(UniquePlace):
     """
     Dol Guldur is a unique place in Southern Mirkwood. In Tolkein's universe,
@@ -36,41 +29,21 @@ class DolGuldur(UniquePlace):
         UniquePlace.__init__(self, name, description, greetings)
         
         self._wave = []
-        self._wave2 = []
-        self._wave3 = []
         
         #Create monster wave #1 
         for monster in range(11):
-            monster = Orc(constants.MONSTER_STATS[Orc])
+            monster = getMonster("Orc")
             self._wave.append(monster)
         for monster in range(10):
-            monster = OrcArcher(constants.MONSTER_STATS[OrcArcher])
+            monster = getMonster("OrcArcher")
             self._wave.append(monster)
         for monster in range(7):
-            monster = Troll(constants.MONSTER_STATS[Troll])
+            monster = getMonster("Troll")
             self._wave.append(monster)
         
-        #Create monster wave #2
-        numberNazgul = random.randrange(0, 8)
-        for monster in range(numberNazgul):
-            nazgul = Nazgul_II(constants.MONSTER_STATS[Nazgul_II])
-            self._wave2.append(nazgul)
-        if random.random() < constants.DOL_GULDUR_WITCH_KING_PROB:
-            witchKing = WitchKing(constants.MONSTER_STATS[WitchKing])
-            self._wave2.append(witchKing)
-        for monster in range(8):
-            monster = BlackNumernorian(constants.MONSTER_STATS[BlackNumernorian])
-            self._wave2.append(monster)
-            
-        #Create monster wave #3
-        numberNazgul = random.randrange(0, 8)
-        for monster in range(numberNazgul):
-            nazgul = Nazgul_II(constants.MONSTER_STATS[Nazgul_II])
-            self._wave3.append(nazgul)
-        for monster in range(6):
-            monster = BlackNumernorian(constants.MONSTER_STATS[BlackNumernorian])
-            self._wave3.append(monster)
-        self._wave3.append(monster)
+        #Waves #2 and #3 are created on first visit
+        self._wave2 = None
+        self._wave3 = None
         
         #Create loot
         weapon = Weapon("Cursed Sword", "Fills you with fear", 5, 18, 18)
@@ -88,11 +61,16 @@ class DolGuldur(UniquePlace):
         
         @param player:   The current player.
         """
-        print self._greetings
-        print ""
+        io = player.getIo()
+
+        if self._wave2 is None:
+            self._createWaves(player)
+
+        io.output(self._greetings)
+        io.output()
         
         #Solicit user choice
-        choice = self._choice()
+        choice = self._choice(player)
         
         #Carry out action sequence given user choice
         if choice == "frontal assault":
@@ -100,16 +78,53 @@ class DolGuldur(UniquePlace):
         if choice == "escape":
             self._run(player)
             
-    def _choice(self):
+    def _createWaves(self, player):
+        """
+        Helper method that creates monster waves #2 and #3, whose numbers of
+        Nazgul are left to chance.
+        
+        @param player:   The current player.
+        """
+        story = player.getRandom(constants.RandomStream.STORY)
+        self._wave2 = []
+        self._wave3 = []
+
+        #Create monster wave #2
+        numberNazgul = story.randrange(0, 8)
+        for monster in range(numberNazgul):
+            nazgul = getMonster("Nazgul_II")
+            self._wave2.append(nazgul)
+        if story.random() < constants.DOL_GULDUR_WITCH_KING_PROB:
+            witchKing = getMonster("WitchKing")
+            self._wave2.append(witchKing)
+        for monster in range(8):
+            monster = getMonster("BlackNumernorian")
+            self._wave2.append(monster)
+        
+        #Create monster wave #3
+        numberNazgul = story.randrange(0, 8)
+        for monster in range(numberNazgul):
+            nazgul = getMonster("Nazgul_II")
+            self._wave3.append(nazgul)
+        for monster in range(6):
+            monster = getMonster("BlackNumernorian")
+            self._wave3.append(monster)
+        self._wave3.append(monster)
+            
+    def _choice(self, player):
         """
         Solicit user choice. Here, user is given option to attack or to run. 
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         choice = None
         acceptable = ["frontal assault", "escape"]
         while choice not in acceptable:
-            choice = raw_input("What do you want to do? Choices: 'frontal" 
+            choice = io.input("What do you want to do? Choices: 'frontal" 
                 " assault' or 'escape.' ")
-        print ""
+        io.output()
         
         return choice
         
@@ -139,28 +154,30 @@ class DolGuldur(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Story
-        print ("Although you have taken the tower of Dol Guldur, a deep sense" 
+        io.output("Although you have taken the tower of Dol Guldur, a deep sense" 
             " of evil still \nlingers over the land.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Give player loot
         if len(self._loot) != 0:
-            print "While looking around, you find several items."
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("While looking around, you find several items.")
+            io.pause()
+            io.output()
             toRemove = []
             for item in self._loot:
                 if player.addToInventory(item):
                     toRemove.append(item)
             for item in toRemove:
                 self._loot.remove(item)
-            print ""
+            io.output()
         
         #Story
-        print "You leave with a sense of foreboding."
-        print ""
+        io.output("You leave with a sense of foreboding.")
+        io.output()
         
     def _run(self, player):
         """
@@ -168,13 +185,15 @@ class DolGuldur(UniquePlace):
         
         @param player:   The current player.
         """
-        print "You find yourself surrounded."
-        raw_input("Press enter to continue. ")
-        print ""
+        io = player.getIo()
+
+        io.output("You find yourself surrounded.")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
             return
         
-        print "You escape with your life!"
-        print ""
\ No newline at end of file
+        io.output("You escape with your life!")
+        io.output()
\ No newline at end of file
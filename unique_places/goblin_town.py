@@ -2,13 +2,10 @@
 
 from unique_place import UniquePlace
 from items.weapon import Weapon
-from monsters.goblin import Goblin
-from monsters.great_goblin import GreatGoblin
+from factories.monster_factory import getMonster
 from battle_engine import battle
 import constants
 
-import random
-
 class GoblinTown(UniquePlace):
     """
     GoblinTown is a unique place in High Pass. 
@@ -44,19 +41,19 @@ class GoblinTown(UniquePlace):
 
         #Create monster wave #1
         for monster in range(2):
-            monster = Goblin(constants.MONSTER_STATS[Goblin])
+            monster = getMonster("Goblin")
             self._wave.append(monster)
             
         #Create monster wave #2
         for monster in range(8):
-            monster = Goblin(constants.MONSTER_STATS[Goblin])
+            monster = getMonster("Goblin")
             self._wave2.append(monster)
 
         #Create monster wave #3
         for monster in range(4):
-            monster = Goblin(constants.MONSTER_STATS[Goblin])
+            monster = getMonster("Goblin")
             self._wave3.append(monster)
-        monster = GreatGoblin(constants.MONSTER_STATS[GreatGoblin])
+        monster = getMonster("GreatGoblin")
         self._wave3.append(monster)
     
         #Create monster wave #4
@@ -68,31 +65,33 @@ class GoblinTown(UniquePlace):
 
         @param player:  The current player.
         """
-        print self._greetings
-        print ""
+        io = player.getIo()
+
+        io.output(self._greetings)
+        io.output()
         
         #Fight wave 1
-        print ("As you creep along High Pass hoping to avoid detection, you" 
+        io.output("As you creep along High Pass hoping to avoid detection, you" 
             " hear some creeping \nin the shadows....")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave)
         if not result:
             return
             
         #Story
-        print ("You have defeated some unsuspecting goblins! Escaping" 
+        io.output("You have defeated some unsuspecting goblins! Escaping" 
             " detection now may \nstill be an option!")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
     
         #Solicit user choice
-        print ("As you think ahead, you have two options. You may attempt to" 
+        io.output("As you think ahead, you have two options. You may attempt to" 
             " sneak through \nGollum's Cave taking the risk getting trapped " 
             " or go straight into Goblin Town.")
-        print ""
-        choice = self._choice()
+        io.output()
+        choice = self._choice(player)
 
         #Run choice-dependent scripts
         if choice == "cave":
@@ -100,18 +99,20 @@ class GoblinTown(UniquePlace):
         else:
             self._frontalAssault(player)
         
-    def _choice(self):
+    def _choice(self, player):
         """
         Solicit user choice.
         
         @param player:  The current player.
         """
+        io = player.getIo()
+
         choice = None
         acceptable = ["cave", "straight"]
         while choice not in acceptable:
-            choice = raw_input("What would you like to do? Choices: try to" 
+            choice = io.input("What would you like to do? Choices: try to" 
                 " sneak through the 'cave' or go 'straight' in. ")
-        print ""
+        io.output()
         
         return choice
         
@@ -121,28 +122,31 @@ class GoblinTown(UniquePlace):
         
         @param player:  The current player.
         """
-        print "You try to sneak through Gollum's Cave."
-        raw_input("Press enter to continue. ")
-        print ""
+        io = player.getIo()
+
+        io.output("You try to sneak through Gollum's Cave.")
+        io.pause()
+        io.output()
 
         #If player ventures through undetected
-        if random.random() < constants.GOBLIN_TOWN_EVASION_PROB:
-            print "You make it through the mountains safely!"
-            raw_input("Press enter to continue. ")
-            print ""
+        story = player.getRandom(constants.RandomStream.STORY)
+        if story.random() < constants.GOBLIN_TOWN_EVASION_PROB:
+            io.output("You make it through the mountains safely!")
+            io.pause()
+            io.output()
             
         #If player gets  trapped in cave.
         else:
             #Story
-            print ("Great Goblin: \"You fool... did you really think you could" 
+            io.output("Great Goblin: \"You fool... did you really think you could" 
                 " make it through my territory \nwithout me knowing?\"")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             
             #Fight wave 4
-            print "Great Goblin: \"Now I will feast on your flesh....\""
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("Great Goblin: \"Now I will feast on your flesh....\"")
+            io.pause()
+            io.output()
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave4)
             if not result:
@@ -157,33 +161,35 @@ class GoblinTown(UniquePlace):
         
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Story
-        print "Time to slay some goblins! On to Goblin Town!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Time to slay some goblins! On to Goblin Town!")
+        io.pause()
+        io.output()
         
-        print "You see some primitive huts, all uninhabited." 
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("You see some primitive huts, all uninhabited.") 
+        io.pause()
+        io.output()
         
-        print "Suddenly, goblins circle you from all directions!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Suddenly, goblins circle you from all directions!")
+        io.pause()
+        io.output()
 
         #Frontal assault wave 1
-        print ("Great Goblin: \"What makes you think that you can just charge" 
+        io.output("Great Goblin: \"What makes you think that you can just charge" 
             " into my city?\"")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
             return
             
         #Frontal assault wave 2
-        print "Great Goblin: \"You stupid fool it is now time to DIE!\" "
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Great Goblin: \"You stupid fool it is now time to DIE!\" ")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
@@ -198,10 +204,12 @@ class GoblinTown(UniquePlace):
         
         @param player:  The current player.
         """
-        print ("As you gaze over the corpses of your enemies, you decide that" 
+        io = player.getIo()
+
+        io.output("As you gaze over the corpses of your enemies, you decide that" 
             " it is time to take your winnings and leave.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
 
         #Give player items
         toRemove = []
@@ -210,6 +218,6 @@ class GoblinTown(UniquePlace):
                 toRemove.append(item)
         for item in toRemove:
             self._loot.remove(item)
-        print ""
+        io.output()
         
-        self._createPort("south")
\ No newline at end of file
+        self._createPort("south", player)
\ No newline at end of file
@@ -1,10 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.uruk_hai import UrukHai
-from monsters.uruk_hai_archer import UrukHaiArcher
-from monsters.elite_uruk_hai import EliteUrukHai
-from monsters.sauroman import Sauroman
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.item import Item
 import constants
@@ -35,30 +32,27 @@ class Isenguard(UniquePlace):
 
         #Create monster wave #1
         for monster in range(6):
-            urukHai = UrukHai(constants.MONSTER_STATS[UrukHai])
+            urukHai = getMonster("UrukHai")
             self._wave.append(urukHai)
         for monster in range(3):
-            urukHaiArcher = UrukHaiArcher(constants.MONSTER_STATS[UrukHaiArcher])
+            urukHaiArcher = getMonster("UrukHaiArcher")
             self._wave.append(urukHaiArcher)
         
         #Create monster wave #2
         for monster in range(10):
-            eliteUrukHai = EliteUrukHai(constants.MONSTER_STATS[EliteUrukHai])
+            eliteUrukHai = getMonster("EliteUrukHai")
             self._wave2.append(eliteUrukHai)
         for monster in range(4):
-            urukHaiArcher = UrukHaiArcher(constants.MONSTER_STATS[UrukHaiArcher])
+            urukHaiArcher = getMonster("UrukHaiArcher")
             self._wave2.append(urukHaiArcher)
 
-        #Create monster wave #3 - elite Uruk Hai have increased stats
-        BONUS = 3
-        increasedStats = []
-        for stat in constants.MONSTER_STATS[EliteUrukHai]:
-            increasedStats.append(stat * BONUS)
+        #Create monster wave #3 - elite Uruk Hai have triple stats
+        BONUS = 2
         for monster in range(2):
-            eliteUrukHai = EliteUrukHai(increasedStats)
+            eliteUrukHai = getMonster("EliteUrukHai", BONUS)
             self._wave3.append(eliteUrukHai)
         #Create Sauroman
-        sauroman = Sauroman(constants.MONSTER_STATS[Sauroman])
+        sauroman = getMonster("Sauroman")
         self._wave3.append(sauroman)
 
         #Spawn loot
@@ -74,8 +68,10 @@ class Isenguard(UniquePlace):
 
         @param player:  The current player.
         """
-        print self._greetings
-        print ""
+        io = player.getIo()
+
+        io.output(self._greetings)
+        io.output()
 
         #Player goes through series of battles to take Isenguard
         result = self._battle(player)
@@ -89,12 +85,12 @@ class Isenguard(UniquePlace):
                 toRemove.append(item)
         for item in toRemove:
             self._loot.remove(item)
-        print ""
+        io.output()
             
         #Ending sequence
-        print "Isenguard has a new overseer this day."
-        print ""
-        self._createPort("south")
+        io.output("Isenguard has a new overseer this day.")
+        io.output()
+        self._createPort("south", player)
         
     def _battle(self, player):
         """
@@ -102,37 +98,39 @@ class Isenguard(UniquePlace):
 
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Wave 1
-        print ("Immediately as you approach the Ring of Isenguard, you are" 
+        io.output("Immediately as you approach the Ring of Isenguard, you are" 
             " greeted with an a wave of Uruk....")
-        raw_input("Press enter to continue. ")
+        io.pause()
         result = battle(player, constants.BattleEngineContext.STORY, self._wave)
         if not result:
             return False
-        print ""
+        io.output()
         
         #Wave 2
-        print ("As you gaze over bodies of your slain enemies, Sauroman the" 
+        io.output("As you gaze over bodies of your slain enemies, Sauroman the" 
             " Great Wizard appears.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
-        print ("Sauroman: \"You shouldn't have come, foolish one. Were you" 
+        io.output("Sauroman: \"You shouldn't have come, foolish one. Were you" 
             " haughty enough to think that you could take the Orthanc?\"")
-        raw_input("Press enter to continue. ")
+        io.pause()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
             return False
-        print ""
+        io.output()
         
         #Wave 3
-        print "Sauroman: \"You stupid fool....\""
-        raw_input("Press enter to continue. ")
+        io.output("Sauroman: \"You stupid fool....\"")
+        io.pause()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
             return False
-        print ""
+        io.output()
         
         return True
\ No newline at end of file
@@ -1,12 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul_iii import Nazgul_III
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.troll_ii import Troll_II
-from monsters.black_numernorian_ii import BlackNumernorian_II
-from monsters.mouth_of_sauron import MouthOfSauron
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
@@ -38,35 +33,35 @@ class Isenmouthe(UniquePlace):
         
         #Create monster wave #1 
         for monster in range(14):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave.append(monster)
         for monster in range(7):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave.append(monster)
         for monster in range(6):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave.append(monster)
         for monster in range(3):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave.append(monster)
         
         #Create monster wave #2
         for monster in range(5):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave2.append(monster)
         for monster in range(4):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave2.append(monster)
         for monster in range(2):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave2.append(monster)
         for monster in range(5):
-            monster = BlackNumernorian_II(constants.MONSTER_STATS[BlackNumernorian_II])
+            monster = getMonster("BlackNumernorian_II")
             self._wave2.append(monster)
         for monster in range(4):
-            monster = Nazgul_III(constants.MONSTER_STATS[Nazgul_III])
+            monster = getMonster("Nazgul_III")
             self._wave2.append(monster)
-        monster = MouthOfSauron(constants.MONSTER_STATS[MouthOfSauron])
+        monster = getMonster("MouthOfSauron")
         self._wave2.append(monster)
         
         #Create loot
@@ -84,11 +79,13 @@ class Isenmouthe(UniquePlace):
         
         @param player:   The current player.
         """
-        print self._greetings
-        print ""
-        print "You see several armies approaching as you near the Isenmouthe."
-        raw_input("Press enter to continue. ")
-        print ""
+        io = player.getIo()
+
+        io.output(self._greetings)
+        io.output()
+        io.output("You see several armies approaching as you near the Isenmouthe.")
+        io.pause()
+        io.output()
         
         #Run battle action sequence
         self._battle(player)
@@ -99,19 +96,21 @@ class Isenmouthe(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Wave 1
-        print "Mouth of Sauron: \"You have overstayed your welcome.\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"You have overstayed your welcome.\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave)
         if not result:
             return
         
         #Wave 2
-        print "Mouth of Sauron: \"Time... to... DIE!!!\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Mouth of Sauron: \"Time... to... DIE!!!\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
@@ -126,24 +125,26 @@ class Isenmouthe(UniquePlace):
         
         @param player:   The current player.
         """
-        print "You have secured the north-west route into Mordor!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io = player.getIo()
+
+        io.output("You have secured the north-west route into Mordor!")
+        io.pause()
+        io.output()
         
         #Give player loot
         if len(self._loot) != 0:
-            print "While looting the battlefield, you find strange items."
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("While looting the battlefield, you find strange items.")
+            io.pause()
+            io.output()
             toRemove = []
             for item in self._loot:
                 if player.addToInventory(item):
                     toRemove.append(item)
             for item in toRemove:
                 self._loot.remove(item)
-            print ""
+            io.output()
         
-        print "Welcome to the heart of Mordor!"
-        print ""
+        io.output("Welcome to the heart of Mordor!")
+        io.output()
         
-        self._createPort("south")
\ No newline at end of file
+        self._createPort("south", player)
\ No newline at end of file
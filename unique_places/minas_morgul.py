@@ -1,11 +1,7 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul_iii import Nazgul_III
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.troll_ii import Troll_II
-from monsters.witch_king import WitchKing
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
@@ -35,31 +31,31 @@ class MinasMorgul(UniquePlace):
         
         #Create monster wave #1
         for monster in range(13):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave.append(monster)
         for monster in range(8):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave.append(monster)
         for monster in range(7):
-            monster = Troll_II(constants.MONSTER_STATS[Troll_II])
+            monster = getMonster("Troll_II")
             self._wave.append(monster)
         
         #Create monster wave #2
         for monster in range(8):
-            monster = Nazgul_III(constants.MONSTER_STATS[Nazgul_III])
+            monster = getMonster("Nazgul_III")
             self._wave2.append(monster)
-        monster = WitchKing(constants.MONSTER_STATS[WitchKing])
+        monster = getMonster("WitchKing")
         self._wave2.append(monster)
         
         #Create monster wave #3
         for monster in range(7):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave3.append(monster)
         for monster in range(3):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave3.append(monster)
         for monster in range(4):
-            monster = Nazgul_III(constants.MONSTER_STATS[Nazgul_III])
+            monster = getMonster("Nazgul_III")
             self._wave3.append(monster)
         
         #Create loot
@@ -85,15 +81,17 @@ class MinasMorgul(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
-        print "The haunted city of Minas Morgul chills your bones."
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output(self._greetings)
+        io.output()
+        io.output("The haunted city of Minas Morgul chills your bones.")
+        io.pause()
+        io.output()
         
         #Solicit user choice
-        choice = self._choice()
+        choice = self._choice(player)
         
         #If player chooses to frontal assault
         if choice == "frontal assault":
@@ -103,18 +101,22 @@ class MinasMorgul(UniquePlace):
         if choice == "run":
             self._run(player)
             
-    def _choice(self):
+    def _choice(self, player):
         """
         Solicit user choice.
         
         @return:      User choice.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         choice = None
         acceptable = ["frontal assault", "run"]
         while choice not in acceptable:
-            choice = raw_input("What do you want to do? Choices: 'frontal" 
+            choice = io.input("What do you want to do? Choices: 'frontal" 
                 " assault' or 'run.' ")
-        print ""
+        io.output()
         
         return choice
         
@@ -124,24 +126,26 @@ class MinasMorgul(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Wave 1
-        print ("Witch-King: \"Time for tea and crumpets. Please keep to the" 
+        io.output("Witch-King: \"Time for tea and crumpets. Please keep to the" 
             " left and don't \ntouch any of the artifacts.\" ")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave)
         if not result:
             return
         
-        print "Witch-King: \"Hmm. You appear to not like my tea. How Rude....\"" 
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Witch-King: \"Hmm. You appear to not like my tea. How Rude....\"") 
+        io.pause()
+        io.output()
         
         #Wave 2
-        print "Witch-King: \"Perhaps you will like this instead....\""
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("Witch-King: \"Perhaps you will like this instead....\"")
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave2)
         if not result:
@@ -156,28 +160,30 @@ class MinasMorgul(UniquePlace):
         
         @param player:   The current player.
         """
-        print ("You have taken the city of Minas Morgul and secured the" 
+        io = player.getIo()
+
+        io.output("You have taken the city of Minas Morgul and secured the" 
             " western route into Mordor!")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Give player loot
         if len(self._loot) != 0:
-            print "You quickly loot the battle field."
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("You quickly loot the battle field.")
+            io.pause()
+            io.output()
             toRemove = []
             for item in self._loot:
                 if player.addToInventory(item):
                     toRemove.append(item)
             for item in toRemove:
                 self._loot.remove(item)
-            print ""
+            io.output()
         
-        print "You quickly move on, knowing that Sauron is on the move too."
-        print ""
+        io.output("You quickly move on, knowing that Sauron is on the move too.")
+        io.output()
         
-        self._createPort("east")
+        self._createPort("east", player)
         
     def _run(self, player):
         """
@@ -186,15 +192,17 @@ class MinasMorgul(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Battle enemies
-        print ("As you rush out of the area, a large number of enemies catch" 
+        io.output("As you rush out of the area, a large number of enemies catch" 
         " up to you.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         result = battle(player, constants.BattleEngineContext.STORY, 
             self._wave3)
         if not result:
             return
             
-        print "You narrowly escape your enemies."
-        print ""
\ No newline at end of file
+        io.output("You narrowly escape your enemies.")
+        io.output()
\ No newline at end of file
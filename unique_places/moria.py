@@ -7,8 +7,6 @@ from items.weapon import Weapon
 from items.armor import Armor
 import constants
 
-import random
-
 class Moria(UniquePlace):
     """
     Moria is a unique place in MistyMountainsSouth. In Tolkien's universe, 
@@ -109,17 +107,20 @@ class Moria(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
+        io.output(self._greetings)
+        io.output()
         
-        print ("You enter into a once-glorious hall, moving quickly among" 
+        io.output("You enter into a once-glorious hall, moving quickly among" 
             " the shadows.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Generate length of time spent in Moria
-        timeInMoria = random.randrange(15, 25)
+        story = player.getRandom(constants.RandomStream.STORY)
+        timeInMoria = story.randrange(15, 25)
 
         #Player journeys through Moria
         for time in range(timeInMoria):
@@ -135,9 +136,9 @@ class Moria(UniquePlace):
             battleOccurence = result[1]
                         
             #Execute action sequence
-            print statement
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output(statement)
+            io.pause()
+            io.output()
             
             if battleOccurence:
                 result = battle(player, constants.BattleEngineContext.RANDOM)
@@ -146,12 +147,12 @@ class Moria(UniquePlace):
                     return
         
         #Ending sequence
-        print "You emerge from the Mines!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("You emerge from the Mines!")
+        io.pause()
+        io.output()
         
         self._danger = 0
-        self._createPort("east")
+        self._createPort("east", player)
         
     def _lowRiskTravel(self, player):
         """
@@ -160,17 +161,18 @@ class Moria(UniquePlace):
         
         @param player:  The current player.
         """
-        chance = random.random()
+        story = player.getRandom(constants.RandomStream.STORY)
+        chance = story.random()
         if chance < constants.MORIA_LOW_RISK_SNEAK_UPPER_LIMIT:
-            statement = random.choice(self._sneakString)
+            statement = story.choice(self._sneakString)
             battle = False
             self._itemFind(player)
         elif chance < constants.MORIA_LOW_RISK_NEUTRAL_UPPER_LIMIT:
-            statement = random.choice(self._neutralString)
+            statement = story.choice(self._neutralString)
             battle = False
             self._itemFind(player)
         else:
-            statement = random.choice(self._encounterString)
+            statement = story.choice(self._encounterString)
             self._danger += 1
             battle = True
         
@@ -183,17 +185,18 @@ class Moria(UniquePlace):
         
         @param player:  The current player.
         """
-        chance = random.random()
+        story = player.getRandom(constants.RandomStream.STORY)
+        chance = story.random()
         if chance < constants.MORIA_MED_RISK_SNEAK_UPPER_LIMIT:
-            statement = random.choice(self._sneakString)
+            statement = story.choice(self._sneakString)
             battle = False
             self._itemFind(player)
         elif chance < constants.MORIA_MED_RISK_NEUTRAL_UPPER_LIMIT:
-            statement = random.choice(self._neutralString)
+            statement = story.choice(self._neutralString)
             battle = False
             self._itemFind(player)
         else:
-            statement = random.choice(self._encounterString)
+            statement = story.choice(self._encounterString)
             self._danger += 1
             battle = True
                
@@ -206,13 +209,14 @@ class Moria(UniquePlace):
         
         @param player:  The current player.
         """
-        chance = random.random()
+        story = player.getRandom(constants.RandomStream.STORY)
+        chance = story.random()
         if chance < constants.MORIA_HIGH_RISK_NEUTRAL_UPPER_LIMIT:
-            statement = random.choice(self._neutralString)
+            statement = story.choice(self._neutralString)
             battle = False
             self._itemFind(player)
         else:
-            statement = random.choice(self._runString)
+            statement = story.choice(self._runString)
             self._danger += 1
             battle = True
         
@@ -225,14 +229,17 @@ class Moria(UniquePlace):
         
         @param player:  The current player.
         """
-        chance = random.random()
+        io = player.getIo()
+
+        loot = player.getRandom(constants.RandomStream.LOOT)
+        chance = loot.random()
         if self._loot and chance < constants.MORIA_ITEM_FIND_PROB:
-            item = random.choice(self._loot)
-            print ("You found %s while venturing through the Mines of Moria!" 
+            item = loot.choice(self._loot)
+            io.output("You found %s while venturing through the Mines of Moria!" 
                 % item.getName())
             
             if player.addToInventory(item):
                 self._loot.remove(item)
             
-            raw_input("Press enter to continue. ")
-            print ""
\ No newline at end of file
+            io.pause()
+            io.output()
\ No newline at end of file
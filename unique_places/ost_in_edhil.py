@@ -26,17 +26,19 @@ class OstInEdhil(UniquePlace):
 
         @param player:  The current player.
         """
+        io = player.getIo()
+
         healing = player.getMaxHp() - player.getHp()
         
-        print self._greetings
-        print ""
-        print "You decide that this is a good place to spend the night."
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output(self._greetings)
+        io.output()
+        io.output("You decide that this is a good place to spend the night.")
+        io.pause()
+        io.output()
             
         player.heal(healing)
-        print "%s was healed by %s!" % (player.getName(), healing)
-        print ""
+        io.output("%s was healed by %s!" % (player.getName(), healing))
+        io.output()
 
-        print "You awaken refreshed and ready for a new day."
-        print ""
\ No newline at end of file
+        io.output("You awaken refreshed and ready for a new day.")
+        io.output()
\ No newline at end of file
@@ -1,13 +1,12 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul import Nazgul
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.weapon import Weapon
 from items.armor import Armor
 from items.item import Item
 import constants
-import random
 
 class Tharbad(UniquePlace):
     """
@@ -29,12 +28,8 @@ class Tharbad(UniquePlace):
         #Call parent class init function
         UniquePlace.__init__(self, name, description, greetings)
 
-        #Generates list of Nazgul that user may fight
-        self._monsters = []
-        numberNazgul = random.randrange(1, 5)
-        for monster in range(numberNazgul):
-            nazgul = Nazgul(constants.MONSTER_STATS[Nazgul])
-            self._monsters.append(nazgul)
+        #List of Nazgul that user may fight is generated on first visit
+        self._monsters = None
 
         #Generate loot
         description = "Ancient runes and symbols"
@@ -51,30 +46,41 @@ class Tharbad(UniquePlace):
 
         @param player:  The current player.
         """
+        io = player.getIo()
+
+        #Generates list of Nazgul that user may fight
+        if self._monsters is None:
+            story = player.getRandom(constants.RandomStream.STORY)
+            self._monsters = []
+            numberNazgul = story.randrange(1, 5)
+            for monster in range(numberNazgul):
+                nazgul = getMonster("Nazgul")
+                self._monsters.append(nazgul)
+
         #Story
-        print self._greetings
-        print ""
+        io.output(self._greetings)
+        io.output()
         
-        print ("You gaze upon the ancient ruins of the once great city of" 
+        io.output("You gaze upon the ancient ruins of the once great city of" 
             " Tharbad and see some very strange sights.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
 
         #Solicit user input
         choice = None
         acceptable = ["explore", "leave"]
         while choice not in acceptable:
-            choice = raw_input("What would you like to do? Choices: 'explore'"
+            choice = io.input("What would you like to do? Choices: 'explore'"
                 " and 'leave.' ")
-            print ""
+            io.output()
         
         #Execute user-dependent scripts
         if choice == "explore":
             self._explore(player)
         else:
-            print ("You bid farewell to the ruins of Tharbad and continue on" 
+            io.output("You bid farewell to the ruins of Tharbad and continue on" 
                 " your journey.")
-            print ""
+            io.output()
 
     def _explore(self, player):
         """
@@ -82,30 +88,32 @@ class Tharbad(UniquePlace):
 
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #Solicit user input
         choice = None
         acceptable = ["ruined mill", "ancient bridge"]
         while choice not in acceptable:
-            choice = raw_input("Where would you like to explore? Options:"
+            choice = io.input("Where would you like to explore? Options:"
                 " 'ruined mill' and 'ancient bridge.' ")
-        print ""
+        io.output()
 
         #If user chooses to explore ruined mill
         if choice == "ruined mill":
-            print ("You find lots of rotting instruments and the remains of"
+            io.output("You find lots of rotting instruments and the remains of"
                 " farming equipment.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             self._itemFind(player)
             self._chanceBattle(player)
 
         #If user choose to explore ancient bridge
         elif choice == "ancient bridge":
-            print ("You find the ruins of the ancient North-South Road bridge"
+            io.output("You find the ruins of the ancient North-South Road bridge"
                 " crossing. This was \nonce one of the greatest causeways in all"
                 " of Middle Earth.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             self._itemFind(player)
             self._chanceBattle(player)
 
@@ -113,15 +121,15 @@ class Tharbad(UniquePlace):
         choice = None
         acceptable = ["yes", "no"]
         while choice not in acceptable:
-            choice = raw_input("Would you like to keep exploring? Options:"
+            choice = io.input("Would you like to keep exploring? Options:"
                 " 'yes' and 'no.' ")
-        print ""
+        io.output()
         
         if choice == "yes":
             self._explore(player)
         else:
-            print "You leave Tharbad with a sense of loss."
-            print ""
+            io.output("You leave Tharbad with a sense of loss.")
+            io.output()
             
     def _chanceBattle(self, player):
         """
@@ -129,10 +137,13 @@ class Tharbad(UniquePlace):
         
         @param player:   The player object.
         """
-        if random.random() < constants.THARBAD_BATTLE_PROB and self._monsters:
-            print "You hear some rustling in the shadows...."
-            raw_input("Press enter to continue. ")
-            print ""
+        io = player.getIo()
+
+        story = player.getRandom(constants.RandomStream.STORY)
+        if story.random() < constants.THARBAD_BATTLE_PROB and self._monsters:
+            io.output("You hear some rustling in the shadows....")
+            io.pause()
+            io.output()
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._monsters)
             if not result:
@@ -144,15 +155,18 @@ class Tharbad(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+
         #If there are no items to find
         if len(self._loot) == 0:
             return
         
-        chance = random.random()
+        loot = player.getRandom(constants.RandomStream.LOOT)
+        chance = loot.random()
         #Determines if player finds item and which item player receives
         if chance < constants.THARBAD_ITEM_FIND_PROB:
-            print "You find something that may be of some value!"
-            item = random.choice(self._loot)
+            io.output("You find something that may be of some value!")
+            item = loot.choice(self._loot)
             if player.addToInventory(item):
                 self._loot.remove(item)
-            print ""
\ No newline at end of file
+            io.output()
\ No newline at end of file
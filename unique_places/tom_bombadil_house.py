@@ -37,19 +37,21 @@ class TomBombadilHouse(UniquePlace):
 
         @param player:  The current player.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
+        io.output(self._greetings)
         
-        print ("\"I am Tom Bombadil. My wife Goldberry and I live in these"
+        io.output("\"I am Tom Bombadil. My wife Goldberry and I live in these"
             " forests.\"")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
-        print ("\"I can tell that you are on a long journey and are carrying"
+        io.output("\"I can tell that you are on a long journey and are carrying"
             " something that \nmust be kept safe. I would like to leave you with"
             " a gift if you would like to \naccept it.\"")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Give player loot
         toRemove = []
@@ -59,7 +61,7 @@ class TomBombadilHouse(UniquePlace):
         for item in toRemove:
             self._gift.remove(item)
             
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
-        print "\"Thank you for visiting me in these forests.\""
\ No newline at end of file
+        io.output("\"Thank you for visiting me in these forests.\"")
\ No newline at end of file
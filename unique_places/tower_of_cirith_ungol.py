@@ -1,15 +1,11 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.orc_ii import Orc_II
-from monsters.orc_archer_ii import OrcArcher_II
-from monsters.shelob import Shelob
+from factories.monster_factory import getMonster
 from battle_engine import battle
 from items.unique_items import phialOfGaladriel
 import constants
 
-import random
-
 class TowerOfCirithUngol(UniquePlace):
     """
     The Tower of Cirith Ungol is a unique place in Cirith Ungol. The Tower of
@@ -33,15 +29,15 @@ class TowerOfCirithUngol(UniquePlace):
         self._wave2 = []
         
         #Create monster wave #1
-        monster = Shelob(constants.MONSTER_STATS[Shelob])
+        monster = getMonster("Shelob")
         self._wave.append(monster)
         
         #Create monster wave #2
         for monster in range(15):
-            monster = Orc_II(constants.MONSTER_STATS[Orc_II])
+            monster = getMonster("Orc_II")
             self._wave2.append(monster)
         for monster in range(6):
-            monster = OrcArcher_II(constants.MONSTER_STATS[OrcArcher_II])
+            monster = getMonster("OrcArcher_II")
             self._wave2.append(monster)
             
     def enter(self, player):
@@ -50,38 +46,44 @@ class TowerOfCirithUngol(UniquePlace):
         
         @param player:   The current player.
         """
+        io = player.getIo()
+
         #Story
-        print self._greetings
-        print ""
+        io.output(self._greetings)
+        io.output()
         
-        print ("As you climb the path of Cirith Ungol, you stare at the"
+        io.output("As you climb the path of Cirith Ungol, you stare at the"
             " ghastly city of Minas \nMorgul.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
         #Solicit user choice
-        choice = self._choice()
+        choice = self._choice(player)
         
         #Action sequences given user choice
         if choice == "yes":
             self._shelobClef(player)
         else:
-            print "You live to fight another day."
-            print ""
+            io.output("You live to fight another day.")
+            io.output()
             return
         
-    def _choice(self):
+    def _choice(self, player):
         """
         Determines if user wants to attack or run.
+        
+        @param player:   The current player.
         """
+        io = player.getIo()
+
         #Solicit user choice
-        print "To continue, you must go through the Shelob's Clef."
+        io.output("To continue, you must go through the Shelob's Clef.")
         choice = None
         acceptable = ["yes", "no"]
         while choice not in acceptable:
-            choice = raw_input("Would you like to continue? Choices:"
+            choice = io.input("Would you like to continue? Choices:"
                 " 'yes' and 'no.' ")
-        print ""
+        io.output()
         
         return choice
 
@@ -91,89 +93,92 @@ class TowerOfCirithUngol(UniquePlace):
         
         @param player:   The player object.
         """
+        io = player.getIo()
+        story = player.getRandom(constants.RandomStream.STORY)
+
         #Story
-        print ("As you enter into Shelob's Clef, you are surrounded by a"
+        io.output("As you enter into Shelob's Clef, you are surrounded by a"
             " supernatural darkness and \nthe stench of rotting corpses.")
-        raw_input("Press enter to continue. ")
-        print ""
+        io.pause()
+        io.output()
         
-        print "...."
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("....")
+        io.pause()
+        io.output()
         
         #If Phial of Galadriel in inventory
         if phialOfGaladriel in player.getInventory():
-            print "Galadriel's phial lights up the entire chamber."
-            raw_input("Press enter to continue. ")
-            print ""
+            io.output("Galadriel's phial lights up the entire chamber.")
+            io.pause()
+            io.output()
             
-            print ("The light gives you strength... and Shelob backs away,"
+            io.output("The light gives you strength... and Shelob backs away,"
             " afraid of the light.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             
             #Call next action sequence
             self._cirithUngol(player)
             return
         
         #A potential encounter with Shelob
-        shelobAppearance = random.random()
+        shelobAppearance = story.random()
         if shelobAppearance < constants.CIRITH_UNGOL_SHELOB_PROB:
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave)
             if not result:
                 return
             
-        print "You encounter a thick spider web."
-        raw_input("Press enter to hack through the web. ")
-        print ""
+        io.output("You encounter a thick spider web.")
+        io.pause("Press enter to hack through the web. ")
+        io.output()
         
         #A potential encounter with Shelob
-        shelobAppearance = random.random()
+        shelobAppearance = story.random()
         if shelobAppearance < constants.CIRITH_UNGOL_SHELOB_PROB:
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave)
             if not result:
                 return
                 
-        print "...."
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("....")
+        io.pause()
+        io.output()
         
         #A potential encounter with Shelob
-        shelobAppearance = random.random()
+        shelobAppearance = story.random()
         if shelobAppearance < constants.CIRITH_UNGOL_SHELOB_PROB:
             result = battle(player, constants.BattleEngineContext.STORY, self._wave)
             if not result:
                 return
                 
-        print "You encounter a thick spider web."
-        raw_input("Press enter to hack through the web. ")
-        print ""
+        io.output("You encounter a thick spider web.")
+        io.pause("Press enter to hack through the web. ")
+        io.output()
         
         #A potential encounter with Shelob
-        shelobAppearance = random.random()
+        shelobAppearance = story.random()
         if shelobAppearance < constants.CIRITH_UNGOL_SHELOB_PROB:
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave)
             if not result:
                 return
                 
-        print "...."
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("....")
+        io.pause()
+        io.output()
         
         #A potential encounter with Shelob
-        shelobAppearance = random.random()
+        shelobAppearance = story.random()
         if shelobAppearance < constants.CIRITH_UNGOL_SHELOB_PROB:
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave)
             if not result:
                 return
                 
-        print "You have emerged through the darkness!"
-        raw_input("Press enter to continue. ")
-        print ""
+        io.output("You have emerged through the darkness!")
+        io.pause()
+        io.output()
         
         #Call next action sequence
         self._cirithUngol(player)
@@ -184,29 +189,32 @@ class TowerOfCirithUngol(UniquePlace):
         
         @param player:   The player object.
         """
-        successfulEscape = random.random()
+        io = player.getIo()
+
+        story = player.getRandom(constants.RandomStream.STORY)
+        successfulEscape = story.random()
         #If player manages to escape undetected
         if successfulEscape < constants.CIRITH_UNGOL_EVASION_PROB:
-            print ("You manage to sneak through the Tower of Cirith Ungol and"
+            io.output("You manage to sneak through the Tower of Cirith Ungol and"
                 " are now in the heart \nof Mordor.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
         #If player gets detected
         else:
-            print ("As you attempt to sneak through the rest of the passage,"
+            io.output("As you attempt to sneak through the rest of the passage,"
                 " you are discovered \nby an orc patrol.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._wave2)
             if not result:
                 return
                 
             #Story
-            print ("You make it into Mordor and Sauron has been alerted of"
+            io.output("You make it into Mordor and Sauron has been alerted of"
                 " your presence.")
-            raw_input("Press enter to continue. ")
-            print ""
+            io.pause()
+            io.output()
         
         #Create port for quest completion
-        self._createPort("east")
\ No newline at end of file
+        self._createPort("east", player)
\ No newline at end of file
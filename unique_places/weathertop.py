@@ -1,10 +1,9 @@
 #!/usr/bin/python
 
 from unique_place import UniquePlace
-from monsters.nazgul import Nazgul
+from factories.monster_factory import getMonster
 from battle_engine import battle
 import constants
-import random
 
 class Weathertop(UniquePlace):
     """
@@ -23,12 +22,8 @@ class Weathertop(UniquePlace):
         #Call parent class init function
         UniquePlace.__init__(self, name, description, greetings)
 
-        #Generates Nazgul wave
-        self._monsters = []
-        numberNazgul = random.randrange(1, 8)
-        for monster in range(numberNazgul):
-            nazgul = Nazgul(constants.MONSTER_STATS[Nazgul])
-            self._monsters.append(nazgul)
+        #Nazgul wave is generated when player first arrives
+        self._monsters = None
                 
     def enter(self, player):
         """
@@ -36,39 +31,53 @@ class Weathertop(UniquePlace):
 
         @param player:  The current player.
         """
-        print self._greetings
-        print ""
+        io = player.getIo()
+
+        #Generates Nazgul wave on first visit
+        if self._monsters is None:
+            story = player.getRandom(constants.RandomStream.STORY)
+            self._monsters = []
+            numberNazgul = story.randrange(1, 8)
+            for monster in range(numberNazgul):
+                nazgul = getMonster("Nazgul")
+                self._monsters.append(nazgul)
+
+        io.output(self._greetings)
+        io.output()
         
-        print ("Even though you have no personal connection with the place,"
+        io.output("Even though you have no personal connection with the place,"
         " you \nfeel a strong sense of nostalgia at Weathertop.")
-        raw_input("Press enter to continue. ")
+        io.pause()
 
         #Solicit user input
-        choice = self._choice()
+        choice = self._choice(player)
             
         #Run user-dependent sequence
         if choice == "camp":
             self._camp(player)
         elif choice == "keep moving":
-            print "You continue in your quest."
-            print ""
+            io.output("You continue in your quest.")
+            io.output()
 
-    def _choice(self):
+    def _choice(self, player):
         """
         Solicits user choice
+        
+        @param player:   The current player.
         """
-        print \
-"""
+        io = player.getIo()
+
+        io.output("""
 You are spent after a day of travel. Would you like
 to camp the night at Weathertop?
 \t\"Yes I would like to camp.\"       - 'camp'
 \t\"No I would like to keep moving.\" - 'keep moving'
-""" 
+""") 
         choice = None
         acceptable = ["camp", "keep moving"]
         while choice not in acceptable:
-            choice = raw_input("Choice? ")
-        print ""
+            choice = io.input("Choice? ")
+        io.output()
         
         return choice
         
@@ -78,23 +87,26 @@ to camp the night at Weathertop?
         -User gets attacked by a group of Nazgul.
         -Player spends the night undisturbed and gets fully healed.
         """
+        io = player.getIo()
+
         #Nazgul encounter
-        if random.random() < constants.WEATHERTOP_BATTLE_PROB:
-            print ("As you prepare your camping gear, you hear some rustling" 
+        story = player.getRandom(constants.RandomStream.STORY)
+        if story.random() < constants.WEATHERTOP_BATTLE_PROB:
+            io.output("As you prepare your camping gear, you hear some rustling" 
             " in the \nshadows....")
             result = battle(player, constants.BattleEngineContext.STORY, 
                 self._monsters)
             if not result:
                 return
                 
-            print ("Alas, peaceful rest was never to be. After all, you are a" 
+            io.output("Alas, peaceful rest was never to be. After all, you are a" 
             " man \nhunted.")
-            print ""
+            io.output()
             
         #Peaceful rest
         else:
-            print "You enjoy a relaxing stay among ancient ruins."
+            io.output("You enjoy a relaxing stay among ancient ruins.")
             amountHealing = player.getMaxHp() - player.getHp()
             player.heal(amountHealing)
-            print "You wake up relaxed and ready to go!"
-            print ""
\ No newline at end of file
+            io.output("You wake up relaxed and ready to go!")
+            io.output()
\ No newline at end of file
@@ -0,0 +1,52 @@
+#!/usr/bin/python
+
+import importlib
+
+class LazyClass(object):
+    """
+    Stand-in for a class whose module is only imported when the class is first
+    used.
+
+    Calling a LazyClass instantiates the real class. This is used for unique 
+    place classes so that starting the game does not import every one of their
+    modules.
+    """
+    def __init__(self, moduleName, className):
+        """
+        Initializes lazy class.
+
+        @param moduleName:   Dotted name of the module defining the class. For
+                             instance, "monsters.goblin".
+        @param className:    Name of the class within the module.
+        """
+        self._moduleName = moduleName
+        self.__name__ = className
+        self._loadedClass = None
+
+    def load(self):
+        """
+        Imports the module, if needed, and returns the real class.
+
+        @return:    The class.
+        """
+        if self._loadedClass is None:
+            module = importlib.import_module(self._moduleName)
+            self._loadedClass = getattr(module, self.__name__)
+
+        return self._loadedClass
+
+    def isLoaded(self):
+        """
+        Returns whether the class has been imported.
+
+        @return:    True if the class has been imported, False otherwise.
+        """
+        return self._loadedClass is not None
+
+    def __call__(self, *args, **kwargs):
+        """
+        Instantiates the real class.
+
+        @return:    New instance of the class.
+        """
+        return self.load()(*args, **kwargs)
@@ -0,0 +1,194 @@
+#!/usr/bin/python
+
+class PrefixTrie(object):
+    """
+    A set of names indexed by prefix, ignoring case.
+
+    Names are stored one character per level, so looking up a prefix takes
+    time proportional to its length. Every node counts the names below it,
+    which makes it cheap to tell whether a prefix is unambiguous. Names may
+    be added and removed at any time.
+    """
+    def __init__(self, names = ()):
+        """
+        Initializes trie.
+
+        @keyword names:     (Optional) Names to add.
+        """
+        self._root = _TrieNode()
+
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        """
+        Adds a name. Names that only differ in case are the same name; the
+        first one added is kept.
+
+        @param name:        The name.
+
+        @return:            True if the name was added, False if it was
+                            already present.
+        """
+        path = [self._root]
+        for character in name.lower():
+            node = path[-1].children.get(character)
+            if node is None:
+                node = _TrieNode()
+                path[-1].children[character] = node
+            path.append(node)
+
+        if path[-1].name is not None:
+            return False
+
+        path[-1].name = name
+        for node in path:
+            node.count += 1
+
+        return True
+
+    def remove(self, name):
+        """
+        Removes a name.
+
+        @param name:        The name, in any case.
+
+        @return:            True if the name was removed, False if it was not
+                            present.
+        """
+        key = name.lower()
+        path = [self._root]
+        for character in key:
+            node = path[-1].children.get(character)
+            if node is None:
+                return False
+            path.append(node)
+
+        if path[-1].name is None:
+            return False
+
+        path[-1].name = None
+        for node in path:
+            node.count -= 1
+
+        #Drop branches that no longer lead to a name
+        for index in range(len(key) - 1, -1, -1):
+            if path[index + 1].count:
+                break
+            del path[index].children[key[index]]
+
+        return True
+
+    def contains(self, name):
+        """
+        Determines if a name is present.
+
+        @param name:        The name, in any case.
+
+        @return:            True if present, False otherwise.
+        """
+        node = self._find(name)
+        return node is not None and node.name is not None
+
+    def resolve(self, prefix):
+        """
+        Finds the name that a prefix stands for: the name itself if it is
+        present, or the only name that starts with it.
+
+        @param prefix:      The prefix, in any case.
+
+        @return:            The name, as it was added, or None if the prefix
+                            matches no name or several.
+        """
+        node = self._find(prefix)
+        if node is None:
+            return None
+        if node.name is not None:
+            return node.name
+        if node.count != 1:
+            return None
+
+        while node.name is None:
+            node = node.children.values()[0]
+
+        return node.name
+
+    def getCompletions(self, prefix):
+        """
+        Returns every name that starts with a prefix.
+
+        @param prefix:      The prefix, in any case.
+
+        @return:            List of names, as they were added, in
+                            alphabetical order ignoring case.
+        """
+        node = self._find(prefix)
+        if node is None:
+            return []
+
+        names = []
+        unvisited = [node]
+        while unvisited:
+            node = unvisited.pop()
+            if node.name is not None:
+                names.append(node.name)
+            for character in sorted(node.children, reverse = True):
+                unvisited.append(node.children[character])
+
+        return names
+
+    def copy(self):
+        """
+        Returns a copy of the trie that may be changed independently.
+
+        @return:            The new PrefixTrie.
+        """
+        trie = PrefixTrie()
+        unvisited = [(self._root, trie._root)]
+        while unvisited:
+            node, copy = unvisited.pop()
+            copy.count = node.count
+            copy.name = node.name
+            for character, child in node.children.iteritems():
+                copy.children[character] = _TrieNode()
+                unvisited.append((child, copy.children[character]))
+
+        return trie
+
+    def count(self):
+        """
+        Returns the number of names.
+
+        @return:            Number of names.
+        """
+        return self._root.count
+
+    def _find(self, prefix):
+        """
+        Helper method that finds the node of a prefix.
+
+        @param prefix:      The prefix, in any case.
+
+        @return:            The node, or None if no name starts with prefix.
+        """
+        node = self._root
+        for character in prefix.lower():
+            node = node.children.get(character)
+            if node is None:
+                return None
+
+        return node
+
+class _TrieNode(object):
+    """
+    A node of a PrefixTrie.
+    """
+    __slots__ = ("children", "count", "name")
+
+    def __init__(self):
+        """
+        Initializes an empty node.
+        """
+        self.children = {}
+        self.count = 0
+        self.name = None
@@ -0,0 +1,267 @@
+#!/usr/bin/python
+
+"""
+Loads Middle Earth from its data file.
+
+The data file, data/world.json, declares every space with its cities,
+buildings and unique place, the exits between spaces and the spaces returned
+to the game. It is compiled into plain tuples that build the world with no
+further lookups. The compiled form is cached next to the data file, keyed by
+a hash of the data, so that later starts read it with a single deserialize.
+
+Compiled form:
+    -spaces: List of (name, description, region, battleProbability,
+     battleBonusDifficulty, cities, uniquePlace, portTo) tuples.
+        -cities: List of (name, description, greeting, buildings) tuples.
+         buildings are tuples whose first element is the building type:
+            ("inn", name, description, greeting, cost)
+            ("shop", name, description, greeting, region, items, quality)
+            ("square", name, description, greeting, talk, gifts)
+         gifts is the name of a square item dictionary in
+         items.unique_items, or None.
+        -uniquePlace: (moduleName, className, name, description, greeting)
+         tuple, or None.
+        -portTo: Index of the space that the unique place's quest opens
+         a port to, or None.
+    -exits: List of (spaceIndex, direction, targetIndex) tuples.
+    -world: List of indices of the spaces returned to the game.
+"""
+
+import hashlib
+import marshal
+import os
+
+from space import Space
+from cities.city import City
+from cities.inn import Inn
+from cities.square import Square
+from cities.shop import Shop
+from unique_place import LazyUniquePlace
+from util.lazy_class import LazyClass
+import items.unique_items
+import constants
+
+WORLD_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "data", "world.json")
+
+#Changes whenever the compiled form changes
+COMPILED_VERSION = 1
+
+def loadWorldData(dataPath = WORLD_DATA_PATH, cachePath = None):
+    """
+    Returns the compiled world data, from the cache if it holds the current
+    data and by compiling the data file otherwise. A fresh compile is written
+    back to the cache; failure to write it is ignored.
+
+    @keyword dataPath:    (Optional) Path of the data file.
+    @keyword cachePath:   (Optional) Path of the cache. Defaults to the data
+                          file's path with ".cache" appended.
+
+    @return:              The compiled world data.
+    """
+    if cachePath is None:
+        cachePath = dataPath + ".cache"
+
+    with open(dataPath, "rb") as dataFile:
+        data = dataFile.read()
+    key = "%s:%s" % (COMPILED_VERSION, hashlib.sha1(data).hexdigest())
+
+    try:
+        with open(cachePath, "rb") as cacheFile:
+            cachedKey, compiled = marshal.load(cacheFile)
+        if cachedKey == key:
+            return compiled
+    except (IOError, EOFError, ValueError, TypeError):
+        pass
+
+    #Only needed when the cache is out of date
+    import json
+    compiled = compileWorldData(json.loads(data))
+    try:
+        with open(cachePath, "wb") as cacheFile:
+            marshal.dump((key, compiled), cacheFile)
+    except (IOError, OSError):
+        pass
+
+    return compiled
+
+def compileWorldData(data):
+    """
+    Checks parsed world data and resolves its names to values.
+
+    @param data:    The contents of the data file, as parsed by json.
+
+    @return:        The compiled world data.
+    """
+    data = _encode(data)
+
+    spaceIndex = {}
+    for index, space in enumerate(data["spaces"]):
+        if space["id"] in spaceIndex:
+            errorMsg = "Duplicate space id in world data: %s" % space["id"]
+            raise AssertionError(errorMsg)
+        spaceIndex[space["id"]] = index
+
+    spaces = []
+    for space in data["spaces"]:
+        cities = [_compileCity(city) for city in space.get("cities", [])]
+
+        uniquePlace = None
+        portTo = None
+        place = space.get("uniquePlace")
+        if place:
+            moduleName, className = place["class"].rsplit(".", 1)
+            uniquePlace = (moduleName, className, place["name"],
+                place["description"], place["greeting"])
+            if "portTo" in place:
+                portTo = _lookUpSpace(spaceIndex, place["portTo"])
+
+        spaces.append((space["name"], space["description"],
+            _lookUpRegion(space["region"]),
+            space.get("battleProbability", 0),
+            space.get("battleBonusDifficulty", 0), cities, uniquePlace,
+            portTo))
+
+    exits = []
+    for spaceId, direction, targetId in data["exits"]:
+        if direction not in (constants.Direction.NORTH,
+            constants.Direction.SOUTH, constants.Direction.EAST,
+            constants.Direction.WEST):
+            errorMsg = "Invalid direction in world data: %s" % direction
+            raise AssertionError(errorMsg)
+        exits.append((_lookUpSpace(spaceIndex, spaceId), direction,
+            _lookUpSpace(spaceIndex, targetId)))
+
+    world = [_lookUpSpace(spaceIndex, spaceId) for spaceId in data["world"]]
+
+    return {"spaces": spaces, "exits": exits, "world": world}
+
+def buildWorld(compiled):
+    """
+    Builds Middle Earth from compiled world data, without findable unique
+    items.
+
+    @param compiled:    The compiled world data.
+
+    @return:            List of created spaces.
+    """
+    spaces = []
+    uniquePlaces = []
+    for (name, description, region, battleProbability, battleBonusDifficulty,
+        cities, uniquePlace, portTo) in compiled["spaces"]:
+        cities = [_buildCity(city) for city in cities]
+        if not cities:
+            city = None
+        elif len(cities) == 1:
+            city = cities[0]
+        else:
+            city = cities
+
+        if uniquePlace:
+            moduleName, className, placeName, placeDescription, greeting = \
+                uniquePlace
+            uniquePlace = LazyUniquePlace(LazyClass(moduleName, className),
+                placeName, placeDescription, greeting)
+            uniquePlaces.append((uniquePlace, len(spaces), portTo))
+
+        spaces.append(Space(name, description, region,
+            battleProbability = battleProbability,
+            battleBonusDifficulty = battleBonusDifficulty, city = city,
+            uniquePlace = uniquePlace))
+
+    for spaceIndex, direction, targetIndex in compiled["exits"]:
+        spaces[spaceIndex].createExit(direction, spaces[targetIndex],
+            outgoingOnly = False)
+
+    #For quest-dependent ports
+    for uniquePlace, spaceIndex, portTo in uniquePlaces:
+        if portTo is not None:
+            uniquePlace.receiveSpaces(spaces[spaceIndex], spaces[portTo])
+
+    return [spaces[index] for index in compiled["world"]]
+
+def _encode(value):
+    """
+    Helper function that converts the unicode strings json produces to UTF-8
+    encoded strings, as used by the rest of the game.
+    """
+    if isinstance(value, unicode):
+        return value.encode("utf-8")
+    elif isinstance(value, list):
+        return [_encode(element) for element in value]
+    elif isinstance(value, dict):
+        return dict((_encode(key), _encode(element))
+            for key, element in value.items())
+
+    return value
+
+def _lookUpSpace(spaceIndex, spaceId):
+    """
+    Helper function that finds the index of a space by its id.
+    """
+    if spaceId not in spaceIndex:
+        errorMsg = "Unknown space in world data: %s" % spaceId
+        raise AssertionError(errorMsg)
+
+    return spaceIndex[spaceId]
+
+def _lookUpRegion(regionName):
+    """
+    Helper function that finds the constants.RegionType of a region name.
+    """
+    region = getattr(constants.RegionType, regionName, None)
+    if not regionName.isupper() or region is None:
+        errorMsg = "Unknown region in world data: %s" % regionName
+        raise AssertionError(errorMsg)
+
+    return region
+
+def _compileCity(city):
+    """
+    Helper function that compiles a city and its buildings.
+    """
+    buildings = []
+    for building in city["buildings"]:
+        buildingType = building["type"]
+        common = (buildingType, building["name"], building["description"],
+            building["greeting"])
+        if buildingType == "inn":
+            buildings.append(common + (building["cost"],))
+        elif buildingType == "shop":
+            buildings.append(common + (_lookUpRegion(building["region"]),
+                building["items"], building["quality"]))
+        elif buildingType == "square":
+            gifts = building.get("gifts")
+            if gifts is not None and not isinstance(
+                getattr(items.unique_items, gifts, None), dict):
+                errorMsg = "Unknown square gifts in world data: %s" % gifts
+                raise AssertionError(errorMsg)
+            buildings.append(common + (building.get("talk", {}), gifts))
+        else:
+            errorMsg = "Unknown building type in world data: %s" % buildingType
+            raise AssertionError(errorMsg)
+
+    return (city["name"], city["description"], city["greeting"], buildings)
+
+def _buildCity(city):
+    """
+    Helper function that builds a city and its buildings.
+    """
+    name, description, greeting, buildingData = city
+
+    buildings = []
+    for building in buildingData:
+        buildingType = building[0]
+        if buildingType == "inn":
+            buildings.append(Inn(*building[1:]))
+        elif buildingType == "shop":
+            buildings.append(Shop(*building[1:]))
+        else:
+            squareName, squareDescription, squareGreeting, talk, gifts = \
+                building[1:]
+            if gifts is not None:
+                gifts = getattr(items.unique_items, gifts)
+            buildings.append(Square(squareName, squareDescription,
+                squareGreeting, talk, gifts))
+
+    return City(name, description, greeting, buildings)
@@ -0,0 +1,419 @@
+#!/usr/bin/python
+
+from array import array
+
+from route_planner import RoutePlanner, SafeRoutePlanner
+from util.prefix_trie import PrefixTrie
+import constants
+from constants import Direction
+
+#Directions in the order their adjacency arrays are stored
+DIRECTIONS = (Direction.NORTH, Direction.SOUTH, Direction.EAST,
+    Direction.WEST)
+
+class WorldGraph(object):
+    """
+    A compiled, integer-indexed view of the exits between spaces.
+
+    Every space gets an ID from 0 to the number of spaces minus one. For each
+    direction, the exits of all spaces are stored in compressed sparse row
+    form: the IDs of the spaces that space i leads to are
+    targets[offsets[i]:offsets[i + 1]]. A direction with no exit is an empty
+    range and a direction with several exits is a longer one, so queries
+    always get back a sequence.
+
+    Spaces hold a reference to their graph and report exits created or
+    cleared while the game runs, so the graph stays in step with them. An
+    exit to a space outside the graph detaches the graph instead.
+
+    Spaces may be looked up by name, or by the name of a city or unique place
+    in them. Spaces that share a name may also be looked up by a qualified 
+    name, which adds the name of their first city or unique place (or, if 
+    they have none, their ID), as in "Misty Mountains (Moria)".
+    """
+    def __init__(self, spaces):
+        """
+        Compiles the graph and attaches it to its spaces.
+
+        @param spaces:    List of spaces. IDs follow the order of this list.
+                          Spaces only reachable through exits are added
+                          after them.
+        """
+        self._spaces = []
+        self._spaceIndex = {}
+        self._nameIndex = {}
+        self._qualifiedNames = {}
+        self._placeNames = []
+        self._nameTrie = None
+        self._routePlanner = None
+        self._safeRoutePlanners = {}
+
+        for space in spaces:
+            if space not in self._spaceIndex:
+                self._addSpace(space)
+
+        #Adjacency arrays, one pair per direction
+        self._offsets = dict((direction, array("i", [0]))
+            for direction in DIRECTIONS)
+        self._targets = dict((direction, array("i"))
+            for direction in DIRECTIONS)
+
+        #Spaces may only be reachable through exits, so spaces found along 
+        #the way are added to the end and compiled in turn
+        spaceId = 0
+        while spaceId < len(self._spaces):
+            exits = self._spaces[spaceId].getExits()
+            for direction in DIRECTIONS:
+                exit = exits[direction]
+                targets = self._targets[direction]
+                if isinstance(exit, list):
+                    for target in exit:
+                        targets.append(self._getOrAddId(target))
+                elif exit:
+                    targets.append(self._getOrAddId(exit))
+                self._offsets[direction].append(len(targets))
+            spaceId += 1
+
+        self._qualifyNames()
+        self._indexPlaceNames()
+
+        for space in self._spaces:
+            space.setWorldGraph(self)
+
+    def _addSpace(self, space):
+        """
+        Helper method that gives a space the next ID.
+
+        @param space:    The space.
+        """
+        spaceId = len(self._spaces)
+        self._spaces.append(space)
+        self._spaceIndex[space] = spaceId
+        self._nameIndex.setdefault(space.getName().lower(), []).append(spaceId)
+
+    def _getOrAddId(self, space):
+        """
+        Helper method that returns the ID of a space, giving it the next ID 
+        if it has none yet.
+
+        @param space:    The space.
+
+        @return:         ID of the space.
+        """
+        spaceId = self._spaceIndex.get(space)
+        if spaceId is None:
+            spaceId = len(self._spaces)
+            self._addSpace(space)
+
+        return spaceId
+
+    def _qualifyNames(self):
+        """
+        Helper method that gives every space whose name is shared a qualified
+        name.
+        """
+        for spaceIds in self._nameIndex.values():
+            if len(spaceIds) == 1:
+                continue
+
+            for spaceId in spaceIds:
+                space = self._spaces[spaceId]
+                placeNames = space.getPlaceNames()
+                qualifier = placeNames[0] if placeNames else spaceId
+                name = "%s (%s)" % (space.getName(), qualifier)
+                if name.lower() in self._nameIndex:
+                    name = "%s (%s)" % (space.getName(), spaceId)
+                self._nameIndex[name.lower()] = [spaceId]
+                self._qualifiedNames[spaceId] = name
+
+    def _indexPlaceNames(self):
+        """
+        Helper method that indexes the spaces by the names of their cities 
+        and unique places. Names of spaces take precedence.
+        """
+        placeIndex = {}
+        for spaceId, space in enumerate(self._spaces):
+            for name in space.getPlaceNames():
+                if name.lower() in self._nameIndex:
+                    continue
+                spaceIds = placeIndex.setdefault(name.lower(), [])
+                if not spaceIds:
+                    self._placeNames.append(name)
+                if spaceId not in spaceIds:
+                    spaceIds.append(spaceId)
+
+        self._nameIndex.update(placeIndex)
+
+    def copy(self, spaces):
+        """
+        Returns a graph with the same exits and IDs for copies of the spaces 
+        in this graph, and attaches it to the copies. Cheaper than compiling 
+        the copies.
+
+        @param spaces:    Dictionary mapping the spaces in this graph to their
+                          copies.
+
+        @return:          The new WorldGraph.
+        """
+        graph = object.__new__(WorldGraph)
+        graph._spaces = [spaces[space] for space in self._spaces]
+        graph._spaceIndex = dict((space, spaceId)
+            for spaceId, space in enumerate(graph._spaces))
+        graph._nameIndex = self._nameIndex
+        graph._qualifiedNames = self._qualifiedNames
+        graph._placeNames = self._placeNames
+        graph._nameTrie = self._nameTrie
+        graph._routePlanner = None
+        graph._safeRoutePlanners = {}
+        graph._offsets = dict((direction, array("i", offsets))
+            for direction, offsets in self._offsets.iteritems())
+        graph._targets = dict((direction, array("i", targets))
+            for direction, targets in self._targets.iteritems())
+
+        for space in graph._spaces:
+            space.setWorldGraph(graph)
+
+        return graph
+
+    def spaceCount(self):
+        """
+        Returns the number of spaces in the graph.
+
+        @return:    Number of spaces.
+        """
+        return len(self._spaces)
+
+    def getSpace(self, spaceId):
+        """
+        Returns the space with a given ID.
+
+        @param spaceId:   ID of the space.
+
+        @return:          The space.
+        """
+        return self._spaces[spaceId]
+
+    def getSpaceId(self, space):
+        """
+        Returns the ID of a space.
+
+        @param space:     A space in the graph.
+
+        @return:          ID of the space.
+        """
+        return self._spaceIndex[space]
+
+    def getSpaceByName(self, name):
+        """
+        Finds a space by name. If several spaces share the name, the one with
+        the lowest ID is returned.
+
+        @param name:      Name or qualified name of the space, or name of a
+                          city or unique place in it, in any case.
+
+        @return:          The space, or None if there is no such space.
+        """
+        spaceId = self.getIdByName(name)
+        if spaceId is None:
+            return None
+
+        return self._spaces[spaceId]
+
+    def getIdByName(self, name):
+        """
+        Finds the ID of a space by name. If several spaces share the name, 
+        the lowest ID is returned.
+
+        @param name:      Name or qualified name of the space, or name of a
+                          city or unique place in it, in any case.
+
+        @return:          ID of the space, or None if there is no such space.
+        """
+        spaceIds = self._nameIndex.get(name.lower())
+        if spaceIds is None:
+            return None
+
+        return spaceIds[0]
+
+    def getIdsByName(self, name):
+        """
+        Finds the IDs of every space with a name.
+
+        @param name:      Name or qualified name of the space, or name of a
+                          city or unique place in it, in any case.
+
+        @return:          List of space IDs, in order. Empty if there is no 
+                          such space. Must not be changed by the caller.
+        """
+        return self._nameIndex.get(name.lower(), [])
+
+    def getQualifiedName(self, spaceId):
+        """
+        Returns a name that only one space is known by.
+
+        @param spaceId:   ID of the space.
+
+        @return:          The qualified name of the space if its name is 
+                          shared, otherwise its name.
+        """
+        name = self._qualifiedNames.get(spaceId)
+        if name is None:
+            return self._spaces[spaceId].getName()
+
+        return name
+
+    def getNameTrie(self):
+        """
+        Returns the names and qualified names of the spaces and the names of
+        their cities and unique places, indexed by prefix. Built on first 
+        request.
+
+        @return:          PrefixTrie of space names. Must not be changed by 
+                          the caller.
+        """
+        if self._nameTrie is None:
+            self._nameTrie = PrefixTrie(space.getName() 
+                for space in self._spaces)
+            for name in self._qualifiedNames.itervalues():
+                self._nameTrie.add(name)
+            for name in self._placeNames:
+                self._nameTrie.add(name)
+
+        return self._nameTrie
+
+    def getExitIds(self, spaceId, direction):
+        """
+        Returns the IDs of the spaces adjacent to a space in a direction.
+
+        @param spaceId:   ID of the space.
+        @param direction: Direction of exit.
+
+        @return:          Sequence of space IDs. Empty if there is no exit.
+        """
+        offsets = self._offsets[direction]
+        return self._targets[direction][offsets[spaceId]:offsets[spaceId + 1]]
+
+    def getNeighborIds(self, spaceId):
+        """
+        Returns the IDs of all spaces adjacent to a space.
+
+        @param spaceId:   ID of the space.
+
+        @return:          List of space IDs, in direction order.
+        """
+        neighborIds = []
+        for direction in DIRECTIONS:
+            neighborIds.extend(self.getExitIds(spaceId, direction))
+
+        return neighborIds
+
+    def getExits(self, space, direction):
+        """
+        Returns the spaces adjacent to a space in a direction.
+
+        @param space:     A space in the graph.
+        @param direction: Direction of exit.
+
+        @return:          List of spaces. Empty if there is no exit.
+        """
+        spaces = self._spaces
+        return [spaces[targetId] for targetId in
+            self.getExitIds(self._spaceIndex[space], direction)]
+
+    def getExitTable(self):
+        """
+        Returns the exits of every space in compact form.
+
+        @return:          Tuple with an (offsets, targets) pair of lists for
+                          each direction, in the order of DIRECTIONS. The IDs
+                          of the spaces that space i leads to are
+                          targets[offsets[i]:offsets[i + 1]].
+        """
+        return tuple((self._offsets[direction].tolist(),
+            self._targets[direction].tolist()) for direction in DIRECTIONS)
+
+    def getRoutePlanner(self):
+        """
+        Returns the shortest routes between spaces, computing them if needed.
+
+        @return:          The RoutePlanner.
+        """
+        if self._routePlanner is None:
+            self._routePlanner = RoutePlanner(self)
+
+        return self._routePlanner
+
+    def getSafeRoutePlanner(self, level, risk = constants.RouteRisk.DAMAGE):
+        """
+        Returns the safest routes between spaces for a player level. Players
+        whose levels fall in the same constants.RoutePlanning.LEVEL_BRACKET
+        share routes, planned for the lowest level in the bracket.
+
+        @param level:     Level of player.
+        @keyword risk:    (Optional) The constants.RouteRisk to minimize.
+
+        @return:          The SafeRoutePlanner.
+        """
+        bracketSize = constants.RoutePlanning.LEVEL_BRACKET
+        bracketLevel = (level - 1) // bracketSize * bracketSize + 1
+        key = (bracketLevel, risk)
+
+        planner = self._safeRoutePlanners.get(key)
+        if planner is None:
+            planner = SafeRoutePlanner(self, bracketLevel, risk)
+            self._safeRoutePlanners[key] = planner
+
+        return planner
+
+    def addExit(self, space, direction, target):
+        """
+        Records a new exit. Called by Space.createExit().
+
+        @param space:     Space the exit leads from.
+        @param direction: Direction of exit.
+        @param target:    Space the exit leads to. Must be in the graph.
+        """
+        spaceId = self._spaceIndex[space]
+        targetId = self._spaceIndex[target]
+        offsets = self._offsets[direction]
+        self._targets[direction].insert(offsets[spaceId + 1], targetId)
+        for index in range(spaceId + 1, len(offsets)):
+            offsets[index] += 1
+
+        if self._routePlanner:
+            self._routePlanner.addExit(spaceId, targetId)
+        self._safeRoutePlanners = {}
+
+    def removeExit(self, space, direction, target):
+        """
+        Forgets an exit. Called by Space.clearExit().
+
+        @param space:     Space the exit leads from.
+        @param direction: Direction of exit.
+        @param target:    Space the exit leads to.
+        """
+        spaceId = self._spaceIndex[space]
+        offsets = self._offsets[direction]
+        targets = self._targets[direction]
+        for index in range(offsets[spaceId], offsets[spaceId + 1]):
+            if targets[index] == self._spaceIndex[target]:
+                del targets[index]
+                break
+        else:
+            return
+
+        for index in range(spaceId + 1, len(offsets)):
+            offsets[index] -= 1
+
+        #Routes may only get longer, so they are computed again when needed
+        self._routePlanner = None
+        self._safeRoutePlanners = {}
+
+    def detach(self):
+        """
+        Detaches the graph from its spaces, which compile a new graph the
+        next time one is requested. Called when an exit joins spaces of
+        different graphs.
+        """
+        for space in self._spaces:
+            space.setWorldGraph(None)
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+
+import random
+
+from space import Space
+from world_graph import WorldGraph
+from place import Place
+from unique_place import LazyUniquePlace
+from cities.building import Building
+from cities.shop import Shop
+from items.item import Item
+from items.item_set import ItemSet
+from monsters.monster import Monster
+from util.prefix_trie import PrefixTrie
+import constants
+
+class WorldTemplate(object):
+    """
+    A fully built Middle Earth that is copied for each new game session.
+
+    Building the world creates every space, city, building, unique place and
+    monster wave. The template does this once and hands out copies instead.
+    Copies are copy-on-write: a session's spaces are copied up front, while
+    cities and unique places are copied the first time the session uses them.
+
+    Items are immutable and are shared between the template and all copies.
+    """
+    def __init__(self, world):
+        """
+        Initializes world template.
+
+        @param world:    List of spaces making up the template world. These
+                         spaces should not be used directly by a game.
+        """
+        self._world = world
+        
+        #Spaces may only be reachable through exits, so find all of them
+        self._spaces = []
+        found = set()
+        unvisited = list(world)
+        while unvisited:
+            space = unvisited.pop()
+            if space in found:
+                continue
+            found.add(space)
+            self._spaces.append(space)
+            
+            for exit in space.getExits().values():
+                if isinstance(exit, list):
+                    unvisited.extend(exit)
+                elif exit:
+                    unvisited.append(exit)
+
+        #Compiled once, then copied for each session
+        self._graph = WorldGraph(world)
+        self._graph.detach()
+
+    def createWorld(self, sessionRandom = None):
+        """
+        Creates a world for a new game session. Its exits are compiled into a
+        WorldGraph, reachable from every space.
+
+        @keyword sessionRandom:  (Optional) The SessionRandom of the session.
+                                 Shops are stocked from its shop stream. 
+                                 Defaults to the random module.
+
+        @return:    List of spaces, in the same order as the template's.
+        """
+        spaces = {}
+
+        if sessionRandom is None:
+            shopRandom = random
+        else:
+            shopRandom = sessionRandom.getStream(constants.RandomStream.SHOP)
+
+        def clonePlace(place):
+            return _cloneState(place, spaces, shopRandom)
+
+        for space in self._spaces:
+            spaces[space] = space.clone(clonePlace)
+
+        for space in spaces.values():
+            space.relinkExits(spaces)
+        self._graph.copy(spaces)
+
+        return [spaces[space] for space in self._world]
+
+#Values of these types are never modified in place
+_ATOMIC_TYPES = (type(None), bool, int, long, float, str, unicode)
+
+def _cloneState(value, spaces, random):
+    """
+    Helper function that copies the mutable state reachable from a city or
+    unique place.
+
+    Lists and dictionaries are copied, as are places, buildings, item sets,
+    name tries and monsters. Items, strings and numbers are shared. 
+    References to template spaces are replaced with their session copies. 
+    Shops are restocked so that every session gets its own selection of 
+    wares.
+
+    @param value:     The object to copy.
+    @param spaces:    Dictionary mapping template spaces to their copies.
+    @param random:    The random.Random that shops are restocked from.
+
+    @return:          Copy of value.
+    """
+    if type(value) in _ATOMIC_TYPES or isinstance(value, Item):
+        return value
+    elif isinstance(value, Space):
+        return spaces.get(value, value)
+    elif isinstance(value, list):
+        return [_cloneState(element, spaces, random) for element in value]
+    elif isinstance(value, dict):
+        return dict((key, _cloneState(element, spaces, random))
+            for key, element in value.iteritems())
+    elif isinstance(value, (Monster, PrefixTrie)):
+        return value.copy()
+    elif isinstance(value, (Place, LazyUniquePlace, Building, ItemSet)):
+        copy = object.__new__(value.__class__)
+        copy.__dict__ = _cloneState(value.__dict__, spaces, random)
+        if isinstance(copy, Shop):
+            copy.restock(random)
+        return copy
+
+    return value